@@ -0,0 +1 @@
+"""Performance benchmarks for the BlueCat CSV Importer."""
@@ -0,0 +1,155 @@
+"""Logging overhead benchmark for the import hot path.
+
+Emits the log events of a synthetic operation stream (one DEBUG and two INFO
+events per operation, as the executor and client log them) and measures the
+time the logging calls take on the calling thread, which in an import is the
+event loop. Each configuration writes JSON lines to a temporary file:
+
+- filtered: level WARNING, every event dropped by the first processor
+- sync: INFO, rendered and written on the calling thread (the old pipeline)
+- background: INFO, rendered and written by the writer thread
+- sampled: background plus per-event sampling (``LOG_SAMPLE_BURST``)
+
+For each it reports microseconds per operation, the share of the time
+budget of one operation at ``--rate`` operations per second, the lines
+written and the time ``shutdown_logging()`` needed to drain the queue.
+Results are written as JSON to benchmarks/results/.
+
+Usage:
+    python -m benchmarks.logging_overhead
+    python -m benchmarks.logging_overhead --operations 50000 --rate 1000
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from src.importer.constants import LOG_SAMPLE_BURST
+from src.importer.observability.logger import configure_logging, shutdown_logging
+
+RESULTS_DIR = Path(__file__).parent / "results"
+MODES: dict[str, dict[str, Any]] = {
+    "filtered": {"level": "WARNING"},
+    "sync": {"level": "INFO"},
+    "background": {"level": "INFO", "background": True},
+    "sampled": {"level": "INFO", "background": True, "sample_burst": LOG_SAMPLE_BURST},
+}
+
+
+def measure(mode: str, operations: int, log_dir: Path) -> dict[str, Any]:
+    """
+    Log an operation stream with one configuration.
+
+    Args:
+        mode: Key of MODES
+        operations: Operations to simulate
+        log_dir: Directory for the log file
+
+    Returns:
+        Timings of the mode
+    """
+    log_file = log_dir / f"{mode}.log"
+    stderr = sys.stderr
+    # The console handler binds sys.stderr when configured; keep it quiet
+    with open(os.devnull, "w") as devnull:
+        sys.stderr = devnull
+        try:
+            configure_logging(log_file=log_file, json_logs=True, **MODES[mode])
+            logger = structlog.get_logger("importer.execution.executor")
+
+            start = time.perf_counter()
+            for i in range(operations):
+                logger.debug("Executing operation", row_id=i, object_type="host_record")
+                logger.info("Resolved deferred block ID", row_id=i, resolved_id=1000 + i)
+                logger.info("Operation completed", row_id=i, duration_ms=12.5)
+            elapsed = time.perf_counter() - start
+
+            drain_start = time.perf_counter()
+            shutdown_logging()
+            drain = time.perf_counter() - drain_start
+        finally:
+            configure_logging("WARNING")
+            sys.stderr = stderr
+
+    with open(log_file, encoding="utf-8") as f:
+        lines = sum(1 for _ in f)
+    return {
+        "mode": mode,
+        "us_per_operation": round(elapsed / operations * 1e6, 2),
+        "drain_seconds": round(drain, 3),
+        "lines_written": lines,
+    }
+
+
+def run_benchmarks(operations: int, rate: float) -> dict[str, Any]:
+    """
+    Benchmark every logging configuration.
+
+    Args:
+        operations: Operations to simulate per configuration
+        rate: Operations per second the time budget is computed for
+
+    Returns:
+        JSON-serializable report
+    """
+    report: dict[str, Any] = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "operations": operations,
+        "rate": rate,
+        "results": [],
+    }
+    budget_us = 1e6 / rate
+    with tempfile.TemporaryDirectory() as tmp:
+        for mode in MODES:
+            result = measure(mode, operations, Path(tmp))
+            result["budget_pct"] = round(result["us_per_operation"] / budget_us * 100, 2)
+            report["results"].append(result)
+    return report
+
+
+def format_report(report: dict[str, Any]) -> str:
+    """Render a report as a plain-text table."""
+    lines = [
+        f"operations={report['operations']} rate={report['rate']:.0f}/s",
+        f"{'mode':<11} {'us/op':>8} {'budget':>8} {'lines':>8} {'drain s':>8}",
+    ]
+    for result in report["results"]:
+        lines.append(
+            f"{result['mode']:<11} {result['us_per_operation']:>8.1f} "
+            f"{result['budget_pct']:>7.2f}% {result['lines_written']:>8} "
+            f"{result['drain_seconds']:>8.3f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Hot-path logging overhead benchmark")
+    parser.add_argument("--operations", type=int, default=20000)
+    parser.add_argument("--rate", type=float, default=1000.0, help="Operations per second")
+    parser.add_argument("--output", type=Path, default=None, help="Result file path")
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(args.operations, args.rate)
+    print(format_report(report))
+
+    output = args.output or RESULTS_DIR / f"logging_{datetime.now():%Y%m%d_%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"\nResults written to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,397 @@
+"""End-to-end throughput benchmark for the import pipeline.
+
+Runs the same stages as ImportRunner.run_session (parse, resolve, graph, plan,
+execute) against a local MockBAMServer and reports, per stage and row count:
+
+- wall and CPU seconds
+- ops/sec (rows / wall seconds)
+- API calls and API calls per row (counted by the mock server)
+- peak RSS of the benchmark process after the stage
+
+The mock server runs in a separate process so its CPU and memory do not skew
+the importer's numbers. Results are written as JSON to benchmarks/results/ and
+can be compared against an earlier result file to spot regressions.
+
+Usage:
+    python -m benchmarks.pipeline --sizes 1000,10000
+    python -m benchmarks.pipeline --sizes 1000 --latency-ms 5 --jitter-ms 5 \\
+        --rate-limit-rate 0.01
+    python -m benchmarks.pipeline --sizes 1000 --compare benchmarks/results/baseline.json
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import platform
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from src.importer.bam.client import BAMClient
+from src.importer.bam.mock_server import MockBAMFaults, MockBAMServer
+from src.importer.config import BAMConfig, CacheConfig, PolicyConfig
+from src.importer.core.operation_factory import OperationFactory, PendingResources
+from src.importer.core.parser import CSVParser
+from src.importer.core.resolver import Resolver
+from src.importer.dependency.graph import DependencyGraph
+from src.importer.dependency.planner import DependencyPlanner
+from src.importer.execution.executor import OperationExecutor
+from src.importer.execution.planner import ExecutionPlanner
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None  # type: ignore[assignment]
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+RESULTS_DIR = Path(__file__).parent / "results"
+PHASES = ("parse", "resolve", "graph", "plan", "execute")
+
+# Rows per /24 network: 1 network row, 12 addresses and 6 host records
+ADDRESSES_PER_NETWORK = 12
+HOSTS_PER_NETWORK = 6
+
+
+@dataclass
+class PhaseResult:
+    """Measurements for one pipeline stage."""
+
+    phase: str
+    wall_seconds: float
+    cpu_seconds: float
+    ops_per_sec: float
+    api_calls: int
+    api_calls_per_row: float
+    peak_rss_mb: float
+
+
+@dataclass
+class SizeResult:
+    """Measurements for one row count."""
+
+    rows: int
+    phases: list[PhaseResult] = field(default_factory=list)
+    total_wall_seconds: float = 0.0
+    failed_operations: int = 0
+    api_calls_by_endpoint: dict[str, int] = field(default_factory=dict)
+
+
+def generate_csv(path: Path, rows: int) -> int:
+    """
+    Write a synthetic import CSV with roughly ``rows`` rows.
+
+    One /8 block and a DNS zone, then /24 networks each followed by addresses
+    and host records inside it, so every stage sees realistic dependencies.
+
+    Args:
+        path: Output CSV path
+        rows: Target row count
+
+    Returns:
+        Number of rows written
+    """
+    lines = [
+        "row_id,object_type,action,config,view_path,zone_name,cidr,name,address,addresses",
+        "blk,ip4_block,create,Default,,,10.0.0.0/8,bench-block,,",
+        "zone,dns_zone,create,Default,Internal,bench.example,,,,",
+    ]
+    written = 2
+    net = 0
+    while written < rows:
+        octet2, octet3 = divmod(net, 256)
+        prefix = f"10.{octet2}.{octet3}"
+        lines.append(f"n{net},ip4_network,create,Default,,,{prefix}.0/24,net-{net},,")
+        written += 1
+        for host in range(1, ADDRESSES_PER_NETWORK + 1):
+            if written >= rows:
+                break
+            lines.append(
+                f"a{net}_{host},ip4_address,create,Default,,,,addr-{net}-{host},{prefix}.{host},"
+            )
+            written += 1
+        for host in range(1, HOSTS_PER_NETWORK + 1):
+            if written >= rows:
+                break
+            lines.append(
+                f"h{net}_{host},host_record,create,Default,Internal,bench.example,,"
+                f"host-{net}-{host}.bench.example,,{prefix}.{100 + host}"
+            )
+            written += 1
+        net += 1
+
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return written
+
+
+def _peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB (0 where unsupported)."""
+    if resource is None:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes on Linux
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _serve(faults: dict[str, Any], queue: Any) -> None:
+    """Subprocess entry point: run a mock server and report its URL."""
+    server = MockBAMServer(faults=MockBAMFaults(**faults))
+    queue.put(server.base_url)
+    server.serve_forever()
+
+
+class MockServerProcess:
+    """MockBAMServer running in a child process."""
+
+    def __init__(self, faults: MockBAMFaults) -> None:
+        """
+        Initialize process wrapper.
+
+        Args:
+            faults: Fault injection settings for the server
+        """
+        self.faults = faults
+        self.base_url = ""
+        self._process: multiprocessing.Process | None = None
+
+    def __enter__(self) -> "MockServerProcess":
+        """Start the server and wait for its URL."""
+        queue: Any = multiprocessing.Queue()
+        self._process = multiprocessing.Process(
+            target=_serve, args=(asdict(self.faults), queue), daemon=True
+        )
+        self._process.start()
+        self.base_url = queue.get(timeout=30)
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Stop the server process."""
+        if self._process:
+            self._process.terminate()
+            self._process.join(timeout=5)
+
+    def stats(self) -> dict[str, Any]:
+        """Fetch request counters from the server."""
+        return httpx.get(f"{self.base_url}/_mock/stats").json()
+
+    def reset_stats(self) -> None:
+        """Reset request counters on the server."""
+        httpx.post(f"{self.base_url}/_mock/stats/reset")
+
+
+async def run_pipeline(csv_path: Path, server: MockServerProcess, rows: int) -> SizeResult:
+    """
+    Run every stage of the pipeline once and measure it.
+
+    Args:
+        csv_path: CSV to import
+        server: Running mock server
+        rows: Row count (for per-row figures)
+
+    Returns:
+        SizeResult with one PhaseResult per stage
+    """
+    result = SizeResult(rows=rows)
+    server.reset_stats()
+    policy = PolicyConfig()
+    client = BAMClient(
+        BAMConfig(base_url=server.base_url, username="admin", password="admin", verify_ssl=False)
+    )
+    state: dict[str, Any] = {}
+
+    async def parse() -> None:
+        state["rows"] = CSVParser(csv_path).parse()
+
+    async def resolve() -> None:
+        await client.authenticate()
+        cache_dir = Path(tempfile.mkdtemp(prefix="bench_resolver_"))
+        resolver = Resolver(client, cache_dir, CacheConfig(), no_cache=True)
+        factory = OperationFactory(client, resolver, PendingResources.from_rows(state["rows"]))
+        state["operations"] = [await factory.create_from_row(row) for row in state["rows"]]
+
+    async def graph() -> None:
+        dependency_graph = DependencyGraph()
+        for op in state["operations"]:
+            dependency_graph.add_operation(op)
+        DependencyPlanner().build_graph(dependency_graph, state["operations"])
+        dependency_graph._apply_phasing()
+        dependency_graph.validate()
+        dependency_graph._calculate_depths()
+        state["graph"] = dependency_graph
+
+    async def plan() -> None:
+        state["plan"] = ExecutionPlanner(policy).create_plan(state["graph"])
+
+    async def execute() -> None:
+        executor = OperationExecutor(
+            bam_client=client, policy=policy, dependency_graph=state["graph"]
+        )
+        results = await executor.execute_plan(state["plan"])
+        result.failed_operations = sum(
+            1 for r in results if not r.success and not r.metadata.get("skipped")
+        )
+
+    stages = {"parse": parse, "resolve": resolve, "graph": graph, "plan": plan, "execute": execute}
+    calls_before = 0
+    try:
+        for name in PHASES:
+            wall_start, cpu_start = time.perf_counter(), time.process_time()
+            await stages[name]()
+            wall = time.perf_counter() - wall_start
+            cpu = time.process_time() - cpu_start
+
+            stats = server.stats()
+            calls = stats["total_requests"] - calls_before
+            calls_before = stats["total_requests"]
+
+            result.phases.append(
+                PhaseResult(
+                    phase=name,
+                    wall_seconds=round(wall, 4),
+                    cpu_seconds=round(cpu, 4),
+                    ops_per_sec=round(rows / wall, 1) if wall > 0 else 0.0,
+                    api_calls=calls,
+                    api_calls_per_row=round(calls / rows, 3) if rows else 0.0,
+                    peak_rss_mb=round(_peak_rss_mb(), 1),
+                )
+            )
+        result.api_calls_by_endpoint = server.stats()["by_endpoint"]
+    finally:
+        await client.close()
+
+    result.total_wall_seconds = round(sum(p.wall_seconds for p in result.phases), 4)
+    return result
+
+
+def run_benchmarks(sizes: list[int], faults: MockBAMFaults) -> dict[str, Any]:
+    """
+    Benchmark every size against a fresh mock server.
+
+    Args:
+        sizes: Row counts to benchmark
+        faults: Fault injection settings
+
+    Returns:
+        JSON-serializable report
+    """
+    report: dict[str, Any] = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "faults": asdict(faults),
+        "results": [],
+    }
+    with tempfile.TemporaryDirectory(prefix="bench_") as tmp:
+        for size in sizes:
+            csv_path = Path(tmp) / f"bench_{size}.csv"
+            rows = generate_csv(csv_path, size)
+            # A fresh server per size keeps BAM state (and 409s) out of the numbers
+            with MockServerProcess(faults) as server:
+                size_result = asyncio.run(run_pipeline(csv_path, server, rows))
+            report["results"].append(asdict(size_result))
+    return report
+
+
+def compare_reports(current: dict[str, Any], baseline: dict[str, Any]) -> list[str]:
+    """
+    Compare wall time and API calls per phase against a baseline report.
+
+    Args:
+        current: Report from run_benchmarks
+        baseline: Earlier report loaded from disk
+
+    Returns:
+        Human-readable lines, one per (rows, phase) present in both reports
+    """
+    lines = []
+    baseline_by_size = {r["rows"]: r for r in baseline.get("results", [])}
+    for size_result in current["results"]:
+        base = baseline_by_size.get(size_result["rows"])
+        if not base:
+            continue
+        base_phases = {p["phase"]: p for p in base["phases"]}
+        for phase in size_result["phases"]:
+            old = base_phases.get(phase["phase"])
+            if not old:
+                continue
+            wall_delta = (
+                (phase["wall_seconds"] - old["wall_seconds"]) / old["wall_seconds"] * 100
+                if old["wall_seconds"]
+                else 0.0
+            )
+            lines.append(
+                f"{size_result['rows']:>7} {phase['phase']:<8} "
+                f"wall {old['wall_seconds']:.3f}s -> {phase['wall_seconds']:.3f}s ({wall_delta:+.1f}%)  "
+                f"api/row {old['api_calls_per_row']:.3f} -> {phase['api_calls_per_row']:.3f}"
+            )
+    return lines
+
+
+def format_report(report: dict[str, Any]) -> str:
+    """Render a report as a plain-text table."""
+    lines = [
+        f"{'rows':>7} {'phase':<8} {'wall s':>9} {'cpu s':>9} {'ops/s':>10} "
+        f"{'api':>8} {'api/row':>8} {'rss MB':>8}"
+    ]
+    for size_result in report["results"]:
+        for p in size_result["phases"]:
+            lines.append(
+                f"{size_result['rows']:>7} {p['phase']:<8} {p['wall_seconds']:>9.3f} "
+                f"{p['cpu_seconds']:>9.3f} {p['ops_per_sec']:>10.1f} {p['api_calls']:>8} "
+                f"{p['api_calls_per_row']:>8.3f} {p['peak_rss_mb']:>8.1f}"
+            )
+        lines.append(
+            f"{size_result['rows']:>7} {'total':<8} {size_result['total_wall_seconds']:>9.3f}"
+            f"   failed={size_result['failed_operations']}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Import pipeline throughput benchmark")
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(s) for s in DEFAULT_SIZES),
+        help="Comma-separated row counts (default: 1000,10000,100000)",
+    )
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--output", type=Path, default=None, help="Result file path")
+    parser.add_argument("--compare", type=Path, default=None, help="Baseline result file")
+    args = parser.parse_args(argv)
+
+    faults = MockBAMFaults(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        seed=args.seed,
+    )
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    report = run_benchmarks(sizes, faults)
+    print(format_report(report))
+
+    output = args.output or RESULTS_DIR / f"pipeline_{datetime.now():%Y%m%d_%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"\nResults written to {output}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        print(f"\nCompared with {args.compare}:")
+        print("\n".join(compare_reports(report, baseline)) or "(no overlapping sizes)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
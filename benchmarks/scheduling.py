@@ -0,0 +1,277 @@
+"""Makespan benchmark for the executor's scheduling modes.
+
+Runs synthetic dependency graphs through OperationExecutor.execute_plan with
+each ``policy.scheduling`` mode and a fixed concurrency limit. Operations do
+no I/O: each holds a throttle slot for a seeded random latency, so the
+numbers isolate the scheduling order from everything else.
+
+Graph shapes:
+
+- deep: a few long chains (zone -> record -> record ...) next to many
+  independent operations, the case where depth batches and plan order leave
+  the chains for last
+- wide: many parents with a fan-out of children and grandchildren, plus a
+  few chains, where every depth batch waits for its slowest operation
+
+For each shape and mode it reports the makespan, the reduction against
+``batch`` scheduling and the lower bound max(critical path, total work /
+concurrency). Results are written as JSON to benchmarks/results/.
+
+Usage:
+    python -m benchmarks.scheduling
+    python -m benchmarks.scheduling --shapes deep --concurrency 16 --latency-ms 10
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import random
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock
+
+from src.importer.config import PolicyConfig
+from src.importer.dependency.graph import DependencyGraph
+from src.importer.execution.executor import OperationExecutor
+from src.importer.execution.planner import ExecutionPlanner
+from src.importer.models.operations import Operation, OperationType
+from src.importer.models.results import OperationResult
+from src.importer.observability.logger import configure_logging
+
+RESULTS_DIR = Path(__file__).parent / "results"
+SHAPES = ("deep", "wide")
+MODES = ("batch", "ready", "critical_path")
+
+
+class SimulatedExecutor(OperationExecutor):
+    """Executor whose operations only hold a throttle slot for their latency."""
+
+    def __init__(self, latencies: dict[str, float], **kwargs: Any) -> None:
+        """
+        Initialize executor.
+
+        Args:
+            latencies: Seconds each operation takes, by row ID
+            **kwargs: OperationExecutor arguments
+        """
+        super().__init__(**kwargs)
+        self.latencies = latencies
+
+    async def _execute_operation(self, operation: Operation) -> OperationResult:
+        """Wait for the operation's latency inside the throttle."""
+        early_result = self._check_runnable(operation)
+        if early_result:
+            return early_result
+        async with self.throttle:
+            await asyncio.sleep(self.latencies[operation.row_id])
+        return OperationResult(
+            row_id=operation.row_id, operation=operation.operation_type, success=True
+        )
+
+
+def _operation(row_id: str) -> Operation:
+    return Operation(
+        row_id=row_id,
+        operation_type=OperationType.NOOP,
+        object_type="ip4_network",
+        resource_id=None,
+        payload={},
+        csv_row=None,
+    )
+
+
+def build_graph(shape: str, scale: int) -> DependencyGraph:
+    """
+    Build a synthetic dependency graph.
+
+    Independent operations are added first, as a CSV listing bulk rows before
+    the deep hierarchies would, so plan order does not favour the chains.
+
+    Args:
+        shape: "deep" or "wide"
+        scale: Size multiplier (1 = about 2,000 operations)
+
+    Returns:
+        Graph with depths calculated
+    """
+    graph = DependencyGraph()
+    edges: list[tuple[str, str]] = []
+
+    def chain(name: str, length: int) -> None:
+        for step in range(length):
+            graph.add_operation(_operation(f"{name}_{step}"))
+            if step:
+                edges.append((f"{name}_{step}", f"{name}_{step - 1}"))
+
+    if shape == "deep":
+        for leaf in range(1_900 * scale):
+            graph.add_operation(_operation(f"leaf{leaf}"))
+        for c in range(4 * scale):
+            chain(f"chain{c}", 40)
+    elif shape == "wide":
+        for parent in range(100 * scale):
+            graph.add_operation(_operation(f"p{parent}"))
+            for child in range(6):
+                graph.add_operation(_operation(f"p{parent}_{child}"))
+                edges.append((f"p{parent}_{child}", f"p{parent}"))
+                for grandchild in range(2):
+                    name = f"p{parent}_{child}_{grandchild}"
+                    graph.add_operation(_operation(name))
+                    edges.append((name, f"p{parent}_{child}"))
+        for c in range(2 * scale):
+            chain(f"chain{c}", 30)
+    else:
+        raise ValueError(f"Unknown graph shape: {shape}")
+
+    for dependent, dependency in edges:
+        graph.add_dependency(f"ip4_network:{dependent}", f"ip4_network:{dependency}")
+    graph._calculate_depths()
+    return graph
+
+
+def lower_bound(graph: DependencyGraph, latencies: dict[str, float], concurrency: int) -> float:
+    """Makespan no schedule can beat: max(critical path, total work / slots)."""
+    finish: dict[str, float] = {}
+    for node in graph.topological_sort():
+        start = max((finish[d] for d in node.dependencies), default=0.0)
+        finish[node.node_id] = start + latencies[node.operation.row_id]
+    return max(max(finish.values()), sum(latencies.values()) / concurrency)
+
+
+async def measure(
+    graph: DependencyGraph, latencies: dict[str, float], mode: str, concurrency: int
+) -> float:
+    """
+    Execute a graph once and return its makespan in seconds.
+
+    Args:
+        graph: Synthetic graph
+        latencies: Seconds each operation takes
+        mode: policy.scheduling value
+        concurrency: Fixed number of throttle slots
+
+    Returns:
+        Wall seconds from the first operation to the last
+    """
+    policy = PolicyConfig(
+        max_concurrent_operations=concurrency,
+        min_concurrency=concurrency,
+        max_concurrency=concurrency,
+        enable_adaptive_throttle=False,
+        scheduling=mode,
+    )
+    plan = ExecutionPlanner(policy).create_plan(graph)
+    executor = SimulatedExecutor(
+        latencies, bam_client=AsyncMock(), policy=policy, dependency_graph=graph
+    )
+    executor.dry_run = True  # No grouping: one unit per operation
+    start = time.perf_counter()
+    results = await executor.execute_plan(plan, keep_results=False)
+    assert not results
+    return time.perf_counter() - start
+
+
+def run_benchmarks(
+    shapes: list[str], scale: int, concurrency: int, latency_ms: float, jitter: float, seed: int
+) -> dict[str, Any]:
+    """
+    Benchmark every scheduling mode on every graph shape.
+
+    Args:
+        shapes: Graph shapes to build
+        scale: Graph size multiplier
+        concurrency: Throttle slots
+        latency_ms: Mean operation latency
+        jitter: Latency spread as a fraction of the mean (uniform)
+        seed: Latency random seed
+
+    Returns:
+        JSON-serializable report
+    """
+    report: dict[str, Any] = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "concurrency": concurrency,
+        "latency_ms": latency_ms,
+        "jitter": jitter,
+        "results": [],
+    }
+    for shape in shapes:
+        graph = build_graph(shape, scale)
+        rng = random.Random(seed)
+        latencies = {
+            node.operation.row_id: latency_ms / 1000 * rng.uniform(1 - jitter, 1 + jitter)
+            for node in graph.nodes.values()
+        }
+        makespans = {
+            mode: asyncio.run(measure(graph, latencies, mode, concurrency)) for mode in MODES
+        }
+        report["results"].append(
+            {
+                "shape": shape,
+                "operations": len(graph.nodes),
+                "max_depth": max(node.depth for node in graph.nodes.values()),
+                "lower_bound_seconds": round(lower_bound(graph, latencies, concurrency), 4),
+                "makespan_seconds": {mode: round(s, 4) for mode, s in makespans.items()},
+                "reduction_vs_batch_pct": {
+                    mode: round((1 - s / makespans["batch"]) * 100, 1)
+                    for mode, s in makespans.items()
+                },
+            }
+        )
+    return report
+
+
+def format_report(report: dict[str, Any]) -> str:
+    """Render a report as a plain-text table."""
+    lines = [
+        f"concurrency={report['concurrency']} latency={report['latency_ms']}ms "
+        f"jitter=±{report['jitter'] * 100:.0f}%",
+        f"{'shape':<6} {'ops':>6} {'depth':>6} {'mode':<14} {'makespan s':>11} "
+        f"{'vs batch':>9} {'bound s':>8}",
+    ]
+    for result in report["results"]:
+        for mode in MODES:
+            lines.append(
+                f"{result['shape']:<6} {result['operations']:>6} {result['max_depth']:>6} "
+                f"{mode:<14} {result['makespan_seconds'][mode]:>11.3f} "
+                f"{result['reduction_vs_batch_pct'][mode]:>8.1f}% "
+                f"{result['lower_bound_seconds']:>8.3f}"
+            )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Executor scheduling makespan benchmark")
+    parser.add_argument("--shapes", default=",".join(SHAPES), help="deep,wide (default: both)")
+    parser.add_argument("--scale", type=int, default=1, help="Graph size multiplier")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    parser.add_argument("--jitter", type=float, default=0.5, help="Latency spread (0-1)")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--output", type=Path, default=None, help="Result file path")
+    args = parser.parse_args(argv)
+
+    # Executor logs every batch and checkpoint; only the report matters here
+    configure_logging("WARNING")
+    shapes = [s.strip() for s in args.shapes.split(",") if s.strip()]
+    report = run_benchmarks(
+        shapes, args.scale, args.concurrency, args.latency_ms, args.jitter, args.seed
+    )
+    print(format_report(report))
+
+    output = args.output or RESULTS_DIR / f"scheduling_{datetime.now():%Y%m%d_%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"\nResults written to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,20 @@
 """BlueCat CSV Importer - Production-grade bulk import tool."""
 
-from .cli import app
-from .config import ImporterConfig
+from typing import Any
 
 __version__ = "0.3.0"
 __all__ = ["app", "ImporterConfig"]
+
+
+def __getattr__(name: str) -> Any:
+    # Resolved lazily so importing a submodule (e.g. importer.cli for the
+    # console script) does not pull in the whole package up front.
+    if name == "app":
+        from .cli import app
+
+        return app
+    if name == "ImporterConfig":
+        from .config import ImporterConfig
+
+        return ImporterConfig
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,232 @@
+"""Chunked, paginated ``field:in(...)`` queries for bulk existence checks.
+
+Purpose:
+-------
+Checking thousands of CIDRs, names or addresses one request at a time is an
+N+1 problem, but putting them all into one ``range:in(...)`` filter fails the
+other way: the request line outgrows what BAM (or a proxy in front of it)
+accepts, and a single request only returns its first page of matches.
+
+``in_filters`` splits the values into filters whose URL-encoded length stays
+under ``MAX_FILTER_LENGTH`` (and at most ``MAX_IN_VALUES`` values each).
+``BulkQuery`` runs one request per filter, a bounded number at a time, and
+follows every filter through all of its pages. BulkValidator and the
+Resolver's ``bulk_resolve_*`` helpers share it.
+
+Usage:
+-----
+```python
+query = BulkQuery(client)
+existing = await query.existing(
+    "networks", "range", cidrs, scope=f"configuration.id:{config_id}"
+)
+```
+"""
+
+import asyncio
+from collections.abc import Callable, Iterable
+from typing import Any
+from urllib.parse import quote
+
+import structlog
+
+from ..constants import (
+    BULK_QUERY_CONCURRENCY,
+    MAX_FILTER_LENGTH,
+    MAX_IN_VALUES,
+    MAX_PAGE_SIZE,
+)
+
+logger = structlog.get_logger(__name__)
+
+
+def _encoded_length(text: str) -> int:
+    # quote() with no safe characters encodes at least as much as httpx does,
+    # so this is an upper bound on what the value costs in the request line.
+    return len(quote(text, safe=""))
+
+
+def in_filters(
+    field: str,
+    values: Iterable[Any],
+    scope: str | None = None,
+    quote_values: bool = True,
+    separator: str = ",",
+    max_length: int = MAX_FILTER_LENGTH,
+    max_values: int = MAX_IN_VALUES,
+) -> list[str]:
+    """
+    Split values into ``[scope and ]field:in(...)`` filters of bounded size.
+
+    Args:
+        field: Field to match (e.g. "range", "absoluteName")
+        values: Values to match; duplicates are sent once
+        scope: Filter terms every chunk must also match
+            (e.g. "configuration.id:5")
+        quote_values: Quote and escape values (False for IDs and bare addresses)
+        separator: Separator between values inside ``in(...)``
+        max_length: Longest URL-encoded filter per chunk
+        max_values: Most values per chunk
+
+    Returns:
+        Filters, one per request; empty if there are no values
+
+    Raises:
+        ValueError: If a single value does not fit within max_length
+    """
+    prefix = f"{scope} and {field}:in(" if scope else f"{field}:in("
+    base = _encoded_length(prefix) + _encoded_length(")")
+    separator_length = _encoded_length(separator)
+
+    filters: list[str] = []
+    chunk: list[str] = []
+    length = base
+    for value in dict.fromkeys(values):
+        if quote_values:
+            escaped = str(value).replace("'", "\\'")
+            item = f"'{escaped}'"
+        else:
+            item = str(value)
+        item_length = _encoded_length(item) + (separator_length if chunk else 0)
+        if chunk and (length + item_length > max_length or len(chunk) >= max_values):
+            filters.append(f"{prefix}{separator.join(chunk)})")
+            chunk, length = [], base
+            item_length -= separator_length
+        if base + item_length > max_length:
+            raise ValueError(f"Filter value is too long for one request: {item[:80]}")
+        chunk.append(item)
+        length += item_length
+    if chunk:
+        filters.append(f"{prefix}{separator.join(chunk)})")
+    return filters
+
+
+class BulkQuery:
+    """Run chunked ``in(...)`` queries concurrently, each through all pages."""
+
+    def __init__(
+        self,
+        client: Any,
+        concurrency: int = BULK_QUERY_CONCURRENCY,
+        page_size: int = MAX_PAGE_SIZE,
+        max_length: int = MAX_FILTER_LENGTH,
+        max_values: int = MAX_IN_VALUES,
+    ) -> None:
+        """
+        Initialize query engine.
+
+        Args:
+            client: BAMClient (or a wrapper exposing ``get``)
+            concurrency: Most requests in flight at once
+            page_size: Items per page
+            max_length: Longest URL-encoded filter per request
+            max_values: Most values per ``in(...)`` term
+        """
+        self.client = client
+        self.page_size = page_size
+        self.max_length = max_length
+        self.max_values = max_values
+        self._semaphore = asyncio.Semaphore(max(1, concurrency))
+        self.requests = 0
+
+    async def _fetch_filter(
+        self, endpoint: str, filter_str: str, fields: str | None
+    ) -> list[dict[str, Any]]:
+        """Fetch every page matching one filter."""
+        items: list[dict[str, Any]] = []
+        offset = 0
+        while True:
+            params: dict[str, Any] = {"filter": filter_str, "limit": self.page_size}
+            if fields:
+                params["fields"] = fields
+            if offset:
+                params["offset"] = offset
+            async with self._semaphore:
+                self.requests += 1
+                response = await self.client.get(endpoint, params=params)
+            page = response.get("data") if isinstance(response, dict) else None
+            if not isinstance(page, list):
+                return items
+            items.extend(page)
+            # BAM v2 links the next page only while more results remain
+            if not page or "next" not in (response.get("_links") or {}):
+                return items
+            offset += len(page)
+
+    async def fetch(
+        self,
+        endpoint: str,
+        field: str,
+        values: Iterable[Any],
+        scope: str | None = None,
+        fields: str | None = None,
+        quote_values: bool = True,
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch every resource whose ``field`` is one of ``values``.
+
+        Args:
+            endpoint: Collection endpoint (e.g. "networks")
+            field: Field to match
+            values: Values to match
+            scope: Filter terms every result must also match
+            fields: Sparse fieldset to request
+            quote_values: Quote and escape values
+
+        Returns:
+            Matching resources, across all chunks and pages
+
+        Raises:
+            Exception: The first error of any chunk (other chunks are awaited)
+        """
+        filters = in_filters(
+            field,
+            values,
+            scope=scope,
+            quote_values=quote_values,
+            max_length=self.max_length,
+            max_values=self.max_values,
+        )
+        if not filters:
+            return []
+        results = await asyncio.gather(
+            *(self._fetch_filter(endpoint, f, fields) for f in filters), return_exceptions=True
+        )
+        items: list[dict[str, Any]] = []
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+            items.extend(result)
+        logger.debug(
+            "Bulk query complete",
+            endpoint=endpoint,
+            field=field,
+            chunks=len(filters),
+            matches=len(items),
+        )
+        return items
+
+    async def existing(
+        self,
+        endpoint: str,
+        field: str,
+        values: Iterable[Any],
+        scope: str | None = None,
+        key: Callable[[dict[str, Any]], Any] | None = None,
+    ) -> set[Any]:
+        """
+        Return the keys of the resources matching ``values``.
+
+        Args:
+            endpoint: Collection endpoint
+            field: Field to match
+            values: Values to match
+            scope: Filter terms every result must also match
+            key: Key of a returned resource (default: its ``field`` value)
+
+        Returns:
+            Set of keys of the resources that exist
+        """
+        items = await self.fetch(endpoint, field, values, scope=scope, fields=None)
+        key = key or (lambda item: item.get(field))
+        return {k for item in items if (k := key(item)) is not None}
@@ -56,8 +56,14 @@ from tenacity import (
 )
 
 from ..config import BAMConfig
-from ..constants import BAM_TO_SAFETY_TYPE_MAP, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from ..constants import (
+    BAM_TO_SAFETY_TYPE_MAP,
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    SESSION_REFRESH_FRACTION,
+)
 from ..observability.metrics import get_global_collector
+from ..observability.profiler import SessionProfiler
 from ..utils.exceptions import (
     BAMAPIError,
     BAMAuthenticationError,
@@ -67,12 +73,15 @@ from ..utils.exceptions import (
 )
 from ..validation.safety import PROTECTED_RESOURCE_TYPES
 from .endpoints import BAMEndpoints
+from .lookup import in_lookup, loads, lookup_fields
+from .response_cache import ResponseCache, in_fresh_reads
 from .response_models import (
     AuthenticationResponse,
     BAMResourceResponse,
     ErrorResponse,
     PaginatedResponse,
 )
+from .routing import BAMInstance, InstancePool
 
 logger = structlog.get_logger(__name__)
 
@@ -112,16 +121,30 @@ class BAMClient:
             config: BAM configuration with connection details
         """
         self.config = config
-        self.base_url = f"{config.base_url.rstrip('/')}/api/{config.api_version}"
-
-        # Authentication state
-        self.token: str | None = None  # Bearer token for API calls
-        self.basic_auth_credentials: str | None = None  # For basic auth endpoints
+        self.base_url = self._api_url(config.base_url)
+
+        # Primary (writes) and optional read instances, each with its own session.
+        # token and basic_auth_credentials are the primary's session.
+        self.instances = InstancePool(
+            self.base_url,
+            [self._api_url(url) for url in getattr(config, "read_urls", ())],
+            health_check_interval=config.health_check_interval,
+            read_after_write_seconds=config.read_after_write_seconds,
+        )
+        # Session renewals and health probes running in the background
+        self._background: set[asyncio.Task[None]] = set()
+
+        # GET responses reused while unchanged (see bam/response_cache.py)
+        self.response_cache = (
+            ResponseCache(config.response_cache_ttl, config.response_cache_size)
+            if config.response_cache_size
+            else None
+        )
 
         # HTTP client management
         self._client: httpx.AsyncClient | None = None  # Lazy-loaded
 
-        # CONCURRENCY SAFETY: Authentication Lock
+        # CONCURRENCY SAFETY: Authentication Lock (one per instance)
         #
         # WHY NEEDED: Prevents thundering herd during token expiry
         #
@@ -140,7 +163,7 @@ class BAMClient:
         #
         # IMPLEMENTATION: asyncio.Lock for async/await compatibility
         # (threading.Lock would block the event loop)
-        self._auth_lock = asyncio.Lock()
+        self._auth_lock = self.instances.primary.auth_lock
 
         # Resource type to endpoint mapping
         # Maps BAM API resource types to their REST endpoint paths.
@@ -182,6 +205,9 @@ class BAMClient:
         # Metrics
         self.collector = get_global_collector()
 
+        # Optional per-endpoint timing for `apply --profile`
+        self.profiler: SessionProfiler | None = None
+
     async def __aenter__(self):
         """Context manager entry."""
         await self.authenticate()
@@ -191,12 +217,39 @@ class BAMClient:
         """Context manager exit."""
         await self.close()
 
-    async def close(self):
+    async def close(self) -> None:
         """Close the HTTP client."""
+        for task in list(self._background):
+            task.cancel()
+        if self._background:
+            await asyncio.gather(*self._background, return_exceptions=True)
+            self._background.clear()
         if self._client:
             await self._client.aclose()
             self._client = None
 
+    def _api_url(self, url: str) -> str:
+        """API base URL of a BAM server URL."""
+        return f"{url.rstrip('/')}/api/{self.config.api_version}"
+
+    @property
+    def token(self) -> str | None:
+        """apiToken of the primary's session."""
+        return self.instances.primary.token
+
+    @token.setter
+    def token(self, value: str | None) -> None:
+        self.instances.primary.token = value
+
+    @property
+    def basic_auth_credentials(self) -> str | None:
+        """Basic credentials of the primary's session."""
+        return self.instances.primary.credentials
+
+    @basic_auth_credentials.setter
+    def basic_auth_credentials(self, value: str | None) -> None:
+        self.instances.primary.set_session(self.instances.primary.token, value)
+
     @property
     def client(self) -> httpx.AsyncClient:
         """
@@ -244,17 +297,37 @@ class BAMClient:
         Raises:
             BAMAuthenticationError: If authentication fails.
         """
-        async with self._auth_lock:
+        await self._authenticate_instance(self.instances.primary, force=force)
+
+    async def _authenticate_instance(
+        self, instance: BAMInstance, force: bool = False, stale: str | None = None
+    ) -> None:
+        """
+        Open a session with one BAM instance.
+
+        Args:
+            instance: Instance to authenticate with
+            force: Re-authenticate even if the instance has credentials
+            stale: Credentials known to be expired; if the instance already holds
+                different ones, another task has renewed the session and this is a no-op
+
+        Raises:
+            BAMAuthenticationError: If authentication fails.
+        """
+        async with instance.auth_lock:
             # Double-check pattern: another task may have already authenticated
-            if self.basic_auth_credentials and not force:
+            if instance.credentials and not force:
                 logger.debug("Already authenticated, skipping")
                 return
+            if stale is not None and instance.credentials not in (None, stale):
+                logger.debug("Session already renewed, skipping", url=instance.api_url)
+                return
 
-            logger.info("Authenticating with BAM", url=self.base_url)
+            logger.info("Authenticating with BAM", url=instance.api_url)
             try:
                 # BAM v2 Token Authentication
                 response = await self.client.post(
-                    f"{self.base_url}/{BAMEndpoints.SESSIONS}",
+                    f"{instance.api_url}/{BAMEndpoints.SESSIONS}",
                     json={"username": self.config.username, "password": self.config.password},
                 )
 
@@ -264,8 +337,9 @@ class BAMClient:
                     # Validate response structure for better error detection
                     try:
                         validated = AuthenticationResponse.model_validate(data)
-                        self.token = validated.apiToken
-                        self.basic_auth_credentials = validated.basicAuthenticationCredentials
+                        instance.set_session(
+                            validated.apiToken, validated.basicAuthenticationCredentials
+                        )
                         logger.info("Authentication successful", validated=True)
                     except ValidationError as e:
                         # Fallback to raw data if validation fails (backward compatibility)
@@ -274,8 +348,9 @@ class BAMClient:
                             error=str(e),
                             validation_errors=e.errors(),
                         )
-                        self.token = data.get("apiToken")
-                        self.basic_auth_credentials = data.get("basicAuthenticationCredentials")
+                        instance.set_session(
+                            data.get("apiToken"), data.get("basicAuthenticationCredentials")
+                        )
                         logger.info("Authentication successful", validated=False)
                 else:
                     logger.error(
@@ -287,6 +362,119 @@ class BAMClient:
                 logger.error("Authentication connection error", error=str(e))
                 raise BAMAuthenticationError(f"Connection error during authentication: {e}") from e
 
+    def _spawn(self, coro: Any) -> None:
+        """Run a coroutine in the background until it finishes or the client closes."""
+        task = asyncio.create_task(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def _renew_session(self, instance: BAMInstance) -> None:
+        """Replace a session that is close to expiry while requests keep using it."""
+        try:
+            await self._authenticate_instance(instance, force=True, stale=instance.credentials)
+        except BAMAuthenticationError as e:
+            # The 401 path re-authenticates if the old session does expire
+            logger.warning("Background session renewal failed", url=instance.api_url, error=str(e))
+        finally:
+            instance.refreshing = False
+
+    async def _probe(self, instance: BAMInstance) -> None:
+        """Health check of an unhealthy read instance: a session and a one-item read."""
+        try:
+            await self._authenticate_instance(instance, force=True)
+            response = await self.client.get(
+                f"{instance.api_url}/{BAMEndpoints.CONFIGURATIONS}",
+                params={"limit": 1, "fields": "id"},
+                headers={"Authorization": f"Basic {instance.credentials}"},
+            )
+            if response.status_code == 200:
+                self.instances.mark_success(instance)
+            else:
+                self.instances.mark_failure(instance, f"HTTP {response.status_code}")
+        except (BAMAuthenticationError, httpx.HTTPError) as e:
+            self.instances.mark_failure(instance, str(e))
+        finally:
+            instance.probing = False
+
+    def _maintain(self, instance: BAMInstance) -> None:
+        """Start background session renewal and due health probes."""
+        timeout = self.config.session_timeout
+        if (
+            self.config.auto_renew
+            and timeout > 0
+            and instance.credentials
+            and not instance.refreshing
+            and instance.session_age() >= timeout * SESSION_REFRESH_FRACTION
+        ):
+            instance.refreshing = True
+            self._spawn(self._renew_session(instance))
+        for reader in self.instances.due_for_probe():
+            reader.probing = True
+            self._spawn(self._probe(reader))
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict[str, Any] | None,
+        json: dict[str, Any] | None,
+        headers: dict[str, str] | None,
+    ) -> tuple[BAMInstance, str | None, httpx.Response]:
+        """
+        Send a request to the first instance that answers it.
+
+        Read instances are skipped on connection errors, 5xx responses and
+        404s (a lagging instance may not have the resource yet); the primary
+        always answers last.
+
+        Returns:
+            Instance that answered, the credentials sent and its response
+        """
+        candidates = self.instances.route(method)
+        for instance in candidates:
+            fallback = instance is not candidates[-1]
+            try:
+                if not instance.credentials:
+                    if instance.primary:
+                        await self.authenticate()
+                    else:
+                        await self._authenticate_instance(instance)
+                self._maintain(instance)
+                credentials = instance.credentials
+                req_headers = {
+                    "Authorization": f"Basic {credentials}",
+                    "Content-Type": "application/json",
+                }
+                if headers:
+                    req_headers.update(headers)
+
+                instance.in_flight += 1
+                try:
+                    response = await self.client.request(
+                        method,
+                        f"{instance.api_url}/{endpoint.lstrip('/')}",
+                        params=params,
+                        json=json,
+                        headers=req_headers,
+                    )
+                finally:
+                    instance.in_flight -= 1
+            except (BAMAuthenticationError, httpx.TransportError) as e:
+                if not fallback:
+                    raise
+                self.instances.mark_failure(instance, str(e))
+                continue
+
+            if fallback and response.status_code >= 500:
+                self.instances.mark_failure(instance, f"HTTP {response.status_code}")
+                continue
+            if response.status_code < 500:
+                self.instances.mark_success(instance)
+            if fallback and response.status_code == 404:
+                continue
+            return instance, credentials, response
+        raise BAMAPIError(f"No BAM instance available for {method} {endpoint}")
+
     def _escape_filter_value(self, value: str) -> str:
         """
         Escape a value for use in an API filter string.
@@ -340,16 +528,22 @@ class BAMClient:
             BAMRateLimitError: For 429 Too Many Requests (after max retries)
             ResourceNotFoundError: For 404 Not Found
         """
-        if not self.basic_auth_credentials:
-            await self.authenticate()
-
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        req_headers = {
-            "Authorization": f"Basic {self.basic_auth_credentials}",
-            "Content-Type": "application/json",
-        }
-        if headers:
-            req_headers.update(headers)
+        # Lookups only need IDs and key fields (see bam/lookup.py)
+        if method.upper() == "GET" and in_lookup() and not (params and "fields" in params):
+            params = {**(params or {}), "fields": lookup_fields(endpoint)}
+
+        # Unchanged GET responses are served from the cache or revalidated
+        cache = self.response_cache
+        cache_key = cached = None
+        if cache is not None and method.upper() == "GET":
+            cache_key = cache.key(endpoint, params)
+            cached = None if in_fresh_reads() else cache.get(cache_key)
+            if cached is not None:
+                if cache.fresh(cached):
+                    self._record_cache("hits")
+                    return loads(cached.content)
+                if cached.validated:
+                    headers = {**(headers or {}), **cached.conditional_headers()}
 
         # Metrics
         self.collector.backend.increment("bam_api_requests_total", tags={"method": method})
@@ -358,13 +552,18 @@ class BAMClient:
         start_time = asyncio.get_event_loop().time()
 
         try:
-            response = await self.client.request(
-                method, url, params=params, json=json, headers=req_headers
+            instance, credentials, response = await self._send(
+                method, endpoint, params, json, headers
             )
+            if cache is not None and cache_key is None:
+                # A write, even a failed one, may change what cached GETs returned
+                cache.invalidate(method, endpoint)
 
             # Record latency
             duration = (asyncio.get_event_loop().time() - start_time) * 1000
             self.collector.backend.timing("bam_api_latency_ms", duration, tags={"method": method})
+            if self.profiler is not None:
+                self.profiler.record_request(method, endpoint, response.status_code, duration)
 
             # Handle Rate Limiting with proper Retry-After support
             if response.status_code == 429:
@@ -444,7 +643,9 @@ class BAMClient:
                 try:
                     # Force re-authentication since we received 401
                     # WHY force=True: Skip the "already authenticated" check in authenticate()
-                    await self.authenticate(force=True)
+                    # WHY stale: requests that got the same 401 find the session already
+                    # renewed and retry at once instead of re-authenticating one by one
+                    await self._authenticate_instance(instance, force=True, stale=credentials)
                 except BAMAuthenticationError as e:
                     # Re-authentication itself failed with invalid credentials
                     # WHY NO RETRY: If POST /sessions fails, credentials are definitely wrong
@@ -457,6 +658,16 @@ class BAMClient:
                     method, endpoint, params=params, json=json, headers=headers, _auth_retry=True
                 )
 
+            if (
+                response.status_code == 304
+                and cache is not None
+                and cache_key is not None
+                and cached is not None
+            ):
+                cache.revalidated(cache_key)
+                self._record_cache("revalidated")
+                return loads(cached.content)
+
             # Get server message for exceptions
             message = response.text
             try:
@@ -509,11 +720,35 @@ class BAMClient:
             # Parse response
             if response.status_code == 204:
                 return None
-            return response.json()
+            data = self._decode(response)
+            if cache is not None and cache_key is not None:
+                self._record_cache("misses")
+                if response.status_code == 200 and isinstance(response.content, bytes):
+                    cache.store(cache_key, response.content, response.headers)
+            return data
 
         except httpx.HTTPError as e:
             raise BAMAPIError(f"HTTP request failed: {e}") from e
 
+    def _record_cache(self, result: str) -> None:
+        """Count a response cache lookup ("hits", "revalidated" or "misses")."""
+        if self.response_cache is not None:
+            self.response_cache.record(result)
+        self.collector.backend.increment("bam_response_cache_total", tags={"result": result})
+        if self.profiler is not None:
+            self.profiler.record_cache(result)
+
+    @staticmethod
+    def _decode(response: httpx.Response) -> Any:
+        """Decode a JSON response body, with orjson when it is installed."""
+        content = response.content
+        if isinstance(content, bytes):
+            try:
+                return loads(content)
+            except ValueError:
+                pass  # Not UTF-8 or not JSON: let httpx decode it or raise
+        return response.json()
+
     async def get(self, endpoint: str, params: dict[str, Any] | None = None) -> Any:
         """Helper for GET requests."""
         return await self.request("GET", endpoint, params=params)
@@ -542,7 +777,7 @@ class BAMClient:
         Returns:
             Validated response data (or raw data if validation fails)
         """
-        if not isinstance(data, dict):
+        if not isinstance(data, dict) or in_lookup():
             return data
 
         try:
@@ -577,7 +812,7 @@ class BAMClient:
         Returns:
             Validated response data (or raw data if validation fails)
         """
-        if not isinstance(data, dict):
+        if not isinstance(data, dict) or in_lookup():
             return data
 
         try:
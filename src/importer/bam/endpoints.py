@@ -176,6 +176,11 @@ class BAMEndpoints:
     ZONE_TAGS: str = "zones/{zone_id}/tags"
     ADDRESS_TAGS: str = "addresses/{address_id}/tags"
 
+    # -------------------------------------------------------------------------
+    # Transactions (audit log of changes, used for incremental snapshot refresh)
+    # -------------------------------------------------------------------------
+    TRANSACTIONS: str = "transactions"
+
     # -------------------------------------------------------------------------
     # Access Rights
     # -------------------------------------------------------------------------
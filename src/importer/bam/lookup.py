@@ -0,0 +1,96 @@
+"""Lookup request profile: sparse fields and fast decoding for ID lookups.
+
+Purpose:
+-------
+Most GETs the importer sends are lookups: the resolver turning a path into
+an ID, the validator checking that a CIDR or zone exists, the executor
+finding the resource behind a 409. Their callers read the ID and the field
+they matched on, but BAM returns every property and the HAL ``_links`` of
+each entity, and the client decodes all of it.
+
+Inside ``lookup_profile()``, BAMClient GETs without an explicit ``fields``
+parameter ask only for ``LOOKUP_FIELDS`` of the collection (ID, type, name
+and the collection's key field), and response-model validation is skipped.
+The profile is a context variable, so it covers the awaits of the task (and
+tasks it starts) and nothing else: lookups that return entities to code
+which reads other fields (operation factory, state loader, exporter) are
+left out by not entering it.
+
+``loads`` decodes JSON with orjson when it is installed (``pip install
+bluecat-csv-importer[fast]``) and with the standard library otherwise.
+
+Usage:
+-----
+```python
+with lookup_profile():
+    config_id = (await client.get_configuration_by_name("Default"))["id"]
+```
+"""
+
+import json
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+_loads: Callable[[bytes], Any]
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # Optional: pip install bluecat-csv-importer[fast]
+    _loads = json.loads
+
+# Key field per collection, requested next to id, type and name
+_KEY_FIELDS = {
+    "blocks": "range",
+    "networks": "range",
+    "ranges": "range",
+    "addresses": "address",
+    "zones": "absoluteName",
+    "resourceRecords": "absoluteName",
+    "locations": "code",
+}
+_BASE_FIELDS = "id,type,name"
+
+LOOKUP_FIELDS: dict[str, str] = {
+    collection: f"{_BASE_FIELDS},{key}" for collection, key in _KEY_FIELDS.items()
+}
+
+_active: ContextVar[bool] = ContextVar("bam_lookup_profile", default=False)
+
+
+@contextmanager
+def lookup_profile() -> Iterator[None]:
+    """Treat BAM GETs in this context as ID lookups."""
+    token = _active.set(True)
+    try:
+        yield
+    finally:
+        _active.reset(token)
+
+
+def in_lookup() -> bool:
+    """Whether the current context is inside lookup_profile()."""
+    return _active.get()
+
+
+def lookup_fields(endpoint: str) -> str:
+    """
+    Fields a lookup on an endpoint needs.
+
+    Args:
+        endpoint: API path, e.g. "configurations/1/blocks" or "zones/7"
+
+    Returns:
+        Comma-separated fields for the collection the endpoint addresses
+    """
+    path = endpoint.split("?", 1)[0]
+    segments = [s for s in path.strip("/").split("/") if s and not s.isdigit()]
+    collection = segments[-1] if segments else ""
+    return LOOKUP_FIELDS.get(collection, _BASE_FIELDS)
+
+
+def loads(content: bytes) -> Any:
+    """Decode a JSON response body, with orjson when available."""
+    return _loads(content)
@@ -0,0 +1,1248 @@
+"""Local stand-in for the BAM REST API v2 surface used by BAMClient.
+
+Purpose:
+-------
+Unit tests mock BAMClient methods, so HTTP, pagination, authentication and
+rate limiting are never exercised end to end. MockBAMServer is a small,
+stateful HTTP server that speaks enough of REST v2 for the importer pipeline
+to run unmodified against it:
+
+- POST /sessions (apiToken + basicAuthenticationCredentials, 401 on bad creds)
+- Generic collections: configurations, views, blocks, networks, addresses,
+  zones, resourceRecords, ranges, ... addressed as ``{collection}``,
+  ``{collection}/{id}`` and ``{collection}/{id}/{child_collection}``
+- BAM filter syntax used by the client (``name:'x'``, ``range:contains('ip')``,
+  ``configuration.id:1 and range:'10.0.0.0/8'``, ``in(...)``, ``like(...)``)
+- ``limit``/``offset`` paging with HAL ``_links.next``
+- ``fields`` projection
+- ``ETag``/``If-None-Match`` revalidation of GETs with ``MockBAMState(etags=True)``
+- ``transactions`` log (one ADD/UPDATE/DELETE entry per API mutation, filterable
+  on ``creationDateTime``) for incremental snapshot refresh
+- 409 on duplicates, on networks overlapping an existing network in the same
+  configuration and on IP resources outside their parent's range; 404 on
+  unknown IDs, 204 on DELETE
+
+Fault Injection:
+---------------
+MockBAMFaults adds per-request latency with jitter, random 500 errors and
+random 429 responses carrying a Retry-After header. Faults are drawn from a
+seeded RNG so runs are reproducible.
+
+Read Instances:
+--------------
+``MockBAMState(primary=...)`` is a read instance: it serves API reads from
+the primary's resources with its own sessions, faults and counters, and
+refuses writes. MockBAMCluster runs a primary and N read instances, each on
+its own port, for BAMClient's read routing (``bam.read_urls``).
+
+Admin Endpoints:
+---------------
+Outside /api/v2 the server exposes helpers so it can run in another process:
+- GET  /_mock/stats            request counters per method and endpoint family
+- POST /_mock/stats/reset      reset counters
+- POST /_mock/faults           replace fault settings (JSON body)
+- POST /_mock/sessions/expire  invalidate issued credentials (forces re-auth)
+
+Usage:
+-----
+```python
+with MockBAMServer(faults=MockBAMFaults(latency_ms=5)) as server:
+    client = BAMClient(BAMConfig(base_url=server.base_url, username="admin",
+                                 password="admin", verify_ssl=False))
+    await client.get_configuration_by_name("Default")
+```
+"""
+
+import argparse
+import base64
+import bisect
+import fnmatch
+import hashlib
+import ipaddress
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlencode, urlparse
+
+import structlog
+
+from ..constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from ..utils.ipnet import try_parse_address, try_parse_network
+
+logger = structlog.get_logger(__name__)
+
+API_PREFIX = "/api/v2/"
+
+# Key field that makes a resource unique within its scope, per collection
+_IDENTITY_FIELDS = {
+    "blocks": "range",
+    "networks": "range",
+    "addresses": "address",
+    "ranges": "range",
+    "zones": "absoluteName",
+    "resourceRecords": "absoluteName",
+}
+
+# Collections whose identity is unique per configuration rather than per parent
+_CONFIG_SCOPED = {"blocks", "networks", "addresses"}
+
+# Record types that may not share an absolute name (TXT/MX/SRV sets may)
+_UNIQUE_RECORD_TYPES = {"HostRecord", "AliasRecord"}
+
+# Collections whose CIDRs may not overlap within a configuration
+_NON_OVERLAPPING = {"networks"}
+
+_FILTER_TERM = re.compile(r"^\s*([\w.]+)\s*:\s*(?:(\w+)\((.*)\)|(.*?))\s*$", re.DOTALL)
+
+
+@dataclass
+class MockBAMFaults:
+    """Fault injection settings for MockBAMServer."""
+
+    latency_ms: float = 0.0  # Base latency added to every API request
+    jitter_ms: float = 0.0  # Uniform random latency added on top of latency_ms
+    error_rate: float = 0.0  # Probability of a 500 response
+    rate_limit_rate: float = 0.0  # Probability of a 429 response
+    retry_after: int = 0  # Retry-After header value (seconds) on 429
+    page_size: int = DEFAULT_PAGE_SIZE  # Page size when the client sends no limit
+    seed: int | None = None  # RNG seed for reproducible fault sequences
+
+
+@dataclass
+class MockResponse:
+    """Response produced by MockBAMState.handle."""
+
+    status: int
+    body: Any = None
+    headers: dict[str, str] = field(default_factory=dict)
+
+
+class MockBAMState:
+    """In-memory BAM resource store with REST v2 request dispatch.
+
+    Transport independent: MockBAMServer feeds it HTTP requests, but it can be
+    driven directly through ``handle``.
+    """
+
+    def __init__(
+        self,
+        username: str = "admin",
+        password: str = "admin",
+        configurations: tuple[str, ...] = ("Default",),
+        views: tuple[str, ...] = ("Internal", "External"),
+        faults: MockBAMFaults | None = None,
+        primary: "MockBAMState | None" = None,
+        etags: bool = False,
+    ) -> None:
+        """
+        Initialize state and seed configurations and views.
+
+        Args:
+            username: Accepted username for POST /sessions
+            password: Accepted password for POST /sessions
+            configurations: Configuration names to create
+            views: View names to create in every configuration
+            faults: Fault injection settings
+            primary: Make this a read instance: API reads are served from the
+                primary's resources and writes are refused with 403. Sessions,
+                faults and counters stay per instance; nothing is seeded.
+            etags: Send an ETag with GET responses and answer a matching
+                If-None-Match with 304
+        """
+        self.username = username
+        self.password = password
+        self.primary = primary
+        self.etags = etags
+        self.faults = faults or MockBAMFaults()
+        self._rng = random.Random(self.faults.seed)
+        self._lock = threading.RLock()
+
+        self._next_id = 1
+        self.entities: dict[int, dict[str, Any]] = {}
+        self._parent: dict[int, int | None] = {}
+        self._collection: dict[int, str] = {}
+        self._children: dict[tuple[int | None, str], list[int]] = defaultdict(list)
+        self._child_collections: dict[int | None, set[str]] = defaultdict(set)
+        self._by_collection: dict[str, dict[int, None]] = defaultdict(dict)
+        # (collection, identity value) -> IDs, keeps lookups and 409 checks O(1)
+        self._identity: dict[tuple[str, Any], set[int]] = defaultdict(set)
+        # (configuration id, collection, IP version) -> sorted (first, last, id)
+        # of non-overlapping CIDRs, so overlap checks are two neighbour probes
+        self._ranges: dict[tuple[int | None, str, int], list[tuple[int, int, int]]] = defaultdict(
+            list
+        )
+        self._credentials: set[str] = set()
+        # Audit log of API mutations, served as the transactions collection
+        self.transactions: list[dict[str, Any]] = []
+
+        self.stats: dict[str, Any] = {}
+        self.reset_stats()
+
+        for config_name in configurations if primary is None else ():
+            config = self.add_entity(
+                None, "configurations", {"type": "Configuration", "name": config_name}
+            )
+            for view_name in views:
+                self.add_entity(config["id"], "views", {"type": "View", "name": view_name})
+
+    # ------------------------------------------------------------------
+    # Store
+    # ------------------------------------------------------------------
+
+    def add_entity(
+        self,
+        parent_id: int | None,
+        collection: str,
+        payload: dict[str, Any],
+        entity_id: int | None = None,
+    ) -> dict[str, Any]:
+        """
+        Insert a resource under a parent.
+
+        Args:
+            parent_id: Parent resource ID (None for top-level configurations)
+            collection: Collection name (e.g. "networks")
+            payload: Resource body as sent by the client
+            entity_id: ID to assign (e.g. when loading an export); the next free
+                ID if omitted
+
+        Returns:
+            The stored resource
+
+        Raises:
+            ValueError: If a resource with the same identity already exists, or
+                a network overlaps an existing network in the configuration
+        """
+        with self._lock:
+            entity = {k: v for k, v in payload.items() if not k.startswith("_")}
+            entity.setdefault("properties", {})
+
+            if collection == "zones" and "absoluteName" in entity:
+                entity["absoluteName"] = str(entity["absoluteName"]).rstrip(".")
+                entity.setdefault("name", entity["absoluteName"].split(".")[0])
+            elif collection == "resourceRecords":
+                zone = self.entities.get(parent_id) if parent_id else None
+                name = str(entity.get("name") or "").rstrip(".")
+                zone_name = zone.get("absoluteName", "") if zone else ""
+                if zone_name and name != zone_name and not name.endswith(f".{zone_name}"):
+                    name = f"{name}.{zone_name}" if name else zone_name
+                entity["absoluteName"] = name
+
+            for ip_field in ("range", "address"):
+                if ip_field in entity and collection in ("blocks", "networks", "addresses"):
+                    entity[ip_field] = _normalize_ip_value(entity[ip_field])
+
+            config = self._configuration_of(parent_id)
+            if config is not None:
+                entity["configuration"] = {
+                    "id": config["id"],
+                    "type": "Configuration",
+                    "name": config.get("name"),
+                }
+
+            if collection in ("zones", "resourceRecords"):
+                view = self._view_of(parent_id)
+                if view is not None:
+                    entity["view"] = {"id": view["id"], "type": "View", "name": view.get("name")}
+
+            key = _identity_key(collection, entity)
+            self._check_unique(parent_id, collection, entity, config, key)
+            span = self._check_overlap(collection, entity, config)
+
+            if entity_id is None:
+                entity_id = self._next_id
+            elif entity_id in self.entities:
+                raise ValueError(f"Resource ID {entity_id} already exists")
+            self._next_id = max(self._next_id, entity_id + 1)
+            entity["id"] = entity_id
+            entity["_links"] = {"self": {"href": f"{API_PREFIX}{collection}/{entity_id}"}}
+            if parent_id is not None:
+                entity["_links"]["up"] = {
+                    "href": f"{API_PREFIX}{self._collection[parent_id]}/{parent_id}"
+                }
+
+            self.entities[entity_id] = entity
+            self._parent[entity_id] = parent_id
+            self._collection[entity_id] = collection
+            self._children[(parent_id, collection)].append(entity_id)
+            self._child_collections[parent_id].add(collection)
+            self._by_collection[collection][entity_id] = None
+            if key is not None:
+                self._identity[(collection, key)].add(entity_id)
+            if span is not None:
+                bisect.insort(self._ranges[span[0]], (span[1], span[2], entity_id))
+            return entity
+
+    def delete_entity(self, entity_id: int) -> None:
+        """Delete a resource and everything below it."""
+        with self._lock:
+            stack = [entity_id]
+            doomed = []
+            while stack:
+                current = stack.pop()
+                doomed.append(current)
+                for collection in self._child_collections.get(current, ()):
+                    stack.extend(self._children.get((current, collection), ()))
+            for current in doomed:
+                parent = self._parent.pop(current, None)
+                collection = self._collection.pop(current)
+                entity = self.entities.pop(current)
+                siblings = self._children.get((parent, collection))
+                if siblings and current in siblings:
+                    siblings.remove(current)
+                for child_collection in self._child_collections.pop(current, ()):
+                    self._children.pop((current, child_collection), None)
+                self._by_collection[collection].pop(current, None)
+                key = _identity_key(collection, entity)
+                if key is not None:
+                    self._identity[(collection, key)].discard(current)
+                if collection in _NON_OVERLAPPING:
+                    self._remove_range(collection, entity, current)
+
+    def find(self, collection: str, **match: Any) -> list[dict[str, Any]]:
+        """Return resources of a collection whose fields equal ``match``."""
+        with self._lock:
+            entities = (self.entities[eid] for eid in self._by_collection.get(collection, {}))
+            return [e for e in entities if all(e.get(k) == v for k, v in match.items())]
+
+    def _configuration_of(self, entity_id: int | None) -> dict[str, Any] | None:
+        """Return the configuration owning a resource (the resource itself for configurations)."""
+        entity = self.entities.get(entity_id) if entity_id is not None else None
+        ref = entity.get("configuration") if entity else None
+        if ref and ref.get("id") in self.entities:
+            return self.entities[ref["id"]]
+        # Walk up the parent chain
+        while entity_id is not None:
+            if self._collection.get(entity_id) == "configurations":
+                return self.entities[entity_id]
+            entity_id = self._parent.get(entity_id)
+        return None
+
+    def _view_of(self, entity_id: int | None) -> dict[str, Any] | None:
+        """Return the view a DNS resource belongs to (the resource itself for views)."""
+        while entity_id is not None:
+            if self._collection.get(entity_id) == "views":
+                return self.entities[entity_id]
+            entity_id = self._parent.get(entity_id)
+        return None
+
+    def _check_unique(
+        self,
+        parent_id: int | None,
+        collection: str,
+        entity: dict[str, Any],
+        config: dict[str, Any] | None,
+        key: Any,
+    ) -> None:
+        """Raise ValueError if the resource duplicates an existing one (``key`` is its identity)."""
+        if key is None:
+            return
+        if collection == "resourceRecords" and entity.get("type") not in _UNIQUE_RECORD_TYPES:
+            return
+
+        for existing_id in self._identity.get((collection, key), ()):
+            existing = self.entities[existing_id]
+            if existing.get("type") != entity.get("type"):
+                continue
+            if collection in _CONFIG_SCOPED and config is not None:
+                same_scope = existing.get("configuration", {}).get("id") == config["id"]
+            else:
+                same_scope = self._parent.get(existing_id) == parent_id
+            if same_scope:
+                raise ValueError(f"{entity.get('type') or collection} {key} already exists")
+
+    def _check_overlap(
+        self, collection: str, entity: dict[str, Any], config: dict[str, Any] | None
+    ) -> tuple[tuple[int | None, str, int], int, int] | None:
+        """
+        Raise ValueError if a network overlaps another network in its configuration.
+
+        Returns:
+            (index key, first, last) to record once the resource is stored, or
+            None if the resource is not range-indexed
+        """
+        if collection not in _NON_OVERLAPPING:
+            return None
+        net = try_parse_network(entity.get("range"))
+        if net is None:
+            return None
+        key = (config["id"] if config else None, collection, net.version)
+        spans = self._ranges.get(key)
+        if spans:
+            i = bisect.bisect_left(spans, (net.first,))
+            for first, last, existing_id in spans[max(i - 1, 0) : i + 1]:
+                if first <= net.last and net.first <= last:
+                    existing = self.entities[existing_id]
+                    raise ValueError(
+                        f"{entity.get('type') or collection} {net.cidr} overlaps "
+                        f"{existing.get('type') or collection} {existing.get('range')}"
+                    )
+        return key, net.first, net.last
+
+    def _remove_range(self, collection: str, entity: dict[str, Any], entity_id: int) -> None:
+        """Drop a deleted network from the overlap index."""
+        net = try_parse_network(entity.get("range"))
+        if net is None:
+            return
+        config_id = entity.get("configuration", {}).get("id")
+        spans = self._ranges.get((config_id, collection, net.version))
+        if spans:
+            i = bisect.bisect_left(spans, (net.first, net.last, entity_id))
+            if i < len(spans) and spans[i][2] == entity_id:
+                del spans[i]
+
+    # ------------------------------------------------------------------
+    # Export and import
+    # ------------------------------------------------------------------
+
+    def export_entities(self) -> list[dict[str, Any]]:
+        """
+        Return every resource with its parent and collection, parents first.
+
+        The result is JSON-serializable and can be loaded with
+        ``load_entities`` (or ``MockBAMState.from_entities``).
+        """
+        with self._lock:
+            records = []
+            stack: list[tuple[int | None, str, int]] = [
+                (None, collection, eid)
+                for collection in sorted(self._child_collections.get(None, ()))
+                for eid in self._children.get((None, collection), ())
+            ]
+            stack.reverse()
+            while stack:
+                parent_id, collection, entity_id = stack.pop()
+                entity = self.entities[entity_id]
+                records.append(
+                    {
+                        "id": entity_id,
+                        "parent_id": parent_id,
+                        "collection": collection,
+                        "data": {
+                            k: v
+                            for k, v in entity.items()
+                            if k not in ("id", "_links", "configuration")
+                        },
+                    }
+                )
+                children = [
+                    (entity_id, child_collection, child_id)
+                    for child_collection in sorted(self._child_collections.get(entity_id, ()))
+                    for child_id in self._children.get((entity_id, child_collection), ())
+                ]
+                stack.extend(reversed(children))
+            return records
+
+    def load_entities(self, records: list[dict[str, Any]]) -> int:
+        """
+        Insert exported resources, keeping their IDs.
+
+        Records must list parents before children (``export_entities`` order).
+
+        Args:
+            records: Records as produced by ``export_entities``
+
+        Returns:
+            Number of resources loaded
+
+        Raises:
+            ValueError: On duplicate IDs or conflicting resources
+            LookupError: If a record's parent has not been loaded
+        """
+        with self._lock:
+            for record in records:
+                parent_id = record.get("parent_id")
+                if parent_id is not None and parent_id not in self.entities:
+                    raise LookupError(
+                        f"Parent {parent_id} of resource {record['id']} has not been loaded"
+                    )
+                self.add_entity(
+                    parent_id, record["collection"], record["data"], entity_id=record["id"]
+                )
+            return len(records)
+
+    @classmethod
+    def from_entities(cls, records: list[dict[str, Any]], **kwargs: Any) -> "MockBAMState":
+        """
+        Build a state holding exactly the given resources.
+
+        Args:
+            records: Records as produced by ``export_entities``
+            **kwargs: Other constructor arguments (username, password, faults)
+
+        Returns:
+            MockBAMState
+        """
+        state = cls(configurations=(), views=(), **kwargs)
+        state.load_entities(records)
+        return state
+
+    # ------------------------------------------------------------------
+    # Stats and faults
+    # ------------------------------------------------------------------
+
+    def reset_stats(self) -> None:
+        """Reset request counters."""
+        with self._lock:
+            self.stats = {
+                "total_requests": 0,
+                "rate_limited": 0,
+                "errors_injected": 0,
+                "unauthorized": 0,
+                "not_modified": 0,
+                "by_endpoint": defaultdict(int),
+            }
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return a JSON-serializable copy of the request counters."""
+        with self._lock:
+            stats = dict(self.stats)
+            stats["by_endpoint"] = dict(self.stats["by_endpoint"])
+            return stats
+
+    def set_faults(self, faults: MockBAMFaults) -> None:
+        """Replace fault injection settings."""
+        with self._lock:
+            self.faults = faults
+            self._rng = random.Random(faults.seed)
+
+    def expire_sessions(self) -> None:
+        """Invalidate all issued credentials."""
+        with self._lock:
+            self._credentials.clear()
+
+    def _draw(self) -> tuple[float, bool, bool]:
+        """Draw latency and fault decisions for one request."""
+        with self._lock:
+            faults = self.faults
+            delay = faults.latency_ms
+            if faults.jitter_ms:
+                delay += self._rng.uniform(0, faults.jitter_ms)
+            rate_limited = (
+                faults.rate_limit_rate > 0 and self._rng.random() < faults.rate_limit_rate
+            )
+            errored = faults.error_rate > 0 and self._rng.random() < faults.error_rate
+            return delay / 1000.0, rate_limited, errored
+
+    # ------------------------------------------------------------------
+    # Request dispatch
+    # ------------------------------------------------------------------
+
+    def handle(
+        self,
+        method: str,
+        path: str,
+        query: dict[str, str],
+        body: Any = None,
+        headers: dict[str, str] | None = None,
+        sleep: bool = True,
+    ) -> MockResponse:
+        """
+        Handle one API request.
+
+        Args:
+            method: HTTP method
+            path: Path relative to /api/v2/ (e.g. "blocks/12/networks")
+            query: Query parameters
+            body: Decoded JSON body
+            headers: Request headers (case-insensitive keys not required)
+            sleep: Whether to apply injected latency
+
+        Returns:
+            MockResponse
+        """
+        method = method.upper()
+        segments = [s for s in path.strip("/").split("/") if s]
+
+        delay, rate_limited, errored = self._draw()
+        if sleep and delay > 0:
+            time.sleep(delay)
+
+        with self._lock:
+            self.stats["total_requests"] += 1
+            self.stats["by_endpoint"][f"{method} {_endpoint_family(segments)}"] += 1
+
+        if rate_limited:
+            with self._lock:
+                self.stats["rate_limited"] += 1
+            return MockResponse(
+                429,
+                {"message": "Too many requests"},
+                {"Retry-After": str(self.faults.retry_after)},
+            )
+        if errored:
+            with self._lock:
+                self.stats["errors_injected"] += 1
+            return MockResponse(500, {"message": "Injected server error"})
+
+        if segments == ["sessions"] and method == "POST":
+            return self._create_session(body or {})
+
+        if not self._is_authorized(headers or {}):
+            with self._lock:
+                self.stats["unauthorized"] += 1
+            return MockResponse(401, {"message": "Unauthorized"})
+
+        store = self.primary or self
+        if store is not self and method != "GET":
+            return MockResponse(403, {"message": "Read-only instance", "code": "ReadOnly"})
+        try:
+            response = store._dispatch(method, segments, query, body)
+        except ValueError as e:
+            return MockResponse(409, {"message": str(e), "code": "DuplicateObject"})
+        except LookupError as e:
+            return MockResponse(404, {"message": str(e), "code": "ObjectNotFound"})
+        if self.etags and method == "GET" and response.status == 200:
+            return self._conditional(response, headers or {})
+        return response
+
+    def _conditional(self, response: MockResponse, headers: dict[str, str]) -> MockResponse:
+        """Tag a GET response with an ETag; 304 if the client already has it."""
+        digest = hashlib.sha1(
+            json.dumps(response.body, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        etag = f'"{digest[:16]}"'
+        if next((v for k, v in headers.items() if k.lower() == "if-none-match"), None) == etag:
+            with self._lock:
+                self.stats["not_modified"] += 1
+            return MockResponse(304, None, {"ETag": etag})
+        response.headers["ETag"] = etag
+        return response
+
+    def _create_session(self, body: dict[str, Any]) -> MockResponse:
+        """Issue credentials for POST /sessions."""
+        if body.get("username") != self.username or body.get("password") != self.password:
+            return MockResponse(401, {"message": "Invalid username or password"})
+        token = uuid.uuid4().hex
+        credentials = base64.b64encode(f"{self.username}:{token}".encode()).decode()
+        with self._lock:
+            self._credentials.add(credentials)
+        return MockResponse(
+            201,
+            {
+                "type": "UserSession",
+                "apiToken": token,
+                "basicAuthenticationCredentials": credentials,
+            },
+        )
+
+    def _is_authorized(self, headers: dict[str, str]) -> bool:
+        """Check the Basic credentials issued by POST /sessions."""
+        auth = next((v for k, v in headers.items() if k.lower() == "authorization"), "")
+        if not auth.startswith("Basic "):
+            return False
+        with self._lock:
+            return auth[len("Basic ") :] in self._credentials
+
+    def _dispatch(
+        self, method: str, segments: list[str], query: dict[str, str], body: Any
+    ) -> MockResponse:
+        """Route a request to collection or entity handlers."""
+        if segments == ["transactions"] and method == "GET":
+            terms = _parse_filter(query["filter"]) if query.get("filter") else []
+            with self._lock:
+                items = [t for t in self.transactions if all(_match_term(t, x) for x in terms)]
+            return self._page(items, query, segments)
+
+        if len(segments) == 1:
+            collection = segments[0]
+            if method == "GET":
+                return self._list(None, collection, query, segments)
+            if method == "POST":
+                created = self.add_entity(None, collection, body or {})
+                self._record_transaction("ADD", created)
+                return MockResponse(201, created)
+
+        elif len(segments) == 2 and segments[1].isdigit():
+            entity_id = int(segments[1])
+            entity = self.entities.get(entity_id)
+            if entity is None or self._collection.get(entity_id) != segments[0]:
+                raise LookupError(f"{segments[0]} {entity_id} not found")
+            if method == "GET":
+                return MockResponse(200, _project(entity, query.get("fields")))
+            if method in ("PATCH", "PUT"):
+                with self._lock:
+                    updates = {k: v for k, v in (body or {}).items() if k not in ("id", "_links")}
+                    if method == "PUT":
+                        preserved = {
+                            k: entity[k] for k in ("id", "_links", "configuration") if k in entity
+                        }
+                        entity.clear()
+                        entity.update(preserved)
+                    entity.update(updates)
+                    self._record_transaction("UPDATE", entity)
+                return MockResponse(200, entity)
+            if method == "DELETE":
+                self._record_transaction("DELETE", entity)
+                self.delete_entity(entity_id)
+                return MockResponse(204)
+
+        elif len(segments) == 3 and segments[1].isdigit():
+            parent_id = int(segments[1])
+            if parent_id not in self.entities:
+                raise LookupError(f"{segments[0]} {parent_id} not found")
+            collection = segments[2]
+            if method == "GET":
+                return self._list(parent_id, collection, query, segments)
+            if method == "POST":
+                self._check_within_parent(parent_id, body or {})
+                created = self.add_entity(parent_id, collection, body or {})
+                self._record_transaction("ADD", created)
+                return MockResponse(201, created)
+
+        return MockResponse(405, {"message": f"{method} /{'/'.join(segments)} not supported"})
+
+    def _record_transaction(self, operation: str, entity: dict[str, Any]) -> None:
+        """Append a single-operation entry to the transaction log."""
+        with self._lock:
+            self.transactions.append(
+                {
+                    "id": len(self.transactions) + 1,
+                    "type": "Transaction",
+                    "creationDateTime": datetime.now(UTC).isoformat(timespec="microseconds"),
+                    "operations": [
+                        {
+                            "type": "Operation",
+                            "operationType": operation,
+                            "resource": {
+                                "id": entity["id"],
+                                "type": entity.get("type"),
+                                "name": entity.get("name"),
+                            },
+                        }
+                    ],
+                }
+            )
+
+    def _check_within_parent(self, parent_id: int, body: dict[str, Any]) -> None:
+        """Reject IP resources outside their parent's range (BAM returns 409)."""
+        parent_range = self.entities[parent_id].get("range")
+        child_value = body.get("range") or body.get("address")
+        if not parent_range or not child_value or "-" in str(parent_range):
+            return
+        parent_net = try_parse_network(str(parent_range))
+        child_net = try_parse_network(str(child_value))
+        if parent_net is None or child_net is None:
+            return
+        if not parent_net.contains(child_net):
+            raise ValueError(f"{child_value} is not within parent range {parent_range}")
+
+    def _list(
+        self,
+        parent_id: int | None,
+        collection: str,
+        query: dict[str, str],
+        segments: list[str],
+    ) -> MockResponse:
+        """List a collection with filtering, projection and HAL paging."""
+        terms = _parse_filter(query["filter"]) if query.get("filter") else []
+
+        with self._lock:
+            if parent_id is None:
+                ids: Any = self._by_collection.get(collection, {})
+            else:
+                ids = self._children.get((parent_id, collection), [])
+
+            # Narrow through the identity index when the filter pins the key field
+            key_field = _IDENTITY_FIELDS.get(collection, "name")
+            for term_field, operator, value in terms:
+                if term_field == key_field and operator == "eq":
+                    indexed = self._identity.get((collection, _identity_value(key_field, value)))
+                    ids = [i for i in ids if i in indexed] if indexed else []
+                    break
+
+            items = [self.entities[eid] for eid in ids]
+
+        if terms:
+            items = [e for e in items if all(_match_term(e, term) for term in terms)]
+
+        return self._page(items, query, segments)
+
+    def _page(
+        self, items: list[dict[str, Any]], query: dict[str, str], segments: list[str]
+    ) -> MockResponse:
+        """Order and page items, with projection and HAL ``next`` link."""
+        order_by = query.get("orderBy")
+        if order_by:
+            descending = order_by.startswith("desc(")
+            key_field = order_by.removeprefix("desc(").removeprefix("asc(").rstrip(")")
+            items = sorted(items, key=lambda e: str(_get_field(e, key_field)), reverse=descending)
+
+        total = len(items)
+        limit = min(int(query.get("limit") or self.faults.page_size), MAX_PAGE_SIZE)
+        offset = int(query.get("offset") or 0)
+        page = items[offset : offset + limit]
+
+        path = "/".join(segments)
+        links: dict[str, Any] = {
+            "self": {"href": f"{API_PREFIX}{path}?{urlencode({**query, 'offset': offset})}"}
+        }
+        if offset + limit < total:
+            next_query = {**query, "limit": limit, "offset": offset + limit}
+            links["next"] = {"href": f"{API_PREFIX}{path}?{urlencode(next_query)}"}
+
+        fields = query.get("fields")
+        return MockResponse(
+            200,
+            {
+                "count": len(page),
+                "totalCount": total,
+                "data": [_project(e, fields) for e in page],
+                "_links": links,
+            },
+        )
+
+
+class MockBAMServer:
+    """Threaded HTTP server exposing MockBAMState."""
+
+    def __init__(
+        self,
+        state: MockBAMState | None = None,
+        faults: MockBAMFaults | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        """
+        Initialize server.
+
+        Args:
+            state: Resource store (a fresh one is created if omitted)
+            faults: Fault injection settings (applied to the state)
+            host: Bind address
+            port: Bind port (0 picks a free port)
+        """
+        self.state = state or MockBAMState()
+        if faults is not None:
+            self.state.set_faults(faults)
+        self._httpd = ThreadingHTTPServer((host, port), _make_handler(self.state))
+        self._httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        """Base URL to use as BAMConfig.base_url."""
+        host, port = self._httpd.server_address[:2]
+        if isinstance(host, bytes):
+            host = host.decode()
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockBAMServer":
+        """Start serving in a daemon thread."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        logger.debug("Mock BAM server started", base_url=self.base_url)
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve in the current thread until interrupted."""
+        self._httpd.serve_forever()
+
+    def stop(self) -> None:
+        """Stop serving and release the socket."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def __enter__(self) -> "MockBAMServer":
+        """Context manager entry."""
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Context manager exit."""
+        self.stop()
+
+
+class MockBAMCluster:
+    """A primary MockBAMServer and read instances serving the same resources."""
+
+    def __init__(
+        self,
+        readers: int = 2,
+        state: MockBAMState | None = None,
+        faults: MockBAMFaults | None = None,
+        host: str = "127.0.0.1",
+    ) -> None:
+        """
+        Initialize cluster.
+
+        Args:
+            readers: Number of read instances
+            state: Primary's resource store (a fresh one is created if omitted)
+            faults: Fault injection settings of the primary
+            host: Bind address of every instance
+        """
+        self.primary = MockBAMServer(state, faults, host)
+        primary_state = self.primary.state
+        self.readers = [
+            MockBAMServer(
+                MockBAMState(
+                    primary_state.username,
+                    primary_state.password,
+                    primary=primary_state,
+                    etags=primary_state.etags,
+                ),
+                host=host,
+            )
+            for _ in range(readers)
+        ]
+
+    @property
+    def servers(self) -> list[MockBAMServer]:
+        """The primary followed by the read instances."""
+        return [self.primary, *self.readers]
+
+    @property
+    def base_url(self) -> str:
+        """Base URL to use as BAMConfig.base_url."""
+        return self.primary.base_url
+
+    @property
+    def read_urls(self) -> list[str]:
+        """Base URLs to use as BAMConfig.read_urls."""
+        return [reader.base_url for reader in self.readers]
+
+    def start(self) -> "MockBAMCluster":
+        """Start every instance in a daemon thread."""
+        for server in self.servers:
+            server.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop every instance."""
+        for server in self.servers:
+            server.stop()
+
+    def __enter__(self) -> "MockBAMCluster":
+        """Context manager entry."""
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Context manager exit."""
+        self.stop()
+
+
+def _make_handler(state: MockBAMState) -> type[BaseHTTPRequestHandler]:
+    """Build a request handler class bound to a state object."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Buffer headers and body into one write; separate small writes hit
+        # Nagle/delayed-ACK stalls (~40ms per request) on keep-alive sockets
+        wbufsize = -1
+
+        def _send(self, response: MockResponse) -> None:
+            payload = b"" if response.body is None else json.dumps(response.body).encode()
+            self.send_response(response.status)
+            if payload:
+                self.send_header("Content-Type", "application/hal+json")
+            for key, value in response.headers.items():
+                self.send_header(key, value)
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            if payload:
+                self.wfile.write(payload)
+            self.wfile.flush()
+
+        def _handle(self) -> None:
+            parsed = urlparse(self.path)
+            query = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+            length = int(self.headers.get("Content-Length") or 0)
+            raw = self.rfile.read(length) if length else b""
+            try:
+                body = json.loads(raw) if raw else None
+            except json.JSONDecodeError:
+                self._send(MockResponse(400, {"message": "Invalid JSON body"}))
+                return
+
+            if parsed.path.startswith("/_mock/"):
+                self._send(_handle_admin(state, self.command, parsed.path, body))
+            elif parsed.path.startswith(API_PREFIX):
+                relative = parsed.path[len(API_PREFIX) :]
+                self._send(state.handle(self.command, relative, query, body, dict(self.headers)))
+            else:
+                self._send(MockResponse(404, {"message": "Not found"}))
+
+        do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _handle
+
+        def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+            return
+
+    return Handler
+
+
+def _handle_admin(state: MockBAMState, method: str, path: str, body: Any) -> MockResponse:
+    """Handle /_mock/* helper endpoints."""
+    if path == "/_mock/stats" and method == "GET":
+        return MockResponse(200, state.get_stats())
+    if path == "/_mock/stats/reset" and method == "POST":
+        state.reset_stats()
+        return MockResponse(204)
+    if path == "/_mock/faults" and method == "POST":
+        state.set_faults(MockBAMFaults(**(body or {})))
+        return MockResponse(200, asdict(state.faults))
+    if path == "/_mock/sessions/expire" and method == "POST":
+        state.expire_sessions()
+        return MockResponse(204)
+    return MockResponse(404, {"message": "Unknown admin endpoint"})
+
+
+def _endpoint_family(segments: list[str]) -> str:
+    """Collapse a path to its endpoint family, e.g. blocks/12/networks -> blocks/{id}/networks."""
+    return "/".join("{id}" if s.isdigit() else s for s in segments) or "/"
+
+
+def _normalize_ip_value(value: Any) -> Any:
+    """Normalize CIDR and address strings; leave ranges and other values alone."""
+    if not isinstance(value, str) or "-" in value:
+        return value
+    if "/" in value:
+        net = try_parse_network(value)
+        return net.cidr if net else value
+    address = try_parse_address(value)
+    return address.text if address else value
+
+
+def _identity_value(key_field: str, value: Any) -> Any:
+    """Normalize an identity value for index lookups."""
+    if key_field in ("range", "address"):
+        return _normalize_ip_value(value)
+    if isinstance(value, str):
+        return value.rstrip(".")
+    return value
+
+
+def _identity_key(collection: str, entity: dict[str, Any]) -> Any:
+    """Identity index key of a resource (None if it has no identity field)."""
+    key_field = _IDENTITY_FIELDS.get(collection, "name")
+    value = entity.get(key_field)
+    return None if value is None else _identity_value(key_field, value)
+
+
+def _get_field(entity: dict[str, Any], dotted: str) -> Any:
+    """Read a possibly nested field (e.g. configuration.id)."""
+    value: Any = entity
+    for part in dotted.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
+def _project(entity: dict[str, Any], fields: str | None) -> dict[str, Any]:
+    """Apply a ``fields`` projection."""
+    if not fields:
+        return entity
+    wanted = {f.strip().split(".")[0] for f in fields.split(",") if f.strip()}
+    return {k: v for k, v in entity.items() if k in wanted}
+
+
+def _split_top_level(text: str) -> list[str]:
+    """Split a filter on commas and ' and ' outside quotes and parentheses."""
+    parts: list[str] = []
+    depth = 0
+    quote: str | None = None
+    current: list[str] = []
+    i = 0
+    while i < len(text):
+        char = text[i]
+        if quote:
+            current.append(char)
+            if char == "\\" and i + 1 < len(text):
+                current.append(text[i + 1])
+                i += 1
+            elif char == quote:
+                quote = None
+        elif char in "'\"":
+            quote = char
+            current.append(char)
+        elif char == "(":
+            depth += 1
+            current.append(char)
+        elif char == ")":
+            depth -= 1
+            current.append(char)
+        elif depth == 0 and char == ",":
+            parts.append("".join(current))
+            current = []
+        elif depth == 0 and text[i : i + 5].lower() == " and ":
+            parts.append("".join(current))
+            current = []
+            i += 4
+        else:
+            current.append(char)
+        i += 1
+    parts.append("".join(current))
+    return [p.strip() for p in parts if p.strip()]
+
+
+def _parse_value(raw: str) -> Any:
+    """Parse a filter literal."""
+    raw = raw.strip()
+    if len(raw) >= 2 and raw[0] == raw[-1] and raw[0] in "'\"":
+        return raw[1:-1].replace("\\'", "'").replace('\\"', '"')
+    if raw == "null":
+        return None
+    if raw in ("true", "false"):
+        return raw == "true"
+    try:
+        return int(raw)
+    except ValueError:
+        return raw
+
+
+def _parse_filter(filter_str: str) -> list[tuple[str, str, Any]]:
+    """Parse a BAM v2 filter into (field, operator, value) terms."""
+    terms = []
+    for part in _split_top_level(filter_str):
+        match = _FILTER_TERM.match(part)
+        if not match:
+            continue
+        field_name, operator, op_args, plain = match.groups()
+        if operator:
+            operator = operator.lower()
+            if operator == "in":
+                value: Any = [_parse_value(v) for v in _split_top_level(op_args)]
+            else:
+                value = _parse_value(op_args)
+        else:
+            operator, value = "eq", _parse_value(plain)
+        terms.append((field_name, operator, value))
+    return terms
+
+
+def _ip_equal(actual: Any, expected: Any) -> bool:
+    """Compare two IP/CIDR values semantically, falling back to string equality."""
+    if actual == expected:
+        return True
+    try:
+        return ipaddress.ip_network(str(actual), strict=False) == ipaddress.ip_network(
+            str(expected), strict=False
+        )
+    except ValueError:
+        return False
+
+
+def _range_contains(actual: Any, target: Any) -> bool:
+    """Whether a range/CIDR value contains an address or CIDR."""
+    try:
+        target_net = ipaddress.ip_network(str(target), strict=False)
+        text = str(actual)
+        if "-" in text:
+            start, end = (ipaddress.ip_address(p.strip()) for p in text.split("-", 1))
+            return (
+                start.version == target_net.version
+                and int(start) <= int(target_net.network_address)
+                and int(target_net.broadcast_address) <= int(end)
+            )
+        actual_net = ipaddress.ip_network(text, strict=False)
+        if isinstance(target_net, ipaddress.IPv4Network):
+            return isinstance(actual_net, ipaddress.IPv4Network) and target_net.subnet_of(
+                actual_net
+            )
+        return isinstance(actual_net, ipaddress.IPv6Network) and target_net.subnet_of(actual_net)
+    except ValueError:
+        return False
+
+
+def _match_term(entity: dict[str, Any], term: tuple[str, str, Any]) -> bool:
+    """Evaluate one filter term against a resource."""
+    field_name, operator, value = term
+    actual = _get_field(entity, field_name)
+    is_ip_field = field_name in ("range", "address")
+
+    if operator == "eq":
+        if is_ip_field and actual is not None:
+            return _ip_equal(actual, value)
+        return bool(actual == value)
+    if operator == "ne":
+        return bool(actual != value)
+    if operator == "in":
+        if is_ip_field:
+            return any(_ip_equal(actual, v) for v in value)
+        return actual in value
+    if operator == "contains":
+        if is_ip_field:
+            return actual is not None and _range_contains(actual, value)
+        return actual is not None and str(value) in str(actual)
+    if operator == "like":
+        return actual is not None and fnmatch.fnmatchcase(str(actual), str(value))
+    if operator == "startswith":
+        return actual is not None and str(actual).startswith(str(value))
+    if operator in ("gt", "lt", "ge", "le"):
+        if actual is None:
+            return False
+        return bool(
+            {
+                "gt": actual > value,
+                "lt": actual < value,
+                "ge": actual >= value,
+                "le": actual <= value,
+            }[operator]
+        )
+    return True
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run a standalone mock BAM server."""
+    parser = argparse.ArgumentParser(description="Local BAM REST v2 stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=int, default=0)
+    parser.add_argument("--page-size", type=int, default=DEFAULT_PAGE_SIZE)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument(
+        "--readers", type=int, default=0, help="Read instances on the following ports"
+    )
+    parser.add_argument(
+        "--etags", action="store_true", help="Send ETags and answer If-None-Match with 304"
+    )
+    args = parser.parse_args(argv)
+
+    faults = MockBAMFaults(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after=args.retry_after,
+        page_size=args.page_size,
+        seed=args.seed,
+    )
+    server = MockBAMServer(MockBAMState(etags=args.etags), faults, args.host, args.port)
+    readers = [
+        MockBAMServer(
+            MockBAMState(primary=server.state, etags=args.etags),
+            host=args.host,
+            port=args.port + i,
+        )
+        for i in range(1, args.readers + 1)
+    ]
+    print(f"Mock BAM listening on {server.base_url}{API_PREFIX} (admin/admin)")
+    for reader in readers:
+        print(f"Read instance listening on {reader.start().base_url}{API_PREFIX}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for reader in readers:
+            reader.stop()
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+"""Conditional-request cache for BAMClient GET responses.
+
+Purpose:
+-------
+Listings such as the views of a configuration, the zones of a view or the
+UDF definitions are fetched again whenever a caller's own cache expires,
+although they rarely change during an import. ``ResponseCache`` keeps the
+body of each GET response, keyed by endpoint and query parameters:
+
+- responses carrying ``ETag`` or ``Last-Modified`` are revalidated with
+  ``If-None-Match``/``If-Modified-Since``; a 304 reuses the stored body
+- responses without validators are reused for ``bam.response_cache_ttl``
+  seconds without asking BAM
+- a write invalidates every entry whose path contains the collection it
+  wrote to (``POST configurations/1/blocks`` drops ``configurations/1/blocks``
+  and ``blocks/7/networks``), and the collections BAM changes along with it
+  (a host record allocates its addresses); a DELETE clears everything,
+  because BAM deletes children with their parent
+
+Bodies are stored as raw bytes and decoded on every use, so callers never
+share (and never mutate) a cached object.
+
+Reads that must see changes made outside the importer, like snapshot pulls,
+run inside ``fresh_reads()``: their GETs always reach BAM, and the responses
+they get replace the cached ones.
+
+Usage:
+-----
+```python
+cache = ResponseCache(ttl=30, max_entries=1024)
+key = cache.key("configurations/1/views", params)
+entry = cache.get(key)
+```
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+CacheKey = tuple[str, tuple[tuple[str, str], ...]]
+
+# Collections a write to another collection also changes: host records
+# allocate and name their addresses, assigning an address with host info
+# creates a host record, and DHCP ranges change the state of their addresses
+_SIDE_EFFECTS: dict[str, tuple[str, ...]] = {
+    "resourceRecords": ("addresses",),
+    "addresses": ("resourceRecords",),
+    "ranges": ("addresses",),
+}
+
+_fresh: ContextVar[bool] = ContextVar("bam_fresh_reads", default=False)
+
+
+@contextmanager
+def fresh_reads() -> Iterator[None]:
+    """Send GETs in this context to BAM even when a cached response would do."""
+    token = _fresh.set(True)
+    try:
+        yield
+    finally:
+        _fresh.reset(token)
+
+
+def in_fresh_reads() -> bool:
+    """Whether the current context is inside fresh_reads()."""
+    return _fresh.get()
+
+
+def _collections(endpoint: str) -> list[str]:
+    """Collection names in an endpoint path ("blocks/7/networks" -> blocks, networks)."""
+    path = endpoint.split("?", 1)[0]
+    return [s for s in path.strip("/").split("/") if s and not s.isdigit()]
+
+
+@dataclass
+class CachedResponse:
+    """
+    A stored GET response.
+
+    Attributes:
+        content: Raw response body
+        etag: ETag header, if BAM sent one
+        last_modified: Last-Modified header, if BAM sent one
+        stored_at: Monotonic time the body was stored or last revalidated
+    """
+
+    content: bytes
+    etag: str | None = None
+    last_modified: str | None = None
+    stored_at: float = 0.0
+
+    @property
+    def validated(self) -> bool:
+        """Whether the entry can be revalidated with a conditional request."""
+        return bool(self.etag or self.last_modified)
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Headers that ask BAM for a 304 if the resource is unchanged."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """LRU store of GET response bodies with validators."""
+
+    def __init__(self, ttl: float = 30.0, max_entries: int = 1024) -> None:
+        """
+        Initialize cache.
+
+        Args:
+            ttl: Seconds a response without validators is reused
+            max_entries: Responses kept before the least recently used is dropped
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[CacheKey, CachedResponse] = OrderedDict()
+        # Collection name -> keys whose path contains it
+        self._by_collection: dict[str, set[CacheKey]] = {}
+        self.stats = {"hits": 0, "revalidated": 0, "misses": 0, "invalidated": 0}
+
+    def __len__(self) -> int:
+        """Number of stored responses."""
+        return len(self._entries)
+
+    @staticmethod
+    def key(endpoint: str, params: Mapping[str, Any] | None) -> CacheKey:
+        """Cache key of a GET request."""
+        return (
+            endpoint.strip("/"),
+            tuple(sorted((str(k), str(v)) for k, v in (params or {}).items())),
+        )
+
+    def get(self, key: CacheKey) -> CachedResponse | None:
+        """Stored response for a key, if any."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def fresh(self, entry: CachedResponse) -> bool:
+        """Whether an entry without validators may be used without asking BAM."""
+        return not entry.validated and time.monotonic() - entry.stored_at < self.ttl
+
+    def record(self, result: str) -> None:
+        """Count a lookup ("hits", "revalidated" or "misses")."""
+        self.stats[result] += 1
+
+    def revalidated(self, key: CacheKey) -> None:
+        """Restart the age of an entry BAM confirmed with a 304."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry.stored_at = time.monotonic()
+
+    def store(
+        self, key: CacheKey, content: bytes, headers: Mapping[str, str]
+    ) -> CachedResponse | None:
+        """
+        Store a 200 response.
+
+        Args:
+            key: Cache key of the request
+            content: Response body
+            headers: Response headers (case-insensitive, as httpx.Headers)
+
+        Returns:
+            The new entry, or None if the response cannot be reused
+        """
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if not etag and not last_modified and self.ttl <= 0:
+            return None
+
+        self._remove(key)
+        entry = CachedResponse(content, etag, last_modified, time.monotonic())
+        self._entries[key] = entry
+        for collection in _collections(key[0]):
+            self._by_collection.setdefault(collection, set()).add(key)
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+        return entry
+
+    def invalidate(self, method: str, endpoint: str) -> None:
+        """
+        Drop the entries a write may have changed.
+
+        Args:
+            method: HTTP method of the write
+            endpoint: Endpoint written to
+        """
+        if method.upper() == "DELETE":
+            self.stats["invalidated"] += len(self._entries)
+            self.clear()
+            return
+        collections = _collections(endpoint)
+        if not collections:
+            return
+        written = collections[-1]
+        for collection in (written, *_SIDE_EFFECTS.get(written, ())):
+            for key in list(self._by_collection.get(collection, ())):
+                self._remove(key)
+                self.stats["invalidated"] += 1
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+        self._by_collection.clear()
+
+    def _remove(self, key: CacheKey) -> None:
+        """Drop one entry and its index references."""
+        if self._entries.pop(key, None) is None:
+            return
+        for collection in _collections(key[0]):
+            keys = self._by_collection.get(collection)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_collection[collection]
@@ -0,0 +1,178 @@
+"""Read routing across BAM instances for BAMClient.
+
+Purpose:
+-------
+A single BAM server answers every request of an import: the writes, but also
+the resolver's path lookups, the validator's existence checks and exports,
+which outnumber the writes many times over. When read instances are
+configured (``bam.read_urls``), GET requests are spread over them and the
+primary (``bam.base_url``) keeps the writes.
+
+Each ``BAMInstance`` holds its own session and health. ``InstancePool``
+decides which instances may serve a request, in order of preference:
+
+- writes, and GETs within ``read_after_write_seconds`` of a write, go to the
+  primary only, so a read never misses a resource the import just created
+  on an instance that has not replicated it yet
+- other GETs go to the healthy read instance with the fewest requests in
+  flight, then to the remaining healthy ones, then to the primary
+- a read instance that fails ``READ_INSTANCE_FAILURE_THRESHOLD`` times in a
+  row (connection error, timeout or 5xx) is skipped until a health probe
+  succeeds; probes run at most every ``health_check_interval`` seconds
+
+Sessions are renewed proactively: once ``SESSION_REFRESH_FRACTION`` of
+``session_timeout`` has passed, the client re-authenticates in the
+background while requests keep using the current credentials.
+
+Usage:
+-----
+```python
+pool = InstancePool(primary_url, read_urls, health_check_interval=30)
+for instance in pool.route("GET"):
+    ...  # first that answers wins
+```
+"""
+
+import asyncio
+import itertools
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+import structlog
+
+from ..constants import READ_INSTANCE_FAILURE_THRESHOLD
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass(eq=False)
+class BAMInstance:
+    """
+    One BAM server and the session the client holds with it.
+
+    Attributes:
+        api_url: API base URL (``.../api/v2``)
+        primary: Whether the instance accepts writes
+        token: apiToken of the current session
+        credentials: basicAuthenticationCredentials of the current session
+        authenticated_at: Monotonic time the session was created
+        in_flight: Requests currently waiting on the instance
+        failures: Consecutive failed requests
+        retry_at: Monotonic time of the next health probe (0 = healthy)
+    """
+
+    api_url: str
+    primary: bool = False
+    token: str | None = None
+    credentials: str | None = None
+    authenticated_at: float = 0.0
+    in_flight: int = 0
+    failures: int = 0
+    retry_at: float = 0.0
+    auth_lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False)
+    refreshing: bool = False
+    probing: bool = False
+
+    @property
+    def healthy(self) -> bool:
+        """Whether the instance may serve requests."""
+        return self.primary or self.retry_at == 0.0
+
+    def session_age(self) -> float:
+        """Seconds since the current session was created."""
+        return time.monotonic() - self.authenticated_at
+
+    def set_session(self, token: str | None, credentials: str | None) -> None:
+        """Store a new session."""
+        self.token = token
+        self.credentials = credentials
+        self.authenticated_at = time.monotonic()
+
+
+class InstancePool:
+    """Routes requests between the primary and the read instances."""
+
+    def __init__(
+        self,
+        primary_url: str,
+        read_urls: Iterable[str] = (),
+        health_check_interval: float = 30,
+        read_after_write_seconds: float = 5.0,
+    ) -> None:
+        """
+        Initialize pool.
+
+        Args:
+            primary_url: API base URL of the primary
+            read_urls: API base URLs of the read instances
+            health_check_interval: Seconds between probes of an unhealthy read instance
+            read_after_write_seconds: Seconds after a write during which GETs use the primary
+        """
+        self.primary = BAMInstance(primary_url, primary=True)
+        self.readers = [BAMInstance(url) for url in read_urls if url != primary_url]
+        self.health_check_interval = health_check_interval
+        self.read_after_write_seconds = read_after_write_seconds
+        self._last_write = float("-inf")
+        self._turn = itertools.count()
+
+    @property
+    def instances(self) -> list[BAMInstance]:
+        """The primary followed by the read instances."""
+        return [self.primary, *self.readers]
+
+    def route(self, method: str) -> list[BAMInstance]:
+        """
+        Instances that may serve a request, most preferred first.
+
+        Args:
+            method: HTTP method
+
+        Returns:
+            Candidates ending with the primary
+        """
+        if method.upper() != "GET":
+            self._last_write = time.monotonic()
+            return [self.primary]
+        if not self.readers:
+            return [self.primary]
+        if time.monotonic() - self._last_write < self.read_after_write_seconds:
+            return [self.primary]
+        healthy = [instance for instance in self.readers if instance.healthy]
+        if not healthy:
+            return [self.primary]
+        # Rotate before sorting so equally loaded instances take turns
+        offset = next(self._turn) % len(healthy)
+        healthy = healthy[offset:] + healthy[:offset]
+        return sorted(healthy, key=lambda instance: instance.in_flight) + [self.primary]
+
+    def due_for_probe(self) -> list[BAMInstance]:
+        """Unhealthy read instances whose next health probe is due."""
+        now = time.monotonic()
+        return [
+            instance
+            for instance in self.readers
+            if not instance.healthy and not instance.probing and now >= instance.retry_at
+        ]
+
+    def mark_success(self, instance: BAMInstance) -> None:
+        """Record a request the instance answered."""
+        if instance.retry_at:
+            logger.info("BAM read instance recovered", url=instance.api_url)
+        instance.failures = 0
+        instance.retry_at = 0.0
+
+    def mark_failure(self, instance: BAMInstance, error: str) -> None:
+        """Record a failed request; enough in a row take a read instance out of rotation."""
+        if instance.primary:
+            return
+        instance.failures += 1
+        if instance.failures >= READ_INSTANCE_FAILURE_THRESHOLD or instance.retry_at:
+            if not instance.retry_at:
+                logger.warning(
+                    "BAM read instance unhealthy",
+                    url=instance.api_url,
+                    failures=instance.failures,
+                    error=error,
+                )
+            instance.retry_at = time.monotonic() + self.health_check_interval
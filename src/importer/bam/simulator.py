@@ -0,0 +1,137 @@
+"""In-process simulated BAM for offline preflight runs.
+
+Purpose:
+-------
+A dry run never talks to BAM about mutations: creates return a fake ID and
+nothing checks duplicates, overlaps or containment, so a dry run says little
+about whether the live run will succeed. A simulated run instead executes the
+real handlers against MockBAMState, an in-memory IPAM/DNS model with BAM's
+conflict semantics (409 on duplicates, overlapping networks and resources
+outside their parent's range), through an httpx transport that dispatches
+requests in-process - no sockets, no latency.
+
+The state starts with the "Default" configuration and its views, or is
+seeded from an export written by ``save_state`` (for example after a previous
+simulated run, to chain several CSVs).
+
+Usage:
+-----
+```python
+state = load_state(Path("bam_state.json"))
+client = create_simulated_client(state)
+await client.authenticate()
+```
+"""
+
+import json
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from ..config import BAMConfig
+from .client import BAMClient
+from .mock_server import API_PREFIX, MockBAMState
+
+SIMULATED_BASE_URL = "http://bam.simulated"
+
+STATE_FORMAT_VERSION = 1
+
+
+class SimulatedTransport(httpx.AsyncBaseTransport):
+    """httpx transport that answers requests from a MockBAMState."""
+
+    def __init__(self, state: MockBAMState) -> None:
+        """
+        Initialize transport.
+
+        Args:
+            state: Resource store that handles the requests
+        """
+        self.state = state
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Dispatch one request to the state and wrap its response."""
+        path = request.url.path
+        if not path.startswith(API_PREFIX):
+            return httpx.Response(404, json={"message": "Not found"})
+
+        content = await request.aread()
+        body = json.loads(content) if content else None
+        response = self.state.handle(
+            request.method,
+            path[len(API_PREFIX) :],
+            dict(request.url.params),
+            body,
+            dict(request.headers),
+            sleep=False,
+        )
+
+        if response.body is None:
+            return httpx.Response(response.status, headers=response.headers)
+        return httpx.Response(
+            response.status,
+            headers={"Content-Type": "application/hal+json", **response.headers},
+            content=json.dumps(response.body).encode(),
+        )
+
+
+def create_simulated_client(state: MockBAMState | None = None) -> BAMClient:
+    """
+    Create a BAMClient whose requests are served by a MockBAMState.
+
+    Args:
+        state: Simulated BAM (a fresh one with the Default configuration if omitted)
+
+    Returns:
+        BAMClient (call ``authenticate`` as with a live client)
+    """
+    state = state or MockBAMState()
+    client = BAMClient(
+        BAMConfig(
+            base_url=SIMULATED_BASE_URL,
+            username=state.username,
+            password=state.password,
+        )
+    )
+    client._client = httpx.AsyncClient(transport=SimulatedTransport(state))
+    return client
+
+
+def load_state(path: Path, **kwargs: Any) -> MockBAMState:
+    """
+    Load a simulated BAM from a JSON export.
+
+    Args:
+        path: File written by ``save_state``
+        **kwargs: Other MockBAMState constructor arguments
+
+    Returns:
+        MockBAMState holding the exported resources
+
+    Raises:
+        ValueError: If the file is not a supported state export
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    if not isinstance(data, dict) or data.get("version") != STATE_FORMAT_VERSION:
+        raise ValueError(f"{path} is not a simulated BAM state export")
+    return MockBAMState.from_entities(data["entities"], **kwargs)
+
+
+def save_state(state: MockBAMState, path: Path) -> int:
+    """
+    Write a simulated BAM to a JSON export.
+
+    Args:
+        state: Simulated BAM
+        path: Output file
+
+    Returns:
+        Number of resources written
+    """
+    entities = state.export_entities()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"version": STATE_FORMAT_VERSION, "entities": entities}, f)
+    return len(entities)
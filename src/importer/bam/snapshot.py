@@ -0,0 +1,625 @@
+"""Pull BAM configurations into a SnapshotStore and serve reads from it.
+
+Purpose:
+-------
+``take_snapshot`` copies whole configurations into a local SnapshotStore with
+one paginated collection query per resource type (``blocks?filter=
+configuration.id:N`` and so on) instead of walking the tree.
+``refresh_snapshot`` brings them up to date: when BAM exposes its transaction
+log, only resources changed since the stored watermark (the newest
+``creationDateTime`` applied) are re-fetched; otherwise the configuration is
+pulled again.
+
+SnapshotReadClient wraps a BAMClient for the Resolver, OperationFactory and
+BulkValidator. Lookups against a configuration that is in the snapshot and
+younger than ``max_age`` are answered locally and are authoritative - a miss
+raises the same not-found error BAM would. Everything else (stale or missing
+configurations, resources created after the snapshot, writes, other
+endpoints) goes to BAM unchanged.
+
+Parents are read from each resource's ``_links.up``; when a server omits it,
+IP resources are placed by containment and views under their configuration.
+
+Usage:
+-----
+```python
+with SnapshotStore(".snapshots/bam.db") as store:
+    await take_snapshot(client, store, ["Default"], include_addresses=True)
+    reader = SnapshotReadClient(client, store, max_age=3600)
+    resolver = Resolver(reader, cache_dir)
+```
+"""
+
+from collections.abc import Iterable
+from typing import Any
+
+import structlog
+
+from ..constants import MAX_PAGE_SIZE
+from ..observability.metrics import get_global_collector
+from ..persistence.snapshot import SnapshotConfiguration, SnapshotRecord, SnapshotStore
+from ..utils.exceptions import ResourceNotFoundError
+from ..utils.ipnet import NetworkIndex, try_parse_address, try_parse_network
+from .bulk_query import BulkQuery
+from .client import BAMClient
+from .endpoints import BAMEndpoints
+from .response_cache import fresh_reads
+
+logger = structlog.get_logger(__name__)
+
+# Collections every snapshot holds, in parent-before-child order
+SNAPSHOT_COLLECTIONS = ("views", "blocks", "networks", "zones")
+
+# Collections that are only pulled on request (they dominate snapshot size)
+OPTIONAL_COLLECTIONS = ("addresses", "resourceRecords")
+
+# BAM resource type -> collection, for transaction log entries
+_TYPE_COLLECTIONS = {
+    "Configuration": "configurations",
+    "View": "views",
+    "IPv4Block": "blocks",
+    "IPv6Block": "blocks",
+    "IPv4Network": "networks",
+    "IPv6Network": "networks",
+    "IPv4Address": "addresses",
+    "IPv6Address": "addresses",
+    "Zone": "zones",
+}
+
+
+def _collection_for_type(resource_type: str | None) -> str | None:
+    """Collection of a BAM resource type (records share resourceRecords)."""
+    if not resource_type:
+        return None
+    if resource_type.endswith("Record"):
+        return "resourceRecords"
+    return _TYPE_COLLECTIONS.get(resource_type)
+
+
+def _up_id(entity: dict[str, Any]) -> int | None:
+    """Parent ID from a resource's HAL ``up`` link."""
+    href = entity.get("_links", {}).get("up", {}).get("href")
+    if not href:
+        return None
+    tail = href.rstrip("/").rsplit("/", 1)[-1]
+    return int(tail) if tail.isdigit() else None
+
+
+async def _latest_transaction_time(client: BAMClient) -> str | None:
+    """Newest transaction timestamp, or None when the log is unavailable."""
+    try:
+        response = await client.get(
+            BAMEndpoints.TRANSACTIONS,
+            params={"orderBy": "desc(creationDateTime)", "limit": 1},
+        )
+    except Exception as e:
+        logger.debug("Transaction log unavailable, refreshes will re-pull", error=str(e))
+        return None
+    data = response.get("data", []) if isinstance(response, dict) else []
+    return data[0].get("creationDateTime") if data else ""
+
+
+async def _fetch_collection(
+    client: BAMClient, config_id: int, collection: str
+) -> list[dict[str, Any]]:
+    """Fetch every resource of a collection in a configuration."""
+    if collection == "views":
+        return await client.get_views_in_configuration(config_id)
+    return await client.get_all_pages(
+        collection, filter=f"configuration.id:{config_id}", page_size=MAX_PAGE_SIZE
+    )
+
+
+def _build_records(
+    config_id: int,
+    fetched: dict[str, list[dict[str, Any]]],
+    store: SnapshotStore | None = None,
+) -> list[SnapshotRecord]:
+    """
+    Attach parent and view IDs to fetched resources.
+
+    Args:
+        config_id: Configuration the resources belong to
+        fetched: Resources per collection
+        store: Existing snapshot used to place resources whose parent was not
+            fetched with them (incremental refresh)
+    """
+    parents: dict[int, int | None] = {}
+    collections: dict[int, str] = {config_id: "configurations"}
+    for collection, entities in fetched.items():
+        for entity in entities:
+            parents[entity["id"]] = _up_id(entity)
+            collections[entity["id"]] = collection
+
+    def containing(
+        index: NetworkIndex[dict[str, Any]], collection: str, value: str, strict: bool
+    ) -> int | None:
+        """ID of the smallest fetched (or already stored) range containing value."""
+        if "/" in value:
+            network = try_parse_network(value)
+            found = index.find_containing(network, strict=strict) if network else None
+        else:
+            address = try_parse_address(value)
+            found = index.find_containing_address(address) if address else None
+        if found is None and store is not None:
+            found = store.find_containing(config_id, collection, value)
+            if found is not None and strict and found.get("range") == value:
+                found = None
+        return found["id"] if found else None
+
+    # Place IP resources without an up link by containment
+    blocks: NetworkIndex[dict[str, Any]] = NetworkIndex()
+    for block in sorted(
+        fetched.get("blocks", []),
+        key=lambda b: getattr(try_parse_network(b.get("range")), "prefixlen", 0),
+    ):
+        network = try_parse_network(block.get("range"))
+        if network is not None:
+            if parents[block["id"]] is None:
+                parents[block["id"]] = (
+                    containing(blocks, "blocks", network.cidr, strict=True) or config_id
+                )
+            blocks.add(network, block)
+    networks: NetworkIndex[dict[str, Any]] = NetworkIndex()
+    for network_entity in fetched.get("networks", []):
+        network = try_parse_network(network_entity.get("range"))
+        if network is None:
+            continue
+        networks.add(network, network_entity)
+        if parents[network_entity["id"]] is None:
+            parents[network_entity["id"]] = containing(blocks, "blocks", network.cidr, False)
+    for address_entity in fetched.get("addresses", []):
+        if parents[address_entity["id"]] is None and address_entity.get("address"):
+            parents[address_entity["id"]] = containing(
+                networks, "networks", str(address_entity["address"]), False
+            )
+    for view in fetched.get("views", []):
+        if parents[view["id"]] is None:
+            parents[view["id"]] = config_id
+
+    def view_of(entity_id: int | None) -> int | None:
+        seen = 0
+        while entity_id is not None and seen < 64:
+            collection = collections.get(entity_id)
+            if collection is None and store is not None:
+                located = store.locate(entity_id)
+                if located is None:
+                    return None
+                collection = located[1]
+                if collection != "views":
+                    return located[2]
+            if collection == "views":
+                return entity_id
+            entity_id = parents.get(entity_id)
+            seen += 1
+        return None
+
+    records = []
+    for collection, entities in fetched.items():
+        for entity in entities:
+            parent_id = parents[entity["id"]]
+            view_id = view_of(parent_id) if collection in ("zones", "resourceRecords") else None
+            records.append(SnapshotRecord(collection, entity, parent_id, view_id))
+    return records
+
+
+async def take_snapshot(
+    client: BAMClient,
+    store: SnapshotStore,
+    config_names: Iterable[str],
+    include_addresses: bool = False,
+    include_records: bool = False,
+) -> list[SnapshotConfiguration]:
+    """
+    Pull configurations from BAM into the store, replacing previous copies.
+
+    Args:
+        client: Authenticated BAM client
+        store: Snapshot store to write
+        config_names: Configurations to pull
+        include_addresses: Also pull IP addresses
+        include_records: Also pull DNS resource records
+
+    Returns:
+        The stored configurations
+
+    Raises:
+        ResourceNotFoundError: If a configuration does not exist
+    """
+    collections = list(SNAPSHOT_COLLECTIONS)
+    if include_addresses:
+        collections.append("addresses")
+    if include_records:
+        collections.append("resourceRecords")
+
+    stored = []
+    for name in config_names:
+        with fresh_reads():
+            config = await client.get_configuration_by_name(name)
+            watermark = await _latest_transaction_time(client)
+            fetched = {
+                collection: await _fetch_collection(client, config["id"], collection)
+                for collection in collections
+            }
+        store.replace_configuration(
+            config, _build_records(config["id"], fetched), collections, watermark
+        )
+        stored.append(store.get_configuration(config["name"]))
+    return [c for c in stored if c is not None]
+
+
+async def refresh_snapshot(
+    client: BAMClient,
+    store: SnapshotStore,
+    config_names: Iterable[str] | None = None,
+    full: bool = False,
+) -> dict[str, str]:
+    """
+    Bring stored configurations up to date.
+
+    Configurations with a watermark are patched from the transaction log;
+    those without one (or all of them with ``full``) are pulled again.
+
+    Args:
+        client: Authenticated BAM client
+        store: Snapshot store to update
+        config_names: Configurations to refresh (all stored ones if omitted)
+        full: Re-pull even when an incremental refresh is possible
+
+    Returns:
+        Mapping of configuration name to "incremental" or "full"
+    """
+    wanted = set(config_names) if config_names is not None else None
+    configs = [c for c in store.configurations() if wanted is None or c.name in wanted]
+    modes: dict[str, str] = {}
+
+    incremental = [c for c in configs if not full and c.watermark is not None]
+    transactions: list[dict[str, Any]] | None = None
+    if incremental:
+        since = min(c.watermark or "" for c in incremental)
+        try:
+            with fresh_reads():
+                transactions = await client.get_all_pages(
+                    BAMEndpoints.TRANSACTIONS,
+                    filter=f"creationDateTime:ge('{since}')" if since else None,
+                )
+        except Exception as e:
+            logger.warning("Transaction log unavailable, re-pulling snapshot", error=str(e))
+
+    for config in configs:
+        if transactions is None or config.watermark is None or full:
+            await take_snapshot(
+                client,
+                store,
+                [config.name],
+                include_addresses="addresses" in config.collections,
+                include_records="resourceRecords" in config.collections,
+            )
+            modes[config.name] = "full"
+            continue
+        with fresh_reads():
+            await _apply_transactions(client, store, config, transactions)
+        modes[config.name] = "incremental"
+    return modes
+
+
+async def _apply_transactions(
+    client: BAMClient,
+    store: SnapshotStore,
+    config: SnapshotConfiguration,
+    transactions: list[dict[str, Any]],
+) -> None:
+    """Re-fetch resources changed since a configuration's watermark and patch the store."""
+    # Last operation per resource wins
+    changes: dict[int, tuple[str, str]] = {}
+    watermark = config.watermark
+    for transaction in transactions:
+        created = transaction.get("creationDateTime") or ""
+        if config.watermark and created < config.watermark:
+            continue
+        if watermark is None or created > watermark:
+            watermark = created
+        for operation in transaction.get("operations", []):
+            resource = operation.get("resource") or {}
+            collection = _collection_for_type(resource.get("type"))
+            if resource.get("id") is None or collection not in config.collections:
+                continue
+            changes[resource["id"]] = (collection, operation.get("operationType", ""))
+
+    deletes = [rid for rid, (_, op) in changes.items() if op == "DELETE"]
+    wanted: dict[str, list[int]] = {}
+    for rid, (collection, op) in changes.items():
+        if op != "DELETE":
+            wanted.setdefault(collection, []).append(rid)
+
+    fetched: dict[str, list[dict[str, Any]]] = {}
+    query = BulkQuery(client)
+    for collection, ids in wanted.items():
+        found = await query.fetch(collection, "id", ids, quote_values=False)
+        # Resources of other configurations share the transaction log
+        fetched[collection] = [
+            e for e in found if (e.get("configuration") or {}).get("id", config.id) == config.id
+        ]
+        returned = {e["id"] for e in found}
+        deletes.extend(i for i in ids if i not in returned)
+
+    records = _build_records(config.id, fetched, store)
+    written, removed = store.apply_changes(config.id, records, deletes, watermark)
+    logger.info(
+        "Snapshot refreshed",
+        configuration=config.name,
+        written=written,
+        removed=removed,
+        watermark=watermark,
+    )
+
+
+class SnapshotReadClient:
+    """
+    BAMClient wrapper that answers lookups from a SnapshotStore.
+
+    Only lookups whose configuration is in the snapshot, holds the collection
+    asked about and is younger than ``max_age`` are served locally; all other
+    attribute access is forwarded to the wrapped client.
+    """
+
+    def __init__(self, client: BAMClient, store: SnapshotStore, max_age: float) -> None:
+        """
+        Initialize read client.
+
+        Args:
+            client: BAM client for writes and lookups the snapshot cannot answer
+            store: Snapshot store
+            max_age: Seconds after which a configuration's snapshot is ignored
+        """
+        self.client = client
+        self.store = store
+        self.max_age = max_age
+        self.hits = 0
+        self.fallbacks = 0
+        self._configs = {c.id: c for c in store.configurations()}
+        self._by_name = {c.name: c for c in self._configs.values()}
+        self._stale_warned: set[int] = set()
+        self.collector = get_global_collector()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.client, name)
+
+    # ------------------------------------------------------------------
+    # Freshness policy
+    # ------------------------------------------------------------------
+
+    def _fresh(self, config: SnapshotConfiguration | None, collection: str) -> bool:
+        if config is None or collection not in (*config.collections, "configurations"):
+            return False
+        if config.age_seconds() > self.max_age:
+            if config.id not in self._stale_warned:
+                self._stale_warned.add(config.id)
+                logger.warning(
+                    "Snapshot too old, using BAM",
+                    configuration=config.name,
+                    age_seconds=round(config.age_seconds()),
+                    max_age=self.max_age,
+                )
+            return False
+        return True
+
+    def covers(self, config_id: int, collection: str) -> bool:
+        """Whether lookups of a collection in a configuration are served locally."""
+        return self._fresh(self._configs.get(config_id), collection)
+
+    def covers_entity(self, entity_id: int, collection: str) -> bool:
+        """Whether lookups below a stored resource are served locally."""
+        located = self.store.locate(entity_id)
+        return located is not None and self.covers(located[0], collection)
+
+    def _hit(self, collection: str) -> None:
+        self.hits += 1
+        self.collector.backend.increment("snapshot_hit_total", tags={"collection": collection})
+
+    def _miss(self) -> None:
+        self.fallbacks += 1
+
+    def existing_keys(self, scope_id: int, collection: str, values: list[str]) -> set[str] | None:
+        """
+        Identity values that already exist, or None if the snapshot cannot say.
+
+        Args:
+            scope_id: View ID for zones, configuration ID otherwise
+            collection: Collection to check
+            values: Values to check (CIDRs, zone names)
+        """
+        covered = (
+            self.covers_entity(scope_id, collection)
+            if collection in ("zones", "resourceRecords")
+            else self.covers(scope_id, collection)
+        )
+        if not covered:
+            self._miss()
+            return None
+        self._hit(collection)
+        return self.store.existing_keys(scope_id, collection, values)
+
+    # ------------------------------------------------------------------
+    # Configurations and views
+    # ------------------------------------------------------------------
+
+    async def get_configuration_by_name(self, name: str) -> dict[str, Any]:
+        """Get configuration by name."""
+        config = self._by_name.get(name)
+        if not self._fresh(config, "configurations"):
+            self._miss()
+            return await self.client.get_configuration_by_name(name)
+        self._hit("configurations")
+        return self.store.get(config.id)  # type: ignore[union-attr,return-value]
+
+    async def get_views_in_configuration(
+        self, config_id: int, **kwargs: Any
+    ) -> list[dict[str, Any]]:
+        """Get all views in a configuration."""
+        if any(kwargs.get(k) for k in ("filter", "fields", "order_by", "limit")) or not self.covers(
+            config_id, "views"
+        ):
+            self._miss()
+            return await self.client.get_views_in_configuration(config_id, **kwargs)
+        self._hit("views")
+        return self.store.children(config_id, "views")
+
+    async def get_view_by_name_in_config(self, config_id: int, view_name: str) -> dict[str, Any]:
+        """Get view by name within a configuration."""
+        if not self.covers(config_id, "views"):
+            self._miss()
+            return await self.client.get_view_by_name_in_config(config_id, view_name)
+        self._hit("views")
+        view = self.store.find_child(config_id, "views", view_name)
+        if view is None:
+            raise ResourceNotFoundError("View", view_name)
+        return view
+
+    # ------------------------------------------------------------------
+    # Blocks, networks and addresses
+    # ------------------------------------------------------------------
+
+    async def get_block_by_cidr_in_config(self, config_id: int, cidr: str) -> dict[str, Any]:
+        """Get top-level block by CIDR within a configuration."""
+        if not self.covers(config_id, "blocks"):
+            self._miss()
+            return await self.client.get_block_by_cidr_in_config(config_id, cidr)
+        self._hit("blocks")
+        block = self.store.find_child(config_id, "blocks", cidr)
+        if block is None:
+            raise ResourceNotFoundError("IPv4Block", cidr)
+        return block
+
+    async def get_ip6_block_by_cidr_in_config(self, config_id: int, cidr: str) -> dict[str, Any]:
+        """Get IPv6 block by CIDR within a configuration."""
+        if not self.covers(config_id, "blocks"):
+            self._miss()
+            return await self.client.get_ip6_block_by_cidr_in_config(config_id, cidr)
+        self._hit("blocks")
+        block = self.store.find(config_id, "blocks", cidr)
+        if block is None:
+            raise ResourceNotFoundError("IPv6Block", cidr)
+        return block
+
+    async def get_network_by_cidr(self, config_id: int, cidr: str) -> dict[str, Any]:
+        """Get network by CIDR within a configuration."""
+        if not self.covers(config_id, "networks"):
+            self._miss()
+            return await self.client.get_network_by_cidr(config_id, cidr)
+        self._hit("networks")
+        network = self.store.find(config_id, "networks", cidr)
+        if network is None:
+            raise ResourceNotFoundError("IPv4Network", cidr)
+        return network
+
+    async def get_ip6_network_by_cidr(self, config_id: int, cidr: str) -> dict[str, Any]:
+        """Get IPv6 network by CIDR within a configuration."""
+        if not self.covers(config_id, "networks"):
+            self._miss()
+            return await self.client.get_ip6_network_by_cidr(config_id, cidr)
+        self._hit("networks")
+        network = self.store.find(config_id, "networks", cidr)
+        if network is None:
+            raise ResourceNotFoundError("IPv6Network", cidr)
+        return network
+
+    async def get_network_by_cidr_in_block(self, block_id: int, cidr: str) -> dict[str, Any]:
+        """Get network by CIDR within a block."""
+        if not self.covers_entity(block_id, "networks"):
+            self._miss()
+            return await self.client.get_network_by_cidr_in_block(block_id, cidr)
+        self._hit("networks")
+        network = self.store.find_child(block_id, "networks", cidr)
+        if network is None:
+            raise ResourceNotFoundError("IPv4Network", cidr)
+        return network
+
+    async def get_ip6_network_by_cidr_in_block(self, block_id: int, cidr: str) -> dict[str, Any]:
+        """Get IPv6 network by CIDR within a block."""
+        if not self.covers_entity(block_id, "networks"):
+            self._miss()
+            return await self.client.get_ip6_network_by_cidr_in_block(block_id, cidr)
+        self._hit("networks")
+        network = self.store.find_child(block_id, "networks", cidr)
+        if network is None:
+            raise ResourceNotFoundError("IPv6Network", cidr)
+        return network
+
+    async def find_network_containing_address(self, config_id: int, address: str) -> dict[str, Any]:
+        """Find the most specific network containing an address."""
+        if not self.covers(config_id, "networks"):
+            self._miss()
+            return await self.client.find_network_containing_address(config_id, address)
+        self._hit("networks")
+        network = self.store.find_containing(config_id, "networks", address)
+        if network is None:
+            raise ResourceNotFoundError(f"Network containing {address}", "any")
+        return network
+
+    async def find_block_containing_network(
+        self, config_id: int, network_cidr: str
+    ) -> dict[str, Any]:
+        """Find the smallest block containing a network CIDR."""
+        if not self.covers(config_id, "blocks"):
+            self._miss()
+            return await self.client.find_block_containing_network(config_id, network_cidr)
+        self._hit("blocks")
+        block = self.store.find_containing(config_id, "blocks", network_cidr)
+        if block is None:
+            raise ValueError(f"No block found containing network {network_cidr}")
+        return block
+
+    async def find_block_containing_address(self, config_id: int, address: str) -> dict[str, Any]:
+        """Find the smallest block containing an address."""
+        if not self.covers(config_id, "blocks"):
+            self._miss()
+            return await self.client.find_block_containing_address(config_id, address)
+        self._hit("blocks")
+        block = self.store.find_containing(config_id, "blocks", address)
+        if block is None:
+            raise ValueError(f"No block found containing address {address}")
+        return block
+
+    async def get_ip4_address(self, config_id: int, address: str) -> dict[str, Any] | None:
+        """Get an IPv4 address (None if it does not exist)."""
+        if not self.covers(config_id, "addresses"):
+            self._miss()
+            return await self.client.get_ip4_address(config_id, address)
+        self._hit("addresses")
+        return self.store.find(config_id, "addresses", address)
+
+    # ------------------------------------------------------------------
+    # Zones
+    # ------------------------------------------------------------------
+
+    async def get_zone_by_fqdn(self, view_id: int, fqdn: str) -> dict[str, Any]:
+        """Get zone by absolute name anywhere in a view."""
+        if not self.covers_entity(view_id, "zones"):
+            self._miss()
+            return await self.client.get_zone_by_fqdn(view_id, fqdn)
+        self._hit("zones")
+        zone = self.store.find_in_view(view_id, "zones", fqdn)
+        if zone is None:
+            raise ResourceNotFoundError("DNSZone", fqdn.rstrip("."))
+        return zone
+
+    async def get_zones_in_view(self, view_id: int, **kwargs: Any) -> list[dict[str, Any]]:
+        """Get top-level zones of a view."""
+        if any(kwargs.get(k) for k in ("filter", "fields", "order_by", "limit")) or not (
+            self.covers_entity(view_id, "zones")
+        ):
+            self._miss()
+            return await self.client.get_zones_in_view(view_id, **kwargs)
+        self._hit("zones")
+        return self.store.children(view_id, "zones")
+
+    async def get_child_zones(self, parent_id: int, **kwargs: Any) -> list[dict[str, Any]]:
+        """Get child zones of a zone."""
+        if any(kwargs.get(k) for k in ("filter", "fields", "order_by", "limit")) or not (
+            self.covers_entity(parent_id, "zones")
+        ):
+            self._miss()
+            return await self.client.get_child_zones(parent_id, **kwargs)
+        self._hit("zones")
+        return self.store.children(parent_id, "zones")
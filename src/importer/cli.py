@@ -1,20 +1,22 @@
-"""Command-line interface for the BlueCat CSV Importer."""
+"""Command-line interface for the BlueCat CSV Importer.
+
+Startup cost matters here: every invocation (including --help and shell
+completion) imports this module. Keep module-level imports to typer/rich and
+the standard library, and import the parser, client, models and runner inside
+the commands that use them. tests/unit/test_import_time.py enforces this.
+"""
 
 import os
 import uuid
+from contextlib import nullcontext
 from datetime import datetime
 from pathlib import Path
 
-import structlog
 import typer
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-from .config import ImporterConfig
-from .core.parser import CSVParser
-from .core.sanitizer import CSVSanitizer
-
 app = typer.Typer(
     name="bluecat-import",
     help="BlueCat CSV Importer - Production-grade bulk import tool",
@@ -22,7 +24,6 @@ app = typer.Typer(
 )
 
 console = Console()
-logger = structlog.get_logger(__name__)
 
 
 @app.command()
@@ -32,47 +33,56 @@ def fix(
         None, "--output", "-o", help="Output file (default: overwrite)"
     ),
     yes: bool = typer.Option(False, "--yes", "-y", help="Automatically accept changes"),
+    workers: int = typer.Option(
+        1, "--workers", "-w", min=1, help="Processes cleaning chunks in parallel"
+    ),
 ) -> None:
     """
     Sanitize CSV file by stripping whitespace and standardizing format.
 
     Uses smart detection to clean headers and values while preserving comments.
-    Displays a diff of changes before applying.
+    Displays a diff of changes before applying. The file is cleaned in chunks
+    straight to disk, so multi-gigabyte exports do not need to fit in memory.
 
     Examples:
         bluecat-import fix data/dirty.csv
         bluecat-import fix data/dirty.csv -o data/clean.csv
         bluecat-import fix data/dirty.csv --yes
+        bluecat-import fix export.csv --yes --workers 4
     """
+    from .core.sanitizer import CSVSanitizer, staging_path
+
     console.print(f"\n[bold blue]Sanitizing CSV:[/bold blue] {csv_file}\n")
 
+    if output_file:
+        target_path = output_file
+    else:
+        target_path = csv_file
+    staged = staging_path(target_path)
+
     try:
         sanitizer = CSVSanitizer(csv_file)
-        result = sanitizer.sanitize()
+        result = sanitizer.sanitize_to(staged, workers=workers)
 
         sanitizer.print_diff(result, console)
 
         if not result.has_changes:
             return
 
-        if output_file:
-            target_path = output_file
-        else:
-            target_path = csv_file
-
         if not yes:
             if not typer.confirm(f"Write cleaned content to {target_path}?"):
                 console.print("[yellow]Aborted.[/yellow]")
                 raise typer.Exit()
 
-        with open(target_path, "w", encoding="utf-8") as f:
-            f.write(result.cleaned_content)
+        os.replace(staged, target_path)
 
         console.print(f"[green]Successfully wrote cleaned CSV to {target_path}[/green]")
 
     except Exception as e:
         console.print(f"\n[red]ERROR: Fix failed:[/red] {e}")
         raise typer.Exit(code=1) from e
+    finally:
+        staged.unlink(missing_ok=True)
 
 
 @app.command()
@@ -87,6 +97,12 @@ def validate(
         False, "--bulk", help="Force enable bulk validation (Auto-enabled for >50 rows)"
     ),
     no_bulk: bool = typer.Option(False, "--no-bulk", help="Force disable bulk validation"),
+    snapshot: Path | None = typer.Option(
+        None,
+        "--snapshot",
+        help="Answer bulk existence checks from this local BAM snapshot where it is fresh",
+        exists=True,
+    ),
 ) -> None:
     """
     Validate CSV file without executing.
@@ -96,11 +112,16 @@ def validate(
     - Syntax (CIDR, MAC, DNS)
     - Field validation
     - Pydantic model validation
+    - Overlapping, duplicate and orphaned IP rows within the file
 
     Examples:
         bluecat-import validate samples/simple_import.csv
         bluecat-import validate samples/complex_import.csv --strict
+        bluecat-import validate big.csv --bulk --snapshot .snapshots/bam.db
     """
+    from .core.parser import CSVParser
+    from .core.sanitizer import CSVSanitizer, staging_path
+
     console.print(f"\n[bold blue]Validating CSV:[/bold blue] {csv_file}\n")
 
     try:
@@ -108,32 +129,30 @@ def validate(
         parser_csv_path = csv_file
         if auto_fix:
             sanitizer = CSVSanitizer(csv_file)
-            result = sanitizer.sanitize()
-            if result.has_changes:
-                sanitizer.print_diff(result, console)
-                if typer.confirm(
-                    "CSV contains formatting issues. Use cleaned data for validation?"
-                ):
-                    if typer.confirm(f"Save cleaned content to {csv_file}?"):
-                        with open(csv_file, "w", encoding="utf-8") as f:
-                            f.write(result.cleaned_content)
-                        console.print("[green]Saved cleaned CSV.[/green]")
+            staged = staging_path(csv_file)
+            try:
+                result = sanitizer.sanitize_to(staged)
+                if result.has_changes:
+                    sanitizer.print_diff(result, console)
+                    if typer.confirm(
+                        "CSV contains formatting issues. Use cleaned data for validation?"
+                    ):
+                        if typer.confirm(f"Save cleaned content to {csv_file}?"):
+                            os.replace(staged, csv_file)
+                            console.print("[green]Saved cleaned CSV.[/green]")
+                        else:
+                            # Validate the cleaned copy; it is removed after parsing
+                            parser_csv_path = staged
+                            console.print(
+                                f"[yellow]Using temporary file for validation: {staged}[/yellow]"
+                            )
                     else:
-                        # Use temp file for validation
-                        import os
-                        import tempfile
-
-                        fd, temp_path = tempfile.mkstemp(suffix=".csv", text=True)
-                        with os.fdopen(fd, "w", encoding="utf-8") as f:
-                            f.write(result.cleaned_content)
-                        parser_csv_path = Path(temp_path)
                         console.print(
-                            f"[yellow]Using temporary file for validation: {temp_path}[/yellow]"
+                            "[yellow]Proceeding with original file (internal parser will clean whitespace automatically).[/yellow]"
                         )
-                else:
-                    console.print(
-                        "[yellow]Proceeding with original file (internal parser will clean whitespace automatically).[/yellow]"
-                    )
+            finally:
+                if parser_csv_path != staged:
+                    staged.unlink(missing_ok=True)
 
         try:
             # Parse CSV
@@ -177,6 +196,23 @@ def validate(
 
             console.print("\n", table)
 
+            # Offline conflicts between rows of this file
+            from .validation.overlap import analyze_overlaps
+
+            overlaps = analyze_overlaps(rows)
+            if overlaps.warnings:
+                console.print(f"\n[yellow]Overlap Warnings ({len(overlaps.warnings)}):[/yellow]")
+                for w in overlaps.warnings:
+                    console.print(f"  - Row {w.row_id}: {w.message}")
+            if overlaps.errors:
+                console.print(f"\n[red]Overlap Errors ({len(overlaps.errors)}):[/red]")
+                for e in overlaps.errors:
+                    console.print(f"  - Row {e.row_id} ({e.field}): {e.message}")
+                console.print(
+                    f"\n[bold red]Overlap analysis failed with {len(overlaps.errors)} errors.[/bold red]"
+                )
+                raise typer.Exit(code=1)
+
             # Bulk Validation Logic
             run_bulk = None
             if bulk:
@@ -223,8 +259,20 @@ def validate(
                     try:
                         async with BAMClient(config=cfg.bam) as client:
                             console.print("[green]Connected. Running checks...[/green]")
-                            validator = BulkValidator(client)
-                            report = await validator.validate(rows)
+                            if snapshot:
+                                from .bam.snapshot import SnapshotReadClient
+                                from .persistence.snapshot import SnapshotStore
+
+                                with SnapshotStore(snapshot) as store:
+                                    validator = BulkValidator(
+                                        SnapshotReadClient(
+                                            client, store, cfg.cache.snapshot_max_age
+                                        )
+                                    )
+                                    report = await validator.validate(rows)
+                            else:
+                                validator = BulkValidator(client)
+                                report = await validator.validate(rows)
 
                             if report.warnings:
                                 console.print(
@@ -297,11 +345,70 @@ def apply(
         "--log-filter",
         help="Filter logs by component (comma-separated, e.g., 'resolver,executor')",
     ),
+    log_file: Path | None = typer.Option(None, "--log-file", help="Also write logs to this file"),
+    json_logs: bool = typer.Option(False, "--json-logs", help="Write logs as JSON lines"),
     show_plan: bool = typer.Option(
         False,
         "--show-plan",
         help="Preview execution plan and exit without running (DX-003)",
     ),
+    incremental: bool = typer.Option(
+        False,
+        "--incremental",
+        help="Only apply rows added, changed or removed since the last successful run of this file",
+    ),
+    profile: bool = typer.Option(
+        False,
+        "--profile",
+        help="Record per-phase and per-endpoint timings and write them to JSON/HTML reports",
+    ),
+    profile_sample: bool = typer.Option(
+        False,
+        "--profile-sample",
+        help="With --profile, also sample the call stack to report the hottest functions",
+    ),
+    simulate: bool = typer.Option(
+        False,
+        "--simulate",
+        help="Execute against an in-memory simulated BAM (duplicate, overlap and containment checks) instead of BAM",
+    ),
+    simulate_state: Path | None = typer.Option(
+        None,
+        "--simulate-state",
+        help="With --simulate, seed the simulated BAM from this state export",
+        exists=True,
+    ),
+    simulate_save: Path | None = typer.Option(
+        None,
+        "--simulate-save",
+        help="With --simulate, write the simulated BAM state here after the run",
+    ),
+    snapshot: Path | None = typer.Option(
+        None,
+        "--snapshot",
+        help="Resolve paths and parents from this local BAM snapshot (see `snapshot`)",
+        exists=True,
+    ),
+    snapshot_max_age: int | None = typer.Option(
+        None,
+        "--snapshot-max-age",
+        min=0,
+        help="Ignore the snapshot for configurations older than this many seconds "
+        "(default: cache.snapshot_max_age)",
+    ),
+    processes: int = typer.Option(
+        1,
+        "--processes",
+        min=1,
+        help="Execute independent parts of the import (e.g. separate configurations or "
+        "zone trees) in this many worker processes, sharing the concurrency limits",
+    ),
+    coordinator: Path | None = typer.Option(
+        None,
+        "--coordinator",
+        help="Publish the plan to this work queue database and let "
+        "`bluecat-import worker` processes (on any host) execute it",
+    ),
 ) -> None:
     """
     Apply changes from CSV to BlueCat Address Manager.
@@ -320,14 +427,27 @@ def apply(
         bluecat-import apply changes.csv --dry-run
         bluecat-import apply changes.csv --config prod.yaml
         bluecat-import apply changes.csv --no-rollback
+        bluecat-import apply daily_feed.csv --incremental
+        bluecat-import apply big.csv --profile --profile-sample
+        bluecat-import apply big.csv --json-logs --log-file import.log
+        bluecat-import apply changes.csv --simulate --simulate-state bam_state.json
+        bluecat-import apply big.csv --snapshot .snapshots/bam.db
+        bluecat-import apply multi_config.csv --processes 4
+        bluecat-import apply big.csv --coordinator /shared/queue.db
     """
     import asyncio
 
+    import structlog
+
+    from .config import ImporterConfig
+    from .constants import LOG_SAMPLE_BURST
+    from .core.sanitizer import CSVSanitizer, staging_path
     from .observability import configure_logging
 
     # Metrics Integration
     from .observability.metrics import get_global_collector
 
+    logger = structlog.get_logger(__name__)
     get_global_collector()
 
     # Simple timer for total duration
@@ -335,21 +455,42 @@ def apply(
 
     time.time()
 
-    # DX-002: Configure logging with custom levels and optional filtering
+    # DX-002: Configure logging with custom levels and optional filtering.
+    # Records are written by a background thread and repeated per-operation
+    # events are sampled, so logging does not stall the event loop.
     configure_logging(
         level=log_level or os.environ.get("LOG_LEVEL", "INFO"),
-        json_logs=False,
+        json_logs=json_logs,
+        log_file=log_file,
         log_filter=log_filter,
+        background=True,
+        sample_burst=LOG_SAMPLE_BURST,
     )
 
+    if dry_run and simulate:
+        console.print("[red]ERROR: --dry-run and --simulate are mutually exclusive[/red]")
+        raise typer.Exit(code=1)
+    if (simulate_state or simulate_save) and not simulate:
+        console.print("[red]ERROR: --simulate-state/--simulate-save require --simulate[/red]")
+        raise typer.Exit(code=1)
+    if snapshot and simulate:
+        console.print("[red]ERROR: --snapshot and --simulate are mutually exclusive[/red]")
+        raise typer.Exit(code=1)
+    if coordinator and (simulate or processes > 1):
+        console.print(
+            "[red]ERROR: --coordinator cannot be combined with --simulate or --processes[/red]"
+        )
+        raise typer.Exit(code=1)
+
     session_id = str(uuid.uuid4())[:8]
+    mode = "DRY RUN" if dry_run else "SIMULATION" if simulate else "EXECUTE"
 
     console.print(
         Panel.fit(
             f"[bold blue]BlueCat CSV Import[/bold blue]\n\n"
             f"Session ID: [cyan]{session_id}[/cyan]\n"
             f"CSV File: {csv_file}\n"
-            f"Mode: [yellow]{'DRY RUN' if dry_run else 'EXECUTE'}[/yellow]\n"
+            f"Mode: [yellow]{mode}[/yellow]\n"
             f"Rollback: [green]{'Enabled' if generate_rollback else 'Disabled'}[/green]\n"
             f"Report: [green]{'Enabled' if report else 'Disabled'}[/green]",
             border_style="blue",
@@ -358,31 +499,46 @@ def apply(
 
     if dry_run:
         console.print("[yellow]WARNING: DRY RUN MODE - No changes will be made to BAM[/yellow]\n")
+    if simulate:
+        console.print(
+            "[yellow]SIMULATION MODE - Operations run against an in-memory BAM model[/yellow]\n"
+        )
+
+    profiler = None
+    if profile or profile_sample:
+        from .observability.profiler import SessionProfiler
+
+        profiler = SessionProfiler(sample=profile_sample)
+        profiler.start()
 
     # Check for formatting issues first
     if auto_fix:
         try:
             sanitizer = CSVSanitizer(csv_file)
-            result = sanitizer.sanitize()
-            if result.has_changes:
-                sanitizer.print_diff(result, console)
-                console.print(
-                    "\n[bold yellow]The CSV file contains formatting issues (whitespace, etc).[/bold yellow]"
-                )
-                console.print("The importer can fix these automatically before proceeding.")
-
-                if typer.confirm(f"Apply fixes to {csv_file} and continue?"):
-                    with open(csv_file, "w", encoding="utf-8") as f:
-                        f.write(result.cleaned_content)
+            staged = staging_path(csv_file)
+            try:
+                with profiler.phase("sanitize") if profiler else nullcontext():
+                    result = sanitizer.sanitize_to(staged)
+                if result.has_changes:
+                    sanitizer.print_diff(result, console)
                     console.print(
-                        f"[green]Saved cleaned CSV to {csv_file}. Proceeding...[/green]\n"
+                        "\n[bold yellow]The CSV file contains formatting issues (whitespace, etc).[/bold yellow]"
                     )
-                else:
-                    if not typer.confirm(
-                        "Continue with original file? (Internal parser will attempt to handle whitespace)"
-                    ):
-                        raise typer.Exit()
-                    console.print("[yellow]Proceeding with original file.[/yellow]\n")
+                    console.print("The importer can fix these automatically before proceeding.")
+
+                    if typer.confirm(f"Apply fixes to {csv_file} and continue?"):
+                        os.replace(staged, csv_file)
+                        console.print(
+                            f"[green]Saved cleaned CSV to {csv_file}. Proceeding...[/green]\n"
+                        )
+                    else:
+                        if not typer.confirm(
+                            "Continue with original file? (Internal parser will attempt to handle whitespace)"
+                        ):
+                            raise typer.Exit()
+                        console.print("[yellow]Proceeding with original file.[/yellow]\n")
+            finally:
+                staged.unlink(missing_ok=True)
         except Exception as e:
             logger.warning(f"Sanitization check failed: {e}")
 
@@ -411,6 +567,17 @@ def apply(
         elif no_resume:
             should_resume = False
 
+        simulation = None
+        if simulate:
+            from .bam.mock_server import MockBAMState
+            from .bam.simulator import load_state
+
+            simulation = load_state(simulate_state) if simulate_state else MockBAMState()
+            console.print(
+                f"Simulated BAM: [cyan]{len(simulation.entities)}[/cyan] resources"
+                + (f" from {simulate_state}" if simulate_state else "")
+            )
+
         exit_code = await runner.run_session(
             csv_file=csv_file,
             dry_run=dry_run,
@@ -421,8 +588,21 @@ def apply(
             no_cache=no_cache,
             show_deps=show_deps,
             show_plan=show_plan,
+            incremental=incremental,
+            profiler=profiler,
+            simulation=simulation,
+            snapshot=snapshot,
+            snapshot_max_age=snapshot_max_age,
+            processes=processes,
+            coordinator=coordinator,
         )
 
+        if simulation is not None and simulate_save:
+            from .bam.simulator import save_state
+
+            count = save_state(simulation, simulate_save)
+            console.print(f"Simulated BAM state ({count} resources) written to {simulate_save}")
+
         if exit_code != 0:
             raise typer.Exit(code=1)
 
@@ -441,6 +621,68 @@ def apply(
         raise typer.Exit(code=1) from e
 
 
+@app.command()
+def worker(
+    queue_db: Path = typer.Argument(..., help="Work queue database shared with the coordinator"),
+    session: str | None = typer.Option(None, "--session", help="Only work on this session"),
+    wait: float = typer.Option(
+        60.0, "--wait", min=0, help="Seconds to wait for queued work before exiting"
+    ),
+    lease_seconds: int | None = typer.Option(
+        None,
+        "--lease-seconds",
+        min=5,
+        help="Seconds before operations of a worker that stopped responding are "
+        "handed to another worker (default: 60)",
+    ),
+    config_file: Path | None = typer.Option(None, "--config", "-c", help="BAM config file"),
+    log_level: str = typer.Option("INFO", "--log-level", help="Logging level"),
+) -> None:
+    """
+    Execute operations published by `apply --coordinator`.
+
+    Leases ready operations from the work queue, executes them against BAM
+    and reports results and created IDs back. Run as many workers as BAM can
+    take, on any hosts that can reach the queue database; the coordinator
+    records the results. Exits when no queued work is left.
+
+    Examples:
+        bluecat-import worker /shared/queue.db
+        bluecat-import worker /shared/queue.db --config prod.yaml --wait 600
+    """
+    import asyncio
+
+    from .config import load_config
+    from .constants import LEASE_SECONDS, LOG_SAMPLE_BURST
+    from .execution.distributed import QueueWorker
+    from .observability import configure_logging
+    from .persistence.work_queue import WorkQueue
+
+    configure_logging(
+        level=log_level, json_logs=False, background=True, sample_burst=LOG_SAMPLE_BURST
+    )
+    config = load_config(config_file)
+    if not config.bam:
+        console.print("\n[bold red]ERROR:[/bold red] BAM configuration required")
+        console.print(
+            "Set BAM_URL, BAM_USERNAME, BAM_PASSWORD environment variables or use --config"
+        )
+        raise typer.Exit(code=1)
+
+    async def run_worker() -> int:
+        with WorkQueue(queue_db) as queue:
+            queue_worker = QueueWorker(config, queue, lease_seconds=lease_seconds or LEASE_SECONDS)
+            console.print(f"Worker [cyan]{queue_worker.worker_id}[/cyan] polling {queue_db}")
+            return await queue_worker.run(session_id=session, wait=wait)
+
+    try:
+        processed = asyncio.run(run_worker())
+    except Exception as e:
+        console.print(f"\n[bold red]ERROR:[/bold red] {str(e)}")
+        raise typer.Exit(code=1) from e
+    console.print(f"[green]Worker finished:[/green] {processed} operations executed")
+
+
 # Note: The _create_operation_from_row function has been moved to
 # src/importer/core/operation_factory.py as part of the OperationFactory class.
 # This improves separation of concerns by keeping CLI code focused on user interaction.
@@ -475,6 +717,7 @@ def rollback(
             raise typer.Abort()
 
     async def run_rollback() -> None:
+        from .config import ImporterConfig
         from .execution.runner import ImportRunner
 
         config = ImporterConfig.from_env()
@@ -742,40 +985,52 @@ def export(
 def status(
     session_id: str = typer.Argument(..., help="Session ID to check"),
     checkpoint_db: Path = typer.Option(
-        Path(".checkpoints/checkpoints.db"),
+        Path(".checkpoints/checkpoint.db"),
         help="Checkpoint database path",
     ),
+    changelog_db: Path = typer.Option(
+        Path(".changelogs/changelog.db"),
+        help="Changelog database path",
+    ),
 ) -> None:
     """
     Check status of running or completed import session.
 
-    Shows checkpoint information and progress.
+    Shows checkpoint information, progress and the changelog summary.
 
     Examples:
         bluecat-import status abc12345
         bluecat-import status abc12345 --checkpoint-db custom/path.db
     """
-    from .persistence import CheckpointManager
+    from .persistence import ChangeLog, CheckpointManager
 
     console.print(f"\n[bold blue]Session Status:[/bold blue] [cyan]{session_id}[/cyan]\n")
 
-    if not checkpoint_db.exists():
-        console.print("[yellow]WARNING: No checkpoint database found[/yellow]")
-        console.print(f"Path: {checkpoint_db}")
+    if not checkpoint_db.exists() and not changelog_db.exists():
+        console.print("[yellow]WARNING: No checkpoint or changelog database found[/yellow]")
+        console.print(f"Paths: {checkpoint_db}, {changelog_db}")
         return
 
-    with CheckpointManager(checkpoint_db) as manager:
-        checkpoint = manager.get_last_checkpoint(session_id)
+    checkpoint = None
+    if checkpoint_db.exists():
+        with CheckpointManager(checkpoint_db) as manager:
+            checkpoint = manager.get_latest_checkpoint(session_id)
 
-        if not checkpoint:
-            console.print(f"[yellow]WARNING: No checkpoint found for session {session_id}[/yellow]")
-            return
+    summary = None
+    if changelog_db.exists():
+        with ChangeLog(changelog_db) as changelog:
+            summary = changelog.get_session(session_id)
 
-        # Create status table
-        table = Table(title=f"Session {session_id}")
-        table.add_column("Property", style="cyan")
-        table.add_column("Value", style="green")
+    if not checkpoint and not summary:
+        console.print(f"[yellow]WARNING: No checkpoint found for session {session_id}[/yellow]")
+        return
+
+    # Create status table
+    table = Table(title=f"Session {session_id}")
+    table.add_column("Property", style="cyan")
+    table.add_column("Value", style="green")
 
+    if checkpoint:
         table.add_row("Status", checkpoint.status.upper())
         table.add_row("Timestamp", checkpoint.timestamp)
         table.add_row("Batch ID", str(checkpoint.batch_id))
@@ -789,21 +1044,30 @@ def status(
             pct = (checkpoint.completed_operations / checkpoint.total_operations) * 100
             table.add_row("Completion", f"{pct:.1f}%")
 
-        console.print(table)
+    if summary:
+        table.add_row("First Operation", summary["start_time"][:19])
+        table.add_row("Last Operation", summary["end_time"][:19])
+        table.add_row("Recorded Operations", str(summary["total_operations"]))
+        table.add_row("Successful", str(summary["successful"]))
+        table.add_row("Failed", str(summary["failed"]))
 
-        if checkpoint.status == "in_progress":
-            console.print("\n[yellow]INFO: Session is still in progress[/yellow]")
-            console.print("To resume: [cyan]bluecat-import apply <csv_file> --resume[/cyan]")
-        elif checkpoint.status == "completed":
-            console.print("\n[green]SUCCESS: Session completed successfully[/green]")
-        elif checkpoint.status == "failed":
-            console.print("\n[red]ERROR: Session failed[/red]")
-            import json
+    console.print(table)
 
-            if checkpoint.metadata:
-                metadata = json.loads(checkpoint.metadata)
-                if "error" in metadata:
-                    console.print(f"Error: {metadata['error']}")
+    if not checkpoint:
+        return
+    if checkpoint.status == "in_progress":
+        console.print("\n[yellow]INFO: Session is still in progress[/yellow]")
+        console.print("To resume: [cyan]bluecat-import apply <csv_file> --resume[/cyan]")
+    elif checkpoint.status == "completed":
+        console.print("\n[green]SUCCESS: Session completed successfully[/green]")
+    elif checkpoint.status == "failed":
+        console.print("\n[red]ERROR: Session failed[/red]")
+        import json
+
+        if checkpoint.metadata:
+            metadata = json.loads(checkpoint.metadata)
+            if "error" in metadata:
+                console.print(f"Error: {metadata['error']}")
 
 
 @app.command()
@@ -889,6 +1153,167 @@ def history(
         console.print("\n[dim]To see details: bluecat-import status <session_id>[/dim]")
 
 
+@app.command()
+def prune(
+    older_than: int = typer.Option(
+        90, "--older-than", min=0, help="Delete sessions whose last operation is older (days)"
+    ),
+    keep: int = typer.Option(10, "--keep", min=0, help="Always keep this many recent sessions"),
+    changelog_db: Path = typer.Option(
+        Path(".changelogs/changelog.db"),
+        help="Changelog database path",
+    ),
+    vacuum: bool = typer.Option(
+        True, "--vacuum/--no-vacuum", help="Compact the database file after pruning"
+    ),
+    dry_run: bool = typer.Option(
+        False, "--dry-run", is_flag=True, help="Show what would be deleted"
+    ),
+    yes: bool = typer.Option(False, "--yes", "-y", is_flag=True, help="Skip confirmation"),
+) -> None:
+    """
+    Apply a retention policy to the changelog database.
+
+    Deletes old sessions (entries and summaries) and compacts the file.
+    Pruned sessions can no longer be inspected with `history` or `status`.
+
+    Examples:
+        bluecat-import prune --dry-run
+        bluecat-import prune --older-than 30 --keep 5 --yes
+    """
+    from .persistence import ChangeLog
+
+    console.print("\n[bold blue]Prune Changelog[/bold blue]\n")
+
+    if not changelog_db.exists():
+        console.print("[yellow]WARNING: No changelog database found[/yellow]")
+        console.print(f"Path: {changelog_db}")
+        return
+
+    with ChangeLog(changelog_db) as changelog:
+        candidates = changelog.prune_sessions(older_than, keep_last=keep, dry_run=True)
+
+        if not candidates:
+            console.print(f"No sessions older than {older_than} days to prune")
+            return
+
+        entries = sum(s["total_operations"] for s in candidates)
+        console.print(
+            f"{len(candidates)} session(s) with {entries} changelog entries are older than "
+            f"{older_than} days (keeping the {keep} most recent)"
+        )
+
+        if dry_run:
+            for session in candidates:
+                console.print(f"  {session['session_id']}  {session['end_time'][:19]}")
+            console.print("\n[dim]Dry run: nothing deleted[/dim]")
+            return
+
+        if not yes and not typer.confirm("Delete these sessions?"):
+            raise typer.Abort()
+
+        size_before = changelog_db.stat().st_size
+        pruned = changelog.prune_sessions(older_than, keep_last=keep)
+        if vacuum:
+            changelog.compact()
+        size_after = changelog_db.stat().st_size
+
+    console.print(f"[green]SUCCESS: Pruned {len(pruned)} session(s)[/green]")
+    if vacuum:
+        console.print(f"Database size: {size_before:,} -> {size_after:,} bytes")
+
+
+@app.command()
+def snapshot(
+    config_names: list[str] | None = typer.Option(
+        None, "--config-name", "-n", help="Configuration to pull (repeatable)"
+    ),
+    addresses: bool = typer.Option(False, "--addresses", help="Also pull IP addresses"),
+    records: bool = typer.Option(False, "--records", help="Also pull DNS resource records"),
+    refresh: bool = typer.Option(
+        False,
+        "--refresh",
+        help="Update configurations already in the snapshot (incremental where BAM allows)",
+    ),
+    full: bool = typer.Option(False, "--full", help="With --refresh, always re-pull"),
+    db: Path | None = typer.Option(
+        None, "--db", help="Snapshot database path (default: cache.snapshot_path)"
+    ),
+    config_file: Path | None = typer.Option(None, "--config", "-c", help="BAM config file"),
+) -> None:
+    """
+    Pull BAM configurations into a local snapshot for offline resolution.
+
+    `apply --snapshot` and `validate --snapshot` answer path resolution,
+    parent discovery and existence checks for the captured configurations
+    locally while the snapshot is younger than cache.snapshot_max_age.
+
+    Examples:
+        bluecat-import snapshot -n Default
+        bluecat-import snapshot -n Default -n Lab --addresses --records
+        bluecat-import snapshot --refresh
+    """
+    import asyncio
+
+    from .bam.client import BAMClient
+    from .bam.snapshot import refresh_snapshot, take_snapshot
+    from .config import load_config
+    from .persistence.snapshot import SnapshotStore
+
+    if not refresh and not config_names:
+        console.print("[red]ERROR: Specify --config-name or --refresh[/red]")
+        raise typer.Exit(code=1)
+
+    config = load_config(config_file)
+    if not config.bam:
+        console.print("\n[bold red]ERROR:[/bold red] BAM configuration required")
+        console.print(
+            "Set BAM_URL, BAM_USERNAME, BAM_PASSWORD environment variables or use --config"
+        )
+        raise typer.Exit(code=1)
+    bam_config = config.bam
+    db_path = db or Path(config.cache.snapshot_path)
+
+    console.print("\n[bold blue]BAM Snapshot[/bold blue]\n")
+
+    async def run_snapshot() -> dict[str, str]:
+        async with BAMClient(config=bam_config) as client:
+            with SnapshotStore(db_path) as store:
+                if refresh:
+                    return await refresh_snapshot(client, store, config_names or None, full=full)
+                stored = await take_snapshot(
+                    client,
+                    store,
+                    config_names or [],
+                    include_addresses=addresses,
+                    include_records=records,
+                )
+                return {c.name: "full" for c in stored}
+
+    try:
+        modes = asyncio.run(run_snapshot())
+    except Exception as e:
+        console.print(f"[red]ERROR: Snapshot failed: {e}[/red]")
+        raise typer.Exit(code=1) from e
+
+    table = Table(title=f"Snapshot {db_path}")
+    table.add_column("Configuration", style="cyan")
+    table.add_column("Resources", justify="right")
+    table.add_column("Collections")
+    table.add_column("Updated")
+    with SnapshotStore(db_path) as store:
+        for stored_config in store.configurations():
+            if stored_config.name not in modes:
+                continue
+            table.add_row(
+                stored_config.name,
+                str(store.count(stored_config.id)),
+                ", ".join(stored_config.collections),
+                modes[stored_config.name],
+            )
+    console.print(table)
+
+
 @app.command()
 def version() -> None:
     """Show version information and features."""
@@ -70,6 +70,9 @@ class PolicyConfig:
     max_concurrency: int = 50
     min_concurrency: int = 1
     enable_adaptive_throttle: bool = True
+    # Options: "critical_path" (start ready operations longest chain first),
+    # "ready" (start them in plan order), "batch" (one dependency depth at a time)
+    scheduling: str = "critical_path"
 
     # Observability
     enable_metrics: bool = False
@@ -88,6 +91,13 @@ class BAMConfig:
     verify_ssl: bool = True
     max_connections: int = 50  # Maximum total connections
     max_keepalive: int = 20  # Maximum keep-alive connections
+    session_timeout: int = 1800  # Seconds a BAM session lasts
+    auto_renew: bool = True  # Renew sessions in the background before they expire
+    read_urls: list[str] = field(default_factory=list)  # Read instances for GET requests
+    health_check_interval: int = 30  # Seconds before probing an unhealthy read instance
+    read_after_write_seconds: float = 5.0  # GETs stay on the primary this long after a write
+    response_cache_ttl: float = 30.0  # Seconds a GET response without ETag/Last-Modified is reused
+    response_cache_size: int = 1024  # GET responses kept for reuse (0 disables the cache)
 
 
 @dataclass
@@ -108,6 +118,8 @@ class CacheConfig:
     enabled: bool = True
     directory: str = ".resolver_cache"
     view_cache_ttl: int = 300  # In-memory view cache TTL (5 minutes)
+    snapshot_path: str = ".snapshots/bam.db"  # Local BAM snapshot (bluecat-import snapshot)
+    snapshot_max_age: int = 3600  # Seconds before a snapshot is no longer trusted
 
 
 @dataclass
@@ -284,6 +296,11 @@ class ImporterConfig:
                 verify_ssl=verify_ssl,
                 max_connections=int(os.environ.get("BAM_MAX_CONNECTIONS", "50")),
                 max_keepalive=int(os.environ.get("BAM_MAX_KEEPALIVE", "20")),
+                read_urls=[
+                    url.strip()
+                    for url in os.environ.get("BAM_READ_URLS", "").split(",")
+                    if url.strip()
+                ],
             )
 
         logging_config = LoggingConfig(
@@ -14,6 +14,50 @@ DEFAULT_PAGE_SIZE: int = 100
 # Maximum page size for API requests
 MAX_PAGE_SIZE: int = 1000
 
+# Longest URL-encoded ``filter`` value per request. Web servers and proxies in
+# front of BAM commonly cap the request line at 8 KiB; this leaves room for the
+# path and the other query parameters.
+MAX_FILTER_LENGTH: int = 6000
+
+# Most values in a single ``field:in(...)`` filter term, however short
+MAX_IN_VALUES: int = 500
+
+# Concurrent requests per bulk existence check
+BULK_QUERY_CONCURRENCY: int = 8
+
+# Most operations the executor hands to one create_many()/delete_many() call;
+# each request the group sends still takes its own throttle slot
+HANDLER_GROUP_SIZE: int = 16
+
+# Results the executor may publish ahead of the result consumers before it
+# waits for them (backpressure), and most results handed to them at once
+RESULT_QUEUE_SIZE: int = 1000
+RESULT_CHUNK_SIZE: int = 500
+
+# Shards per worker process in sharded execution: more, smaller shards balance
+# uneven components and return results sooner
+SHARDS_PER_PROCESS: int = 4
+
+# Work queue (apply --coordinator / worker): seconds a worker holds leased
+# operations before another worker may take them over (renewed while it is
+# alive), leases an operation may lose before it is failed, and seconds
+# between queue polls when idle
+LEASE_SECONDS: int = 60
+MAX_LEASE_ATTEMPTS: int = 3
+QUEUE_POLL_INTERVAL: float = 0.5
+
+# Cost model: recent changelog sessions whose latencies the planner learns
+# from, and how many samples the fallback estimate counts as (a type needs
+# more observations than this before its own mean dominates)
+COST_HISTORY_SESSIONS: int = 20
+COST_PRIOR_WEIGHT: int = 5
+
+# Read routing: a session is renewed in the background once this fraction of
+# bam.session_timeout has passed, and a read instance is marked unhealthy
+# after this many consecutive connection failures or 5xx responses
+SESSION_REFRESH_FRACTION: float = 0.8
+READ_INSTANCE_FAILURE_THRESHOLD: int = 2
+
 
 # Supported CSV schema versions
 # Used by parser to warn about unsupported versions
@@ -94,3 +138,9 @@ RESOLVER_TYPE_MAP: dict[str, str] = {
     "dns_deployment_role": "dns_deployment_role",
     "location": "Location",
 }
+
+# Log sampling (apply, worker): an event below WARNING may be logged this many
+# times per window of LOG_SAMPLE_INTERVAL seconds; further repeats are dropped
+# and counted in a summary event when the window closes
+LOG_SAMPLE_BURST: int = 20
+LOG_SAMPLE_INTERVAL: float = 10.0
@@ -2,22 +2,35 @@
 
 This package contains the core engines for parsing, state loading,
 diff computation, exporting, path resolution, and operation creation.
+
+Exports are resolved lazily: importing one submodule (e.g. core.sanitizer for
+`bluecat-import fix`) does not import the BAM client and row models.
 """
 
-from .diff_engine import DiffEngine
-from .exporter import BlueCatExporter
-from .operation_factory import DeferredResolver, OperationFactory, PendingResources
-from .parser import CSVParser
-from .resolver import Resolver
-from .state_loader import StateLoader
+from importlib import import_module
+from typing import Any
+
+_EXPORTS = {
+    "DeferredResolver": ".operation_factory",
+    "DiffEngine": ".diff_engine",
+    "BlueCatExporter": ".exporter",
+    "IncrementalSelection": ".incremental",
+    "OperationFactory": ".operation_factory",
+    "CSVParser": ".parser",
+    "PendingResources": ".operation_factory",
+    "Resolver": ".resolver",
+    "StateLoader": ".state_loader",
+    "fingerprint_rows": ".incremental",
+    "select_incremental_rows": ".incremental",
+}
+
+__all__ = list(_EXPORTS)
+
 
-__all__ = [
-    "DeferredResolver",
-    "DiffEngine",
-    "BlueCatExporter",
-    "OperationFactory",
-    "CSVParser",
-    "PendingResources",
-    "Resolver",
-    "StateLoader",
-]
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,280 @@
+"""Columnar validation of single-type CSV sections.
+
+Purpose:
+-------
+Large CSVs are mostly long runs of one object type under one header
+(thousands of ``ip4_address`` or ``host_record`` rows). Validating each of
+them through the ``CSVRow`` discriminated union calls the same field
+validators once per row and builds a cleaned dict per row just to hand it to
+pydantic.
+
+``validate_section`` instead takes the whole section at once, cleans and
+checks it column by column (addresses through one batched dotted-quad check,
+MACs through one regex per column, integers and booleans through lookups) and
+builds row models directly for the rows whose every column passed.
+
+Any row with a value the column checks do not positively accept is left for
+the per-row path, which accepts it or produces the usual error message. A
+section that is not a single supported object type, or whose header has a
+field column the checks do not cover, is left to the per-row path entirely.
+The column checks only ever reject, never accept, what the models would
+reject, so both paths produce equal models.
+
+Usage:
+-----
+```python
+models = validate_section(headers, rows)
+if models is None:
+    ...  # validate every row individually
+for row_list, model in zip(rows, models):
+    ...  # model is None: validate this row individually
+```
+"""
+
+import re
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from itertools import chain
+from typing import Any, cast
+
+from pydantic import BaseModel
+
+from ..models.csv_row import CSVRow, CSVRowBase, HostRecordRow, IP4AddressRow
+from ..utils.ipnet import ipv4_address_mask
+
+# Marks a value the column checks did not accept
+_REJECT: Any = object()
+
+# Fields the parser keeps "" for instead of converting to None: they use
+# strip_whitespace_preserve_empty, and an empty or "@" DNS name is the apex
+PRESERVE_EMPTY_FIELDS = frozenset({"description", "parent_code", "name"})
+
+_ACTIONS = frozenset({"create", "update", "delete"})
+_IP_STATES = frozenset({"STATIC", "RESERVED", "DHCP_RESERVED", "GATEWAY"})
+# The strings pydantic's lax mode accepts as booleans (case-insensitive)
+_BOOLS = {
+    **dict.fromkeys(("1", "true", "t", "yes", "y", "on"), True),
+    **dict.fromkeys(("0", "false", "f", "no", "n", "off"), False),
+}
+_MAC = re.compile(r"([0-9A-Fa-f]{2}[:-]){5}[0-9A-Fa-f]{2}")
+
+Column = list[Any]
+Check = Callable[[Column], Column]
+
+
+def _keep(values: Column) -> Column:
+    return values
+
+
+def _required(values: Column) -> Column:
+    return [_REJECT if v is None else v for v in values]
+
+
+def _text(values: Column) -> Column:
+    # strip_whitespace: values are already stripped, only "" -> None remains
+    return [v or None for v in values]
+
+
+def _required_text(values: Column) -> Column:
+    return [v or _REJECT for v in values]
+
+
+def _action(values: Column) -> Column:
+    return [v if v in _ACTIONS else _REJECT for v in values]
+
+
+def _optional_int(values: Column) -> Column:
+    # Plain digits only; signs, underscores and "1.0" go through pydantic
+    return [
+        None if v is None else int(v) if v.isascii() and v.isdigit() else _REJECT for v in values
+    ]
+
+
+def _optional_bool(values: Column) -> Column:
+    return [None if v is None else _BOOLS.get(v.lower(), _REJECT) for v in values]
+
+
+def _ipv4(values: Column) -> Column:
+    mask = ipv4_address_mask(v or "" for v in values)
+    return [v if ok else _REJECT for v, ok in zip(values, mask, strict=True)]
+
+
+def _ipv4_list(values: Column) -> Column:
+    # HostRecordRow.addresses: pipe-separated, blanks ignored, at least one
+    split = [[a for a in map(str.strip, v.split("|")) if a] if v else [] for v in values]
+    mask = ipv4_address_mask(chain.from_iterable(split))
+    checked, start = [], 0
+    for v, parts in zip(values, split, strict=True):
+        end = start + len(parts)
+        checked.append(v if parts and all(mask[start:end]) else _REJECT)
+        start = end
+    return checked
+
+
+def _mac(values: Column) -> Column:
+    match = _MAC.fullmatch
+    return [v if v is None or match(v) else _REJECT for v in values]
+
+
+def _ip_state(values: Column) -> Column:
+    return [
+        None if v is None else upper if (upper := v.upper()) in _IP_STATES else _REJECT
+        for v in values
+    ]
+
+
+def _dns_name(values: Column) -> Column:
+    return [v or "@" for v in values]
+
+
+_BASE_CHECKS: dict[str, Check] = {
+    "row_id": _required,
+    "object_type": _keep,
+    "action": _action,
+    "_version": _required,
+    "bam_id": _optional_int,
+    "verify_name": _keep,
+    "verify_address": _keep,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class _Spec:
+    """How to check each column of one row model, keyed by CSV column name."""
+
+    model: type[CSVRowBase]
+    checks: dict[str, Check]
+
+    def field_of(self, column: str) -> str:
+        """Model field name for a column (``_version`` is an alias)."""
+        return "version" if column == "_version" else column
+
+
+SPECS: dict[str, _Spec] = {
+    "ip4_address": _Spec(
+        IP4AddressRow,
+        {
+            **_BASE_CHECKS,
+            "config": _required_text,
+            "address": _ipv4,
+            "name": _text,
+            "mac": _mac,
+            "parent": _text,
+            "description": _keep,
+            "location_code": _text,
+            "state": _ip_state,
+        },
+    ),
+    "host_record": _Spec(
+        HostRecordRow,
+        {
+            **_BASE_CHECKS,
+            "config": _required_text,
+            "view_path": _required_text,
+            "name": _dns_name,
+            "addresses": _ipv4_list,
+            "ttl": _optional_int,
+            "description": _keep,
+            "location_code": _text,
+            "ptr": _optional_bool,
+        },
+    ),
+}
+
+
+def _transpose(rows: Sequence[Sequence[str]], width: int) -> list[tuple[str, ...]]:
+    """Columns of the rows, short rows padded with "" and long ones truncated."""
+    if set(map(len, rows)) != {width}:
+        rows = [[*row[:width], *[""] * (width - len(row))] for row in rows]
+    return list(zip(*rows, strict=True))
+
+
+def clean_column(header: str, cells: Sequence[str]) -> Column:
+    """Strip a column and turn blanks into None, as CSVParser does per row."""
+    column = list(map(str.strip, cells))
+    if header in PRESERVE_EMPTY_FIELDS:
+        return column
+    return [v or None for v in column]
+
+
+def _rejected(column: Column) -> list[int]:
+    if _REJECT not in column:
+        return []
+    return [i for i, v in enumerate(column) if v is _REJECT]
+
+
+def _defaults(model: type[BaseModel]) -> dict[str, Any]:
+    return {
+        name: field.get_default(call_default_factory=True)
+        for name, field in model.model_fields.items()
+        if not field.is_required()
+    }
+
+
+def validate_section(
+    headers: Sequence[str], rows: Sequence[Sequence[str]]
+) -> list[CSVRow | None] | None:
+    """
+    Validate the data rows under one header column by column.
+
+    Args:
+        headers: Cleaned header names of the section
+        rows: Raw cell lists of its data rows (blank rows already skipped)
+
+    Returns:
+        One model per row, None for rows that need per-row validation; or
+        None if the whole section needs per-row validation
+    """
+    if not rows or "object_type" not in headers:
+        return None
+    # dict(zip(headers, row)) semantics: the last of duplicate columns wins
+    index = {header: i for i, header in enumerate(headers)}
+    columns = _transpose(rows, len(headers))
+    types = clean_column("object_type", columns[index["object_type"]])
+    spec = SPECS.get(types[0]) if types[0] is not None else None
+    if spec is None or types.count(types[0]) != len(types):
+        return None
+
+    fields = spec.model.model_fields
+    checked: dict[str, Column] = {}
+    extra: dict[str, Column] = {}
+    for header, i in index.items():
+        name = spec.field_of(header)
+        if header in spec.checks:
+            checked[name] = spec.checks[header](clean_column(header, columns[i]))
+        elif name in fields or header in fields:
+            # A field the checks do not cover (e.g. the "version" spelling)
+            return None
+        else:
+            extra[header] = clean_column(header, columns[i])
+    if any(field.is_required() and name not in checked for name, field in fields.items()):
+        return None
+
+    rejected = {i for column in checked.values() for i in _rejected(column)}
+    defaults = _defaults(spec.model)
+    names = list(checked)
+    extra_names = list(extra)
+    fields_set = set(names) | set(extra_names)
+    extras = zip(*extra.values(), strict=True) if extra else ((),) * len(rows)
+
+    # What model_construct does, without its per-field default lookups
+    model = spec.model
+    new = model.__new__
+    setattr_ = object.__setattr__
+    models: list[CSVRow | None] = []
+    for i, (values, extra_values) in enumerate(
+        zip(zip(*checked.values(), strict=True), extras, strict=True)
+    ):
+        if i in rejected:
+            models.append(None)
+            continue
+        row = new(model)
+        data = defaults.copy()
+        data.update(zip(names, values, strict=True))
+        setattr_(row, "__dict__", data)
+        setattr_(row, "__pydantic_extra__", dict(zip(extra_names, extra_values, strict=True)))
+        setattr_(row, "__pydantic_fields_set__", fields_set.copy())
+        setattr_(row, "__pydantic_private__", None)
+        # SPECS only cover members of the CSVRow union
+        models.append(cast(CSVRow, row))
+    return models
@@ -44,7 +44,6 @@ CSV Row: ip4_network, create, Default, 10.1.0.0/24
 4. Returns Operation with payload containing block_id or _deferred_block_cidr
 """
 
-import ipaddress
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -52,6 +51,7 @@ import structlog
 
 from ..bam.client import BAMClient
 from ..models.operations import Operation, OperationType
+from ..utils.ipnet import NetworkIndex, parse_address, parse_network, try_parse_network
 from .resolver import Resolver
 
 logger = structlog.get_logger(__name__)
@@ -160,6 +160,10 @@ class DeferredResolver:
         self.pending = pending
         # Maps created resources to their BAM IDs
         self.created_ids: dict[str, int] = {}  # "type:key" -> BAM ID
+        # Containment indexes over pending blocks/networks, built on first lookup,
+        # with the size of the pending map each was built from
+        self._block_index: tuple[int, NetworkIndex[tuple[str, int]]] | None = None
+        self._network_index: tuple[int, NetworkIndex[tuple[str, int]]] | None = None
 
     def register_created_resource(self, resource_type: str, key: str, bam_id: int) -> None:
         """Register a resource that was just created.
@@ -224,9 +228,31 @@ class DeferredResolver:
         """
         return self.pending.zones.get(zone_name)
 
+    @staticmethod
+    def _build_index(
+        pending: dict[str, int], cached: tuple[int, NetworkIndex[tuple[str, int]]] | None
+    ) -> tuple[int, NetworkIndex[tuple[str, int]]]:
+        """
+        Return ``cached`` if ``pending`` has not grown since it was built, else rebuild it.
+
+        The size of ``pending`` is compared, not the size of the index: the
+        index merges equal networks and skips invalid CIDRs.
+        """
+        if cached is not None and cached[0] == len(pending):
+            return cached
+        index: NetworkIndex[tuple[str, int]] = NetworkIndex()
+        for cidr, row_id in pending.items():
+            net = try_parse_network(cidr)
+            if net is not None:
+                index.add(net, (cidr, row_id))
+        return len(pending), index
+
     def find_containing_pending_block(self, network_cidr: str) -> tuple[str, int] | None:
         """Find a pending block that would contain the given network.
 
+        When blocks are nested, the most specific one is returned, matching
+        BAMClient.find_block_containing_network.
+
         Args:
             network_cidr: Network CIDR to find container for
 
@@ -234,17 +260,12 @@ class DeferredResolver:
             Tuple of (block_cidr, row_id) if found, None otherwise
         """
         try:
-            target_net = ipaddress.ip_network(network_cidr, strict=False)
-            for block_cidr, row_id in self.pending.blocks.items():
-                try:
-                    block_net = ipaddress.ip_network(block_cidr, strict=False)
-                    if target_net.subnet_of(block_net):
-                        return (block_cidr, row_id)
-                except (ValueError, TypeError):
-                    continue
-        except ValueError:
+            target_net = parse_network(network_cidr)
+        except (ValueError, TypeError):
             logger.warning(f"Invalid network CIDR during pending block check: {network_cidr}")
-        return None
+            return None
+        self._block_index = self._build_index(self.pending.blocks, self._block_index)
+        return self._block_index[1].find_containing(target_net)
 
     def find_containing_pending_network(self, address: str) -> tuple[str, int] | None:
         """Find a pending network that would contain the given address.
@@ -256,17 +277,12 @@ class DeferredResolver:
             Tuple of (network_cidr, row_id) if found, None otherwise
         """
         try:
-            target_ip = ipaddress.ip_address(address)
-            for net_cidr, row_id in self.pending.networks.items():
-                try:
-                    net = ipaddress.ip_network(net_cidr, strict=False)
-                    if target_ip in net:
-                        return (net_cidr, row_id)
-                except (ValueError, TypeError):
-                    continue
-        except ValueError:
+            target_ip = parse_address(address)
+        except (ValueError, TypeError):
             logger.warning(f"Invalid IP address during pending network check: {address}")
-        return None
+            return None
+        self._network_index = self._build_index(self.pending.networks, self._network_index)
+        return self._network_index[1].find_containing_address(target_ip)
 
     def check_pending_device_type(self, name: str) -> int | None:
         """Check if a device type is pending creation in this batch.
@@ -1687,11 +1703,8 @@ class OperationFactory:
             # Try to find the address in BAM
             try:
                 # Determine IP version
-                import ipaddress as ip_module
-
                 try:
-                    ip_obj = ip_module.ip_address(address_str)
-                    if isinstance(ip_obj, ip_module.IPv6Address):
+                    if parse_address(address_str).version == 6:
                         address_type = "IPv6Address"
                     else:
                         address_type = "IPv4Address"
@@ -23,6 +23,10 @@ Key Features:
 
 5. Extra Fields - Fields not in the model are preserved (useful for UDFs)
 
+6. Columnar Sections - The data rows under each header are validated together.
+   Sections of a single supported type (ip4_address, host_record) are checked
+   column by column (core.columnar); other rows are validated one at a time.
+
 CSV Format:
 ----------
 Standard format with headers on first line:
@@ -55,14 +59,18 @@ from pathlib import Path
 from typing import Any
 
 import structlog
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from ..constants import SUPPORTED_CSV_VERSIONS
 from ..models.csv_row import CSVRow
 from ..utils.exceptions import CSVValidationError
+from .columnar import PRESERVE_EMPTY_FIELDS, validate_section
 
 logger = structlog.get_logger(__name__)
 
+# Building the discriminated-union validator is expensive; do it once per process
+_ROW_ADAPTER: TypeAdapter[CSVRow] = TypeAdapter(CSVRow)
+
 
 class CSVParser:
     """
@@ -134,8 +142,8 @@ class CSVParser:
             reader = csv.reader(io.StringIO(csv_content))
 
             current_headers = None
-            rows: list[CSVRow] = []
-            seen_row_ids: dict[Any, int] = {}
+            # Data rows under the current header, validated together
+            section: list[tuple[int, list[str]]] = []
 
             for line_num, row_list in enumerate(reader, start=1):
                 # 1. Header Detection
@@ -143,12 +151,14 @@ class CSVParser:
                 # Header lines are identified by 'row_id' in the first column (required field)
                 # This enables multi-type CSV files without pre-defining all columns
                 if row_list and row_list[0].strip().lstrip("*") == "row_id":
+                    self._parse_section(current_headers, section, strict, rows, seen_row_ids)
+                    section = []
                     current_headers = [h.strip().lstrip("*") for h in row_list]
                     logger.debug("Schema switch detected", headers=current_headers, line=line_num)
                     continue
 
                 # 2. Skip completely empty rows
-                if not row_list or all(not cell.strip() for cell in row_list):
+                if not "".join(row_list).strip():
                     continue
 
                 # 3. Safety Check: Data found before any header
@@ -159,85 +169,9 @@ class CSVParser:
                         )
                     continue
 
-                # 4. Process Data Row
-                try:
-                    # Check for column count mismatch
-                    if len(row_list) != len(current_headers):
-                        logger.warning(
-                            "Column count mismatch",
-                            line=line_num,
-                            expected=len(current_headers),
-                            actual=len(row_list),
-                            extra_columns=(
-                                row_list[len(current_headers) :]
-                                if len(row_list) > len(current_headers)
-                                else None
-                            ),
-                        )
-
-                    # Create the dictionary expected by the validation logic
-                    # Pad row_list if shorter than headers, truncate if longer
-                    padded_row = row_list[: len(current_headers)]
-                    while len(padded_row) < len(current_headers):
-                        padded_row.append("")
-                    row_dict = dict(zip(current_headers, padded_row, strict=True))
-
-                    # Clean empty string values to None
-                    cleaned = self._clean_row_dict(row_dict)
-
-                    # Validate version if present (but make it optional)
-                    if "_version" in cleaned and cleaned["_version"] not in SUPPORTED_CSV_VERSIONS:
-                        logger.warning(
-                            "Unsupported CSV version",
-                            line=line_num,
-                            version=cleaned["_version"],
-                            supported=list(SUPPORTED_CSV_VERSIONS),
-                        )
-
-                    # Pydantic discriminated union automatically picks correct model
-                    row = self._validate_row(cleaned)
+                section.append((line_num, row_list))
 
-                    # Check for duplicate row_id with detailed reporting
-                    if row.row_id in seen_row_ids:
-                        first_line = seen_row_ids[row.row_id]
-                        error = CSVValidationError(
-                            f"Duplicate row_id '{row.row_id}' "
-                            f"(first occurrence on line {first_line}, duplicate on line {line_num})",
-                            line_number=line_num,
-                        )
-                        if strict:
-                            logger.error(
-                                "CSV validation failed - duplicate row_id",
-                                line=line_num,
-                                row_id=row.row_id,
-                            )
-                            raise error
-                        self.errors.append(error)
-                        continue
-
-                    seen_row_ids[row.row_id] = line_num
-                    rows.append(row)
-                    self.rows_parsed += 1
-
-                except ValidationError as e:
-                    error = CSVValidationError(
-                        f"Line {line_num}: {self._format_validation_error(e)}",
-                        line_number=line_num,
-                        original_error=e,
-                    )
-                    if strict:
-                        raise error from e
-                    self.errors.append(error)
-
-                except Exception as e:
-                    error = CSVValidationError(
-                        f"Line {line_num}: Unexpected error: {e}",
-                        line_number=line_num,
-                        original_error=e,
-                    )
-                    if strict:
-                        raise error from e
-                    self.errors.append(error)
+            self._parse_section(current_headers, section, strict, rows, seen_row_ids)
 
         if self.rows_parsed == 0:
             logger.warning(
@@ -255,6 +189,149 @@ class CSVParser:
 
         return rows
 
+    def _parse_section(
+        self,
+        headers: list[str] | None,
+        section: list[tuple[int, list[str]]],
+        strict: bool,
+        rows: list[CSVRow],
+        seen_row_ids: dict[Any, int],
+    ) -> None:
+        """
+        Validate the data rows under one header and append them to rows.
+
+        Single-type address and record sections are validated column by
+        column (see core.columnar); rows it does not accept, and every row of
+        other sections, are validated one at a time.
+
+        Args:
+            headers: Header of the section
+            section: (line number, cells) of its data rows
+            strict: Raise on the first error instead of collecting it
+            rows: Parsed rows to append to
+            seen_row_ids: row_id -> line number of the rows parsed so far
+        """
+        if not section or headers is None:
+            return
+        models = validate_section(headers, [row_list for _, row_list in section])
+        if models is not None:
+            logger.debug(
+                "Columnar section validated",
+                rows=len(section),
+                fallback=models.count(None),
+                line=section[0][0],
+            )
+        for i, (line_num, row_list) in enumerate(section):
+            model = models[i] if models is not None else None
+            self._parse_row(line_num, row_list, headers, model, strict, rows, seen_row_ids)
+
+    def _parse_row(
+        self,
+        line_num: int,
+        row_list: list[str],
+        current_headers: list[str],
+        row: CSVRow | None,
+        strict: bool,
+        rows: list[CSVRow],
+        seen_row_ids: dict[Any, int],
+    ) -> None:
+        """
+        Validate one data row (unless already validated) and append it to rows.
+
+        Args:
+            line_num: Line number of the row
+            row_list: Cells of the row
+            current_headers: Header of its section
+            row: Model already validated by the columnar path, or None
+            strict: Raise on the first error instead of collecting it
+            rows: Parsed rows to append to
+            seen_row_ids: row_id -> line number of the rows parsed so far
+        """
+        try:
+            # Check for column count mismatch
+            if len(row_list) != len(current_headers):
+                logger.warning(
+                    "Column count mismatch",
+                    line=line_num,
+                    expected=len(current_headers),
+                    actual=len(row_list),
+                    extra_columns=(
+                        row_list[len(current_headers) :]
+                        if len(row_list) > len(current_headers)
+                        else None
+                    ),
+                )
+
+            if row is None:
+                # Create the dictionary expected by the validation logic
+                # Pad row_list if shorter than headers, truncate if longer
+                padded_row = row_list[: len(current_headers)]
+                while len(padded_row) < len(current_headers):
+                    padded_row.append("")
+                row_dict = dict(zip(current_headers, padded_row, strict=True))
+
+                # Clean empty string values to None
+                cleaned = self._clean_row_dict(row_dict)
+                if "_version" in cleaned:
+                    self._check_version(line_num, cleaned["_version"])
+
+                # Pydantic discriminated union automatically picks correct model
+                row = self._validate_row(cleaned)
+            elif "_version" in current_headers:
+                self._check_version(line_num, row.version)
+
+            # Check for duplicate row_id with detailed reporting
+            if row.row_id in seen_row_ids:
+                first_line = seen_row_ids[row.row_id]
+                error = CSVValidationError(
+                    f"Duplicate row_id '{row.row_id}' "
+                    f"(first occurrence on line {first_line}, duplicate on line {line_num})",
+                    line_number=line_num,
+                )
+                if strict:
+                    logger.error(
+                        "CSV validation failed - duplicate row_id",
+                        line=line_num,
+                        row_id=row.row_id,
+                    )
+                    raise error
+                self.errors.append(error)
+                return
+
+            seen_row_ids[row.row_id] = line_num
+            rows.append(row)
+            self.rows_parsed += 1
+
+        except ValidationError as e:
+            error = CSVValidationError(
+                f"Line {line_num}: {self._format_validation_error(e)}",
+                line_number=line_num,
+                original_error=e,
+            )
+            if strict:
+                raise error from e
+            self.errors.append(error)
+
+        except Exception as e:
+            error = CSVValidationError(
+                f"Line {line_num}: Unexpected error: {e}",
+                line_number=line_num,
+                original_error=e,
+            )
+            if strict:
+                raise error from e
+            self.errors.append(error)
+
+    def _check_version(self, line_num: int, version: Any) -> None:
+        """Warn about an unsupported _version (the column is optional)."""
+        if version not in SUPPORTED_CSV_VERSIONS:
+            logger.warning(
+                "Unsupported CSV version",
+                line=line_num,
+                version=version,
+                supported=list(SUPPORTED_CSV_VERSIONS),
+            )
+
     def _clean_row_dict(self, row_dict: dict[str, Any]) -> dict[str, Any]:
         """
         Clean row dictionary by converting empty strings to None and stripping whitespace.
@@ -266,11 +343,6 @@ class CSVParser:
             Cleaned dictionary
         """
         cleaned = {}
-        # Fields that should allow empty strings (for clearing values or semantic meaning)
-        # These correspond to fields using strip_whitespace_preserve_empty
-        # Note: "name" is preserved for DNS apex records (empty or "@" means zone apex)
-        PRESERVE_EMPTY_FIELDS = {"description", "parent_code", "name"}
-
         for k, v in row_dict.items():
             if isinstance(v, str):
                 v = v.strip()
@@ -312,10 +384,7 @@ class CSVParser:
             )
 
         # Pydantic v2 will automatically select the right model based on object_type
-        from pydantic import TypeAdapter
-
-        adapter = TypeAdapter(CSVRow)
-        return adapter.validate_python(cleaned)
+        return _ROW_ADAPTER.validate_python(cleaned)
 
     def _format_validation_error(self, error: ValidationError) -> str:
         """
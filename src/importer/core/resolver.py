@@ -9,7 +9,9 @@ from typing import Any
 import diskcache
 import structlog
 
+from ..bam.bulk_query import in_filters
 from ..bam.client import BAMClient
+from ..bam.lookup import lookup_profile
 from ..config import CacheConfig
 from ..constants import RESOLVER_TYPE_MAP
 from ..observability.metrics import get_global_collector
@@ -428,7 +430,8 @@ class Resolver:
             )
 
         try:
-            bam_id = await self._query_bam(path, resource_type)
+            with lookup_profile():
+                bam_id = await self._query_bam(path, resource_type)
 
             # Update cache with error handling
             try:
@@ -586,7 +589,8 @@ class Resolver:
                         error=str(e),
                     )
 
-        await asyncio.gather(*[fetch_config(name) for name in config_names])
+        with lookup_profile():
+            await asyncio.gather(*[fetch_config(name) for name in config_names])
 
         # 3. Bulk resolve Views
         # For each known config, fetch all views
@@ -604,7 +608,8 @@ class Resolver:
                         error=str(e),
                     )
 
-        await asyncio.gather(*[fetch_views(cid) for cid in config_map.values()])
+        with lookup_profile():
+            await asyncio.gather(*[fetch_views(cid) for cid in config_map.values()])
 
         # 4. Bulk resolve Blocks
         # For each known config, fetch all blocks (expensive if many, so maybe limit?)
@@ -632,13 +637,9 @@ class Resolver:
 
         logger.debug("Bulk resolving networks", count=len(cidrs), parent_id=parent_id)
         result = {}
-        chunk_size = 50
-
-        for i in range(0, len(cidrs), chunk_size):
-            chunk = cidrs[i : i + chunk_size]
-            escaped = [f"'{c}'" for c in chunk]
-            filter_str = f"range:in({','.join(escaped)})"
 
+        # Chunks bounded by encoded URL length, shared with BulkValidator
+        for filter_str in in_filters("range", cidrs):
             try:
                 # Assuming simple network parenting
                 nets = await self.client.get_child_networks(parent_id, filter=filter_str)
@@ -670,13 +671,8 @@ class Resolver:
 
         logger.debug("Bulk resolving zones", count=len(zone_names), view_id=view_id)
         result = {}
-        chunk_size = 50
-
-        for i in range(0, len(zone_names), chunk_size):
-            chunk = zone_names[i : i + chunk_size]
-            escaped = [f"'{n}'" for n in chunk]
-            filter_str = f"name:in({','.join(escaped)})"
 
+        for filter_str in in_filters("name", zone_names):
             try:
                 zones = await self.client.get_zones_in_view(view_id, filter=filter_str)
                 for zone in zones:
@@ -3,9 +3,14 @@
 import csv
 import io
 import os
+import re
 import tempfile
-from dataclasses import dataclass, field
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
 from pathlib import Path
+from typing import BinaryIO, Literal
 
 import structlog
 from rich.console import Console
@@ -16,6 +21,43 @@ logger = structlog.get_logger(__name__)
 # Files larger than this threshold will use streaming mode
 STREAMING_THRESHOLD_BYTES = 50 * 1024 * 1024  # 50 MB
 
+# sanitize_to() reads the file in chunks of about this size (cut at a record
+# boundary) and keeps at most MAX_CHANGE_SAMPLES change descriptions.
+CHUNK_SIZE_BYTES = 8 * 1024 * 1024  # 8 MB
+MAX_CHANGE_SAMPLES = 1000
+
+# --- Raw-byte fast path -----------------------------------------------------
+# Whitespace str.strip() removes, as UTF-8 bytes. Space, tab, VT and FF are
+# stripped from unquoted cells with bytes.replace(). Lines containing a quote
+# or any of the rarer characters (or any other U+20xx character, which share
+# the \xe2\x80 prefix) go through the csv module instead, as do comment and
+# header lines. Regex scans over whole chunks are an order of magnitude
+# slower than bytes.find/count/replace, so they are only used anchored.
+_EDGE_SPACES = (b" ", b"\t", b"\x0b", b"\x0c")
+_TRIGGERS = (
+    b'"',
+    b"#",
+    b"row_id",
+    b"\x1c",
+    b"\x1d",
+    b"\x1e",
+    b"\x1f",
+    b"\xc2\x85",
+    b"\xc2\xa0",
+    b"\xe1\x9a\x80",
+    b"\xe2\x80",
+    b"\xe2\x81\x9f",
+    b"\xe3\x80\x80",
+)
+# ASCII bytes no trigger but "row_id" starts with; translate(None, _PLAIN_BYTES)
+# keeps only the bytes that may start one
+_PLAIN_BYTES = bytes(b for b in range(0x80) if b not in b'"#\x1c\x1d\x1e\x1f')
+_HEADER_LINE = re.compile(rb'[ \t]*"?[ \t]*row_id[ \t]*"?[ \t]*(?:,|\r?\n|\r?\Z)')
+_SKIPPED_LINE = re.compile(rb"[ \t\x0b\x0c\r]*(?:#|\n|\Z)")
+_COMMENT_LINE = re.compile(rb"[ \t\x0b\x0c]*#")
+# A cell with whitespace on both ends (or only whitespace), after its delimiter
+_BOTH_EDGES = re.compile(rb"[,\n][\t\x0b\x0c ][^,\n]*(?<=[\t\x0b\x0c ])\r?(?=[,\n])")
+
 
 @dataclass
 class SanitizeResult:
@@ -23,9 +65,21 @@ class SanitizeResult:
 
     original_path: Path
     has_changes: bool
-    cleaned_content: str
+    cleaned_content: str = ""
     changes: list[str] = field(default_factory=list)
     stats: dict[str, int] = field(default_factory=dict)
+    # Set by sanitize_to(): where the cleaned file was written (None if the
+    # input was already clean) and how many changes were counted but not kept
+    output_path: Path | None = None
+    changes_dropped: int = 0
+
+
+@dataclass(slots=True)
+class _Cursor:
+    """Next offset of token at or after the last search (-1 once exhausted)."""
+
+    token: bytes
+    pos: int
 
 
 class CSVSanitizer:
@@ -209,106 +263,125 @@ class CSVSanitizer:
             stats=stats,
         )
 
-    def _sanitize_streaming(self) -> SanitizeResult:
+    def sanitize_to(
+        self,
+        output_path: Path,
+        workers: int = 1,
+        chunk_size: int = CHUNK_SIZE_BYTES,
+    ) -> SanitizeResult:
         """
-        Streaming sanitization for large CSV files.
+        Sanitize the CSV file into output_path without holding it in memory.
+
+        The file is read as raw bytes in chunks cut at record boundaries.
+        Records without quotes or edge whitespace are copied unchanged, and
+        unquoted cells are stripped with a byte-level substitution. Only
+        quoted records, header rows and rows containing Unicode whitespace are
+        parsed with the csv module. Comments and blank lines are kept verbatim.
+        Only the first MAX_CHANGE_SAMPLES changes are described; the rest are
+        counted. Column counts are not checked.
 
-        Processes the file in chunks to avoid loading the entire file into memory.
-        Uses a temporary file to store the cleaned output.
+        Nothing is written if the file is already clean. Otherwise
+        output_path is written through a temporary sibling and replaced at the
+        end, so it may be the input file itself.
+
+        Args:
+            output_path: Where to write the cleaned file
+            workers: Processes cleaning chunks in parallel (1: in-process)
+            chunk_size: Bytes read per chunk
 
         Returns:
-            SanitizeResult object with details
+            SanitizeResult with ``output_path`` set if anything changed
+            (``cleaned_content`` is left empty)
         """
+        if not self.csv_path.exists():
+            raise FileNotFoundError(f"CSV file not found: {self.csv_path}")
+
+        logger.info(
+            "Starting chunked CSV sanitization",
+            csv_path=str(self.csv_path),
+            file_size_mb=round(self.csv_path.stat().st_size / (1024 * 1024), 2),
+            workers=workers,
+        )
         changes: list[str] = []
+        dropped = 0
         stats = {"rows_processed": 0, "cells_cleaned": 0, "headers_cleaned": 0}
-        current_headers: list[str] | None = None
-        has_changes = False
+        partial = output_path.with_name(f".{output_path.name}.partial")
+        out: BinaryIO | None = None
+
+        def with_room(chunks: Iterator[_Chunk]) -> Iterator[_Chunk]:
+            # Chunks only describe as many changes as may still be kept
+            for chunk in chunks:
+                chunk.max_samples = MAX_CHANGE_SAMPLES - len(changes)
+                yield chunk
 
-        # Create temp file for output
-        fd, temp_path = tempfile.mkstemp(suffix=".csv", prefix="sanitized_")
         try:
-            with (
-                open(self.csv_path, encoding="utf-8", newline="") as infile,
-                os.fdopen(fd, "w", encoding="utf-8", newline="") as outfile,
-            ):
-                reader = csv.reader(infile)
-                writer = csv.writer(outfile)
-
-                for row_idx, row in enumerate(reader):
-                    line_num = row_idx + 1
-                    clean_row = []
-                    row_changed = False
-
-                    # Check for header row (schema switch)
-                    if row and row[0].strip() == "row_id":
-                        # This is a header row
-                        for cell in row:
-                            clean_cell = cell.strip()
-                            if clean_cell != cell:
-                                # Only track first 1000 changes to avoid memory issues
-                                if len(changes) < 1000:
-                                    changes.append(
-                                        f"Row {row_idx + 1} (line ~{line_num}): "
-                                        f"Header '{cell}' -> '{clean_cell}'"
-                                    )
-                                stats["headers_cleaned"] += 1
-                                row_changed = True
-                            clean_row.append(clean_cell)
-                        current_headers = clean_row.copy()
-                    else:
-                        # Data row
-                        for idx, cell in enumerate(row):
-                            if not isinstance(cell, str):
-                                clean_row.append(cell)
-                                continue
-
-                            clean_cell = cell.strip()
-                            if clean_cell != cell:
-                                if len(changes) < 1000:
-                                    header_name = (
-                                        current_headers[idx]
-                                        if current_headers and idx < len(current_headers)
-                                        else f"col_{idx}"
-                                    )
-                                    changes.append(
-                                        f"Row {row_idx + 1} (line ~{line_num}) [{header_name}]: "
-                                        f"'{_truncate(cell)}' -> '{_truncate(clean_cell)}'"
-                                    )
-                                stats["cells_cleaned"] += 1
-                                row_changed = True
-                            clean_row.append(clean_cell)
-
-                    writer.writerow(clean_row)
-                    stats["rows_processed"] += 1
-
-                    if row_changed:
-                        has_changes = True
-
-                    # Log progress for large files
-                    if stats["rows_processed"] % 100000 == 0:
-                        logger.info(
-                            "Streaming sanitization progress",
-                            rows_processed=stats["rows_processed"],
-                        )
+            with open(self.csv_path, "rb") as source:
+                chunks = with_room(_split_chunks(source, chunk_size))
+                for chunk, cleaned in _map_chunks(chunks, workers):
+                    stats["rows_processed"] += cleaned.rows
+                    stats["cells_cleaned"] += cleaned.cells_cleaned
+                    stats["headers_cleaned"] += cleaned.headers_cleaned
+                    room = MAX_CHANGE_SAMPLES - len(changes)
+                    changes.extend(cleaned.changes[:room])
+                    dropped += cleaned.changes_dropped + max(0, len(cleaned.changes) - room)
+
+                    if cleaned.output is not None and out is None:
+                        # First change: copy the clean chunks before it
+                        out = open(partial, "wb")
+                        _copy_prefix(self.csv_path, out, chunk.offset)
+                    if out is not None:
+                        out.write(chunk.data if cleaned.output is None else cleaned.output)
+            if out is not None:
+                out.close()
+                os.replace(partial, output_path)
+        finally:
+            if out is not None and not out.closed:
+                out.close()
+            partial.unlink(missing_ok=True)
 
-            # Read the cleaned content from temp file
-            with open(temp_path, encoding="utf-8") as f:
-                cleaned_content = f.read()
+        has_changes = bool(stats["cells_cleaned"] or stats["headers_cleaned"])
+        logger.info("Chunked CSV sanitization complete", has_changes=has_changes, **stats)
+        return SanitizeResult(
+            original_path=self.csv_path,
+            has_changes=has_changes,
+            changes=changes,
+            stats=stats,
+            output_path=output_path if has_changes else None,
+            changes_dropped=dropped,
+        )
+
+    def _sanitize_streaming(self) -> SanitizeResult:
+        """
+        Streaming sanitization for large CSV files.
+
+        Runs the chunked fast path (``sanitize_to``) into a temporary file and
+        reads it back for ``cleaned_content``. Callers that can work with a
+        file should use ``sanitize_to`` directly.
 
+        Returns:
+            SanitizeResult object with details
+        """
+        fd, temp_path = tempfile.mkstemp(suffix=".csv", prefix="sanitized_")
+        os.close(fd)
+        try:
+            result = self.sanitize_to(Path(temp_path))
+            with open(result.output_path or self.csv_path, encoding="utf-8") as f:
+                cleaned_content = f.read()
         finally:
             # Clean up temp file
             if os.path.exists(temp_path):
                 os.unlink(temp_path)
 
-        if len(changes) >= 1000:
+        changes = result.changes
+        if result.changes_dropped:
             changes.append("... (additional changes truncated for memory efficiency)")
 
-        return SanitizeResult(
-            original_path=self.csv_path,
-            has_changes=has_changes,
+        return replace(
+            result,
             cleaned_content=cleaned_content,
             changes=changes,
-            stats=stats,
+            output_path=None,
+            changes_dropped=0,
         )
 
     def print_diff(self, result: SanitizeResult, console: Console) -> None:
@@ -317,7 +390,8 @@ class CSVSanitizer:
             console.print("[green]No issues found. CSV is clean.[/green]")
             return
 
-        console.print(f"[yellow]Found {len(result.changes)} issues in CSV:[/yellow]")
+        issues = len(result.changes) + result.changes_dropped
+        console.print(f"[yellow]Found {issues} issues in CSV:[/yellow]")
 
         # Show stats
         stats_table = Table(show_header=False, box=None)
@@ -335,8 +409,8 @@ class CSVSanitizer:
         for change in result.changes[:limit]:
             table.add_row(change)
 
-        if len(result.changes) > limit:
-            table.add_row(f"... and {len(result.changes) - limit} more")
+        if issues > limit:
+            table.add_row(f"... and {issues - limit} more")
 
         console.print(table)
 
@@ -348,3 +422,366 @@ def _truncate(s: str, max_len: int = 30) -> str:
     if len(s) > max_len:
         return s[: max_len - 3] + "..."
     return s
+
+
+def staging_path(target: Path) -> Path:
+    """Hidden sibling of target to sanitize into before replacing target."""
+    return target.with_name(f".{target.name}.sanitized")
+
+
+@dataclass(slots=True)
+class _Chunk:
+    """Whole records of the input and the context needed to clean them alone."""
+
+    offset: int
+    data: bytes
+    first_line: int
+    headers: list[str] | None
+    max_samples: int = MAX_CHANGE_SAMPLES
+
+
+@dataclass(slots=True)
+class _ChunkResult:
+    """Cleaned bytes of a chunk (None if unchanged) and its counters."""
+
+    output: bytes | None = None
+    rows: int = 0
+    cells_cleaned: int = 0
+    headers_cleaned: int = 0
+    changes: list[str] = field(default_factory=list)
+    changes_dropped: int = 0
+
+
+def _line_end(data: bytes, start: int) -> int:
+    end = data.find(b"\n", start)
+    return len(data) if end < 0 else end + 1
+
+
+def _quotes(data: bytes, start: int, end: int) -> int:
+    """Quote characters in data[start:end] outside comment lines."""
+    # The parser drops comment lines before reading the CSV, so a quote in
+    # a comment never opens a field.
+    count = data.count(b'"', start, end)
+    pos = data.find(b"#", start, end) if count else -1
+    while pos >= 0:
+        line_start = max(start, data.rfind(b"\n", 0, pos) + 1)
+        line_end = min(end, _line_end(data, pos))
+        if _COMMENT_LINE.match(data, line_start):
+            count -= data.count(b'"', line_start, line_end)
+        pos = data.find(b"#", line_end, end)
+    return count
+
+
+def _record_boundary(data: bytes) -> int:
+    """Offset just past the last newline that is not inside a quoted field."""
+    cut = data.rfind(b"\n")
+    quotes = _quotes(data, 0, cut) if cut >= 0 else 0
+    while cut >= 0 and quotes % 2:
+        previous = data.rfind(b"\n", 0, cut)
+        quotes -= _quotes(data, previous + 1, cut)
+        cut = previous
+    return cut + 1
+
+
+def _last_header(data: bytes) -> list[str] | None:
+    """Cleaned column names of the last header row in data, if any."""
+    end = len(data)
+    while (pos := data.rfind(b"row_id", 0, end)) >= 0:
+        start = data.rfind(b"\n", 0, pos) + 1
+        if _HEADER_LINE.match(data, start):
+            line = data[start : _line_end(data, start)].decode("utf-8").rstrip("\r\n")
+            return [cell.strip() for cell in next(csv.reader([line]))]
+        end = pos
+    return None
+
+
+def _split_chunks(source: BinaryIO, chunk_size: int) -> Iterator[_Chunk]:
+    """Read source in chunks of whole records, tracking line numbers and headers."""
+    offset, line = 0, 1
+    headers: list[str] | None = None
+    pending = b""
+    while True:
+        block = source.read(chunk_size)
+        data = pending + block if pending else block
+        if not block:
+            if data:
+                yield _Chunk(offset, data, line, headers)
+            return
+        cut = _record_boundary(data)
+        if not cut:
+            # A single record longer than the chunk: keep reading
+            pending = data
+            continue
+        chunk = _Chunk(offset, data[:cut], line, headers)
+        pending = data[cut:]
+        yield chunk
+        offset += cut
+        line += chunk.data.count(b"\n")
+        headers = _last_header(chunk.data) or headers
+
+
+def _copy_prefix(path: Path, out: BinaryIO, length: int) -> None:
+    """Copy the first length bytes of path to out."""
+    with open(path, "rb") as source:
+        while length > 0:
+            block = source.read(min(length, CHUNK_SIZE_BYTES))
+            if not block:
+                return
+            out.write(block)
+            length -= len(block)
+
+
+class _ChunkCleaner:
+    """Clean one chunk: strip plain spans with bytes ops, parse the rest."""
+
+    def __init__(self, chunk: _Chunk) -> None:
+        self.data = chunk.data
+        self.headers = chunk.headers
+        self.max_samples = chunk.max_samples
+        self.result = _ChunkResult()
+        self._line = chunk.first_line
+        self._line_pos = 0
+        # One pass tells which trigger bytes occur at all ("row_id" is plain text)
+        present = chunk.data.translate(None, _PLAIN_BYTES)
+        self._triggers = [
+            _Cursor(token, chunk.data.find(token))
+            for token in _TRIGGERS
+            if token == b"row_id" or token[0] in present
+        ]
+
+    def run(self) -> _ChunkResult:
+        data = self.data
+        pieces: list[bytes] = []
+        changed = False
+        pos = 0
+        while (start := self._next_special(pos)) >= 0:
+            plain = self._clean_plain(pos, start)
+            end, record = self._clean_record(start)
+            changed = changed or plain is not None or record is not None
+            pieces.append(data[pos:start] if plain is None else plain)
+            pieces.append(data[start:end] if record is None else record)
+            pos = end
+        tail = self._clean_plain(pos, len(data))
+        if tail is not None:
+            changed = True
+            pieces.append(tail)
+        elif changed:
+            pieces.append(data[pos:])
+
+        if changed:
+            self.result.output = b"".join(pieces)
+        return self.result
+
+    def _next_special(self, pos: int) -> int:
+        """Start of the first line at or after pos that needs _clean_record, or -1."""
+        data = self.data
+        while True:
+            first = -1
+            trigger = None
+            for cursor in self._triggers:
+                if 0 <= cursor.pos < pos:
+                    cursor.pos = data.find(cursor.token, pos)
+                found = cursor.pos
+                if found >= 0 and (first < 0 or found < first):
+                    first, trigger = found, cursor
+            if trigger is None:
+                return -1
+            start = data.rfind(b"\n", 0, first) + 1
+            token = trigger.token
+            if token == b"#" and not _COMMENT_LINE.match(data, start):
+                trigger.pos = data.find(token, first + 1)
+            elif token == b"row_id" and not _HEADER_LINE.match(data, start):
+                trigger.pos = data.find(token, first + 1)
+            else:
+                return start
+
+    def _line_at(self, pos: int) -> int:
+        # Positions are asked for in increasing order
+        self._line += self.data.count(b"\n", self._line_pos, pos)
+        self._line_pos = pos
+        return self._line
+
+    def _column_name(self, column: int) -> str:
+        if self.headers and column < len(self.headers):
+            return self.headers[column]
+        return f"col_{column}"
+
+    def _room(self) -> int:
+        return self.max_samples - len(self.result.changes)
+
+    def _clean_plain(self, start: int, end: int) -> bytes | None:
+        """
+        Strip the cells of data[start:end], which holds only unquoted rows.
+
+        Returns:
+            Cleaned bytes, or None if nothing needed stripping
+        """
+        if start == end:
+            return None
+        segment = self.data[start:end]
+        # Sentinel newlines make every cell start after "," or "\n" and end
+        # before one of them.
+        terminated = segment.endswith(b"\n")
+        buf = b"\n" + segment + (b"" if terminated else b"\n")
+        spaces = [space for space in _EDGE_SPACES if space in segment]
+        # (edge, replacement, count): trailing edges first, then leading
+        edges = [
+            (edge, replacement, buf.count(edge))
+            for space in spaces
+            for edge, replacement in (
+                (space + b",", b","),
+                (space + b"\n", b"\n"),
+                (space + b"\r\n", b"\r\n"),
+                (b"," + space, b","),
+                (b"\n" + space, b"\n"),
+            )
+        ]
+        found = [edge for edge in edges if edge[2]]
+        if not found:
+            self.result.rows += _row_count(buf)
+            return None
+
+        # Each run of edge whitespace ends (trailing) or starts (leading) with
+        # exactly one edge; cells that have both are counted twice.
+        trailing = sum(count for edge, _, count in edges if edge[0] not in b",\n")
+        leading = sum(count for edge, _, count in edges if edge[0] in b",\n")
+        cells = leading + trailing
+        if leading and trailing:
+            cells -= sum(1 for _ in _BOTH_EDGES.finditer(buf))
+        self._sample_plain(buf, start - 1, spaces, cells)
+
+        for edge, replacement, _ in found:
+            buf = buf.replace(edge, replacement)
+        # Removing one character only exposes another edge inside a run of
+        # several whitespace characters; those need more passes
+        doubled = any(first + second in segment for first in spaces for second in spaces)
+        while doubled and any(edge in buf for edge, _, _ in edges):
+            for edge, replacement, _ in edges:
+                buf = buf.replace(edge, replacement)
+        # Whitespace-only lines are now empty and, like blank lines, not rows
+        self.result.rows += _row_count(buf)
+        self.result.cells_cleaned += cells
+        return buf[1:] if terminated else buf[1:-1]
+
+    def _sample_plain(self, buf: bytes, offset: int, spaces: list[bytes], cells: int) -> None:
+        """Describe the first changes of a plain span (buf[i] is data[offset + i])."""
+        room = self._room()
+        taken = 0
+        pos = 0
+        edges = [
+            _Cursor(token, buf.find(token))
+            for space in spaces
+            for token in (b"," + space, b"\n" + space, space + b",", space + b"\r", space + b"\n")
+        ]
+        while taken < room:
+            for edge in edges:
+                if 0 <= edge.pos < pos:
+                    edge.pos = buf.find(edge.token, pos)
+            found = [edge.pos for edge in edges if edge.pos >= 0]
+            if not found:
+                break
+            line_start = buf.rfind(b"\n", 0, min(found) + 1) + 1
+            line_end = buf.find(b"\n", line_start)
+            line = self._line_at(offset + line_start)
+            cells_in_line = buf[line_start:line_end].removesuffix(b"\r").split(b",")
+            for column, cell in enumerate(cells_in_line):
+                clean_cell = cell.strip(b" \t\x0b\x0c")
+                if clean_cell != cell and taken < room:
+                    self.result.changes.append(
+                        f"Line {line} [{self._column_name(column)}]: "
+                        f"'{_truncate(cell.decode('utf-8', 'replace'))}' -> "
+                        f"'{_truncate(clean_cell.decode('utf-8', 'replace'))}'"
+                    )
+                    taken += 1
+            pos = line_end
+        self.result.changes_dropped += cells - taken
+
+    def _clean_record(self, start: int) -> tuple[int, bytes | None]:
+        """
+        Clean the record starting at data[start] with the csv module.
+
+        Returns:
+            (end offset of the record, cleaned bytes or None if unchanged)
+        """
+        data = self.data
+        end = _line_end(data, start)
+        if _SKIPPED_LINE.match(data, start):
+            # Comment or blank line: kept verbatim
+            return end, None
+        self.result.rows += 1
+        quotes = _quotes(data, start, end)
+        while quotes % 2 and end < len(data):
+            # A quoted field continues on the next line
+            following = _line_end(data, end)
+            quotes += _quotes(data, end, following)
+            end = following
+
+        text = data[start:end].decode("utf-8")
+        body = text.rstrip("\r\n")
+        line = self._line_at(start)
+        result = self.result
+        changed = False
+        rows: list[list[str]] = []
+        for row in csv.reader(io.StringIO(body)):
+            clean_row = [cell.strip() for cell in row]
+            is_header = bool(row) and clean_row[0] == "row_id"
+            for column, (cell, clean_cell) in enumerate(zip(row, clean_row, strict=True)):
+                if cell == clean_cell:
+                    continue
+                changed = True
+                if is_header:
+                    result.headers_cleaned += 1
+                    message = f"Line {line}: Header '{cell}' -> '{clean_cell}'"
+                else:
+                    result.cells_cleaned += 1
+                    message = (
+                        f"Line {line} [{self._column_name(column)}]: "
+                        f"'{_truncate(cell)}' -> '{_truncate(clean_cell)}'"
+                    )
+                if self._room() > 0:
+                    result.changes.append(message)
+                else:
+                    result.changes_dropped += 1
+            if is_header:
+                self.headers = clean_row
+            rows.append(clean_row)
+
+        if not changed:
+            return end, None
+        buffer = io.StringIO()
+        # Keep a quoted "#..." cell from turning the row into a comment
+        quoting: Literal[0, 1] = (
+            csv.QUOTE_ALL if rows and rows[0] and rows[0][0].startswith("#") else csv.QUOTE_MINIMAL
+        )
+        csv.writer(buffer, lineterminator="\n", quoting=quoting).writerows(rows)
+        return end, (buffer.getvalue()[:-1] + text[len(body) :]).encode("utf-8")
+
+
+def _row_count(buf: bytes) -> int:
+    """Non-blank lines of a sentinel-wrapped plain span."""
+    # The sentinels are the empty first and last items
+    lines = buf.split(b"\n")
+    return len(lines) - lines.count(b"") - lines.count(b"\r")
+
+
+def _sanitize_chunk(chunk: _Chunk) -> _ChunkResult:
+    """Clean one chunk (runs in a worker process when workers > 1)."""
+    return _ChunkCleaner(chunk).run()
+
+
+def _map_chunks(chunks: Iterator[_Chunk], workers: int) -> Iterator[tuple[_Chunk, _ChunkResult]]:
+    """Clean chunks in order, with at most 2 * workers chunks in flight."""
+    if workers <= 1:
+        for chunk in chunks:
+            yield chunk, _sanitize_chunk(chunk)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: deque[tuple[_Chunk, Future[_ChunkResult]]] = deque()
+        for chunk in chunks:
+            pending.append((chunk, pool.submit(_sanitize_chunk, chunk)))
+            if len(pending) >= 2 * workers:
+                done, future = pending.popleft()
+                yield done, future.result()
+        while pending:
+            done, future = pending.popleft()
+            yield done, future.result()
@@ -10,6 +10,7 @@ import structlog
 
 from ..models.operations import Operation, OperationStatus, OperationType
 from ..utils.exceptions import CyclicDependencyError
+from ..utils.ipnet import parse_path_networks, try_parse_network
 
 logger = structlog.get_logger(__name__)
 
@@ -24,7 +25,8 @@ logger = structlog.get_logger(__name__)
 # Deletion Order: Phase N -> Phase N-1 -> ... -> Phase 0 (children before parents)
 #
 # To prevent race conditions between deletions and creations of the same resource,
-# all DELETE operations run BEFORE any CREATE/UPDATE operations.
+# all DELETE operations run BEFORE any CREATE/UPDATE operations of the same
+# configuration (see _apply_phasing for how barriers are scoped).
 #
 # Rationale for PHASE_ORDER:
 # This strict ordering reflects the BAM resource hierarchy. We must create containers
@@ -295,13 +297,58 @@ class DependencyGraph:
         - No race conditions between delete and recreate of the same resource
         - Proper dependency ordering within each operation type
 
+        Scope:
+        Barriers are applied per configuration. Resources of one configuration
+        never contain or reference resources of another, so a Phase 1 create
+        in configuration B does not wait for Phase 0 creates in configuration A.
+        Narrower scopes (a view, a block subtree) are not safe: within one
+        configuration, DNS and IP hierarchies reference each other (host
+        records allocate addresses in networks, deployment roles target zones
+        and networks) in ways dependency detection does not always link.
+
+        Operations without a configuration (tags, UDF definitions, device
+        types, MAC pools, rows without a config column) are global. They are
+        placed in every configuration's phase chain, so they stay ordered
+        against everything, as before. With a single scope the barrier names
+        are unchanged (``barrier_create_phase_2``); with several, they carry
+        the configuration (``barrier_create_phase_2@Default``).
+
         Side Effect:
-        These barriers serialize execution between phases. For example, no Phase 1 creation
-        can start until ALL Phase 0 creations are finished. This reduces maximum theoretical
+        Within a scope, barriers serialize execution between phases: no Phase 1
+        creation can start until ALL Phase 0 creations of the same configuration
+        (and all global ones) are finished. This reduces maximum theoretical
         parallelism but guarantees correctness for the container hierarchy.
         """
         logger.info("Applying phased execution barriers")
 
+        scopes: dict[str | None, list[DependencyNode]] = {}
+        for node in self.nodes.values():
+            scopes.setdefault(self._phase_scope(node.operation), []).append(node)
+        global_nodes = scopes.pop(None, [])
+
+        if len(scopes) <= 1:
+            nodes = next(iter(scopes.values()), []) + global_nodes
+            self._apply_scope_phasing(nodes, suffix="")
+        else:
+            for config in sorted(filter(None, scopes)):
+                self._apply_scope_phasing(scopes[config] + global_nodes, suffix=f"@{config}")
+
+        logger.info("Phased execution barriers applied successfully", scopes=max(1, len(scopes)))
+
+    @staticmethod
+    def _phase_scope(operation: Operation) -> str | None:
+        """Configuration whose phase barriers apply to an operation (None = global)."""
+        config = getattr(operation.csv_row, "config", None)
+        return config if isinstance(config, str) and config else None
+
+    def _apply_scope_phasing(self, nodes: list[DependencyNode], suffix: str) -> None:
+        """
+        Chain one scope's operations through delete and create phase barriers.
+
+        Args:
+            nodes: Operations of the scope (global operations included)
+            suffix: Appended to barrier row IDs to keep scopes apart
+        """
         previous_barrier_id = None
 
         # Phase 1: Apply DELETE phasing (reverse order - children before parents)
@@ -309,7 +356,7 @@ class DependencyGraph:
             # Find all DELETE operations in this phase
             delete_nodes = [
                 node
-                for node in self.nodes.values()
+                for node in nodes
                 if node.operation.object_type in phase_types
                 and node.operation.operation_type == OperationType.DELETE
             ]
@@ -328,7 +375,7 @@ class DependencyGraph:
 
             # Create barrier for END of this delete phase
             barrier_op = Operation(
-                row_id=f"barrier_delete_phase_{delete_phase_index}",
+                row_id=f"barrier_delete_phase_{delete_phase_index}{suffix}",
                 operation_type=OperationType.NOOP,
                 object_type="system_barrier",
                 resource_id=None,
@@ -344,7 +391,8 @@ class DependencyGraph:
                 self.add_dependency(barrier_node.node_id, node.node_id, DependencyType.PREREQUISITE)
 
             logger.debug(
-                f"Created Delete Barrier for Phase {delete_phase_index} with {len(delete_nodes)} nodes"
+                f"Created Delete Barrier for Phase {delete_phase_index}{suffix} "
+                f"with {len(delete_nodes)} nodes"
             )
             previous_barrier_id = barrier_node.node_id
 
@@ -353,7 +401,7 @@ class DependencyGraph:
             # Find all CREATE/UPDATE operations in this phase
             phase_nodes = [
                 node
-                for node in self.nodes.values()
+                for node in nodes
                 if node.operation.object_type in phase_types
                 and node.operation.operation_type in (OperationType.CREATE, OperationType.UPDATE)
             ]
@@ -373,7 +421,7 @@ class DependencyGraph:
 
             # Create new Barrier for END of this create phase
             barrier_op = Operation(
-                row_id=f"barrier_create_phase_{phase_index}",
+                row_id=f"barrier_create_phase_{phase_index}{suffix}",
                 operation_type=OperationType.NOOP,
                 object_type="system_barrier",
                 resource_id=None,
@@ -389,12 +437,11 @@ class DependencyGraph:
                 self.add_dependency(barrier_node.node_id, node.node_id, DependencyType.PREREQUISITE)
 
             logger.debug(
-                f"Created Create Barrier for Phase {phase_index} with {len(phase_nodes)} nodes"
+                f"Created Create Barrier for Phase {phase_index}{suffix} "
+                f"with {len(phase_nodes)} nodes"
             )
             previous_barrier_id = barrier_node.node_id
 
-        logger.info("Phased execution barriers applied successfully")
-
     def _detect_dependencies(self, operation: Operation) -> None:
         """
         Detect and add dependencies for an operation.
@@ -670,9 +717,12 @@ class DependencyGraph:
         This performs strict segment matching to avoid false positives from
         substring matching (e.g., "1.1.1.1" matching "1.1.1.10").
 
+        CIDRs are compared as canonical networks via the shared parse cache, so
+        "10.0.1.5/24" in a path matches "10.0.1.0/24". Unparseable CIDRs fall
+        back to exact segment matching.
+
         Assumptions:
         - Assumes BAM API V2 path format where segments are slash-separated.
-        - Assumes CIDRs in paths are normalized (e.g. no extra leading zeros).
         - This logic is tightly coupled to the current API path structure and
           may break if the API changes how it represents paths (e.g. using IDs instead of names).
 
@@ -690,8 +740,11 @@ class DependencyGraph:
         # Path format: /IPv4/10.0.0.0/8/10.0.1.0/24 or Config/IPv4/10.0.0.0/8
         path_segments = path.split("/")
 
-        # CIDR format: "10.0.0.0/8" - split into address and prefix
+        # CIDR format: "10.0.0.0/8" - compare against networks parsed from the path
         if "/" in cidr:
+            network = try_parse_network(cidr)
+            if network is not None:
+                return network in parse_path_networks(path)
             cidr_parts = cidr.split("/")
             if len(cidr_parts) == 2:
                 address, prefix = cidr_parts
@@ -978,7 +1031,12 @@ class DependencyGraph:
 
         return None
 
-    def _has_cycle_from(self, start_node_id: str, recursion_stack: set[str]) -> bool:
+    def _has_cycle_from(
+        self,
+        start_node_id: str,
+        recursion_stack: set[str],
+        finished: set[str] | None = None,
+    ) -> bool:
         """
         Detect cycles using Depth-First Search (DFS) with recursion stack tracking.
 
@@ -999,9 +1057,15 @@ class DependencyGraph:
         3. DFS visits C (stack: {A, B, C})
         4. C depends on A (in stack!) → CYCLE DETECTED
 
+        Why finished:
+        Without it, a node reachable along many paths is re-explored once per
+        path. Phase barriers shared by several scopes make that exponential.
+        A fully explored node led to no cycle, so it is skipped when reached again.
+
         Args:
             start_node_id: Node to start DFS from
             recursion_stack: Set of nodes in current traversal path
+            finished: Nodes fully explored without finding a cycle
 
         Returns:
             True if cycle detected, False otherwise
@@ -1010,6 +1074,11 @@ class DependencyGraph:
         if start_node_id in recursion_stack:
             return True
 
+        if finished is None:
+            finished = set()
+        elif start_node_id in finished:
+            return False
+
         # Invalid node - shouldn't happen in normal operation
         if start_node_id not in self.nodes:
             return False
@@ -1020,11 +1089,12 @@ class DependencyGraph:
         # Recursively check all dependencies
         node = self.nodes[start_node_id]
         for dependency_id in node.dependencies:
-            if self._has_cycle_from(dependency_id, recursion_stack):
+            if self._has_cycle_from(dependency_id, recursion_stack, finished):
                 return True
 
         # Backtrack: remove from path as we return up the call stack
         recursion_stack.remove(start_node_id)
+        finished.add(start_node_id)
 
         return False
 
@@ -1224,6 +1294,90 @@ class DependencyGraph:
 
         return result
 
+    def weakly_connected_components(self) -> list[list[str]]:
+        """
+        Split the graph into groups of operations that are independent of each other.
+
+        Components follow the phase scopes (see ``_apply_phasing``): all
+        operations of one configuration form one component, because phase
+        barriers order them in ways dependency edges do not capture (a delete
+        of one network before the create of an overlapping one). Global
+        operations are left out; they are ordered against every configuration
+        and must run before the components (see ``global_node_ids``).
+
+        Configurations are further joined by dependency edges (in either
+        direction), by the row that creates a resource an operation
+        references by deferred ID (``_deferred_*_row``) and by operations on
+        the same resource path or BAM ID, so that no two components create,
+        change or delete the same resource.
+
+        Returns:
+            Node IDs of each component (barriers and global operations
+            excluded), largest first, in the order the nodes were added
+        """
+        global_ids = set(self.global_node_ids())
+        node_ids = [
+            node_id
+            for node_id, node in self.nodes.items()
+            if node.operation.object_type != "system_barrier" and node_id not in global_ids
+        ]
+        parent = {node_id: node_id for node_id in node_ids}
+
+        def find(node_id: str) -> str:
+            root = node_id
+            while parent[root] != root:
+                root = parent[root]
+            while parent[node_id] != root:
+                parent[node_id], node_id = root, parent[node_id]
+            return root
+
+        def union(a: str, b: str) -> None:
+            root_a, root_b = find(a), find(b)
+            if root_a != root_b:
+                parent[root_b] = root_a
+
+        by_row = {str(self.nodes[node_id].operation.row_id): node_id for node_id in node_ids}
+        by_scope: dict[str | None, str] = {}
+        by_resource: dict[tuple[str, ...], str] = {}
+        for node_id in node_ids:
+            operation = self.nodes[node_id].operation
+            union(node_id, by_scope.setdefault(self._phase_scope(operation), node_id))
+            for dep_id in self.nodes[node_id].dependencies:
+                if dep_id in parent:
+                    union(node_id, dep_id)
+            for key, value in operation.payload.items():
+                if key.startswith("_deferred_") and key.endswith("_row"):
+                    creator = by_row.get(str(value))
+                    if creator is not None:
+                        union(node_id, creator)
+            resource_keys = []
+            if operation.payload.get("resource_path"):
+                resource_keys.append(("path", str(operation.payload["resource_path"])))
+            if operation.resource_id:
+                resource_keys.append(("id", str(operation.resource_id)))
+            for resource_key in resource_keys:
+                union(node_id, by_resource.setdefault(resource_key, node_id))
+
+        components: dict[str, list[str]] = {}
+        for node_id in node_ids:
+            components.setdefault(find(node_id), []).append(node_id)
+        return sorted(components.values(), key=len, reverse=True)
+
+    def global_node_ids(self) -> list[str]:
+        """
+        Operations outside every configuration (tags, UDF definitions, device types).
+
+        Returns:
+            Node IDs of global operations (barriers excluded), in the order the
+            nodes were added
+        """
+        return [
+            node_id
+            for node_id, node in self.nodes.items()
+            if node.operation.object_type != "system_barrier"
+            and self._phase_scope(node.operation) is None
+        ]
+
     def validate(self) -> bool:
         """
         Validate the dependency graph.
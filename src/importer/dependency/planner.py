@@ -52,6 +52,7 @@ Example Workflow:
 import structlog
 
 from ..models.operations import Operation
+from ..utils.ipnet import NetworkIndex, parse_address, try_parse_network
 from .graph import DependencyGraph
 
 logger = structlog.get_logger(__name__)
@@ -154,6 +155,13 @@ class DependencyPlanner:
                 if name:
                     device_subtypes[name] = node_id
 
+        # Containment index for host_record address -> network lookups
+        network_index: NetworkIndex[tuple[str, str]] = NetworkIndex()
+        for network_cidr, network_node_id in networks.items():
+            network_net = try_parse_network(network_cidr)
+            if network_net is not None:
+                network_index.add(network_net, (network_cidr, network_node_id))
+
         # Add dependencies (only for valid operations)
         for op in operations:
             node_id = f"{op.object_type}:{op.row_id}"
@@ -246,43 +254,36 @@ class DependencyPlanner:
 
                 # Host records with addresses also depend on networks containing those addresses
                 if op.object_type == "host_record":
-                    import ipaddress
-
-                    addresses = getattr(op.csv_row, "addresses", None)
-                    if addresses:
+                    host_addresses = getattr(op.csv_row, "addresses", None)
+                    if host_addresses:
                         # Parse addresses (pipe-separated)
                         addr_list = (
-                            addresses.split("|") if isinstance(addresses, str) else [addresses]
+                            host_addresses.split("|")
+                            if isinstance(host_addresses, str)
+                            else [host_addresses]
                         )
                         for addr_str in addr_list:
                             try:
-                                addr = ipaddress.ip_address(addr_str.strip())
-                                # Check if address is in any network being created
-                                for network_cidr, network_node_id in networks.items():
-                                    if network_node_id in valid_node_ids:
-                                        try:
-                                            network = ipaddress.ip_network(
-                                                network_cidr, strict=False
-                                            )
-                                            if addr in network:
-                                                try:
-                                                    graph.add_dependency(node_id, network_node_id)
-                                                    logger.info(
-                                                        "Added network->host_record dependency",
-                                                        record=op.row_id,
-                                                        network_cidr=network_cidr,
-                                                    )
-                                                except Exception as e:
-                                                    logger.warning(
-                                                        "Failed to add dependency", error=str(e)
-                                                    )
-                                                break
-                                        except ValueError:
-                                            pass
+                                addr = parse_address(addr_str.strip())
                             except ValueError:
                                 logger.debug(
                                     f"Skipping invalid IP address in dependency check: {addr_str}"
                                 )
+                                continue
+                            # Check if address is in any network being created
+                            match = network_index.find_containing_address(addr)
+                            if match is None:
+                                continue
+                            network_cidr, network_node_id = match
+                            try:
+                                graph.add_dependency(node_id, network_node_id)
+                                logger.info(
+                                    "Added network->host_record dependency",
+                                    record=op.row_id,
+                                    network_cidr=network_cidr,
+                                )
+                            except Exception as e:
+                                logger.warning("Failed to add dependency", error=str(e))
 
             elif op.object_type == "ipv4_dhcp_range":
                 # DHCP ranges depend on networks - check for deferred network
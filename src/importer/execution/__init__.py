@@ -1,6 +1,7 @@
 """Execution engine for running operations against BAM."""
 
 from .executor import OperationExecutor
+from .pipeline import ResultPipeline
 from .planner import ExecutionBatch, ExecutionPlan, ExecutionPlanner
 from .throttle import AdaptiveThrottle
 
@@ -10,4 +11,5 @@ __all__ = [
     "ExecutionBatch",
     "ExecutionPlan",
     "ExecutionPlanner",
+    "ResultPipeline",
 ]
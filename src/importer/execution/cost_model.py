@@ -0,0 +1,263 @@
+"""Cost Model - Learned operation latencies for planning and ETAs.
+
+Purpose:
+-------
+The planner used to estimate every operation from a fixed guess per
+operation type (0.5 s per create, ...). Real latencies differ by an order of
+magnitude between object types (a host record is not a network) and between
+BAM servers, so plan durations and the progress bar's time remaining were
+mostly noise.
+
+``CostModel`` estimates the latency of each (object_type, operation_type)
+from three layers, each the fallback for the next:
+
+1. the static guess per operation type (``DEFAULT_OPERATION_SECONDS``)
+2. latencies of successful operations in recent sessions, read from the
+   changelog's ``operation_timings`` table
+3. latencies observed in the current run
+
+Each layer is shrunk toward the one below by ``COST_PRIOR_WEIGHT`` samples:
+a type seen a handful of times moves only part of the way, and the current
+run takes over quickly from history once it has its own observations.
+
+``RemainingWork`` is a result consumer that feeds observed latencies to the
+model and estimates the time left for the operations not finished yet.
+
+Usage:
+-----
+```python
+model = CostModel.from_changelog(changelog)
+plan = ExecutionPlanner(policy, cost_model=model).create_plan(graph)
+remaining = RemainingWork(model, operations, concurrency=policy.max_concurrent_operations)
+# ResultPipeline([..., remaining, ...]); remaining.seconds() for the ETA
+```
+"""
+
+import math
+import time
+from collections import Counter
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+import structlog
+
+from ..constants import COST_HISTORY_SESSIONS, COST_PRIOR_WEIGHT
+from ..models.operations import Operation, OperationType
+from ..models.results import OperationResult
+
+logger = structlog.get_logger(__name__)
+
+_BARRIER = "system_barrier"
+
+# Static guesses (seconds) for types without history
+DEFAULT_OPERATION_SECONDS: dict[OperationType, float] = {
+    OperationType.CREATE: 0.5,
+    OperationType.UPDATE: 0.3,
+    OperationType.DELETE: 0.2,
+    OperationType.NOOP: 0.01,
+    OperationType.ORPHAN: 0.0,
+}
+# Fallback for operation types missing from the guesses
+UNKNOWN_OPERATION_SECONDS = 0.5
+
+
+@dataclass
+class LatencyStats:
+    """
+    Latency distribution of one (object_type, operation_type).
+
+    Attributes:
+        count: Number of samples
+        mean: Mean latency in seconds
+        m2: Sum of squared deviations from the mean (Welford)
+    """
+
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+
+    @classmethod
+    def from_sums(cls, count: int, total_ms: float, total_sq_ms: float) -> "LatencyStats":
+        """Build from the sums stored in the changelog (milliseconds)."""
+        if count <= 0:
+            return cls()
+        mean = total_ms / 1000 / count
+        return cls(count, mean, max(0.0, total_sq_ms / 1e6 - count * mean * mean))
+
+    @property
+    def stddev(self) -> float:
+        """Sample standard deviation in seconds."""
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+    def add(self, seconds: float) -> None:
+        """Add one sample."""
+        self.count += 1
+        delta = seconds - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (seconds - self.mean)
+
+
+class CostModel:
+    """Estimates operation latencies from guesses, history and the current run."""
+
+    def __init__(
+        self,
+        priors: Mapping[Any, float] | None = None,
+        history: Mapping[tuple[str, str], LatencyStats] | None = None,
+        prior_weight: int = COST_PRIOR_WEIGHT,
+    ) -> None:
+        """
+        Initialize model.
+
+        Args:
+            priors: Seconds per operation type (default: DEFAULT_OPERATION_SECONDS)
+            history: Latencies from past sessions by (object_type, operation_type value)
+            prior_weight: Samples each fallback estimate counts as
+        """
+        self.priors = priors if priors is not None else dict(DEFAULT_OPERATION_SECONDS)
+        self.history = dict(history or {})
+        self.prior_weight = prior_weight
+        self.observed: dict[tuple[str, str], LatencyStats] = {}
+
+    @classmethod
+    def from_changelog(
+        cls,
+        changelog: Any,
+        sessions: int = COST_HISTORY_SESSIONS,
+        priors: Mapping[Any, float] | None = None,
+    ) -> "CostModel":
+        """
+        Learn from the timings of recent changelog sessions.
+
+        Args:
+            changelog: ChangeLog to read
+            sessions: Number of most recent sessions to learn from
+            priors: Seconds per operation type (default: DEFAULT_OPERATION_SECONDS)
+
+        Returns:
+            CostModel (static guesses only if the changelog has no timings)
+        """
+        history = {
+            key: LatencyStats.from_sums(*sums)
+            for key, sums in changelog.get_operation_timings(sessions).items()
+        }
+        logger.debug("Loaded operation timings", types=len(history), sessions=sessions)
+        return cls(priors, history)
+
+    def _shrink(self, fallback: float, stats: LatencyStats | None) -> float:
+        """Mean of stats, pulled toward fallback while stats has few samples."""
+        if stats is None or stats.count == 0:
+            return fallback
+        weight = self.prior_weight
+        return (fallback * weight + stats.mean * stats.count) / (weight + stats.count)
+
+    def estimate(self, object_type: str, operation_type: OperationType | str) -> float:
+        """
+        Estimated latency in seconds.
+
+        Args:
+            object_type: Resource type (phase barriers cost nothing)
+            operation_type: Operation type
+
+        Returns:
+            Seconds
+        """
+        if object_type == _BARRIER:
+            return 0.0
+        key = (object_type, getattr(operation_type, "value", operation_type))
+        guess = self.priors.get(operation_type, UNKNOWN_OPERATION_SECONDS)
+        learned = self._shrink(guess, self.history.get(key))
+        return self._shrink(learned, self.observed.get(key))
+
+    def cost(self, operation: Operation) -> float:
+        """Estimated latency of an operation in seconds."""
+        return self.estimate(operation.object_type, operation.operation_type)
+
+    def observe(
+        self, object_type: str, operation_type: OperationType | str, seconds: float
+    ) -> None:
+        """Add a latency measured in the current run."""
+        key = (object_type, getattr(operation_type, "value", operation_type))
+        self.observed.setdefault(key, LatencyStats()).add(seconds)
+
+    def describe(self) -> list[dict[str, Any]]:
+        """
+        Learned latencies for display, most frequent types first.
+
+        Returns:
+            One dict per (object_type, operation_type) with samples, mean and stddev
+        """
+        rows = []
+        for (object_type, operation_type), stats in self.history.items():
+            rows.append(
+                {
+                    "object_type": object_type,
+                    "operation_type": operation_type,
+                    "samples": stats.count,
+                    "mean_seconds": stats.mean,
+                    "stddev_seconds": stats.stddev,
+                }
+            )
+        return sorted(rows, key=lambda row: -row["samples"])
+
+
+class RemainingWork:
+    """Result consumer that refines the cost model and estimates the time left."""
+
+    def __init__(
+        self,
+        model: CostModel,
+        operations: Iterable[Operation],
+        concurrency: int,
+    ) -> None:
+        """
+        Initialize estimator.
+
+        Args:
+            model: Cost model to estimate with and feed observations to
+            operations: Operations still to execute
+            concurrency: Operations running at once, until measured
+        """
+        self.model = model
+        self.concurrency = max(1, int(concurrency))
+        self._operations = {op.row_id: op for op in operations if op.object_type != _BARRIER}
+        self._pending: Counter[tuple[str, Any]] = Counter(
+            (op.object_type, op.operation_type) for op in self._operations.values()
+        )
+        self._completed = 0
+        self._busy_seconds = 0.0
+        self._started = time.monotonic()
+
+    async def handle(self, results: list[OperationResult]) -> None:
+        """Count results off and learn from the latencies of successful ones."""
+        for result in results:
+            op = self._operations.pop(result.row_id, None)
+            if op is None:
+                continue
+            self._pending[(op.object_type, op.operation_type)] -= 1
+            self._completed += 1
+            if result.success and result.duration_ms is not None:
+                seconds = result.duration_ms / 1000
+                self.model.observe(op.object_type, op.operation_type, seconds)
+                self._busy_seconds += seconds
+
+    def seconds(self) -> float:
+        """
+        Estimated seconds until every pending operation has finished.
+
+        The estimated work left is divided by the parallelism achieved so far
+        (busy operation-seconds per elapsed second) once a full round of
+        results is in, and by the configured concurrency before that.
+
+        Returns:
+            Seconds
+        """
+        work = sum(
+            count * self.model.estimate(*key) for key, count in self._pending.items() if count > 0
+        )
+        parallelism = float(self.concurrency)
+        elapsed = time.monotonic() - self._started
+        if self._completed >= self.concurrency and elapsed > 0 and self._busy_seconds > 0:
+            parallelism = max(1.0, self._busy_seconds / elapsed)
+        return work / parallelism
@@ -0,0 +1,360 @@
+"""Distributed Execution - Coordinator and workers sharing a durable work queue.
+
+Purpose:
+-------
+``--processes`` spreads an import over the cores of one host; at some point
+payload building, authentication round-trips and connection limits of one
+host cap throughput well below what BAM can take. ``apply --coordinator``
+instead publishes the planned dependency graph to a ``WorkQueue`` (see
+persistence/work_queue.py) and ``bluecat-import worker`` processes, on as many
+hosts as needed, execute it.
+
+``QueueCoordinator`` publishes the graph and feeds the results workers report
+into the session's result pipeline (changelog, resolver cache invalidation,
+progress) until every operation is finished. A restarted coordinator
+reattaches to its session and continues after the last result it consumed.
+
+``QueueWorker`` keeps up to ``policy.max_concurrent_operations`` operations
+leased, runs each leased chunk through an ``OperationExecutor`` batch (so
+handler grouping and the adaptive throttle apply), and reports each chunk's
+results together with the resources it created. Before each lease it loads
+the resources other workers created, which deferred references resolve
+against. Leases are renewed while the worker runs; if it dies, its
+operations go to another worker once the leases expire.
+
+Dependencies are released by the queue as results arrive, with no batch
+barriers: an operation runs as soon as its own parents are done. Ready
+operations are leased longest remaining dependency chain first (see
+scheduler.py).
+
+Usage:
+-----
+```python
+# Coordinator
+with WorkQueue("queue.db") as queue:
+    coordinator = QueueCoordinator(queue, session_id)
+    await coordinator.execute(graph, sink=pipeline)
+
+# Each worker (any host)
+with WorkQueue("queue.db") as queue:
+    await QueueWorker(config, queue).run()
+```
+"""
+
+import asyncio
+import socket
+import time
+import uuid
+
+import structlog
+
+from ..bam.client import BAMClient
+from ..config import ImporterConfig
+from ..constants import LEASE_SECONDS, QUEUE_POLL_INTERVAL
+from ..dependency.graph import DependencyGraph
+from ..models.results import OperationResult
+from ..persistence.work_queue import QueueSession, WorkItem, WorkQueue
+from .executor import OperationExecutor
+from .pipeline import ResultPipeline
+from .planner import ExecutionBatch
+from .scheduler import critical_path_priorities
+from .sharding import CREATED_RESOURCE_MAPS
+
+logger = structlog.get_logger(__name__)
+
+
+class QueueCoordinator:
+    """Publishes a session to the work queue and consumes the reported results."""
+
+    def __init__(
+        self,
+        queue: WorkQueue,
+        session_id: str,
+        poll_interval: float = QUEUE_POLL_INTERVAL,
+    ) -> None:
+        """
+        Initialize coordinator.
+
+        Args:
+            queue: Work queue shared with the workers
+            session_id: Session identifier
+            poll_interval: Seconds between polls for new results
+        """
+        self.queue = queue
+        self.session_id = session_id
+        self.poll_interval = poll_interval
+        self.completed_count = 0
+        self.succeeded_count = 0
+
+    async def execute(
+        self,
+        graph: DependencyGraph,
+        sink: ResultPipeline | None = None,
+        keep_results: bool = True,
+        dry_run: bool = False,
+        allow_dangerous_operations: bool = False,
+        input_hash: str | None = None,
+        costs: dict[str, float] | None = None,
+    ) -> list[OperationResult]:
+        """
+        Publish the graph (unless already published) and wait for every result.
+
+        Args:
+            graph: Validated dependency graph, depths calculated
+            sink: Pipeline to publish results to as workers report them
+            keep_results: Also collect and return every result
+            dry_run: Workers simulate execution without API calls
+            allow_dangerous_operations: Workers may delete critical resources
+            input_hash: Input file hash, to reattach after a restart
+            costs: Estimated seconds per node ID (ExecutionPlan.costs) to weigh
+                lease priorities with
+
+        Returns:
+            Results in report order (empty if keep_results is False)
+        """
+        published = self.queue.publish(
+            self.session_id,
+            graph,
+            dry_run=dry_run,
+            allow_dangerous_operations=allow_dangerous_operations,
+            input_hash=input_hash,
+            priorities=critical_path_priorities(graph, costs),
+        )
+        session = self.queue.session(self.session_id)
+        assert session is not None
+        cursor = session.consumed
+        if not published:
+            logger.info("Reattached to queued session", session_id=self.session_id, after=cursor)
+
+        results: list[OperationResult] = []
+        while True:
+            # Checked first: every result reported before it finished is read below
+            finished = self.queue.finished(self.session_id)
+            batch = self.queue.results(self.session_id, after=cursor)
+            if not batch:
+                if finished:
+                    break
+                await asyncio.sleep(self.poll_interval)
+                continue
+            for _, result in batch:
+                if sink is not None:
+                    await sink.publish(result)
+                if keep_results:
+                    results.append(result)
+            self.completed_count += len(batch)
+            self.succeeded_count += sum(1 for _, result in batch if result.success)
+            if sink is not None:
+                await sink.drain()
+            cursor = batch[-1][0]
+            self.queue.mark_consumed(self.session_id, cursor)
+
+        logger.info(
+            "Queued session complete",
+            session_id=self.session_id,
+            results=self.completed_count,
+            successful=self.succeeded_count,
+        )
+        return results
+
+
+class QueueWorker:
+    """Leases operations from the work queue, executes them and reports back."""
+
+    def __init__(
+        self,
+        config: ImporterConfig,
+        queue: WorkQueue,
+        worker_id: str | None = None,
+        bam_client: BAMClient | None = None,
+        capacity: int | None = None,
+        lease_seconds: float = LEASE_SECONDS,
+        poll_interval: float = QUEUE_POLL_INTERVAL,
+    ) -> None:
+        """
+        Initialize worker.
+
+        Args:
+            config: Worker configuration (BAM connection and policy limits)
+            queue: Work queue shared with the coordinator
+            worker_id: Lease owner name (default: host name and a random suffix)
+            bam_client: Client to use (default: one created from config.bam)
+            capacity: Most operations leased at once (default:
+                policy.max_concurrent_operations)
+            lease_seconds: Lease duration, renewed every third of it
+            poll_interval: Seconds between polls when no work is ready
+
+        Raises:
+            ValueError: If no bam_client is given and config has no BAM
+                connection settings
+        """
+        if bam_client is None and config.bam is None:
+            raise ValueError("BAM configuration required for a worker without a client")
+        self.config = config
+        self.queue = queue
+        self.worker_id = worker_id or f"{socket.gethostname()}-{uuid.uuid4().hex[:6]}"
+        self.client = bam_client
+        self.capacity = max(1, capacity or config.policy.max_concurrent_operations)
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self.processed = 0
+        self._authenticated = False
+
+    async def run(self, session_id: str | None = None, wait: float = 0.0) -> int:
+        """
+        Work on queued sessions until none is left.
+
+        Args:
+            session_id: Only work on this session
+            wait: Seconds to keep polling for a session when none is open
+
+        Returns:
+            Number of operations this worker reported
+        """
+        owns_client = self.client is None
+        if self.client is None:
+            assert self.config.bam is not None
+            self.client = BAMClient(self.config.bam)
+        deadline = time.monotonic() + wait
+        try:
+            while True:
+                open_sessions = self.queue.open_sessions()
+                if session_id is not None:
+                    open_sessions = [s for s in open_sessions if s == session_id]
+                if not open_sessions:
+                    if time.monotonic() >= deadline:
+                        break
+                    await asyncio.sleep(self.poll_interval)
+                    continue
+                session = self.queue.session(open_sessions[0])
+                assert session is not None
+                await self.run_session(session)
+                deadline = time.monotonic() + wait
+        finally:
+            if owns_client:
+                await self.client.close()
+        return self.processed
+
+    async def run_session(self, session: QueueSession) -> None:
+        """
+        Work on one session until all of its operations are finished.
+
+        Args:
+            session: Queued session
+        """
+        assert self.client is not None
+        if not session.dry_run and not self._authenticated:
+            await self.client.authenticate()
+            self._authenticated = True
+        executor = OperationExecutor(
+            bam_client=self.client,
+            policy=self.config.policy,
+            allow_dangerous_operations=session.allow_dangerous_operations,
+            session_id=session.session_id,
+        )
+        executor.dry_run = session.dry_run
+        known: dict[str, dict[str, int]] = {
+            resource_type: {} for resource_type in CREATED_RESOURCE_MAPS
+        }
+        created_seq = 0
+        in_flight: dict[asyncio.Task[list[OperationResult]], list[WorkItem]] = {}
+        renewed = time.monotonic()
+        logger.info("Working on session", session_id=session.session_id, worker=self.worker_id)
+
+        try:
+            while True:
+                held = sum(map(len, in_flight.values()))
+                if held < self.capacity:
+                    # Load first: whatever is ready now has its parents' IDs stored
+                    created_seq = self._load_created(executor, known, session, created_seq)
+                    items = self.queue.lease(
+                        session.session_id, self.worker_id, self.capacity - held, self.lease_seconds
+                    )
+                    if items:
+                        task = asyncio.create_task(self._execute(executor, items))
+                        in_flight[task] = items
+                        continue
+                if not in_flight:
+                    if self.queue.finished(session.session_id):
+                        break
+                    await asyncio.sleep(self.poll_interval)
+                    continue
+
+                done, _ = await asyncio.wait(
+                    in_flight, timeout=self.poll_interval, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    items = in_flight.pop(task)
+                    results = task.result()
+                    self.queue.complete(
+                        session.session_id,
+                        self.worker_id,
+                        [
+                            (item.node_id, result)
+                            for item, result in zip(items, results, strict=True)
+                        ],
+                        self._new_created(executor, known),
+                    )
+                    self.processed += len(items)
+                if in_flight and time.monotonic() - renewed > self.lease_seconds / 3:
+                    self.queue.renew(session.session_id, self.worker_id, self.lease_seconds)
+                    renewed = time.monotonic()
+        finally:
+            for task in in_flight:
+                task.cancel()
+
+        logger.info(
+            "Session finished",
+            session_id=session.session_id,
+            worker=self.worker_id,
+            processed=self.processed,
+        )
+
+    async def _execute(
+        self, executor: OperationExecutor, items: list[WorkItem]
+    ) -> list[OperationResult]:
+        """Run leased operations as one executor batch."""
+        operations = [item.operation for item in items]
+        try:
+            return await executor._execute_batch(ExecutionBatch(batch_id=0, operations=operations))
+        except Exception as e:
+            return [
+                OperationResult(
+                    row_id=op.row_id,
+                    operation=op.operation_type,
+                    success=False,
+                    error_message=str(e),
+                    duration_ms=0,
+                )
+                for op in operations
+            ]
+
+    def _load_created(
+        self,
+        executor: OperationExecutor,
+        known: dict[str, dict[str, int]],
+        session: QueueSession,
+        after: int,
+    ) -> int:
+        """Add resources reported since after to the executor's created maps."""
+        created, seq = self.queue.created_resources(session.session_id, after=after)
+        for resource_type, entries in created.items():
+            attribute = CREATED_RESOURCE_MAPS.get(resource_type)
+            if attribute is None:
+                continue
+            getattr(executor, attribute).update(entries)
+            known[resource_type].update(entries)
+        return seq
+
+    @staticmethod
+    def _new_created(
+        executor: OperationExecutor, known: dict[str, dict[str, int]]
+    ) -> dict[str, dict[str, int]]:
+        """Resources in the executor's created maps not yet reported or loaded."""
+        new: dict[str, dict[str, int]] = {}
+        for resource_type, attribute in CREATED_RESOURCE_MAPS.items():
+            seen = known[resource_type]
+            for key, bam_id in getattr(executor, attribute).items():
+                if seen.get(key) != bam_id:
+                    new.setdefault(resource_type, {})[key] = bam_id
+                    seen[key] = bam_id
+        return new
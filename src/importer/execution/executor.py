@@ -6,6 +6,7 @@ Executes operations from execution plan with concurrency control and retries.
 import asyncio
 import copy
 import time
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any, Optional
 
 import structlog
@@ -14,7 +15,10 @@ if TYPE_CHECKING:
     from ..dependency.graph import DependencyGraph
 
 from ..bam.client import BAMClient
+from ..bam.lookup import lookup_profile
+from ..bam.response_cache import fresh_reads
 from ..config import PolicyConfig, ThrottleConfig
+from ..constants import HANDLER_GROUP_SIZE
 from ..models.operations import Operation, OperationStatus, OperationType
 from ..models.results import OperationResult
 from ..persistence.checkpoint import CheckpointManager
@@ -25,7 +29,9 @@ from ..utils.exceptions import (
     ResourceNotFoundError,
 )
 from .handlers import get_handler
+from .pipeline import ResultPipeline
 from .planner import ExecutionBatch, ExecutionPlan
+from .scheduler import PriorityScheduler, critical_path_priorities
 from .throttle import AdaptiveThrottle
 
 logger = structlog.get_logger(__name__)
@@ -91,6 +97,9 @@ class OperationExecutor:
         # Runtime state
         self.dry_run = False
         self.results: list[OperationResult] = []
+        self.sink: ResultPipeline | None = None
+        self.completed_count = 0
+        self.succeeded_count = 0
 
         # Dependency graph for cascading failure handling
         self.dependency_graph = dependency_graph
@@ -113,12 +122,8 @@ class OperationExecutor:
             self.created_networks = dict(initial_created_resources.get("network", {}))
             self.created_zones = dict(initial_created_resources.get("zone", {}))
             self.created_locations = dict(initial_created_resources.get("location", {}))
-            self.created_device_types = dict(
-                initial_created_resources.get("device_type", {})
-            )
-            self.created_device_subtypes = dict(
-                initial_created_resources.get("device_subtype", {})
-            )
+            self.created_device_types = dict(initial_created_resources.get("device_type", {}))
+            self.created_device_subtypes = dict(initial_created_resources.get("device_subtype", {}))
             self.created_devices = dict(initial_created_resources.get("device", {}))
         else:
             self.created_blocks = {}  # CIDR -> block_id
@@ -135,6 +140,8 @@ class OperationExecutor:
         dry_run: bool = False,
         start_batch_id: int = 0,
         input_hash: str | None = None,
+        sink: ResultPipeline | None = None,
+        keep_results: bool = True,
     ) -> list[OperationResult]:
         """
         Execute all operations in plan with proper ordering and error handling.
@@ -144,16 +151,27 @@ class OperationExecutor:
         2. Operations within a batch run in parallel (subject to throttle)
         3. Failed operations don't prevent others from completing
         4. Results include detailed error information for debugging
+        5. With a sink, each result is published as its operation completes, and
+           the sink is drained before a batch's checkpoint is saved
 
         Args:
             plan: Execution plan containing batches of operations
             dry_run: Simulate execution without API calls
+            start_batch_id: First batch to run (earlier ones completed before a resume)
+            input_hash: Input file hash stored with checkpoints
+            sink: Pipeline to publish results to as they complete
+            keep_results: Also collect every result in self.results (and return them);
+                with a sink that consumes them this can be False to keep memory bounded
 
         Returns:
-            List of results for all operations in execution order
+            List of results for all operations in execution order (empty if
+            keep_results is False)
         """
         self.dry_run = dry_run
         self.results = []
+        self.sink = sink
+        self.completed_count = 0
+        self.succeeded_count = 0
 
         logger.info(
             "Starting plan execution",
@@ -164,6 +182,37 @@ class OperationExecutor:
 
         execution_start = time.time()
 
+        if self.dependency_graph is not None and self.policy.scheduling != "batch":
+            await self._execute_ready_operations(plan, start_batch_id, input_hash, keep_results)
+        else:
+            await self._execute_batches(plan, start_batch_id, input_hash, keep_results)
+
+        # Final execution statistics
+        total_duration = time.time() - execution_start
+        total = self.completed_count
+        total_successful = self.succeeded_count
+
+        logger.info(
+            "Plan execution complete",
+            duration_seconds=f"{total_duration:.2f}",
+            total_operations=total,
+            successful=total_successful,
+            failed=total - total_successful,
+            success_rate=f"{total_successful / total:.1%}" if total else "N/A",
+            final_throttle_state=self.throttle.get_metrics(),
+        )
+
+        return self.results
+
+    async def _execute_batches(
+        self,
+        plan: ExecutionPlan,
+        start_batch_id: int,
+        input_hash: str | None,
+        keep_results: bool,
+    ) -> None:
+        """Run the plan one batch at a time, checkpointing after each."""
+        sink = self.sink
         # Execute batches sequentially to maintain dependency order
         for batch_index, batch in enumerate(plan.batches):
             logger.info(
@@ -186,10 +235,16 @@ class OperationExecutor:
 
             # All operations in batch execute in parallel
             batch_results = await self._execute_batch(batch)
-            self.results.extend(batch_results)
+            batch_successful = sum(1 for r in batch_results if r.success)
+            self.completed_count += len(batch_results)
+            self.succeeded_count += batch_successful
+            if keep_results:
+                self.results.extend(batch_results)
+            if sink is not None:
+                # Batch barrier: everything the checkpoint covers is consumed
+                await sink.drain()
 
             # Log batch completion stats
-            batch_successful = sum(1 for r in batch_results if r.success)
             logger.info(
                 "Batch completed",
                 batch_id=batch.batch_id,
@@ -198,39 +253,116 @@ class OperationExecutor:
                 total=len(batch_results),
             )
 
-            # Save checkpoint if configured and not dry run
-            if self.checkpoint_manager and self.session_id and not self.dry_run:
-                completed_count = sum(1 for r in self.results if r.success)
-                self.checkpoint_manager.save_checkpoint(
-                    session_id=self.session_id,
-                    batch_id=batch.batch_id,
-                    operation_index=len(self.results),
-                    completed_operations=completed_count,
-                    total_operations=plan.total_operations,
-                    input_hash=input_hash,
-                )
-
-        # Final execution statistics
-        total_duration = time.time() - execution_start
-        total_successful = sum(1 for r in self.results if r.success)
-        total_failed = len(self.results) - total_successful
+            self._save_batch_checkpoint(plan, batch, input_hash)
 
+    async def _execute_ready_operations(
+        self,
+        plan: ExecutionPlan,
+        start_batch_id: int,
+        input_hash: str | None,
+        keep_results: bool,
+    ) -> None:
+        """
+        Run each operation as soon as its own dependencies are done.
+
+        A PriorityScheduler hands out ready operations, longest remaining
+        dependency chain first, weighed by the plan's estimated costs (plan
+        order with scheduling "ready"), and only while throttle slots are
+        free, so that priority decides which operations the throttle admits.
+        Ready operations taken together are grouped as in a batch; a group
+        counts once per operation against the free slots.
+
+        Checkpoints keep their batch meaning: batch N is checkpointed once it
+        and every earlier batch have completed, after draining the sink.
+        Batches before start_batch_id count as done.
+        """
+        assert self.dependency_graph is not None
+        batch_of: dict[str, int] = {}
+        pending: list[int] = []
+        for index, batch in enumerate(plan.batches):
+            node_ids = [f"{op.object_type}:{op.row_id}" for op in batch.operations]
+            if batch.batch_id < start_batch_id:
+                pending.append(0)
+                continue
+            batch_of.update(dict.fromkeys(node_ids, index))
+            pending.append(len(node_ids))
+
+        # Everything outside the remaining plan counts as done
+        graph = self.dependency_graph
+        scheduler = PriorityScheduler(
+            graph,
+            done=(node_id for node_id in graph.nodes if node_id not in batch_of),
+            # "ready": plan order, i.e. depth, then the order within each batch
+            priorities=(
+                {node_id: (0, 0, position) for position, node_id in enumerate(batch_of)}
+                if self.policy.scheduling == "ready"
+                else critical_path_priorities(graph, plan.costs or None)
+            ),
+        )
         logger.info(
-            "Plan execution complete",
-            duration_seconds=f"{total_duration:.2f}",
-            total_operations=len(self.results),
-            successful=total_successful,
-            failed=total_failed,
-            success_rate=f"{total_successful / len(self.results):.1%}" if self.results else "N/A",
-            final_throttle_state=self.throttle.get_metrics(),
+            "Scheduling ready operations",
+            scheduling=self.policy.scheduling,
+            operations=scheduler.pending_count,
+            ready=scheduler.ready_count,
         )
 
-        return self.results
+        running: dict[asyncio.Task[list[OperationResult]], list[Operation]] = {}
+        checkpointed = 0
+        while scheduler.ready_count or running:
+            free = self.throttle.current_concurrency - sum(map(len, running.values()))
+            if free > 0 and scheduler.ready_count:
+                for unit in self._group_operations(scheduler.pop(free)):
+                    running[asyncio.create_task(self._run_unit(unit))] = unit
+            finished, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in finished:
+                unit = running.pop(task)
+                results = task.result()
+                self.completed_count += len(results)
+                self.succeeded_count += sum(1 for r in results if r.success)
+                if keep_results:
+                    self.results.extend(results)
+                for op in unit:
+                    node_id = f"{op.object_type}:{op.row_id}"
+                    scheduler.complete(node_id)
+                    if node_id in batch_of:
+                        pending[batch_of[node_id]] -= 1
+
+            while checkpointed < len(pending) and pending[checkpointed] == 0:
+                batch = plan.batches[checkpointed]
+                checkpointed += 1
+                if batch.batch_id < start_batch_id:
+                    continue
+                if self.sink is not None:
+                    await self.sink.drain()
+                self._save_batch_checkpoint(plan, batch, input_hash)
+
+        if scheduler.pending_count:
+            # Only possible if plan and graph disagree
+            logger.error("Operations never became ready", operations=scheduler.pending_count)
+
+    def _save_batch_checkpoint(
+        self, plan: ExecutionPlan, batch: ExecutionBatch, input_hash: str | None
+    ) -> None:
+        """Save a checkpoint for a completed batch if configured and not dry run."""
+        if self.checkpoint_manager and self.session_id and not self.dry_run:
+            self.checkpoint_manager.save_checkpoint(
+                session_id=self.session_id,
+                batch_id=batch.batch_id,
+                operation_index=self.completed_count,
+                completed_operations=self.succeeded_count,
+                total_operations=plan.total_operations,
+                input_hash=input_hash,
+            )
 
     async def _execute_batch(self, batch: ExecutionBatch) -> list[OperationResult]:
         """
         Execute a single batch of operations in parallel.
 
+        CREATE and DELETE operations whose handler groups them (see
+        BaseHandler.batch_key) run as groups of up to HANDLER_GROUP_SIZE, each
+        through one create_many()/delete_many() call; the rest run one by one.
+        Results are published to the sink as each operation or group completes.
+
         Args:
             batch: Execution batch
 
@@ -239,28 +371,100 @@ class OperationExecutor:
         """
         logger.debug("Executing batch", batch_id=batch.batch_id, operations=len(batch.operations))
 
-        # Execute all operations in parallel with throttling
-        tasks = [self._execute_operation(op) for op in batch.operations]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Process results
-        batch_results: list[OperationResult] = []
-        for op, result in zip(batch.operations, results, strict=True):
-            if isinstance(result, Exception):
-                # Handle exception
-                batch_results.append(
-                    OperationResult(
-                        row_id=op.row_id,
-                        operation=op.operation_type,
-                        success=False,
-                        error_message=str(result),
-                        duration_ms=0,
-                    )
-                )
+        # Execute all operations (and groups) in parallel with throttling
+        units = self._group_operations(batch.operations)
+        unit_results = await asyncio.gather(*(self._run_unit(unit) for unit in units))
+
+        # Back in batch order
+        by_operation: dict[int, OperationResult] = {}
+        for unit, results in zip(units, unit_results, strict=True):
+            by_operation.update(zip(map(id, unit), results, strict=True))
+        return [by_operation[id(op)] for op in batch.operations]
+
+    async def _run_unit(self, unit: list[Operation]) -> list[OperationResult]:
+        """
+        Execute one operation or group and publish its results to the sink.
+
+        Args:
+            unit: Operations to run together (one unless grouped)
+
+        Returns:
+            One result per operation, in unit order
+        """
+        outcomes: list[OperationResult | Exception]
+        try:
+            if len(unit) > 1:
+                outcomes = list(await self._execute_group(unit))
             else:
-                batch_results.append(result)
+                outcomes = [await self._execute_operation(unit[0])]
+        except Exception as e:
+            outcomes = [e] * len(unit)
+
+        results = [
+            (
+                OperationResult(
+                    row_id=op.row_id,
+                    operation=op.operation_type,
+                    success=False,
+                    error_message=str(outcome),
+                    duration_ms=0,
+                )
+                if isinstance(outcome, Exception)
+                else outcome
+            )
+            for op, outcome in zip(unit, outcomes, strict=True)
+        ]
+        if self.sink is not None:
+            for result in results:
+                await self.sink.publish(result)
+        return results
+
+    def _group_operations(self, operations: list[Operation]) -> list[list[Operation]]:
+        """
+        Split a batch into groups sharing a handler and parent container.
+
+        Operations are grouped by (operation type, handler, handler batch key,
+        unresolved deferred references), so that every operation of a group
+        resolves to the same parent. Dry runs and handlers without batch_key()
+        keep every operation on its own.
 
-        return batch_results
+        Returns:
+            Units of execution in batch order; each is one operation or a group
+        """
+        if self.dry_run:
+            return [[op] for op in operations]
+
+        units: list[list[Operation]] = []
+        groups: dict[tuple[Any, ...], list[Operation]] = {}
+        for op in operations:
+            key = self._group_key(op)
+            if key is None:
+                units.append([op])
+                continue
+            group = groups.get(key)
+            if group is None or len(group) >= HANDLER_GROUP_SIZE:
+                group = groups[key] = []
+                units.append(group)
+            group.append(op)
+        return units
+
+    def _group_key(self, operation: Operation) -> tuple[Any, ...] | None:
+        """Grouping key of an operation, or None if it runs on its own."""
+        if operation.operation_type not in (OperationType.CREATE, OperationType.DELETE):
+            return None
+        try:
+            handler = get_handler(operation.object_type)
+        except ValueError:
+            return None
+        # Handlers registered from outside BaseHandler may not group at all
+        batch_key = getattr(type(handler), "batch_key", None)
+        parent = batch_key(handler, operation) if batch_key else None
+        if parent is None:
+            return None
+        deferred = tuple(
+            sorted((k, str(v)) for k, v in operation.payload.items() if k.startswith("_deferred_"))
+        )
+        return (operation.operation_type, id(handler), parent, deferred)
 
     def _resolve_deferred_ids(self, operation: Operation) -> None:
         """
@@ -445,9 +649,7 @@ class OperationExecutor:
         if "_deferred_device_subtype_name" in payload:
             device_subtype_name = payload["_deferred_device_subtype_name"]
             if device_subtype_name in self.created_device_subtypes:
-                payload["device_subtype_id"] = self.created_device_subtypes[
-                    device_subtype_name
-                ]
+                payload["device_subtype_id"] = self.created_device_subtypes[device_subtype_name]
                 logger.info(
                     "Resolved deferred device_subtype_id",
                     row_id=operation.row_id,
@@ -633,33 +835,9 @@ class OperationExecutor:
         Returns:
             OperationResult
         """
-        # Check if operation should be skipped due to parent failure
-        skipped_result = self._check_operation_skipped(operation)
-        if skipped_result:
-            return skipped_result
-
-        # Check for pre-existing errors (fail-fast)
-        if "error" in operation.payload:
-            error_msg = operation.payload["error"]
-            tb_str = operation.payload.get("traceback")
-
-            logger.error(
-                "Operation failed during Creation/Resolution",
-                row_id=operation.row_id,
-                error=error_msg,
-                traceback=tb_str,
-            )
-
-            self._mark_operation_failed(operation, error_msg)
-
-            return OperationResult(
-                row_id=operation.row_id,
-                operation=operation.operation_type,
-                success=False,
-                error_message=error_msg,
-                duration_ms=0,
-                metadata={"traceback": tb_str} if tb_str else {},
-            )
+        early_result = self._check_runnable(operation)
+        if early_result:
+            return early_result
 
         start_time = time.time()
 
@@ -673,6 +851,8 @@ class OperationExecutor:
 
         # Acquire throttle slot
         async with self.throttle:
+            # Latency for the cost model, without the wait for the slot
+            run_start = time.time()
             try:
                 # Execute based on operation type using the working copy
                 if working_op.operation_type == OperationType.CREATE:
@@ -686,23 +866,8 @@ class OperationExecutor:
                 else:
                     raise ValueError(f"Unknown operation type: {working_op.operation_type}")
 
-                # Update the original operation with success state
-
-                if not self.dry_run:
-                    # Update the original operation with success state
-                    operation.status = OperationStatus.SUCCEEDED
-                    operation.resource_id = working_op.resource_id
-
-                    # IMPORTANT: If success, we *do* want the resolved IDs to be reflected in the original
-                    # operation payload if we want them there?
-                    # Actually, for the purpose of the log/report, the resolved payload is better.
-                    # So we update the original payload with the resolved one upon success.
-                    operation.payload = working_op.payload
-
-                # Record success metrics
-                duration_ms = (time.time() - start_time) * 1000
-                self.throttle.record_success(duration_ms)
-
+                self._record_success(operation, working_op, start_time)
+                result.duration_ms = (time.time() - run_start) * 1000
                 return result
 
             except BAMRateLimitError as e:
@@ -719,26 +884,215 @@ class OperationExecutor:
                 return await self._execute_operation(operation)
 
             except Exception as e:
-                # Record failure
-                self.throttle.record_failure(is_rate_limit=False)
+                return self._record_failure(operation, e, start_time)
 
-                logger.error(
-                    "Operation failed",
-                    operation_type=operation.operation_type.value,
-                    row_id=operation.row_id,
-                    error=str(e),
-                )
+    async def _execute_group(self, operations: list[Operation]) -> list[OperationResult]:
+        """
+        Execute operations sharing a handler and parent with one handler call.
 
-                # Mark operation as failed and cascade to dependents
-                self._mark_operation_failed(operation, str(e))
+        The group resolves its deferred parent once and calls
+        create_many()/delete_many() with the throttle, which the handler
+        enters for every request it sends, so a group takes as many slots as
+        it has requests in flight. Each outcome is then handled as
+        _execute_operation would: 409 lookups, created-resource tracking,
+        per-operation throttle metrics and failure cascades. Operations that
+        hit a rate limit are retried on their own after the group finishes.
 
-                return OperationResult(
-                    row_id=operation.row_id,
-                    operation=operation.operation_type,
-                    success=False,
-                    error_message=str(e),
-                    duration_ms=(time.time() - start_time) * 1000,
-                )
+        Args:
+            operations: CREATE or DELETE operations with the same group key
+
+        Returns:
+            Results in the order of operations
+        """
+        results: dict[int, OperationResult] = {}
+        runnable: list[Operation] = []
+        for operation in operations:
+            early_result = self._check_runnable(operation)
+            if early_result:
+                results[id(operation)] = early_result
+            else:
+                runnable.append(operation)
+
+        if runnable:
+            start_time = time.time()
+            working_ops = [copy.deepcopy(operation) for operation in runnable]
+            try:
+                self._resolve_group_deferred_ids(working_ops)
+            except Exception as e:
+                # As for a single operation: reported, but not run or cascaded
+                for operation in runnable:
+                    results[id(operation)] = OperationResult(
+                        row_id=operation.row_id,
+                        operation=operation.operation_type,
+                        success=False,
+                        error_message=str(e),
+                        duration_ms=0,
+                    )
+                runnable = []
+
+        retries: list[Operation] = []
+        retry_after = 0.0
+        if runnable:
+            handler = get_handler(runnable[0].object_type)
+            is_create = runnable[0].operation_type == OperationType.CREATE
+            run_start = time.time()
+            outcomes: Sequence[dict[str, Any] | OperationResult | BaseException | None]
+            try:
+                if is_create:
+                    outcomes = await handler.create_many(
+                        self.client, working_ops, throttle=self.throttle
+                    )
+                else:
+                    outcomes = await handler.delete_many(
+                        self.client,
+                        working_ops,
+                        allow_dangerous_operations=self.allow_dangerous_operations,
+                        throttle=self.throttle,
+                    )
+            except Exception as e:
+                outcomes = [e] * len(working_ops)
+            # Each operation's share of the group call, for the cost model
+            share_ms = (time.time() - run_start) * 1000 / len(working_ops)
+
+            for operation, working_op, outcome in zip(runnable, working_ops, outcomes, strict=True):
+                try:
+                    if isinstance(outcome, BaseException):
+                        raise outcome
+                    # Creates return what was created, deletes return None
+                    if outcome is None:
+                        result = self._record_deleted(working_op)
+                    else:
+                        result = self._record_created(working_op, outcome)
+                    self._record_success(operation, working_op, start_time)
+                    result.duration_ms = share_ms
+                except ResourceAlreadyExistsError as e:
+                    try:
+                        # The 409 lookup is a request of its own
+                        async with self.throttle:
+                            result = await self._adopt_existing(working_op, e)
+                        self._record_success(operation, working_op, start_time)
+                        result.duration_ms = share_ms
+                    except Exception as lookup_error:
+                        result = self._record_failure(operation, lookup_error, start_time)
+                except BAMRateLimitError as e:
+                    self.throttle.record_failure(is_rate_limit=True)
+                    logger.warning(
+                        "Rate limit hit", operation=operation.row_id, retry_after=e.retry_after
+                    )
+                    retry_after = max(retry_after, e.retry_after)
+                    retries.append(operation)
+                    continue
+                except Exception as e:
+                    result = self._record_failure(operation, e, start_time)
+                results[id(operation)] = result
+
+        if retries:
+            # Wait and retry
+            await asyncio.sleep(retry_after)
+            retried = await asyncio.gather(*(self._execute_operation(op) for op in retries))
+            results.update(zip(map(id, retries), retried, strict=True))
+
+        return [results[id(operation)] for operation in operations]
+
+    def _check_runnable(self, operation: Operation) -> OperationResult | None:
+        """
+        Result for an operation that must not run, or None if it can.
+
+        Covers operations skipped because a parent failed and operations that
+        already failed during creation/resolution (fail-fast).
+        """
+        # Check if operation should be skipped due to parent failure
+        skipped_result = self._check_operation_skipped(operation)
+        if skipped_result:
+            return skipped_result
+
+        # Check for pre-existing errors (fail-fast)
+        if "error" in operation.payload:
+            error_msg = operation.payload["error"]
+            tb_str = operation.payload.get("traceback")
+
+            logger.error(
+                "Operation failed during Creation/Resolution",
+                row_id=operation.row_id,
+                error=error_msg,
+                traceback=tb_str,
+            )
+
+            self._mark_operation_failed(operation, error_msg)
+
+            return OperationResult(
+                row_id=operation.row_id,
+                operation=operation.operation_type,
+                success=False,
+                error_message=error_msg,
+                duration_ms=0,
+                metadata={"traceback": tb_str} if tb_str else {},
+            )
+        return None
+
+    def _resolve_group_deferred_ids(self, working_ops: list[Operation]) -> None:
+        """
+        Resolve the deferred IDs of a group once and apply them to every member.
+
+        Group members share the same deferred references (they are part of the
+        group key), so the first operation's resolution holds for all of them.
+        """
+        first = working_ops[0].payload
+        before = dict(first)
+        self._resolve_deferred_ids(working_ops[0])
+        removed = before.keys() - first.keys()
+        resolved = {k: v for k, v in first.items() if k not in before or before[k] is not v}
+        if not removed and not resolved:
+            return
+        for working_op in working_ops[1:]:
+            payload = working_op.payload
+            for key in removed:
+                del payload[key]
+            payload.update(resolved)
+
+    def _record_success(
+        self, operation: Operation, working_op: Operation, start_time: float
+    ) -> None:
+        """Copy a successful working copy's state back and record metrics."""
+        if not self.dry_run:
+            # Update the original operation with success state
+            operation.status = OperationStatus.SUCCEEDED
+            operation.resource_id = working_op.resource_id
+
+            # IMPORTANT: If success, we *do* want the resolved IDs to be reflected in the original
+            # operation payload if we want them there?
+            # Actually, for the purpose of the log/report, the resolved payload is better.
+            # So we update the original payload with the resolved one upon success.
+            operation.payload = working_op.payload
+
+        # Record success metrics
+        duration_ms = (time.time() - start_time) * 1000
+        self.throttle.record_success(duration_ms)
+
+    def _record_failure(
+        self, operation: Operation, error: BaseException, start_time: float
+    ) -> OperationResult:
+        """Record a failed operation, cascade it to dependents and build its result."""
+        # Record failure
+        self.throttle.record_failure(is_rate_limit=False)
+
+        logger.error(
+            "Operation failed",
+            operation_type=operation.operation_type.value,
+            row_id=operation.row_id,
+            error=str(error),
+        )
+
+        # Mark operation as failed and cascade to dependents
+        self._mark_operation_failed(operation, str(error))
+
+        return OperationResult(
+            row_id=operation.row_id,
+            operation=operation.operation_type,
+            success=False,
+            error_message=str(error),
+            duration_ms=(time.time() - start_time) * 1000,
+        )
 
     async def _execute_create(self, operation: Operation) -> OperationResult:
         """Execute CREATE operation using handler registry."""
@@ -765,52 +1119,44 @@ class OperationExecutor:
 
         try:
             # Execute CREATE operation using handler
-            result = await handler.create(self.client, operation)
-
-            # Handler may return OperationResult or dict - handle both
-            if isinstance(result, OperationResult):
-                # Handler returned OperationResult
-                if not result.success:
-                    raise ValueError(
-                        result.error_message
-                        or f"Handler for {operation.object_type} failed in row {operation.row_id}"
-                    )
-                resource_id = result.resource_id
-            else:
-                # Handler returned dict (API response)
-                resource_id = result.get("id")
-                result = OperationResult(
-                    row_id=operation.row_id,
-                    operation=operation.operation_type,
-                    success=True,
-                    resource_id=resource_id,
-                )
+            created = await handler.create(self.client, operation)
+        except ResourceAlreadyExistsError as e:
+            return await self._adopt_existing(operation, e)
+        return self._record_created(operation, created)
+
+    def _record_created(
+        self, operation: Operation, created: dict[str, Any] | OperationResult
+    ) -> OperationResult:
+        """
+        Turn a handler's create() outcome into a result and track the new resource.
 
-            if not resource_id:
+        Raises:
+            ValueError: If the handler reported failure or returned no resource ID
+        """
+        # Handler may return OperationResult or dict - handle both
+        if isinstance(created, OperationResult):
+            # Handler returned OperationResult
+            if not created.success:
                 raise ValueError(
-                    f"Handler for {operation.object_type} did not return resource ID in row {operation.row_id}"
+                    created.error_message
+                    or f"Handler for {operation.object_type} failed in row {operation.row_id}"
                 )
+            result = created
+            resource_id = created.resource_id
+        else:
+            # Handler returned dict (API response)
+            resource_id = created.get("id")
+            result = OperationResult(
+                row_id=operation.row_id,
+                operation=operation.operation_type,
+                success=True,
+                resource_id=resource_id,
+            )
 
-        except ResourceAlreadyExistsError:
-            # Resource already exists - look up the existing resource ID
-            resource_id = await self._lookup_existing_resource(operation)
-            if resource_id:
-                logger.info(
-                    "Resource already exists, using existing ID",
-                    row_id=operation.row_id,
-                    object_type=operation.object_type,
-                    resource_id=resource_id,
-                )
-                result = OperationResult(
-                    row_id=operation.row_id,
-                    operation=operation.operation_type,
-                    success=True,
-                    resource_id=resource_id,
-                    metadata={"already_exists": True},
-                )
-            else:
-                # Could not find existing resource, re-raise the error
-                raise
+        if not resource_id:
+            raise ValueError(
+                f"Handler for {operation.object_type} did not return resource ID in row {operation.row_id}"
+            )
 
         operation.status = OperationStatus.SUCCEEDED
         operation.resource_id = resource_id
@@ -820,6 +1166,67 @@ class OperationExecutor:
 
         return result
 
+    async def _adopt_existing(
+        self, operation: Operation, error: ResourceAlreadyExistsError
+    ) -> OperationResult:
+        """
+        Use the existing resource after a 409 Conflict on create.
+
+        Raises:
+            ResourceAlreadyExistsError: If the existing resource cannot be found
+        """
+        # Resource already exists - look up the existing resource ID. The
+        # conflict may come from a resource created since a listing was cached
+        with lookup_profile(), fresh_reads():
+            resource_id = await self._lookup_existing_resource(operation)
+        if not resource_id:
+            # Could not find existing resource, re-raise the error
+            raise error
+        logger.info(
+            "Resource already exists, using existing ID",
+            row_id=operation.row_id,
+            object_type=operation.object_type,
+            resource_id=resource_id,
+        )
+
+        operation.resource_id = resource_id
+        updated = False
+        if operation.payload.get("_update_existing"):
+            # The row changed since the run that created the resource
+            updated = await self._update_adopted(operation)
+        operation.status = OperationStatus.SUCCEEDED
+
+        # Store created resource for deferred resolution by dependent operations
+        self._store_created_resource(operation, resource_id)
+
+        return OperationResult(
+            row_id=operation.row_id,
+            operation=operation.operation_type,
+            success=True,
+            resource_id=resource_id,
+            metadata={"already_exists": True, "updated": updated},
+        )
+
+    async def _update_adopted(self, operation: Operation) -> bool:
+        """
+        Apply a create's payload to the existing resource it adopted.
+
+        Returns:
+            True if updated, False if the handler does not support updates
+        """
+        update = copy.copy(operation)
+        update.payload = {k: v for k, v in operation.payload.items() if k != "_update_existing"}
+        try:
+            await get_handler(operation.object_type).update(self.client, update)
+        except NotImplementedError:
+            logger.warning(
+                "Changed row adopted without update; resource type cannot be updated",
+                row_id=operation.row_id,
+                object_type=operation.object_type,
+            )
+            return False
+        return True
+
     async def _lookup_existing_resource(self, operation: Operation) -> int | None:
         """
         Look up the ID of an existing resource when a 409 Conflict occurs.
@@ -1018,7 +1425,10 @@ class OperationExecutor:
             operation,
             allow_dangerous_operations=self.allow_dangerous_operations,
         )
+        return self._record_deleted(operation)
 
+    def _record_deleted(self, operation: Operation) -> OperationResult:
+        """Result of a successful delete."""
         operation.status = OperationStatus.SUCCEEDED
 
         return OperationResult(
@@ -9,9 +9,22 @@ Each handler is responsible for:
 3. DELETE operations
 
 Handlers are registered in HANDLER_REGISTRY for efficient dispatch.
+
+Batch Extension:
+Handlers may also implement create_many()/delete_many() for several operations
+under the same parent container. The executor groups CREATE and DELETE
+operations of a batch by handler and parent (see BaseHandler.batch_key) and
+hands each group over in one call, so that parent resolution and payload
+building happen once per group instead of once per row. The executor's
+throttle is passed along: every request a handler sends takes its own slot, so
+a group never exceeds the concurrency limit. BaseHandler's default
+implementations run the single-row calls concurrently, one slot each.
 """
 
-from typing import Any, Protocol
+import asyncio
+from collections.abc import Hashable, Sequence
+from contextlib import AbstractAsyncContextManager, nullcontext
+from typing import Any, ClassVar, Protocol, cast
 
 import structlog
 
@@ -109,6 +122,46 @@ class OperationHandler(Protocol):
         """
         ...
 
+    async def create_many(
+        self,
+        client: BAMClient,
+        operations: Sequence[Operation],
+        throttle: AbstractAsyncContextManager[Any] | None = None,
+    ) -> list[dict[str, Any] | OperationResult | BaseException]:
+        """Handle CREATE for operations sharing a parent container (optional).
+
+        Args:
+            client: BAM client instance
+            operations: Operations with the same handler and batch_key()
+            throttle: Entered around every request sent (one slot per request)
+
+        Returns:
+            One outcome per operation, in order: what create() would return,
+            or the exception it would raise
+        """
+        ...
+
+    async def delete_many(
+        self,
+        client: BAMClient,
+        operations: Sequence[Operation],
+        allow_dangerous_operations: bool = False,
+        throttle: AbstractAsyncContextManager[Any] | None = None,
+    ) -> list[BaseException | None]:
+        """Handle DELETE for operations sharing a parent container (optional).
+
+        Args:
+            client: BAM client instance
+            operations: Operations with the same handler and batch_key()
+            allow_dangerous_operations: Allow deletion of protected resources
+            throttle: Entered around every request sent (one slot per request)
+
+        Returns:
+            One outcome per operation, in order: None, or the exception
+            delete() would raise
+        """
+        ...
+
 
 class BaseHandler:
     """Base class with common functionality for all handlers."""
@@ -117,6 +170,57 @@ class BaseHandler:
     # Maps CSV object types (snake_case) to BAM API types (PascalCase)
     _TYPE_MAPPING = CSV_TO_BAM_TYPE_MAP
 
+    # Payload keys naming the parent container. Operations with the same
+    # handler and parent are executed together through create_many() and
+    # delete_many(); None keeps every operation on its own.
+    BATCH_PARENT_KEYS: ClassVar[tuple[str, ...] | None] = None
+
+    def batch_key(self, operation: Operation) -> Hashable | None:
+        """
+        Key of the parent container an operation is grouped by.
+
+        Returns:
+            Hashable key, or None if the operation must run on its own
+        """
+        if self.BATCH_PARENT_KEYS is None:
+            return None
+        payload = operation.payload
+        return tuple(payload.get(key) for key in self.BATCH_PARENT_KEYS)
+
+    async def create_many(
+        self,
+        client: BAMClient,
+        operations: Sequence[Operation],
+        throttle: AbstractAsyncContextManager[Any] | None = None,
+    ) -> list[dict[str, Any] | OperationResult | BaseException]:
+        """Create each operation with create(), concurrently, one throttle slot each."""
+        # Subclasses provide create() and delete()
+        handler = cast(OperationHandler, self)
+
+        async def create(operation: Operation) -> dict[str, Any] | OperationResult:
+            async with throttle or nullcontext():
+                return await handler.create(client, operation)
+
+        return await asyncio.gather(*map(create, operations), return_exceptions=True)
+
+    async def delete_many(
+        self,
+        client: BAMClient,
+        operations: Sequence[Operation],
+        allow_dangerous_operations: bool = False,
+        throttle: AbstractAsyncContextManager[Any] | None = None,
+    ) -> list[BaseException | None]:
+        """Delete each operation with delete(), concurrently, one throttle slot each."""
+        handler = cast(OperationHandler, self)
+
+        async def delete(operation: Operation) -> None:
+            async with throttle or nullcontext():
+                await handler.delete(
+                    client, operation, allow_dangerous_operations=allow_dangerous_operations
+                )
+
+        return await asyncio.gather(*map(delete, operations), return_exceptions=True)
+
     def _get_bam_type(self, object_type: str) -> str:
         """
         Convert CSV object type to BAM API type name.
@@ -338,6 +442,8 @@ class IPv4GroupHandler(BaseHandler):
 class IPv4AddressHandler(BaseHandler):
     """Handler for IPv4 addresses."""
 
+    BATCH_PARENT_KEYS = ("network_id",)
+
     async def create(self, client: BAMClient, operation: Operation) -> dict[str, Any]:
         """Create IPv4 address."""
         network_id = self._get_required_payload_id(operation, "network_id")
@@ -492,6 +598,8 @@ class IPv6NetworkHandler(BaseHandler):
 class IPv6AddressHandler(BaseHandler):
     """Handler for IPv6 addresses."""
 
+    BATCH_PARENT_KEYS = ("network_id",)
+
     async def create(self, client: BAMClient, operation: Operation) -> dict[str, Any]:
         """
         Create IPv6 address.
@@ -978,6 +1086,8 @@ class DNSZoneHandler(BaseHandler):
 class HostRecordHandler(BaseHandler):
     """Handler for DNS host (A) record operations."""
 
+    BATCH_PARENT_KEYS = ("zone_id",)
+
     async def create(self, client: BAMClient, operation: Operation) -> OperationResult:
         """Create host record."""
         payload = operation.payload
@@ -1046,6 +1156,8 @@ class HostRecordHandler(BaseHandler):
 class AliasRecordHandler(BaseHandler):
     """Handler for DNS alias (CNAME) record operations."""
 
+    BATCH_PARENT_KEYS = ("zone_id",)
+
     async def create(self, client: BAMClient, operation: Operation) -> OperationResult:
         """Create alias record."""
         payload = operation.payload
@@ -1100,6 +1212,8 @@ class AliasRecordHandler(BaseHandler):
 class MXRecordHandler(BaseHandler):
     """Handler for DNS MX record operations."""
 
+    BATCH_PARENT_KEYS = ("zone_id",)
+
     async def create(self, client: BAMClient, operation: Operation) -> OperationResult:
         """Create MX record."""
         payload = operation.payload
@@ -1156,6 +1270,8 @@ class MXRecordHandler(BaseHandler):
 class TXTRecordHandler(BaseHandler):
     """Handler for DNS TXT record operations."""
 
+    BATCH_PARENT_KEYS = ("zone_id",)
+
     async def create(self, client: BAMClient, operation: Operation) -> OperationResult:
         """Create TXT record."""
         payload = operation.payload
@@ -1207,6 +1323,8 @@ class TXTRecordHandler(BaseHandler):
 class SRVRecordHandler(BaseHandler):
     """Handler for DNS SRV record operations."""
 
+    BATCH_PARENT_KEYS = ("zone_id",)
+
     async def create(self, client: BAMClient, operation: Operation) -> OperationResult:
         """Create SRV record."""
         payload = operation.payload
@@ -1267,6 +1385,8 @@ class SRVRecordHandler(BaseHandler):
 class ExternalHostRecordHandler(BaseHandler):
     """Handler for DNS external host record operations."""
 
+    BATCH_PARENT_KEYS = ("zone_id",)
+
     async def create(self, client: BAMClient, operation: Operation) -> OperationResult:
         """Create external host record."""
         payload = operation.payload
@@ -1337,6 +1457,8 @@ class GenericRecordHandler(BaseHandler):
     such as SSHFP, TLSA, CAA, DS, DNAME, etc.
     """
 
+    BATCH_PARENT_KEYS = ("zone_id",)
+
     async def create(self, client: BAMClient, operation: Operation) -> OperationResult:
         """Create generic DNS record."""
         payload = operation.payload
@@ -0,0 +1,378 @@
+"""Result Pipeline - Stream operation results to consumers during execution.
+
+Purpose:
+-------
+The executor used to hand back one list of every result once the whole plan
+had run, and the runner then invalidated caches, wrote the changelog and
+advanced the progress bar in one serial loop. The bar sat at 0% for the whole
+run and every result of a million-operation import was held in memory.
+
+``ResultPipeline`` sits between the two. The executor publishes each result
+as soon as its operation (or group) completes; a single worker task takes
+them off a bounded queue in chunks and hands each chunk to every consumer in
+turn, while execution carries on. When the queue is full, ``publish`` waits,
+so execution never runs more than ``RESULT_QUEUE_SIZE`` results ahead of the
+consumers. The executor drains the pipeline at every batch barrier, before
+it saves the batch's checkpoint, so a checkpoint never claims results the
+changelog has not recorded.
+
+A consumer that raises does not stop the others; the first error is raised
+from ``drain``/``close``.
+
+Usage:
+-----
+```python
+tally = ResultTally()
+async with ResultPipeline([tally, ChangelogRecorder(...)]) as pipeline:
+    await executor.execute_plan(plan, sink=pipeline, keep_results=False)
+print(tally.successful, tally.failed)
+```
+"""
+
+import asyncio
+from collections.abc import Callable, Mapping, Sequence
+from types import TracebackType
+from typing import Any, Protocol
+
+import structlog
+
+from ..constants import RESULT_CHUNK_SIZE, RESULT_QUEUE_SIZE
+from ..models.operations import Operation, OperationType
+from ..models.results import OperationResult
+
+logger = structlog.get_logger(__name__)
+
+_MUTATIONS = (OperationType.CREATE, OperationType.UPDATE, OperationType.DELETE)
+
+
+class ResultConsumer(Protocol):
+    """Receives chunks of results, in completion order."""
+
+    async def handle(self, results: list[OperationResult]) -> None:
+        """Process a chunk of results."""
+        ...
+
+
+class ResultPipeline:
+    """Bounded queue from the executor to result consumers."""
+
+    def __init__(
+        self,
+        consumers: Sequence[ResultConsumer],
+        maxsize: int = RESULT_QUEUE_SIZE,
+        chunk_size: int = RESULT_CHUNK_SIZE,
+    ) -> None:
+        """
+        Initialize pipeline.
+
+        Args:
+            consumers: Consumers, called in this order for every chunk
+            maxsize: Most results queued before publish() waits
+            chunk_size: Most results handed to the consumers at once
+        """
+        self.consumers = list(consumers)
+        self.chunk_size = max(1, chunk_size)
+        self._queue: asyncio.Queue[OperationResult] = asyncio.Queue(maxsize=max(1, maxsize))
+        self._worker: asyncio.Task[None] | None = None
+        self._error: Exception | None = None
+        self.published = 0
+
+    def start(self) -> None:
+        """Start the worker task (idempotent)."""
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._run())
+
+    async def publish(self, result: OperationResult) -> None:
+        """Queue a result, waiting while the queue is full."""
+        if self._worker is None:
+            self.start()
+        await self._queue.put(result)
+        self.published += 1
+
+    async def drain(self) -> None:
+        """
+        Wait until every published result has been consumed.
+
+        Raises:
+            Exception: The first error raised by a consumer
+        """
+        if self._worker is not None:
+            await self._queue.join()
+        if self._error is not None:
+            raise self._error
+
+    async def close(self) -> None:
+        """Drain, then stop the worker."""
+        try:
+            await self.drain()
+        finally:
+            await self._stop()
+
+    async def _stop(self) -> None:
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+    async def __aenter__(self) -> "ResultPipeline":
+        self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            await self.close()
+        else:
+            # Don't wait on consumers (or mask the error) when execution failed
+            await self._stop()
+
+    async def _run(self) -> None:
+        queue = self._queue
+        while True:
+            chunk = [await queue.get()]
+            while len(chunk) < self.chunk_size and not queue.empty():
+                chunk.append(queue.get_nowait())
+            try:
+                for consumer in self.consumers:
+                    try:
+                        await consumer.handle(chunk)
+                    except Exception as e:
+                        logger.error(
+                            "Result consumer failed",
+                            consumer=type(consumer).__name__,
+                            error=str(e),
+                        )
+                        if self._error is None:
+                            self._error = e
+            finally:
+                for _ in chunk:
+                    queue.task_done()
+
+
+class ResultTally:
+    """Counts outcomes and keeps the first few failures."""
+
+    def __init__(self, max_failures: int = 10) -> None:
+        """
+        Initialize tally.
+
+        Args:
+            max_failures: Failed results to keep for the summary
+        """
+        self.max_failures = max_failures
+        self.successful = 0
+        self.failed = 0
+        self.skipped = 0
+        self.failures: list[OperationResult] = []
+
+    @property
+    def total(self) -> int:
+        """Results counted so far."""
+        return self.successful + self.failed + self.skipped
+
+    async def handle(self, results: list[OperationResult]) -> None:
+        """Count a chunk of results."""
+        for result in results:
+            if result.success:
+                self.successful += 1
+            elif result.metadata.get("skipped"):
+                self.skipped += 1
+            else:
+                self.failed += 1
+                if len(self.failures) < self.max_failures:
+                    self.failures.append(result)
+
+
+class CacheInvalidator:
+    """Invalidates resolver cache entries of mutated resources."""
+
+    def __init__(self, resolver: Any, operations: Mapping[Any, Operation]) -> None:
+        """
+        Initialize invalidator.
+
+        Args:
+            resolver: Resolver whose cache to invalidate
+            operations: Operations by row_id
+        """
+        self.resolver = resolver
+        self.operations = operations
+
+    async def handle(self, results: list[OperationResult]) -> None:
+        """Invalidate the paths (and parent paths) of successful mutations."""
+        # PERF-001: Cache Coherency - Invalidate resolver cache for ALL mutations
+        #
+        # WHY INVALIDATE ON ALL OPERATIONS:
+        # The resolver caches path→ID mappings (e.g., "Default/10.0.0.0/8" → 123).
+        # When we CREATE/UPDATE/DELETE a resource, the cache may contain stale data:
+        #   - CREATE: New resource exists but cache thinks it doesn't
+        #   - UPDATE: Resource properties changed (name, CIDR normalization)
+        #   - DELETE: Resource gone but cache still returns ID
+        #
+        # Failing to invalidate causes:
+        #   - Deferred resolution failures (can't find newly created parents)
+        #   - Duplicate creation attempts (cache miss on existing resource)
+        #   - Invalid ID references (deleted resource still cached)
+        #
+        # PERFORMANCE TRADE-OFF:
+        # Invalidation on every mutation is conservative but safe. Alternative
+        # (selective invalidation) risks subtle cache bugs that are hard to debug.
+        for result in results:
+            if not result.success or result.operation not in _MUTATIONS:
+                continue
+            op = self.operations.get(result.row_id)
+            if not op or not op.payload.get("resource_path"):
+                continue
+            path = op.payload["resource_path"]
+
+            # Invalidate the resource's own cache entry
+            await self.resolver.invalidate(path, op.object_type)
+
+            # Hierarchical resources affect parent listings: creating or deleting a
+            # network makes the parent block's "list networks" cache stale
+            parent_path = self.parent_path(path)
+            if parent_path:
+                await self.resolver.invalidate(parent_path, op.object_type)
+
+    @staticmethod
+    def parent_path(path: str) -> str | None:
+        """
+        Return the parent of a resource path.
+
+        EDGE CASE: CIDR Paths vs Hierarchical Paths
+
+        CIDR Path (IPv4/IPv6):
+          Format: "Config/IP/Prefix"  e.g., "Default/10.0.0.0/8"
+          Parent: Just the config name ("Default")
+          WHY: The "/8" is part of CIDR notation, not a path separator
+
+        Hierarchical Path (Zones, UDLs):
+          Format: "Parent/Child"  e.g., "RootZone/SubZone"
+          Parent: Everything before last "/" ("RootZone")
+
+        A last component of digits is taken as a prefix length. This could
+        misread zones named "123", which is rare and against DNS conventions.
+
+        Args:
+            path: Resource path
+
+        Returns:
+            Parent path, or None for a top-level path
+        """
+        if "/" not in path:
+            return None
+        parts = path.split("/")
+        if len(parts) >= 3 and parts[-1].isdigit():
+            return parts[0]
+        return "/".join(parts[:-1])
+
+
+class ChangelogRecorder:
+    """Records each chunk of results in the changelog in one transaction."""
+
+    def __init__(
+        self,
+        changelog: Any,
+        session_id: str,
+        operations: Mapping[Any, Operation],
+        states: Callable[[Operation | None, OperationResult], tuple[Any, Any]],
+    ) -> None:
+        """
+        Initialize recorder.
+
+        Args:
+            changelog: ChangeLog to write to
+            session_id: Session identifier
+            operations: Operations by row_id
+            states: Builds the (before_state, after_state) of a successful result
+        """
+        self.changelog = changelog
+        self.session_id = session_id
+        self.operations = operations
+        self.states = states
+        self.recorded = 0
+
+    async def handle(self, results: list[OperationResult]) -> None:
+        """Record successful and failed results (skipped ones are not recorded)."""
+        entries: list[dict[str, Any]] = []
+        for result in results:
+            op = self.operations.get(result.row_id)
+            entry: dict[str, Any] = {
+                "row_id": str(result.row_id),
+                "operation_type": result.operation.value,
+                "object_type": op.object_type if op else "unknown",
+                "success": result.success,
+            }
+            if result.success:
+                try:
+                    before_state, after_state = self.states(op, result)
+                except Exception as e:
+                    logger.error("Failed to build changelog states", error=str(e))
+                    continue
+                entry.update(
+                    resource_id=result.resource_id,
+                    before_state=before_state,
+                    after_state=after_state,
+                    duration_ms=result.duration_ms,
+                )
+            elif result.metadata.get("skipped"):
+                continue
+            else:
+                entry["error_message"] = result.error_message
+            entries.append(entry)
+        try:
+            self.recorded += self.changelog.record_operations(self.session_id, entries)
+        except Exception as e:
+            logger.error("Failed to write to changelog", error=str(e), entries=len(entries))
+
+
+class MetricsRecorder:
+    """Counts operation outcomes in a MetricsCollector."""
+
+    def __init__(self, collector: Any, operations: Mapping[Any, Operation]) -> None:
+        """
+        Initialize recorder.
+
+        Args:
+            collector: MetricsCollector
+            operations: Operations by row_id
+        """
+        self.collector = collector
+        self.operations = operations
+
+    async def handle(self, results: list[OperationResult]) -> None:
+        """Count each result by operation, status and object type."""
+        for result in results:
+            op = self.operations.get(result.row_id)
+            if result.success:
+                status = "success"
+            elif result.metadata.get("skipped"):
+                status = "skipped"
+            else:
+                status = "failed"
+            self.collector.count_operation(
+                result.operation.value, status, op.object_type if op else "unknown"
+            )
+
+
+class ProgressReporter:
+    """Advances a progress display by the number of results."""
+
+    def __init__(self, advance: Callable[[int], None]) -> None:
+        """
+        Initialize reporter.
+
+        Args:
+            advance: Called with the number of results in each chunk
+        """
+        self.advance = advance
+
+    async def handle(self, results: list[OperationResult]) -> None:
+        """Advance by one per result."""
+        self.advance(len(results))
@@ -35,9 +35,16 @@ Resulting Plan:
 
 Duration Estimation:
 -------------------
-Durations are rough estimates for progress reporting. Actual times depend on
-BAM server load, network latency, and operation complexity. The estimates
-assume average conditions and are used for user feedback, not scheduling.
+Each operation's latency comes from a CostModel (see cost_model.py): a static
+guess per operation type, refined by the latencies of recent sessions in the
+changelog. A batch takes at least its slowest operation and at least its
+total work divided by max_concurrent_operations. The plan's duration is the
+sum of its batches with scheduling "batch"; otherwise operations start as
+soon as their dependencies finish, and it is the longer of the critical path
+and the total work divided by the concurrency.
+
+The per-node estimates are kept in ExecutionPlan.costs. The executor weighs
+its critical-path priorities with them.
 
 Relationship to DependencyGraph:
 -------------------------------
@@ -54,6 +61,8 @@ import structlog
 from ..config import PolicyConfig
 from ..dependency.graph import DependencyGraph, DependencyNode
 from ..models.operations import Operation, OperationType
+from .cost_model import CostModel
+from .scheduler import longest_paths
 
 logger = structlog.get_logger(__name__)
 
@@ -91,6 +100,7 @@ class ExecutionPlan:
         max_parallelism: Maximum number of parallel operations in any batch
         estimated_total_duration: Estimated total execution time
         metadata: Additional plan metadata
+        costs: Estimated seconds per node ID
     """
 
     batches: list[ExecutionBatch] = field(default_factory=list)
@@ -98,6 +108,7 @@ class ExecutionPlan:
     max_parallelism: int = 0
     estimated_total_duration: float = 0.0
     metadata: dict[str, Any] = field(default_factory=dict)
+    costs: dict[str, float] = field(default_factory=dict)
 
 
 class ExecutionPlanner:
@@ -111,23 +122,19 @@ class ExecutionPlanner:
     - Resource-aware scheduling
     """
 
-    def __init__(self, policy: PolicyConfig) -> None:
+    def __init__(self, policy: PolicyConfig, cost_model: CostModel | None = None) -> None:
         """
         Initialize Execution Planner.
 
         Args:
             policy: Policy configuration for planning
+            cost_model: Operation latency estimates (default: static guesses only)
         """
         self.policy = policy
+        self.cost_model = cost_model or CostModel()
 
-        # Estimated duration per operation type (seconds)
-        self.operation_durations = {
-            OperationType.CREATE: 0.5,
-            OperationType.UPDATE: 0.3,
-            OperationType.DELETE: 0.2,
-            OperationType.NOOP: 0.01,
-            OperationType.ORPHAN: 0.0,
-        }
+        # Estimated duration per operation type (seconds) for types without history
+        self.operation_durations = self.cost_model.priors
 
     def create_plan(
         self,
@@ -175,7 +182,15 @@ class ExecutionPlanner:
         # Calculate plan statistics
         total_ops = sum(len(batch) for batch in execution_batches)
         max_parallelism = max(len(batch) for batch in execution_batches) if execution_batches else 0
-        estimated_duration = sum(batch.estimated_duration for batch in execution_batches)
+        costs = {
+            node_id: self.cost_model.cost(node.operation)
+            for node_id, node in dependency_graph.nodes.items()
+        }
+        if self.policy.scheduling == "batch":
+            estimated_duration = sum(batch.estimated_duration for batch in execution_batches)
+        else:
+            critical_path = max(longest_paths(dependency_graph, costs).values(), default=0.0)
+            estimated_duration = max(critical_path, sum(costs.values()) / self._concurrency())
 
         # Create execution plan
         plan = ExecutionPlan(
@@ -183,6 +198,7 @@ class ExecutionPlanner:
             total_operations=total_ops,
             max_parallelism=max_parallelism,
             estimated_total_duration=estimated_duration,
+            costs=costs,
             metadata={
                 "batch_count": len(execution_batches),
                 "creates": sum(
@@ -240,11 +256,11 @@ class ExecutionPlanner:
         operations = [node.operation for node in nodes]
         depth = nodes[0].depth if nodes else 0
 
-        # Estimate batch duration (max of concurrent operations)
+        # Estimate batch duration: its slowest operation, or its total work
+        # spread over the concurrency limit, whichever is longer
+        costs = [self.cost_model.cost(op) for op in operations]
         estimated_duration = (
-            max(self.operation_durations.get(op.operation_type, 0.5) for op in operations)
-            if operations
-            else 0.0
+            max(max(costs), sum(costs) / self._concurrency()) if operations else 0.0
         )
 
         return ExecutionBatch(
@@ -284,6 +300,10 @@ class ExecutionPlanner:
 
         return sub_batches
 
+    def _concurrency(self) -> int:
+        """Operations expected to run at once."""
+        return max(1, int(self.policy.max_concurrent_operations))
+
     def optimize_plan(self, plan: ExecutionPlan) -> ExecutionPlan:
         """
         Optimize an execution plan for better performance.
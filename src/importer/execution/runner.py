@@ -14,9 +14,10 @@ It handles:
 import hashlib
 import traceback
 import uuid
+from contextlib import AbstractContextManager, nullcontext
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import structlog
 from rich.console import Console
@@ -30,24 +31,67 @@ from rich.progress import (
     TimeRemainingColumn,
 )
 from rich.prompt import Confirm
+from rich.table import Table
+from rich.text import Text
 
 from ..bam.client import BAMClient
+from ..bam.snapshot import SnapshotReadClient
 from ..config import ImporterConfig
+from ..constants import SHARDS_PER_PROCESS
+from ..core.incremental import (
+    IncrementalSelection,
+    fingerprint_rows,
+    flag_changed_creates,
+    select_incremental_rows,
+)
 from ..core.operation_factory import OperationFactory, PendingResources
 from ..core.parser import CSVParser
 from ..core.resolver import Resolver
 from ..dependency.graph import DependencyGraph
 from ..dependency.planner import DependencyPlanner
+from ..execution.cost_model import CostModel, RemainingWork
+from ..execution.distributed import QueueCoordinator
 from ..execution.executor import OperationExecutor
+from ..execution.pipeline import (
+    CacheInvalidator,
+    ChangelogRecorder,
+    MetricsRecorder,
+    ProgressReporter,
+    ResultConsumer,
+    ResultPipeline,
+    ResultTally,
+)
 from ..execution.planner import ExecutionPlanner
+from ..execution.sharding import ShardedExecutor, completed_shards, plan_shards
 from ..models.operations import Operation, OperationType
+from ..observability.metrics import get_global_collector
+from ..observability.profiler import SessionProfiler
+from ..observability.reporter import ReportGenerator
 from ..persistence.changelog import ChangeLog
 from ..persistence.checkpoint import CheckpointManager
+from ..persistence.snapshot import SnapshotStore
+from ..persistence.work_queue import WorkQueue
 from ..rollback.generator import RollbackGenerator
 
+if TYPE_CHECKING:
+    from ..bam.mock_server import MockBAMState
+
 logger = structlog.get_logger(__name__)
 
 
+class EstimatedTimeRemainingColumn(TimeRemainingColumn):
+    """Time remaining from a task's "eta" field (learned costs), else from its speed."""
+
+    def render(self, task: Any) -> Text:
+        """Render the estimate as H:MM:SS."""
+        eta = task.fields.get("eta")
+        if eta is None or task.finished:
+            return super().render(task)
+        minutes, seconds = divmod(int(eta), 60)
+        hours, minutes = divmod(minutes, 60)
+        return Text(f"{hours:d}:{minutes:02d}:{seconds:02d}", style="progress.remaining")
+
+
 class ImportRunner:
     """
     Executes an import session from start to finish.
@@ -76,6 +120,13 @@ class ImportRunner:
         no_cache: bool = False,
         show_deps: Path | None = None,
         show_plan: bool = False,
+        incremental: bool = False,
+        profiler: SessionProfiler | None = None,
+        simulation: "MockBAMState | None" = None,
+        snapshot: Path | None = None,
+        snapshot_max_age: int | None = None,
+        processes: int = 1,
+        coordinator: Path | None = None,
     ) -> int:
         """
         Run an import session.
@@ -90,11 +141,37 @@ class ImportRunner:
             no_cache: Whether to disable resolver caching
             show_deps: Optional path to output dependency graph as DOT file
             show_plan: Whether to show execution plan and exit without running
+            incremental: Only execute rows added, changed or removed since the last
+                successful run of this file (plus their in-CSV dependencies)
+            profiler: Optional profiler; when set, per-phase and per-endpoint timings
+                are collected and written to JSON/HTML reports
+            simulation: Optional simulated BAM; when set, operations are executed
+                against it instead of BAM and nothing is persisted (no changelog,
+                checkpoints, resolver cache or rollback)
+            snapshot: Optional snapshot database (see ``bluecat-import snapshot``);
+                path resolution and parent discovery for configurations it holds
+                are answered locally
+            snapshot_max_age: Seconds after which a snapshot is ignored (defaults
+                to ``cache.snapshot_max_age``)
+            processes: Worker processes; above 1, independent parts of the
+                dependency graph execute in parallel processes
+            coordinator: Optional work queue database; when set, the plan is
+                published there and executed by ``bluecat-import worker``
+                processes instead of this one (an unfinished queued session of
+                the same file is reattached)
 
         Returns:
             int: Number of failed operations (0 = success)
         """
         start_time = datetime.now()
+        if profiler:
+            profiler.start()
+
+        def phase(name: str) -> AbstractContextManager[Any]:
+            return profiler.phase(name) if profiler else nullcontext()
+
+        # Only live runs write changelog, checkpoints and rollback
+        live = not dry_run and simulation is None
 
         # Initialize persistence first to check for resume
         changelog_db = Path(".changelogs/changelog.db")
@@ -112,8 +189,17 @@ class ImportRunner:
         # Track created resources loaded from checkpoint for resume
         initial_created_resources: dict[str, dict[str, int]] | None = None
 
+        # Coordinator mode: reattach to this file's unfinished queued session
+        work_queue: WorkQueue | None = None
+        if coordinator is not None:
+            work_queue = WorkQueue(coordinator)
+            if not session_id:
+                session_id = work_queue.find_session(input_hash)
+                if session_id:
+                    self.console.print(f"[green]Reattaching to queued session {session_id}[/green]")
+
         # Resume logic
-        if not session_id and not dry_run:
+        if not session_id and live:
             resumable_checkpoint = checkpoint_mgr.find_resumable_session(input_hash)
 
             if resumable_checkpoint:
@@ -142,13 +228,19 @@ class ImportRunner:
             session_id = f"sess_{uuid.uuid4().hex[:8]}"
 
         self.console.print(f"Session ID: [cyan]{session_id}[/cyan]")
-        self.console.print(f"Mode: [yellow]{'DRY RUN' if dry_run else 'LIVE'}[/yellow]")
+        mode = "DRY RUN" if dry_run else "SIMULATION" if simulation is not None else "LIVE"
+        self.console.print(f"Mode: [yellow]{mode}[/yellow]")
 
         # Metrics
         successful = 0
         failed = 0
         skipped = 0
-        results = []
+        tally = ResultTally()
+        results: list[Any] = []
+        ops_map: dict[Any, Operation] = {}
+        all_rows: list[Any] = []
+        fingerprints: dict[str, tuple[str, str]] | None = None
+        selection: IncrementalSelection | None = None
 
         # Persistence initialized above
 
@@ -159,24 +251,52 @@ class ImportRunner:
             BarColumn(),
             MofNCompleteColumn(),
             TimeElapsedColumn(),
-            TimeRemainingColumn(),
+            EstimatedTimeRemainingColumn(),
             console=self.console,
         )
 
-        client = BAMClient(self.config.bam)
+        if simulation is not None:
+            from ..bam.simulator import create_simulated_client
+
+            client = create_simulated_client(simulation)
+            no_cache = True
+        else:
+            if self.config.bam is None:
+                raise ValueError("BAM configuration required")
+            client = BAMClient(self.config.bam)
+        client.profiler = profiler
+        rollback_path: Path | None = None
+
+        # Lookups (resolver and factory) may be served by a local snapshot;
+        # writes always go to the client
+        snapshot_store: SnapshotStore | None = None
+        lookup_client: BAMClient | SnapshotReadClient = client
+        if snapshot is not None and simulation is None:
+            snapshot_store = SnapshotStore(snapshot)
+            lookup_client = SnapshotReadClient(
+                client,
+                snapshot_store,
+                (
+                    snapshot_max_age
+                    if snapshot_max_age is not None
+                    else self.config.cache.snapshot_max_age
+                ),
+            )
 
         with progress:
             try:
                 # Step 1: Connect to BAM
                 task = progress.add_task("[cyan]Connecting to BAM...", total=None)
                 if not dry_run:
-                    await client.authenticate()
+                    with phase("connect"):
+                        await client.authenticate()
                 progress.update(task, completed=True, description="[green]DONE: Connected to BAM")
 
                 # Step 2: Parse CSV
                 task = progress.add_task("[cyan]Parsing CSV...", total=None)
-                parser = CSVParser(csv_file)
-                rows = parser.parse()
+                with phase("parse"):
+                    parser = CSVParser(csv_file)
+                    rows = parser.parse()
                 progress.update(
                     task, completed=True, description=f"[green]DONE: Parsed {len(rows)} rows"
                 )
@@ -199,65 +319,109 @@ class ImportRunner:
                         "message": "No operations to execute (empty CSV)",
                     }
 
-                # Step 3: Resolve paths and create operations
-                task = progress.add_task("[cyan]Resolving paths...", total=len(rows))
-                resolver = Resolver(
-                    client, Path(".cache/resolver"), self.config.cache, no_cache=no_cache
-                )
-                operations = []
-
-                # Pre-scan for pending resources
-                pending = PendingResources.from_rows(rows)
-                factory = OperationFactory(client, resolver, pending)
-
-                for row in rows:
-                    try:
-                        operation = await factory.create_from_row(row)
-                        operations.append(operation)
-                    except Exception as e:
-                        tb_str = traceback.format_exc()
-                        logger.warning(
-                            f"Failed to create operation for row {row.row_id}: {e}",
-                            traceback=tb_str,
+                all_rows = rows
+
+                # Incremental mode: execute only rows that differ from the last successful run
+                if incremental:
+                    with phase("incremental"):
+                        fingerprints = fingerprint_rows(rows)
+                        row_snapshot = changelog.get_latest_row_snapshot(self._source_key(csv_file))
+                    if row_snapshot is None:
+                        progress.console.print(
+                            "[yellow]No previous successful run recorded for this file - "
+                            "running a full import.[/yellow]"
                         )
-                        # Create failed placeholder
-                        operations.append(
-                            Operation(
-                                row_id=row.row_id,
-                                operation_type=(
-                                    OperationType.CREATE
-                                    if row.action == "create"
-                                    else (
-                                        OperationType.UPDATE
-                                        if row.action == "update"
-                                        else OperationType.DELETE
-                                    )
-                                ),
-                                object_type=row.object_type,
-                                resource_id=getattr(row, "bam_id", None),
-                                payload={"error": str(e), "traceback": tb_str},
-                                csv_row=row,
+                    else:
+                        with phase("incremental"):
+                            selection = select_incremental_rows(
+                                rows, fingerprints, row_snapshot.session_id, row_snapshot.rows
                             )
+                        progress.console.print(
+                            f"Incremental against [cyan]{row_snapshot.session_id}[/cyan]: "
+                            f"{len(selection.added)} added, {len(selection.changed)} changed, "
+                            f"{len(selection.removed)} removed, "
+                            f"{len(selection.dependencies)} dependencies, "
+                            f"{selection.unchanged} unchanged"
                         )
-                    progress.update(task, advance=1)
+                        if not selection.has_changes:
+                            progress.console.print(
+                                "[green]No changes since the last successful run.[/green]"
+                            )
+                            return 0
+                        rows = selection.rows
+
+                # Step 3: Resolve paths and create operations
+                task = progress.add_task("[cyan]Resolving paths...", total=len(rows))
+                with phase("resolve"):
+                    resolver = Resolver(
+                        lookup_client,  # type: ignore[arg-type]
+                        Path(".cache/resolver"),
+                        self.config.cache,
+                        no_cache=no_cache,
+                    )
+                    operations = []
+
+                    # Pre-scan for pending resources
+                    pending = PendingResources.from_rows(rows)
+                    factory = OperationFactory(lookup_client, resolver, pending)  # type: ignore[arg-type]
+
+                    for row in rows:
+                        try:
+                            operation = await factory.create_from_row(row)
+                            operations.append(operation)
+                        except Exception as e:
+                            tb_str = traceback.format_exc()
+                            logger.warning(
+                                f"Failed to create operation for row {row.row_id}: {e}",
+                                traceback=tb_str,
+                            )
+                            # Create failed placeholder
+                            operations.append(
+                                Operation(
+                                    row_id=row.row_id,
+                                    operation_type=(
+                                        OperationType.CREATE
+                                        if row.action == "create"
+                                        else (
+                                            OperationType.UPDATE
+                                            if row.action == "update"
+                                            else OperationType.DELETE
+                                        )
+                                    ),
+                                    object_type=row.object_type,
+                                    resource_id=getattr(row, "bam_id", None),
+                                    payload={"error": str(e), "traceback": tb_str},
+                                    csv_row=row,
+                                )
+                            )
+                        progress.update(task, advance=1)
+                    if selection is not None:
+                        flag_changed_creates(operations, selection)
                 progress.update(
                     task, description=f"[green]DONE: Resolved {len(operations)} operations"
                 )
+                if isinstance(lookup_client, SnapshotReadClient):
+                    progress.console.print(
+                        f"Snapshot: [cyan]{lookup_client.hits}[/cyan] lookups served locally, "
+                        f"{lookup_client.fallbacks} from BAM"
+                    )
 
                 # Step 4: Build dependency graph
                 task = progress.add_task("[cyan]Building dependency graph...", total=None)
-                graph = DependencyGraph()
-                for op in operations:
-                    graph.add_operation(op)
+                with phase("graph_build"):
+                    graph = DependencyGraph()
+                    for op in operations:
+                        graph.add_operation(op)
 
-                # Wire dependencies
-                dependency_planner = DependencyPlanner()
-                dependency_planner.build_graph(graph, operations)
+                    # Wire dependencies
+                    dependency_planner = DependencyPlanner()
+                    dependency_planner.build_graph(graph, operations)
 
                 # Apply barriers and validation
-                graph._apply_phasing()
-                graph.validate()
-                graph._calculate_depths()
+                with phase("phasing"):
+                    graph._apply_phasing()
+                    graph.validate()
+                    graph._calculate_depths()
 
                 progress.update(
                     task, completed=True, description="[green]DONE: Dependency graph built"
@@ -275,182 +439,161 @@ class ImportRunner:
 
                 # Step 5: Execution plan
                 task = progress.add_task("[cyan]Creating execution plan...", total=None)
-                planner = ExecutionPlanner(self.config.policy)
-                plan = planner.create_plan(graph)
+                with phase("plan"):
+                    try:
+                        cost_model = CostModel.from_changelog(changelog)
+                    except Exception as e:
+                        logger.warning("Failed to load operation timings", error=str(e))
+                        cost_model = CostModel()
+                    planner = ExecutionPlanner(self.config.policy, cost_model=cost_model)
+                    plan = planner.create_plan(graph)
                 progress.update(
                     task, completed=True, description="[green]DONE: Execution plan created"
                 )
 
                 # DX-003: Show execution plan and exit if --show-plan flag is set
                 if show_plan:
-                    self._display_execution_plan(plan, graph, operations)
+                    self._display_execution_plan(plan, graph, operations, cost_model)
                     await client.close()
                     await client.close()
                     return 0
 
                 # Step 6: Execute
-                task = progress.add_task(
-                    "[cyan]Executing operations...", total=plan.total_operations
-                )
-                executor = OperationExecutor(
-                    bam_client=client,
-                    policy=self.config.policy,
-                    allow_dangerous_operations=allow_dangerous_operations,
-                    dependency_graph=graph,
-                    checkpoint_manager=checkpoint_mgr,
-                    session_id=session_id,
-                    initial_created_resources=initial_created_resources,
+                shards: list[list[Operation]] = []
+                global_ops: list[Operation] = []
+                if work_queue is not None:
+                    total = sum(
+                        1
+                        for node in graph.nodes.values()
+                        if node.operation.object_type != "system_barrier"
+                    )
+                    progress.console.print(
+                        f"Queued execution: start workers with [yellow]bluecat-import worker "
+                        f"{coordinator}[/yellow]"
+                    )
+                elif processes > 1:
+                    global_ops, shards = self._plan_shards(graph, processes, simulation is not None)
+                    total = sum(map(len, shards)) + len(global_ops) or plan.total_operations
+                else:
+                    total = plan.total_operations
+                # Time remaining from learned costs, refined by this run's latencies
+                remaining = RemainingWork(
+                    cost_model,
+                    (
+                        op
+                        for batch in plan.batches
+                        if batch.batch_id >= start_batch_id
+                        for op in batch.operations
+                    ),
+                    self.config.policy.max_concurrent_operations,
                 )
-
-                # Hook up changelog recording
-                if not dry_run:
-                    # We need a way to capture results and write to changelog/checkpoint
-                    # The executor returns results, but we might want intermediate saving
-                    pass
-
-                results = await executor.execute_plan(
-                    plan,
-                    dry_run=dry_run,
-                    start_batch_id=start_batch_id,
-                    input_hash=input_hash,
+                task = progress.add_task(
+                    "[cyan]Executing operations...", total=total, eta=remaining.seconds()
                 )
 
-                # Map operations for quick lookup during results processing
+                # Results stream to these consumers while execution runs
                 ops_map = {op.row_id: op for op in operations}
+                consumers: list[ResultConsumer] = [tally, CacheInvalidator(resolver, ops_map)]
+                if live:
+                    consumers.append(
+                        ChangelogRecorder(changelog, session_id, ops_map, self._changelog_states)
+                    )
+                consumers += [
+                    MetricsRecorder(get_global_collector(), ops_map),
+                    remaining,
+                    ProgressReporter(
+                        lambda n: progress.update(task, advance=n, eta=remaining.seconds())
+                    ),
+                ]
+                # Reports need every result; otherwise only the tally is kept
+                keep_results = dry_run or simulation is not None or profiler is not None
+
+                with phase("execute"):
+                    async with ResultPipeline(consumers) as pipeline:
+                        if work_queue is not None:
+                            results = await QueueCoordinator(work_queue, session_id).execute(
+                                graph,
+                                sink=pipeline,
+                                keep_results=keep_results,
+                                dry_run=dry_run,
+                                allow_dangerous_operations=allow_dangerous_operations,
+                                input_hash=input_hash,
+                                costs=plan.costs,
+                            )
+                        elif shards:
+                            sharded = ShardedExecutor(
+                                self.config,
+                                processes,
+                                session_id,
+                                dry_run=dry_run,
+                                allow_dangerous_operations=allow_dangerous_operations,
+                                checkpoint_manager=checkpoint_mgr if live else None,
+                                input_hash=input_hash,
+                                initial_created_resources=initial_created_resources,
+                            )
+                            skip = (
+                                completed_shards(checkpoint_mgr, session_id, len(shards))
+                                if initial_created_resources is not None
+                                else set()
+                            )
+                            results = await sharded.execute(
+                                shards,
+                                sink=pipeline,
+                                keep_results=keep_results,
+                                skip=skip,
+                                global_operations=global_ops,
+                            )
+                        else:
+                            executor = OperationExecutor(
+                                bam_client=client,
+                                policy=self.config.policy,
+                                allow_dangerous_operations=allow_dangerous_operations,
+                                dependency_graph=graph,
+                                checkpoint_manager=checkpoint_mgr if live else None,
+                                session_id=session_id,
+                                initial_created_resources=initial_created_resources,
+                            )
+                            results = await executor.execute_plan(
+                                plan,
+                                dry_run=dry_run,
+                                start_batch_id=start_batch_id,
+                                input_hash=input_hash,
+                                sink=pipeline,
+                                keep_results=keep_results,
+                            )
+                successful, failed, skipped = tally.successful, tally.failed, tally.skipped
 
-                for result in results:
-                    # PERF-001: Cache Coherency - Invalidate resolver cache for ALL mutations
-                    #
-                    # WHY INVALIDATE ON ALL OPERATIONS:
-                    # The resolver caches path→ID mappings (e.g., "Default/10.0.0.0/8" → 123).
-                    # When we CREATE/UPDATE/DELETE a resource, the cache may contain stale data:
-                    #   - CREATE: New resource exists but cache thinks it doesn't
-                    #   - UPDATE: Resource properties changed (name, CIDR normalization)
-                    #   - DELETE: Resource gone but cache still returns ID
-                    #
-                    # Failing to invalidate causes:
-                    #   - Deferred resolution failures (can't find newly created parents)
-                    #   - Duplicate creation attempts (cache miss on existing resource)
-                    #   - Invalid ID references (deleted resource still cached)
-                    #
-                    # PERFORMANCE TRADE-OFF:
-                    # Invalidation on every mutation is conservative but safe. Alternative
-                    # (selective invalidation) risks subtle cache bugs that are hard to debug.
-                    if result.success and result.operation in (
-                        OperationType.CREATE,
-                        OperationType.UPDATE,
-                        OperationType.DELETE,
-                    ):
-                        op = ops_map.get(result.row_id)
-                        if op and op.payload.get("resource_path"):
-                            path = op.payload["resource_path"]
-
-                            # Invalidate the resource's own cache entry
-                            await resolver.invalidate(path, op.object_type)
-
-                            # WHY INVALIDATE PARENT: Hierarchical resources (blocks, networks, zones)
-                            # affect parent listings. If we create/delete a network, the parent block's
-                            # "list networks" cache is now stale.
-                            #
-                            # EDGE CASE: CIDR Paths vs Hierarchical Paths
-                            #
-                            # CIDR Path (IPv4/IPv6):
-                            #   Format: "Config/IP/Prefix"  e.g., "Default/10.0.0.0/8"
-                            #   Parent: Just the config name ("Default")
-                            #   WHY: The "/8" is part of CIDR notation, not a path separator
-                            #
-                            # Hierarchical Path (Zones, UDLs):
-                            #   Format: "Parent/Child"  e.g., "RootZone/SubZone"
-                            #   Parent: Everything before last "/" ("RootZone")
-                            #
-                            # DETECTION STRATEGY:
-                            #   - If last component is a digit, assume CIDR notation
-                            #   - Else, assume hierarchical path and split on "/"
-                            #
-                            # LIMITATION:
-                            #   This heuristic could fail for zones named "123" but that's
-                            #   extremely rare and violates DNS naming conventions.
-                            if "/" in path:
-                                parts = path.split("/")
-
-                                # Check if this looks like a CIDR (ends with digit)
-                                if len(parts) >= 3 and parts[-1].isdigit():
-                                    # CIDR path like "Default/10.0.0.0/8"
-                                    # Parent is everything before the IP/prefix
-                                    parent_path = parts[0]  # Just the config name
-                                elif len(parts) >= 2:
-                                    # Non-CIDR hierarchical path like "view/zone/subzone"
-                                    # Parent is everything except last component
-                                    parent_path = "/".join(parts[:-1])
-                                else:
-                                    parent_path = None
-
-                                if parent_path:
-                                    # Invalidate parent's cache (affects parent's child listings)
-                                    await resolver.invalidate(parent_path, op.object_type)
-
-                    if result.success:
-
-                        successful += 1
-                        # Record in changelog
-                        if not dry_run:
-                            try:
-                                op = ops_map.get(result.row_id)
-                                changelog.record_operation(
-                                    session_id=session_id,
-                                    row_id=str(result.row_id),
-                                    operation_type=result.operation.value,
-                                    object_type=op.object_type if op else "unknown",
-                                    resource_id=result.resource_id,
-                                    before_state=(
-                                        str(result.before_state) if result.before_state else None
-                                    ),
-                                    after_state=(
-                                        str(result.after_state) if result.after_state else None
-                                    ),
-                                    success=True,
-                                )
-                            except Exception as e:
-                                logger.error("Failed to write to changelog", error=str(e))
-
-                    elif result.metadata.get("skipped"):
-                        skipped += 1
-                    else:
-                        failed += 1
-                        if not dry_run:
-                            try:
-                                op = ops_map.get(result.row_id)
-                                changelog.record_operation(
-                                    session_id=session_id,
-                                    row_id=str(result.row_id),
-                                    operation_type=result.operation.value,
-                                    object_type=op.object_type if op else "unknown",
-                                    resource_id=None,
-                                    before_state=None,
-                                    after_state=None,
-                                    success=False,
-                                    error_message=result.error_message,
-                                )
-                            except Exception:
-                                pass
-                    progress.update(task, advance=1)
-
-                progress.update(
-                    task, description=f"[green]DONE: Executed {len(results)} operations"
-                )
+                progress.update(task, description=f"[green]DONE: Executed {tally.total} operations")
 
             finally:
-                if not dry_run:
+                if live:
                     await client.close()
 
                     # update session status
-                    if failed > 0:
-                        checkpoint_mgr.mark_session_failed(session_id, "Completed with errors")
-                    else:
-                        checkpoint_mgr.mark_session_completed(session_id)
+                    with phase("persistence"):
+                        if failed > 0:
+                            checkpoint_mgr.mark_session_failed(session_id, "Completed with errors")
+                        else:
+                            checkpoint_mgr.mark_session_completed(session_id)
 
                 await client.close()
                 checkpoint_mgr.close()
+                if work_queue is not None:
+                    work_queue.close()
+                if snapshot_store is not None:
+                    snapshot_store.close()
+
+        # Record per-row hashes so the next --incremental run can diff against this one
+        if live and failed == 0 and skipped == 0 and all_rows:
+            try:
+                with phase("persistence"):
+                    changelog.record_row_snapshot(
+                        session_id,
+                        self._source_key(csv_file),
+                        fingerprints if fingerprints is not None else fingerprint_rows(all_rows),
+                    )
+            except Exception as e:
+                logger.error("Failed to record row snapshot", error=str(e))
 
         end_time = datetime.now()
         duration = (end_time - start_time).total_seconds()
@@ -474,23 +617,20 @@ class ImportRunner:
         # Show failed/skipped (Simplified)
         if failed > 0:
             self.console.print("\n[red]Failed operations:[/red]")
-            count = 0
-            for result in results:
-                if not result.success and not result.metadata.get("skipped"):
-                    self.console.print(f"  - Row {result.row_id}: {result.error_message}")
-                    count += 1
-                    if count >= 10:
-                        self.console.print(f"  ... and {failed - 10} more")
-                        break
+            for result in tally.failures:
+                self.console.print(f"  - Row {result.row_id}: {result.error_message}")
+            if failed > len(tally.failures):
+                self.console.print(f"  ... and {failed - len(tally.failures)} more")
 
         # Rollback generation
-        if generate_rollback and not dry_run and successful > 0:
+        if generate_rollback and live and successful > 0:
             try:
-                generator = RollbackGenerator(changelog)
-                rollback_dir = Path("rollbacks")
-                rollback_dir.mkdir(exist_ok=True)
-                rollback_path = rollback_dir / f"{session_id}_rollback.csv"
-                generator.generate_rollback_csv(session_id, rollback_path)
+                with phase("rollback"):
+                    generator = RollbackGenerator(changelog)
+                    rollback_dir = Path("rollbacks")
+                    rollback_dir.mkdir(exist_ok=True)
+                    rollback_path = rollback_dir / f"{session_id}_rollback.csv"
+                    generator.generate_rollback_csv(session_id, rollback_path)
                 self.console.print(f"\nRollback CSV: [cyan]{rollback_path}[/cyan]")
                 self.console.print(
                     f"To rollback: [yellow]bluecat-import rollback {rollback_path}[/yellow]"
@@ -498,13 +638,124 @@ class ImportRunner:
             except Exception as e:
                 logger.error("Failed to generate rollback", error=str(e))
                 self.console.print(f"[red]Failed to generate rollback CSV: {e}[/red]")
+                rollback_path = None
 
-        # Dry Run Report
-        if dry_run and report:
+        # Dry Run Report (also written for simulated runs)
+        if (dry_run or simulation is not None) and report:
             self._generate_dry_run_report(results, session_id, duration, ops_map)
 
+        # Profile report
+        if profiler:
+            profiler.stop()
+            self._write_profile_report(
+                profiler,
+                results,
+                session_id,
+                start_time,
+                csv_file,
+                dry_run,
+                rollback_path,
+                {row_id: op.object_type for row_id, op in ops_map.items()},
+            )
+
         return failed
 
+    def _plan_shards(
+        self, graph: DependencyGraph, processes: int, simulated: bool
+    ) -> tuple[list[Operation], list[list[Operation]]]:
+        """
+        Split the graph's independent components into shards for worker processes.
+
+        Components never split a configuration (see
+        ``DependencyGraph.weakly_connected_components``). Global operations
+        run in this process before the shards; if one of them is a delete, or
+        waits for an operation of a configuration, they cannot go first and
+        nothing is sharded.
+
+        Args:
+            graph: Session dependency graph
+            processes: Requested worker processes
+            simulated: Running against the in-process simulated BAM
+
+        Returns:
+            Tuple of (global operations, shards of operations), or ([], []) to
+            execute in this process
+        """
+        if simulated:
+            self.console.print(
+                "[yellow]--processes is ignored with --simulate: the simulated BAM "
+                "lives in this process.[/yellow]"
+            )
+            return [], []
+        global_ids = graph.global_node_ids()
+        global_set = set(global_ids)
+        for node_id in global_ids:
+            node = graph.nodes[node_id]
+            if node.operation.operation_type == OperationType.DELETE or any(
+                dep_id not in global_set
+                and graph.nodes[dep_id].operation.object_type != "system_barrier"
+                for dep_id in node.dependencies
+            ):
+                self.console.print(
+                    "[yellow]Global operations must be ordered against every "
+                    "configuration; running in one process.[/yellow]"
+                )
+                return [], []
+        components = graph.weakly_connected_components()
+        if len(components) < 2:
+            self.console.print(
+                "[yellow]All operations depend on each other; running in one process.[/yellow]"
+            )
+            return [], []
+        shards = plan_shards(
+            [[graph.nodes[node_id].operation for node_id in c] for c in components],
+            processes * SHARDS_PER_PROCESS,
+        )
+        self.console.print(
+            f"Sharding: [cyan]{len(components)}[/cyan] independent components in "
+            f"[cyan]{len(shards)}[/cyan] shards across "
+            f"[cyan]{min(processes, len(shards))}[/cyan] processes"
+            + (f" after [cyan]{len(global_ids)}[/cyan] global operations" if global_ids else "")
+        )
+        return [graph.nodes[node_id].operation for node_id in global_ids], shards
+
+    @staticmethod
+    def _changelog_states(
+        op: Operation | None, result: Any
+    ) -> tuple[dict[str, Any] | None, dict[str, Any] | None]:
+        """
+        Build the before/after states recorded in the changelog for a result.
+
+        States set by the executor are used as-is. Otherwise the operation's CSV
+        row (plus the BAM id) is recorded as the after state of a create/update
+        and the before state of a delete, which is what the rollback generator
+        needs to delete or re-create the resource.
+
+        Args:
+            op: Operation that produced the result
+            result: Successful OperationResult
+
+        Returns:
+            Tuple of (before_state, after_state)
+        """
+        before_state, after_state = result.before_state, result.after_state
+        if before_state or after_state or op is None or op.csv_row is None:
+            return before_state, after_state
+
+        state = op.csv_row.model_dump(
+            mode="json",
+            exclude_none=True,
+            exclude={"row_id", "object_type", "action", "version", "bam_id"},
+        )
+        if result.resource_id:
+            state["id"] = result.resource_id
+
+        if result.operation == OperationType.DELETE:
+            return state, None
+        if result.operation in (OperationType.CREATE, OperationType.UPDATE):
+            return None, state
+        return None, None
+
     def _generate_dry_run_report(
         self,
         results: list[Any],
@@ -571,6 +822,100 @@ class ImportRunner:
             f"\n[bold cyan]Detailed dry-run report written to: {report_path}[/bold cyan]"
         )
 
+    def _write_profile_report(
+        self,
+        profiler: SessionProfiler,
+        results: list[Any],
+        session_id: str,
+        start_time: datetime,
+        csv_file: Path,
+        dry_run: bool,
+        rollback_path: Path | None,
+        object_types: dict[str | int, str] | None = None,
+    ) -> None:
+        """
+        Print the profile breakdown and write JSON/HTML reports that include it.
+
+        Args:
+            profiler: Stopped session profiler
+            results: Operation results
+            session_id: Session identifier
+            start_time: Session start time
+            csv_file: Input CSV
+            dry_run: Whether this was a dry run
+            rollback_path: Rollback CSV path, if one was generated
+            object_types: Mapping of row ID to object type, used to group errors
+        """
+        profile = profiler.to_dict()
+
+        table = Table(title="Phase Breakdown")
+        table.add_column("Phase")
+        table.add_column("Wall (s)", justify="right")
+        table.add_column("CPU (s)", justify="right")
+        table.add_column("%", justify="right")
+        for entry in profile["phases"]:
+            table.add_row(
+                entry["name"],
+                f"{entry['wall_seconds']:.3f}",
+                f"{entry['cpu_seconds']:.3f}",
+                f"{entry['percent']:.1f}",
+            )
+        self.console.print(table)
+
+        if profile["endpoints"]:
+            table = Table(title=f"API Calls ({profile['api_calls']})")
+            table.add_column("Endpoint")
+            table.add_column("Calls", justify="right")
+            table.add_column("Errors", justify="right")
+            table.add_column("Avg (ms)", justify="right")
+            table.add_column("Total (ms)", justify="right")
+            for entry in profile["endpoints"][:10]:
+                table.add_row(
+                    entry["family"],
+                    str(entry["count"]),
+                    str(entry["errors"]),
+                    f"{entry['avg_ms']:.1f}",
+                    f"{entry['total_ms']:.0f}",
+                )
+            self.console.print(table)
+
+        cache = profile["response_cache"]
+        if any(cache.values()):
+            self.console.print(
+                f"Response cache: {cache['hits']} hits, {cache['revalidated']} revalidated, "
+                f"{cache['misses']} misses"
+            )
+
+        try:
+            report_dir = Path("reports")
+            results_path = report_dir / f"{session_id}_results.jsonl"
+            generator = ReportGenerator()
+            import_report = generator.generate_report(
+                session_id=session_id,
+                start_time=start_time,
+                end_time=datetime.now(),
+                csv_file=csv_file,
+                dry_run=dry_run,
+                results=results,
+                metrics={},
+                rollback_path=rollback_path,
+                profile=profile,
+                latency_histograms=get_global_collector().get_latency_histograms(),
+                results_path=results_path,
+                object_types=object_types,
+            )
+            json_path = report_dir / f"{session_id}_report.json"
+            html_path = report_dir / f"{session_id}_report.html"
+            generator.write_json_report(import_report, json_path)
+            generator.write_html_report(import_report, html_path)
+            self.console.print(
+                f"\nProfile report: [cyan]{json_path}[/cyan], [cyan]{html_path}[/cyan], "
+                f"[cyan]{results_path}[/cyan]"
+            )
+        except Exception as e:
+            logger.error("Failed to write profile report", error=str(e))
+            self.console.print(f"[red]Failed to write profile report: {e}[/red]")
+
     def _format_operation_details(self, operation: Operation) -> str:
         """Format operation details for report."""
         details = []
@@ -592,17 +937,49 @@ class ImportRunner:
 
         return ", ".join(details).replace("|", "\\|")
 
-    def _display_execution_plan(self, plan: Any, graph: Any, operations: list[Operation]) -> None:
+    def _display_execution_plan(
+        self, plan: Any, graph: Any, operations: list[Operation], cost_model: CostModel
+    ) -> None:
         """
         DX-003: Display execution plan in a human-readable format.
 
-        Shows operations grouped by phase with dependencies.
+        Shows operations grouped by phase with dependencies, the estimated
+        duration and the latencies it is based on.
         """
         from rich.tree import Tree
 
         self.console.print("\n")
         self.console.print("[bold cyan]═══ Execution Plan Preview ═══[/bold cyan]\n")
-        self.console.print(f"[dim]Total operations: {plan.total_operations}[/dim]\n")
+        self.console.print(f"[dim]Total operations: {plan.total_operations}[/dim]")
+        minutes, seconds = divmod(int(plan.estimated_total_duration), 60)
+        learned = cost_model.describe()
+        basis = (
+            f"latencies of {sum(entry['samples'] for entry in learned)} operations in recent sessions"
+            if learned
+            else "default latencies; no timings recorded yet"
+        )
+        self.console.print(
+            f"[dim]Estimated duration: {minutes}m {seconds:02d}s "
+            f"at {self.config.policy.max_concurrent_operations} concurrent operations "
+            f"({basis})[/dim]\n"
+        )
+        if learned:
+            latency_table = Table(title="Learned Latencies")
+            latency_table.add_column("Object Type")
+            latency_table.add_column("Operation")
+            latency_table.add_column("Samples", justify="right")
+            latency_table.add_column("Mean", justify="right")
+            latency_table.add_column("Std Dev", justify="right")
+            for entry in learned[:15]:
+                latency_table.add_row(
+                    entry["object_type"],
+                    entry["operation_type"],
+                    str(entry["samples"]),
+                    f"{entry['mean_seconds'] * 1000:.0f} ms",
+                    f"{entry['stddev_seconds'] * 1000:.0f} ms",
+                )
+            self.console.print(latency_table)
+            self.console.print()
 
         # Group operations by phase
         phases: dict[int, list[Operation]] = {}
@@ -661,6 +1038,10 @@ class ImportRunner:
         self.console.print("\n[bold green]✓ Plan preview complete. No changes made.[/bold green]")
         self.console.print("[dim]Remove --show-plan to execute the import.[/dim]\n")
 
+    def _source_key(self, csv_file: Path) -> str:
+        """Identify the logical input file across runs (its resolved path)."""
+        return str(Path(csv_file).resolve())
+
     def _calculate_file_hash(self, file_path: Path) -> str:
         """Calculate SHA256 hash of file content."""
         sha256 = hashlib.sha256()
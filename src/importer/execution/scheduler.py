@@ -0,0 +1,173 @@
+"""Priority Scheduler - Run ready operations critical path first.
+
+Purpose:
+-------
+Depth batches make every operation wait for the slowest operation of the
+previous depth, even one it does not depend on, and within a batch the
+throttle admits operations in plan order. One deep chain of zones and
+records then finishes long after the wide batches around it have drained.
+
+``PriorityScheduler`` tracks the unfinished dependencies of every node and
+hands out ready operations highest priority first. The executor starts them
+only while throttle slots are free, so when concurrency is the limit, the
+operations that unblock the most remaining work are admitted first.
+
+Priority:
+--------
+``critical_path_priorities`` ranks each node by
+
+1. the longest downstream path: operations on the longest chain of
+   dependents starting at the node, itself included (phase barriers count 0),
+   or with the plan's estimated costs, that chain's estimated seconds
+2. the number of direct dependents
+3. plan order, so that equal priorities keep a deterministic order
+
+Both are computed in one pass over the graph in reverse topological order.
+
+Usage:
+-----
+```python
+scheduler = PriorityScheduler(graph)
+ready = scheduler.pop(free_slots)
+...
+scheduler.complete(node_id)  # its dependents may become ready
+```
+"""
+
+import heapq
+from collections.abc import Iterable
+
+from ..dependency.graph import DependencyGraph, DependencyNode
+from ..models.operations import Operation
+
+_BARRIER = "system_barrier"
+
+# Sort key: ascending order is highest priority first
+Priority = tuple[float, int, int]
+
+
+def longest_paths(
+    graph: DependencyGraph,
+    costs: dict[str, float] | None = None,
+    order: list[DependencyNode] | None = None,
+) -> dict[str, float]:
+    """
+    Length of the longest chain of dependents starting at each node.
+
+    Args:
+        graph: Validated dependency graph
+        costs: Estimated seconds per node ID (default: 1 per operation, 0 per barrier)
+        order: The graph's topological order, if already computed
+
+    Returns:
+        Node ID -> summed cost of the node and its longest downstream chain
+    """
+    path: dict[str, float] = {}
+    for node in reversed(order if order is not None else graph.topological_sort()):
+        if costs is not None:
+            weight = costs.get(node.node_id, 0.0)
+        else:
+            weight = 0 if node.operation.object_type == _BARRIER else 1
+        path[node.node_id] = weight + max(
+            (path[dependent] for dependent in node.dependents), default=0
+        )
+    return path
+
+
+def critical_path_priorities(
+    graph: DependencyGraph, costs: dict[str, float] | None = None
+) -> dict[str, Priority]:
+    """
+    Priority sort key of every node in a graph.
+
+    Args:
+        graph: Validated dependency graph
+        costs: Estimated seconds per node ID (default: every operation costs 1)
+
+    Returns:
+        Node ID -> (-longest downstream path, -direct dependents, topological index)
+    """
+    order = graph.topological_sort()
+    path = longest_paths(graph, costs, order)
+    return {
+        node.node_id: (-path[node.node_id], -len(node.dependents), index)
+        for index, node in enumerate(order)
+    }
+
+
+class PriorityScheduler:
+    """Releases a graph's operations as their dependencies complete, best first."""
+
+    def __init__(
+        self,
+        graph: DependencyGraph,
+        done: Iterable[str] = (),
+        priorities: dict[str, Priority] | None = None,
+    ) -> None:
+        """
+        Initialize scheduler.
+
+        Args:
+            graph: Validated dependency graph
+            done: Nodes already completed (e.g. before a resume); never handed out
+            priorities: Sort key of every node not done (default:
+                critical_path_priorities)
+        """
+        self.graph = graph
+        self.priorities = priorities if priorities is not None else critical_path_priorities(graph)
+        done_ids = set(done)
+        self._remaining: dict[str, int] = {}
+        self._ready: list[tuple[Priority, str]] = []
+        for node_id, node in graph.nodes.items():
+            if node_id in done_ids:
+                continue
+            remaining = sum(1 for dependency in node.dependencies if dependency not in done_ids)
+            self._remaining[node_id] = remaining
+            if remaining == 0:
+                self._ready.append((self.priorities[node_id], node_id))
+        heapq.heapify(self._ready)
+
+    @property
+    def ready_count(self) -> int:
+        """Operations ready to start."""
+        return len(self._ready)
+
+    @property
+    def pending_count(self) -> int:
+        """Operations handed out or not yet ready (not completed)."""
+        return len(self._remaining)
+
+    def pop(self, limit: int) -> list[Operation]:
+        """
+        Take up to limit ready operations, highest priority first.
+
+        Args:
+            limit: Most operations to take
+
+        Returns:
+            Operations to start now
+        """
+        operations: list[Operation] = []
+        while self._ready and len(operations) < limit:
+            _, node_id = heapq.heappop(self._ready)
+            operations.append(self.graph.nodes[node_id].operation)
+        return operations
+
+    def complete(self, node_id: str) -> None:
+        """
+        Record that an operation finished (succeeded, failed or was skipped).
+
+        A failed operation also releases its dependents: the executor has
+        marked them skipped, and they complete without running.
+
+        Args:
+            node_id: Node of the finished operation
+        """
+        if self._remaining.pop(node_id, None) is None:
+            return
+        for dependent in self.graph.nodes[node_id].dependents:
+            if dependent not in self._remaining:
+                continue
+            self._remaining[dependent] -= 1
+            if self._remaining[dependent] == 0:
+                heapq.heappush(self._ready, (self.priorities[dependent], dependent))
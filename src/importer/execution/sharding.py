@@ -0,0 +1,462 @@
+"""Sharded Execution - Run independent parts of a plan in worker processes.
+
+Purpose:
+-------
+Imports spanning several configurations or unrelated zone trees produce a
+dependency graph of independent components, yet everything still runs on one
+event loop, one BAMClient and one core. Payload building, pydantic and JSON
+work are CPU-bound and stop scaling long before BAM does.
+
+``plan_shards`` packs the graph's weakly connected components (see
+``DependencyGraph.weakly_connected_components``) into shards of similar size,
+largest component first. A component never splits a configuration, since
+phase barriers order its operations beyond their dependency edges.
+``ShardedExecutor`` first runs the global operations (tags, UDF definitions,
+device types) in the parent, as every configuration's phases wait for them,
+then runs each shard in a process pool. Every worker rebuilds the graph and
+plan of its own operations, and runs them with its own BAMClient and its
+share of the throttle limits.
+
+Workers do not write to the changelog or checkpoint database. As each shard
+finishes, the parent publishes its results to the session's result pipeline
+(changelog, resolver cache invalidation, progress). It then saves the
+shard's created resources and a checkpoint marking the shard complete. A
+resumed sharded session skips completed shards, provided it is split the same
+way.
+
+Paths are resolved in the parent before sharding, so workers do no lookups
+and keep no resolver cache; invalidation runs on the parent's cache as
+results arrive.
+
+Usage:
+-----
+```python
+components = graph.weakly_connected_components()
+shards = plan_shards([[graph.nodes[n].operation for n in c] for c in components], 8)
+global_ops = [graph.nodes[n].operation for n in graph.global_node_ids()]
+executor = ShardedExecutor(config, processes=4, session_id=session_id)
+results = await executor.execute(shards, sink=pipeline, global_operations=global_ops)
+```
+"""
+
+import asyncio
+import dataclasses
+import heapq
+import json
+import logging
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+import structlog
+
+from ..bam.client import BAMClient
+from ..config import ImporterConfig, PolicyConfig
+from ..dependency.graph import DependencyGraph
+from ..dependency.planner import DependencyPlanner
+from ..models.operations import Operation
+from ..models.results import OperationResult
+from ..persistence.checkpoint import CheckpointManager
+from .executor import OperationExecutor
+from .pipeline import ResultPipeline
+from .planner import ExecutionPlanner
+
+logger = structlog.get_logger(__name__)
+
+# Executor map -> created resource type used by CheckpointManager
+CREATED_RESOURCE_MAPS = {
+    "block": "created_blocks",
+    "network": "created_networks",
+    "zone": "created_zones",
+    "location": "created_locations",
+    "device_type": "created_device_types",
+    "device_subtype": "created_device_subtypes",
+    "device": "created_devices",
+}
+
+# Shard index recorded in checkpoints for the global operations run in the parent
+GLOBAL_SHARD = -1
+
+
+@dataclass
+class ShardTask:
+    """Everything a worker process needs to run one shard."""
+
+    shard_index: int
+    operations: list[Operation]
+    config: ImporterConfig
+    session_id: str
+    dry_run: bool = False
+    allow_dangerous_operations: bool = False
+    initial_created_resources: dict[str, dict[str, int]] | None = None
+    log_level: str = "INFO"
+
+
+@dataclass
+class ShardOutcome:
+    """Results of one shard, returned to the parent."""
+
+    shard_index: int
+    results: list[OperationResult]
+    created_resources: dict[str, dict[str, int]] = field(default_factory=dict)
+    duration_seconds: float = 0.0
+
+
+def plan_shards(components: list[list[Operation]], shard_count: int) -> list[list[Operation]]:
+    """
+    Pack components into at most shard_count shards of similar size.
+
+    Components are placed largest first, each into the currently smallest
+    shard. A component is never split.
+
+    Args:
+        components: Operations of each independent component
+        shard_count: Most shards to produce
+
+    Returns:
+        Non-empty shards, in a deterministic order
+    """
+    shard_count = max(1, min(shard_count, len(components)))
+    shards: list[list[Operation]] = [[] for _ in range(shard_count)]
+    heap = [(0, index) for index in range(shard_count)]
+    for component in sorted(components, key=len, reverse=True):
+        size, index = heapq.heappop(heap)
+        shards[index].extend(component)
+        heapq.heappush(heap, (size + len(component), index))
+    return [shard for shard in shards if shard]
+
+
+def shard_policy(policy: PolicyConfig, processes: int) -> PolicyConfig:
+    """
+    Give each of processes workers an equal share of the concurrency limits.
+
+    Args:
+        policy: Session policy
+        processes: Number of worker processes
+
+    Returns:
+        Policy copy with divided concurrency limits (at least 1)
+    """
+    share = max(1, policy.max_concurrent_operations // processes)
+    return dataclasses.replace(
+        policy,
+        max_concurrent_operations=share,
+        max_concurrency=max(share, policy.max_concurrency // processes),
+        min_concurrency=min(policy.min_concurrency, share),
+    )
+
+
+def build_graph(operations: list[Operation]) -> DependencyGraph:
+    """
+    Build, phase and validate the dependency graph of some operations.
+
+    Args:
+        operations: Operations (no barrier nodes)
+
+    Returns:
+        Validated graph with depths calculated
+    """
+    graph = DependencyGraph()
+    DependencyPlanner().build_graph(graph, operations)
+    graph._apply_phasing()
+    graph.validate()
+    graph._calculate_depths()
+    return graph
+
+
+def run_shard(task: ShardTask) -> ShardOutcome:
+    """
+    Worker process entry point: run one shard to completion.
+
+    Args:
+        task: Shard to run
+
+    Returns:
+        Results and created resources of the shard
+    """
+    from ..observability import configure_logging
+
+    configure_logging(level=task.log_level)
+    return asyncio.run(_run_shard(task))
+
+
+async def _run_shard(task: ShardTask) -> ShardOutcome:
+    start = time.perf_counter()
+    graph = build_graph(task.operations)
+    plan = ExecutionPlanner(task.config.policy).create_plan(graph)
+    assert task.config.bam is not None
+    client = BAMClient(task.config.bam)
+    try:
+        if not task.dry_run:
+            await client.authenticate()
+        executor = OperationExecutor(
+            bam_client=client,
+            policy=task.config.policy,
+            allow_dangerous_operations=task.allow_dangerous_operations,
+            dependency_graph=graph,
+            session_id=task.session_id,
+            initial_created_resources=task.initial_created_resources,
+        )
+        results = await executor.execute_plan(plan, dry_run=task.dry_run)
+    finally:
+        await client.close()
+
+    # The worker's own phase barriers are not part of the session's plan
+    row_ids = {operation.row_id for operation in task.operations}
+    results = [result for result in results if result.row_id in row_ids]
+
+    created = {
+        resource_type: dict(getattr(executor, attribute))
+        for resource_type, attribute in CREATED_RESOURCE_MAPS.items()
+    }
+    return ShardOutcome(
+        shard_index=task.shard_index,
+        results=results,
+        created_resources=created,
+        duration_seconds=time.perf_counter() - start,
+    )
+
+
+def _failed_outcome(task: ShardTask, error: Exception) -> ShardOutcome:
+    """Failed results for every operation of a shard that could not run."""
+    logger.error("Shard failed", shard=task.shard_index, error=str(error))
+    return ShardOutcome(
+        shard_index=task.shard_index,
+        results=[
+            OperationResult(
+                row_id=op.row_id,
+                operation=op.operation_type,
+                success=False,
+                error_message=f"Shard {task.shard_index} failed: {error}",
+                duration_ms=0,
+            )
+            for op in task.operations
+        ],
+    )
+
+
+def completed_shards(
+    checkpoint_manager: CheckpointManager, session_id: str, shard_count: int
+) -> set[int]:
+    """
+    Shards a previous run of a sharded session completed.
+
+    Args:
+        checkpoint_manager: Session checkpoint store
+        session_id: Session identifier
+        shard_count: Shards the plan is split into now
+
+    Returns:
+        Indexes of completed shards (empty if the session was split differently)
+    """
+    done: set[int] = set()
+    for checkpoint in checkpoint_manager.get_session_checkpoints(session_id):
+        metadata = json.loads(checkpoint.metadata) if checkpoint.metadata else {}
+        if "shard" not in metadata:
+            continue
+        if metadata.get("shards") != shard_count:
+            return set()
+        done.add(metadata["shard"])
+    return done
+
+
+class ShardedExecutor:
+    """Runs shards in a process pool and merges their results into the session."""
+
+    def __init__(
+        self,
+        config: ImporterConfig,
+        processes: int,
+        session_id: str,
+        dry_run: bool = False,
+        allow_dangerous_operations: bool = False,
+        checkpoint_manager: CheckpointManager | None = None,
+        input_hash: str | None = None,
+        initial_created_resources: dict[str, dict[str, int]] | None = None,
+    ) -> None:
+        """
+        Initialize sharded executor.
+
+        Args:
+            config: Session configuration (workers get a share of its policy limits)
+            processes: Worker processes
+            session_id: Session identifier
+            dry_run: Simulate execution without API calls
+            allow_dangerous_operations: Allow deletion of critical resources
+            checkpoint_manager: Where to record completed shards and created
+                resources (None: not recorded)
+            input_hash: Input file hash stored with checkpoints
+            initial_created_resources: Created resources loaded on resume
+
+        Raises:
+            ValueError: If config has no BAM connection settings
+        """
+        if config.bam is None:
+            raise ValueError("BAM configuration required for sharded execution")
+        self.config = config
+        self.processes = max(1, processes)
+        self.session_id = session_id
+        self.dry_run = dry_run
+        self.allow_dangerous_operations = allow_dangerous_operations
+        self.checkpoint_manager = checkpoint_manager
+        self.input_hash = input_hash
+        self.initial_created_resources = initial_created_resources
+        self.completed_count = 0
+        self.succeeded_count = 0
+
+    def _tasks(self, shards: list[list[Operation]], skip: set[int]) -> list[ShardTask]:
+        processes = max(1, min(self.processes, len(shards)))
+        config = dataclasses.replace(
+            self.config, policy=shard_policy(self.config.policy, processes)
+        )
+        log_level = logging.getLevelName(logging.getLogger().getEffectiveLevel())
+        return [
+            ShardTask(
+                shard_index=index,
+                operations=shard,
+                config=config,
+                session_id=self.session_id,
+                dry_run=self.dry_run,
+                allow_dangerous_operations=self.allow_dangerous_operations,
+                initial_created_resources=self.initial_created_resources,
+                log_level=log_level if isinstance(log_level, str) else "INFO",
+            )
+            for index, shard in enumerate(shards)
+            if index not in skip
+        ]
+
+    async def execute(
+        self,
+        shards: list[list[Operation]],
+        sink: ResultPipeline | None = None,
+        keep_results: bool = True,
+        skip: set[int] | None = None,
+        global_operations: list[Operation] | None = None,
+    ) -> list[OperationResult]:
+        """
+        Run shards in worker processes, merging results as each shard finishes.
+
+        Global operations run first, in this process with the full policy
+        limits; their created resources are handed to every worker. A shard
+        whose worker fails (e.g. cannot authenticate) gets a failed result for
+        each of its operations; the other shards are unaffected.
+
+        Args:
+            shards: Operations of each shard (see plan_shards)
+            sink: Pipeline to publish results to as shards finish
+            keep_results: Also collect and return every result
+            skip: Indexes of shards already completed (resume; GLOBAL_SHARD for
+                the global operations)
+            global_operations: Operations outside every configuration (see
+                DependencyGraph.global_node_ids); creates and updates only
+
+        Returns:
+            Results in completion order, global operations first (empty if
+            keep_results is False)
+        """
+        skip = skip or set()
+        total = sum(len(shard) for shard in shards) + len(global_operations or [])
+        results: list[OperationResult] = []
+        if global_operations and GLOBAL_SHARD not in skip:
+            outcome = await self._run_global(global_operations)
+            await self._merge(outcome, len(shards), total, sink)
+            if keep_results:
+                results.extend(outcome.results)
+            created = {
+                resource_type: dict(resources)
+                for resource_type, resources in (self.initial_created_resources or {}).items()
+            }
+            for resource_type, resources in outcome.created_resources.items():
+                created.setdefault(resource_type, {}).update(resources)
+            self.initial_created_resources = created
+
+        tasks = self._tasks(shards, skip)
+        if not tasks:
+            return results
+        processes = min(self.processes, len(tasks))
+        logger.info(
+            "Starting sharded execution",
+            shards=len(shards),
+            skipped=len(shards) - len(tasks),
+            processes=processes,
+            operations=sum(len(task.operations) for task in tasks),
+        )
+
+        loop = asyncio.get_running_loop()
+        # spawn: workers must not inherit the parent's event loop or connections
+        with ProcessPoolExecutor(
+            max_workers=processes, mp_context=multiprocessing.get_context("spawn")
+        ) as pool:
+
+            async def run(task: ShardTask) -> ShardOutcome:
+                try:
+                    return await loop.run_in_executor(pool, run_shard, task)
+                except Exception as e:
+                    return _failed_outcome(task, e)
+
+            for done in asyncio.as_completed([run(task) for task in tasks]):
+                outcome = await done
+                await self._merge(outcome, len(shards), total, sink)
+                if keep_results:
+                    results.extend(outcome.results)
+        return results
+
+    async def _run_global(self, operations: list[Operation]) -> ShardOutcome:
+        """Run the global operations in this process, before any shard starts."""
+        logger.info("Running global operations before sharding", operations=len(operations))
+        task = ShardTask(
+            shard_index=GLOBAL_SHARD,
+            operations=operations,
+            config=self.config,
+            session_id=self.session_id,
+            dry_run=self.dry_run,
+            allow_dangerous_operations=self.allow_dangerous_operations,
+            initial_created_resources=self.initial_created_resources,
+        )
+        try:
+            return await _run_shard(task)
+        except Exception as e:
+            return _failed_outcome(task, e)
+
+    async def _merge(
+        self,
+        outcome: ShardOutcome,
+        shard_count: int,
+        total_operations: int,
+        sink: ResultPipeline | None,
+    ) -> None:
+        """Publish a finished shard's results, then record it in the checkpoint store."""
+        succeeded = sum(1 for r in outcome.results if r.success)
+        self.completed_count += len(outcome.results)
+        self.succeeded_count += succeeded
+        if sink is not None:
+            for result in outcome.results:
+                await sink.publish(result)
+            # As at a batch barrier: consumed before the checkpoint claims it
+            await sink.drain()
+
+        logger.info(
+            "Shard completed",
+            shard=outcome.shard_index,
+            successful=succeeded,
+            failed=len(outcome.results) - succeeded,
+            duration_seconds=f"{outcome.duration_seconds:.2f}",
+        )
+        if self.checkpoint_manager is None or self.dry_run:
+            return
+        for resource_type, created in outcome.created_resources.items():
+            for resource_key, bam_id in created.items():
+                self.checkpoint_manager.save_created_resource(
+                    self.session_id, resource_type, resource_key, bam_id
+                )
+        # batch_id 0: a resume that is not sharded the same way reruns everything
+        self.checkpoint_manager.save_checkpoint(
+            session_id=self.session_id,
+            batch_id=0,
+            operation_index=self.completed_count,
+            completed_operations=self.succeeded_count,
+            total_operations=total_operations,
+            input_hash=self.input_hash,
+            metadata={"shard": outcome.shard_index, "shards": shard_count},
+        )
@@ -1,7 +1,6 @@
 """CSV row models with Pydantic v2 discriminated unions."""
 
 import re
-from ipaddress import IPv4Address, IPv4Network, IPv6Address, IPv6Network
 from typing import Annotated, Any, ClassVar, Literal
 
 from pydantic import (
@@ -13,6 +12,8 @@ from pydantic import (
     model_validator,
 )
 
+from ..utils.ipnet import parse_address, parse_network
+
 
 def strip_whitespace(v: Any) -> Any:
     """
@@ -185,10 +186,8 @@ def validate_and_normalize_ipv4_cidr(v: Any) -> str:
         v = v.strip()
 
     try:
-        # Validate using ipaddress module (strict=False allows host bits set)
-        network = IPv4Network(v, strict=False)
-        # Return normalized CIDR
-        return str(network)
+        # Validate and normalize (host bits allowed, parse is memoised)
+        return parse_network(v, 4).cidr
     except Exception as e:
         raise ValueError(f"Invalid IPv4 CIDR notation '{v}': {str(e)}") from e
 
@@ -219,10 +218,8 @@ def validate_and_normalize_ipv6_cidr(v: Any) -> str:
         v = v.strip()
 
     try:
-        # Validate using ipaddress module (strict=False allows host bits set)
-        network = IPv6Network(v, strict=False)
-        # Return normalized CIDR
-        return str(network)
+        # Validate and normalize (host bits allowed, parse is memoised)
+        return parse_network(v, 6).cidr
     except Exception as e:
         raise ValueError(f"Invalid IPv6 CIDR notation '{v}': {str(e)}") from e
 
@@ -310,8 +307,8 @@ class IP4NetworkRow(CSVRowBase):
 
         try:
             # Validate and normalize (strict=False allows host bits to be set)
-            network = IPv4Network(v, strict=False)
-            normalized = str(network)
+            network = parse_network(v, 4)
+            normalized = network.cidr
 
             # Log if normalization occurred
             if normalized != v:
@@ -384,8 +381,8 @@ class IP4BlockRow(CSVRowBase):
 
         try:
             # Validate and normalize (strict=False allows host bits to be set)
-            network = IPv4Network(v, strict=False)
-            normalized = str(network)
+            network = parse_network(v, 4)
+            normalized = network.cidr
 
             # Log if normalization occurred
             if normalized != v:
@@ -589,7 +586,7 @@ class IP4AddressRow(CSVRowBase):
             ValueError: If the IP address format is invalid.
         """
         try:
-            IPv4Address(v)
+            parse_address(v, 4)
         except ValueError as e:
             raise ValueError(f"Invalid IPv4 address '{v}': {e}") from e
         return v
@@ -658,8 +655,8 @@ class IP6BlockRow(CSVRowBase):
             raise ValueError("CIDR cannot be empty")
         try:
             # Validate and normalize (strict=False allows host bits to be set)
-            network = IPv6Network(v, strict=False)
-            normalized = str(network)
+            network = parse_network(v, 6)
+            normalized = network.cidr
 
             # Log if normalization occurred
             if normalized != v:
@@ -728,8 +725,8 @@ class IP6NetworkRow(CSVRowBase):
             raise ValueError("CIDR cannot be empty")
         try:
             # Validate and normalize (strict=False allows host bits to be set)
-            network = IPv6Network(v, strict=False)
-            normalized = str(network)
+            network = parse_network(v, 6)
+            normalized = network.cidr
 
             # Log if normalization occurred
             if normalized != v:
@@ -831,9 +828,8 @@ class IP6AddressRow(CSVRowBase):
             ValueError: If the address format is invalid.
         """
         try:
-            addr = IPv6Address(v)
             # Return compressed notation for consistency
-            return addr.compressed
+            return parse_address(v, 6).text
         except ValueError as e:
             raise ValueError(f"Invalid IPv6 address '{v}': {e}") from e
 
@@ -915,7 +911,7 @@ class HostRecordRow(CSVRowBase):
             if not addr:  # Empty address
                 continue
             try:
-                IPv4Address(addr)  # Validate IP address format
+                parse_address(addr, 4)  # Validate IP address format
                 valid_addresses.append(addr)
             except ValueError as e:
                 raise ValueError(f"Invalid IP address '{addr}': {e}") from e
@@ -1402,9 +1398,9 @@ class IPv6DHCPRangeRow(CSVRowBase):
                     f"Invalid DHCPv6 range format: {v}. Expected format: '2001:db8::100-2001:db8::200'"
                 )
             try:
-                start = IPv6Address(parts[0].strip())
-                end = IPv6Address(parts[1].strip())
-                if start >= end:
+                start = parse_address(parts[0].strip(), 6)
+                end = parse_address(parts[1].strip(), 6)
+                if start.value >= end.value:
                     raise ValueError(f"DHCPv6 range start must be less than end: {v}")
             except ValueError as e:
                 raise ValueError(f"Invalid IPv6 address in range: {v}. {str(e)}") from e
@@ -2593,11 +2589,11 @@ class DeviceRow(CSVRowBase):
                 continue
             try:
                 # Try IPv4 first
-                IPv4Address(addr)
+                parse_address(addr, 4)
             except ValueError:
                 try:
                     # Try IPv6
-                    IPv6Address(addr)
+                    parse_address(addr, 6)
                 except ValueError as e:
                     raise ValueError(f"Invalid IP address '{addr}': {e}") from e
 
@@ -2659,11 +2655,11 @@ class DeviceAddressRow(CSVRowBase):
             raise ValueError("Address cannot be empty")
         try:
             # Try IPv4 first
-            IPv4Address(v)
+            parse_address(v, 4)
         except ValueError:
             try:
                 # Try IPv6
-                IPv6Address(v)
+                parse_address(v, 6)
             except ValueError as e:
                 raise ValueError(f"Invalid IP address '{v}': {e}") from e
         return v
@@ -1,16 +1,29 @@
 """Observability - Metrics, logging, and reporting."""
 
-from .logger import LogContext, add_context, clear_all_context, clear_context, configure_logging
-from .metrics import LoggerBackend, MetricsCollector, get_global_collector
+from .logger import (
+    LogContext,
+    LogSampler,
+    add_context,
+    clear_all_context,
+    clear_context,
+    configure_logging,
+    shutdown_logging,
+)
+from .metrics import LatencyHistogram, LoggerBackend, MetricsCollector, get_global_collector
+from .profiler import SessionProfiler
 from .reporter import ImportReport, ReportGenerator
 
 __all__ = [
     "MetricsCollector",
     "LoggerBackend",
+    "LatencyHistogram",
     "get_global_collector",
     "ReportGenerator",
     "ImportReport",
+    "SessionProfiler",
     "configure_logging",
+    "shutdown_logging",
+    "LogSampler",
     "add_context",
     "clear_context",
     "clear_all_context",
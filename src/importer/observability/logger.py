@@ -5,16 +5,34 @@ DX-002: Adds four log levels:
 - VERBOSE (15): Operation-level detail
 - DEBUG (10): Full trace including resolver cache hits
 - TRACE (5): Everything (extremely verbose)
+
+Hot-path logging:
+- Events below the logger's level are dropped before any processor runs
+  (``LevelFilteringBoundLogger``), so a filtered ``logger.debug`` costs one
+  level check
+- ``background=True`` hands records to a queue; a writer thread renders
+  them (console or JSON) and writes them, so the event loop never blocks on
+  formatting or I/O. ``shutdown_logging()`` (also run at exit) drains it
+- ``sample_burst`` rate-limits repeated events below WARNING (per-operation
+  messages): each event may log that many times per ``sample_interval``
+  seconds, and a "Log events sampled" summary counts the dropped ones
 """
 
+import atexit
 import logging
+import queue
 import sys
+import threading
+import time
 from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Any
 
 import structlog
 
+from ..constants import LOG_SAMPLE_INTERVAL
+
 # Context variables for request tracing
 _log_context: ContextVar[dict[str, Any]] = ContextVar("log_context", default={})
 
@@ -138,6 +156,136 @@ LOG_LEVELS = {
 }
 
 
+# Level of each structlog method name
+_METHOD_LEVELS = {
+    **{name.lower(): value for name, value in LOG_LEVELS.items()},
+    "warn": logging.WARNING,
+    "exception": logging.ERROR,
+    "fatal": logging.CRITICAL,
+}
+
+
+class LevelFilteringBoundLogger(structlog.stdlib.BoundLogger):
+    """
+    BoundLogger that checks the stdlib logger's level before processing.
+
+    structlog runs the whole processor chain and leaves level filtering to
+    the stdlib logger at the end; here an event below the level returns at
+    once, without building an event dict.
+    """
+
+    def _proxy_to_logger(
+        self, method_name: str, event: str | None = None, *event_args: str, **event_kw: Any
+    ) -> Any:
+        """Process and log the event if its level is enabled."""
+        level = _METHOD_LEVELS.get(method_name)
+        if level is not None and not self._logger.isEnabledFor(level):
+            return None
+        return super()._proxy_to_logger(method_name, event, *event_args, **event_kw)
+
+
+class LogSampler:
+    """
+    Structlog processor rate-limiting repeated events below WARNING.
+
+    Each event name may be logged ``burst`` times per window of ``interval``
+    seconds; later occurrences in the window are dropped and counted. The
+    first event after a window closes (or ``flush()``) logs one summary of
+    the dropped counts. Warnings and errors are never sampled.
+    """
+
+    SUMMARY_EVENT = "Log events sampled"
+
+    def __init__(self, burst: int, interval: float = LOG_SAMPLE_INTERVAL) -> None:
+        """
+        Initialize sampler.
+
+        Args:
+            burst: Occurrences of one event logged per window
+            interval: Window length in seconds
+        """
+        self.burst = burst
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._window_start = time.monotonic()
+        self._counts: dict[str, int] = {}
+        self._dropped: dict[str, int] = {}
+
+    def __call__(
+        self, logger: logging.Logger, method_name: str, event_dict: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Pass the event on or drop it (structlog processor)."""
+        if _METHOD_LEVELS.get(method_name, logging.INFO) >= logging.WARNING:
+            return event_dict
+        event = str(event_dict.get("event"))
+        if event == self.SUMMARY_EVENT:
+            return event_dict
+
+        with self._lock:
+            dropped = self._roll() if time.monotonic() - self._window_start >= self.interval else {}
+            count = self._counts[event] = self._counts.get(event, 0) + 1
+            if count > self.burst:
+                self._dropped[event] = self._dropped.get(event, 0) + 1
+        self._summarize(dropped)
+        if count > self.burst:
+            raise structlog.DropEvent
+        return event_dict
+
+    def flush(self) -> None:
+        """Log the summary of the current window now."""
+        with self._lock:
+            dropped = self._roll()
+        self._summarize(dropped)
+
+    def _roll(self) -> dict[str, int]:
+        """Start a new window; return the drop counts of the closed one."""
+        dropped = self._dropped
+        self._window_start = time.monotonic()
+        self._counts = {}
+        self._dropped = {}
+        return dropped
+
+    def _summarize(self, dropped: dict[str, int]) -> None:
+        """Log how often each event was dropped."""
+        if dropped:
+            structlog.get_logger(__name__).info(
+                self.SUMMARY_EVENT,
+                dropped=dict(sorted(dropped.items(), key=lambda item: -item[1])),
+                total_dropped=sum(dropped.values()),
+                burst=self.burst,
+                interval_seconds=self.interval,
+            )
+
+
+class _RecordQueueHandler(QueueHandler):
+    """Queue records as they are; the writer thread's handlers format them."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Skip QueueHandler's formatting on the logging thread."""
+        return record
+
+
+# Background writer and sampler of the current configuration
+_listener: QueueListener | None = None
+_sampler: LogSampler | None = None
+
+
+def shutdown_logging() -> None:
+    """Log pending sampling summaries and drain the background writer."""
+    global _listener, _sampler
+    if _sampler is not None:
+        _sampler.flush()
+        _sampler = None
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(shutdown_logging)
+
+
 def get_log_level(level: str) -> int:
     """
     Get numeric log level from string.
@@ -156,6 +304,9 @@ def configure_logging(
     json_logs: bool = False,
     log_file: str | Path | None = None,
     log_filter: str | None = None,
+    background: bool = False,
+    sample_burst: int = 0,
+    sample_interval: float = LOG_SAMPLE_INTERVAL,
 ) -> None:
     """
     Configure structured logging with custom verbosity levels.
@@ -171,10 +322,19 @@ def configure_logging(
         json_logs: Whether to output logs in JSON format
         log_file: Optional path to write logs to file
         log_filter: Comma-separated component names to filter (e.g., "resolver,executor")
+        background: Render and write records in a background thread
+        sample_burst: Occurrences of one event below WARNING logged per
+            ``sample_interval`` (0 logs all; ignored below INFO)
+        sample_interval: Sampling window in seconds
     """
+    global _listener, _sampler
+
     # Parse level using custom mapping
     log_level = get_log_level(level)
 
+    # Drain the previous writer before replacing its handlers
+    shutdown_logging()
+
     # Basic configuration for standard logging
     handlers: list[logging.Handler] = [logging.StreamHandler(sys.stderr)]
     if log_file:
@@ -182,6 +342,30 @@ def configure_logging(
         file_path.parent.mkdir(parents=True, exist_ok=True)
         handlers.append(logging.FileHandler(file_path))
 
+    # Rendering happens in the handlers (in the writer thread with background);
+    # records from plain stdlib loggers get the same level, name and timestamp
+    renderer = (
+        structlog.processors.JSONRenderer()
+        if json_logs
+        else structlog.dev.ConsoleRenderer(colors=True)
+    )
+    formatter = structlog.stdlib.ProcessorFormatter(
+        processors=[structlog.stdlib.ProcessorFormatter.remove_processors_meta, renderer],
+        foreign_pre_chain=[
+            structlog.stdlib.add_logger_name,
+            structlog.stdlib.add_log_level,
+            structlog.processors.TimeStamper(fmt="iso"),
+        ],
+    )
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    if background:
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+        handlers = [_RecordQueueHandler(log_queue)]
+
     logging.basicConfig(
         format="%(message)s",
         level=log_level,
@@ -201,7 +385,11 @@ def configure_logging(
                 logger.setLevel(logging.WARNING)
 
     # Structlog processors
-    processors = [
+    processors: list[Any] = []
+    if sample_burst > 0 and log_level >= logging.INFO:
+        _sampler = LogSampler(sample_burst, sample_interval)
+        processors.append(_sampler)
+    processors += [
         structlog.contextvars.merge_contextvars,
         structlog.stdlib.add_logger_name,
         structlog.stdlib.add_log_level,
@@ -211,16 +399,12 @@ def configure_logging(
         structlog.processors.format_exc_info,
         structlog.processors.UnicodeDecoder(),
         _context_processor,
+        structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
     ]
 
-    if json_logs:
-        processors.append(structlog.processors.JSONRenderer())
-    else:
-        processors.append(structlog.dev.ConsoleRenderer(colors=True))
-
     structlog.configure(
         processors=processors,
         logger_factory=structlog.stdlib.LoggerFactory(),
-        wrapper_class=structlog.stdlib.BoundLogger,
+        wrapper_class=LevelFilteringBoundLogger,
         cache_logger_on_first_use=True,
     )
@@ -1,6 +1,8 @@
 """Metrics collection for monitoring import performance."""
 
+import math
 from abc import ABC, abstractmethod
+from bisect import bisect_left
 from collections import Counter, defaultdict
 from typing import Any
 
@@ -9,6 +11,97 @@ import structlog
 logger = structlog.get_logger(__name__)
 
 
+# Upper bounds (ms) of the latency histogram buckets; a final +Inf bucket is implied.
+LATENCY_BUCKETS_MS: tuple[float, ...] = (
+    1,
+    2.5,
+    5,
+    10,
+    25,
+    50,
+    100,
+    250,
+    500,
+    1000,
+    2500,
+    5000,
+    10000,
+)
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram.
+
+    Memory is constant regardless of the number of observations; percentiles
+    are estimated by interpolating within the bucket that contains them.
+    """
+
+    def __init__(self, bounds: tuple[float, ...] = LATENCY_BUCKETS_MS) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add another histogram with the same bounds into this one."""
+        for i, count in enumerate(other.counts):
+            self.counts[i] += count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def percentile(self, q: float) -> float:
+        """
+        Estimate the q-th percentile (0-100).
+
+        Args:
+            q: Percentile to estimate
+
+        Returns:
+            Estimated value in ms (0.0 when empty)
+        """
+        if not self.count:
+            return 0.0
+        rank = q / 100 * self.count
+        seen = 0
+        for i, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                lower = self.bounds[i - 1] if i > 0 else self.min
+                upper = self.bounds[i] if i < len(self.bounds) else self.max
+                lower, upper = max(lower, self.min), min(upper, self.max)
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+        return self.max
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return count, summary statistics, percentiles and non-cumulative buckets."""
+        return {
+            "count": self.count,
+            "avg": self.total / self.count if self.count else 0.0,
+            "min": self.min if self.count else 0.0,
+            "max": self.max,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "buckets": [
+                {"le": bound, "count": count}
+                for bound, count in zip([*self.bounds, "+Inf"], self.counts, strict=True)
+            ],
+        }
+
+
 class MetricsBackend(ABC):
     """Abstract base class for metrics backends."""
 
@@ -34,6 +127,7 @@ class LoggerBackend(MetricsBackend):
         self.counters: Counter[str] = Counter()
         self.gauges: dict[str, float] = {}
         self.timings: dict[str, list[float]] = defaultdict(list)
+        self.histograms: dict[str, LatencyHistogram] = {}
 
     def increment(self, name: str, value: int = 1, tags: dict[str, str] | None = None) -> None:
         """Increment a counter."""
@@ -50,6 +144,28 @@ class LoggerBackend(MetricsBackend):
         """Record a timing."""
         key = self._format_key(name, tags)
         self.timings[key].append(value)
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = LatencyHistogram()
+        histogram.observe(value)
+
+    def get_histogram(self, name: str) -> LatencyHistogram | None:
+        """
+        Return the histogram for a timing, merged across all tag combinations.
+
+        Args:
+            name: Timing name without tags (e.g. "bam_api_latency_ms")
+
+        Returns:
+            Merged histogram, or None if the timing was never recorded
+        """
+        merged: LatencyHistogram | None = None
+        for key, histogram in self.histograms.items():
+            if key == name or key.startswith(f"{name}["):
+                if merged is None:
+                    merged = LatencyHistogram(histogram.bounds)
+                merged.merge(histogram)
+        return merged
 
     def _format_key(self, name: str, tags: dict[str, str] | None) -> str:
         if not tags:
@@ -124,6 +240,24 @@ class MetricsCollector:
             float(current_concurrency),
         )
 
+    def get_latency_histograms(self) -> dict[str, dict[str, Any]]:
+        """
+        Get a histogram per timing name, merged across tags.
+
+        Returns:
+            Mapping of timing name to LatencyHistogram.to_dict() (empty if the
+            backend does not keep histograms)
+        """
+        if not isinstance(self.backend, LoggerBackend):
+            return {}
+        names = {key.split("[", 1)[0] for key in self.backend.histograms}
+        histograms = {}
+        for name in sorted(names):
+            histogram = self.backend.get_histogram(name)
+            if histogram is not None:
+                histograms[name] = histogram.to_dict()
+        return histograms
+
     def get_summary(self) -> dict[str, Any]:
         """Get summary from backend if supported."""
         if hasattr(self.backend, "get_summary"):
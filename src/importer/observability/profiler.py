@@ -0,0 +1,279 @@
+"""Session profiler for import runs.
+
+Collects a timing breakdown for `apply --profile`:
+- Wall and CPU time per pipeline phase
+- API call counts, errors and latency per endpoint family
+- Optional sampling profile of the hottest functions
+"""
+
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass
+class PhaseTiming:
+    """Accumulated timing for one pipeline phase."""
+
+    name: str
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    calls: int = 0
+
+
+@dataclass
+class EndpointStats:
+    """API call statistics for one endpoint family (e.g. GET blocks/{id}/networks)."""
+
+    family: str
+    count: int = 0
+    errors: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    @property
+    def avg_ms(self) -> float:
+        """Average latency in milliseconds."""
+        return self.total_ms / self.count if self.count else 0.0
+
+
+def endpoint_family(method: str, endpoint: str) -> str:
+    """
+    Collapse a request to its endpoint family.
+
+    Numeric path segments are replaced by ``{id}`` and the query string is
+    dropped, so ``GET blocks/12/networks?filter=...`` becomes
+    ``GET blocks/{id}/networks``.
+
+    Args:
+        method: HTTP method
+        endpoint: Endpoint relative to the API base URL
+
+    Returns:
+        Endpoint family key
+    """
+    path = endpoint.split("?", 1)[0].strip("/")
+    segments = ["{id}" if s.isdigit() else s for s in path.split("/") if s]
+    return f"{method.upper()} {'/'.join(segments) or '/'}"
+
+
+class StackSampler:
+    """
+    Statistical profiler that samples one thread's stack at a fixed interval.
+
+    Runs in a daemon thread and reads the target thread's current frame via
+    ``sys._current_frames()``, so the profiled code runs unmodified (unlike
+    cProfile, which instruments every call).
+    """
+
+    def __init__(self, interval: float = 0.005, thread_id: int | None = None) -> None:
+        """
+        Initialize sampler.
+
+        Args:
+            interval: Seconds between samples
+            thread_id: Thread to sample (default: the calling thread)
+        """
+        self.interval = interval
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.samples = 0
+        self.self_counts: Counter[str] = Counter()
+        self.total_counts: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start sampling in a background thread."""
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling and wait for the sampler thread."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=1)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self._record(frame)
+
+    def _record(self, frame: Any) -> None:
+        self.samples += 1
+        self.self_counts[_frame_key(frame)] += 1
+        # Count each function once per sample, even if recursive
+        seen = set()
+        while frame is not None:
+            key = _frame_key(frame)
+            if key not in seen:
+                seen.add(key)
+                self.total_counts[key] += 1
+            frame = frame.f_back
+
+    def hotspots(self, limit: int = 25) -> list[dict[str, Any]]:
+        """
+        Return the functions with the most samples at the top of the stack.
+
+        Args:
+            limit: Maximum number of functions
+
+        Returns:
+            List of dicts with function, self/total samples and percentages
+        """
+        if not self.samples:
+            return []
+        return [
+            {
+                "function": key,
+                "self_samples": count,
+                "total_samples": self.total_counts[key],
+                "self_percent": round(count / self.samples * 100, 1),
+                "total_percent": round(self.total_counts[key] / self.samples * 100, 1),
+            }
+            for key, count in self.self_counts.most_common(limit)
+        ]
+
+
+def _frame_key(frame: Any) -> str:
+    code = frame.f_code
+    return f"{code.co_filename}:{code.co_firstlineno}({code.co_name})"
+
+
+class SessionProfiler:
+    """
+    Collects per-phase and per-endpoint timings for an import session.
+
+    Usage:
+        profiler = SessionProfiler(sample=True)
+        profiler.start()
+        with profiler.phase("parse"):
+            rows = parser.parse()
+        profiler.stop()
+        report_data = profiler.to_dict()
+    """
+
+    def __init__(self, sample: bool = False, sample_interval: float = 0.005) -> None:
+        """
+        Initialize profiler.
+
+        Args:
+            sample: Whether to capture a sampling profile of hot functions
+            sample_interval: Seconds between stack samples
+        """
+        self.phases: dict[str, PhaseTiming] = {}
+        self.endpoints: dict[str, EndpointStats] = {}
+        self.cache: dict[str, int] = {"hits": 0, "revalidated": 0, "misses": 0}
+        self.sampler = StackSampler(sample_interval) if sample else None
+        self._wall_start: float | None = None
+        self._cpu_start: float | None = None
+        self.wall_seconds = 0.0
+        self.cpu_seconds = 0.0
+
+    def start(self) -> None:
+        """Start the session clock (and the sampler, if enabled). No-op if running."""
+        if self._wall_start is not None:
+            return
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.process_time()
+        if self.sampler:
+            self.sampler.start()
+
+    def stop(self) -> None:
+        """Stop the session clock and sampler."""
+        if self.sampler:
+            self.sampler.stop()
+        if self._wall_start is not None and self._cpu_start is not None:
+            self.wall_seconds = time.perf_counter() - self._wall_start
+            self.cpu_seconds = time.process_time() - self._cpu_start
+            self._wall_start = None
+            self._cpu_start = None
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Time a pipeline phase. Re-entering the same phase accumulates.
+
+        Args:
+            name: Phase name (e.g. "parse", "resolve")
+        """
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            timing = self.phases.setdefault(name, PhaseTiming(name))
+            timing.wall_seconds += time.perf_counter() - wall_start
+            timing.cpu_seconds += time.process_time() - cpu_start
+            timing.calls += 1
+
+    def record_request(self, method: str, endpoint: str, status: int, duration_ms: float) -> None:
+        """
+        Record one API request.
+
+        Args:
+            method: HTTP method
+            endpoint: Endpoint relative to the API base URL
+            status: HTTP status code
+            duration_ms: Request latency in milliseconds
+        """
+        family = endpoint_family(method, endpoint)
+        stats = self.endpoints.get(family)
+        if stats is None:
+            stats = self.endpoints[family] = EndpointStats(family)
+        stats.count += 1
+        stats.total_ms += duration_ms
+        stats.max_ms = max(stats.max_ms, duration_ms)
+        if status >= 400:
+            stats.errors += 1
+
+    def record_cache(self, result: str) -> None:
+        """
+        Record one GET response cache lookup.
+
+        Args:
+            result: "hits" (no request), "revalidated" (304) or "misses"
+        """
+        self.cache[result] = self.cache.get(result, 0) + 1
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Return the profile as a JSON-serializable dict.
+
+        Phases keep their execution order; endpoints are sorted by total time.
+        """
+        total_wall = self.wall_seconds or sum(p.wall_seconds for p in self.phases.values())
+        phases = []
+        for timing in self.phases.values():
+            entry = asdict(timing)
+            entry["percent"] = (
+                round(timing.wall_seconds / total_wall * 100, 1) if total_wall > 0 else 0.0
+            )
+            phases.append(entry)
+
+        endpoints = [
+            {**asdict(stats), "avg_ms": stats.avg_ms}
+            for stats in sorted(self.endpoints.values(), key=lambda s: s.total_ms, reverse=True)
+        ]
+
+        return {
+            "wall_seconds": total_wall,
+            "cpu_seconds": self.cpu_seconds,
+            "phases": phases,
+            "api_calls": sum(s.count for s in self.endpoints.values()),
+            "endpoints": endpoints,
+            "response_cache": dict(self.cache),
+            "hotspots": self.sampler.hotspots() if self.sampler else [],
+            "samples": self.sampler.samples if self.sampler else 0,
+        }
@@ -1,20 +1,74 @@
 """Import Report Generator.
 
 Generates JSON and HTML reports for import sessions.
+
+Reports are built in a single pass over the operation results: per-operation
+results can be streamed to a JSON Lines file, errors are aggregated by
+signature and object type with only a bounded sample kept in memory, and the
+HTML document is written to disk section by section.
 """
 
+import io
 import json
+import re
+from collections.abc import Iterable, Mapping
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
+from html import escape
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
 import structlog
 
 from ..persistence.changelog import ChangeLog
+from .metrics import LatencyHistogram
 
 logger = structlog.get_logger(__name__)
 
+# Failed rows kept verbatim on the report (JSON and HTML); the rest are only
+# counted in their error group and written to the results JSONL file.
+MAX_ERROR_DETAILS = 1000
+
+# Distinct (signature, object type, operation) groups tracked; failures beyond
+# this are folded into a single overflow group.
+MAX_ERROR_GROUPS = 200
+
+# Example row IDs kept per error group.
+ERROR_GROUP_SAMPLES = 5
+
+OPERATION_LATENCY_METRIC = "import_operation_duration_ms"
+
+_JSONL_ENCODER = json.JSONEncoder(default=str)
+
+_SIGNATURE_PATTERNS = (
+    (re.compile(r"[0-9a-fA-F]{8}-[0-9a-fA-F-]{27}"), "<uuid>"),
+    (re.compile(r"\b\d{1,3}(?:\.\d{1,3}){3}(?:/\d{1,2})?\b"), "<ip>"),
+    (re.compile(r"\b[0-9a-fA-F]*:[0-9a-fA-F:]*:[0-9a-fA-F:]*(?:/\d{1,3})?"), "<ip>"),
+    (re.compile(r"'[^']*'"), "'<str>'"),
+    (re.compile(r'"[^"]*"'), '"<str>"'),
+    (re.compile(r"\d+"), "<n>"),
+)
+
+
+def error_signature(message: Any) -> str:
+    """
+    Reduce an error message to a signature shared by errors of the same kind.
+
+    Addresses, quoted values, UUIDs and numbers are replaced with placeholders,
+    so "Network 10.0.0.0/24 not found (id 12)" and "Network 10.1.0.0/24 not
+    found (id 99)" share the signature "Network <ip> not found (id <n>)".
+
+    Args:
+        message: Error message
+
+    Returns:
+        Signature string (at most 200 characters)
+    """
+    signature = str(message) if message is not None else "Unknown error"
+    for pattern, placeholder in _SIGNATURE_PATTERNS:
+        signature = pattern.sub(placeholder, signature)
+    return signature[:200]
+
 
 @dataclass
 class ImportReport:
@@ -46,6 +100,10 @@ class ImportReport:
         updates: Count of UPDATE operations
         deletes: Count of DELETE operations
         noops: Count of NOOP operations
+        profile: Phase/endpoint timing breakdown from `apply --profile` (if enabled)
+        error_groups: Failures grouped by error signature, object type and operation
+        latency_histograms: Latency histograms by metric name
+        results_path: Path to the per-operation results JSONL file (if written)
     """
 
     session_id: str
@@ -72,6 +130,109 @@ class ImportReport:
     updates: int = 0
     deletes: int = 0
     noops: int = 0
+    profile: dict[str, Any] | None = None
+    error_groups: list[dict[str, Any]] = field(default_factory=list)
+    latency_histograms: dict[str, dict[str, Any]] = field(default_factory=dict)
+    results_path: str | None = None
+
+
+class _ResultAccumulator:
+    """
+    Single-pass aggregation of operation results.
+
+    Memory is bounded by MAX_ERROR_DETAILS and MAX_ERROR_GROUPS regardless of
+    the number of results.
+    """
+
+    def __init__(
+        self,
+        object_types: Mapping[Any, str] | None = None,
+        max_errors: int = MAX_ERROR_DETAILS,
+        jsonl: TextIO | None = None,
+    ) -> None:
+        self.object_types = object_types or {}
+        self.max_errors = max_errors
+        self.jsonl = jsonl
+        self.total = 0
+        self.successful = 0
+        self.failed = 0
+        self.operations: dict[str, int] = {}
+        self.duration_count = 0
+        self.duration_total = 0.0
+        self.duration_max = 0.0
+        self.histogram = LatencyHistogram()
+        self.errors: list[dict[str, Any]] = []
+        self.groups: dict[tuple[str, Any, str], dict[str, Any]] = {}
+
+    def add(self, result: Any) -> None:
+        """Aggregate one OperationResult (and stream it to the JSONL file, if any)."""
+        operation = getattr(result.operation, "value", result.operation)
+        object_type = self.object_types.get(result.row_id)
+        if object_type is None:
+            object_type = getattr(result, "object_type", None)
+
+        self.total += 1
+        self.operations[operation] = self.operations.get(operation, 0) + 1
+
+        duration = result.duration_ms
+        if duration is not None:
+            self.duration_count += 1
+            self.duration_total += duration
+            self.duration_max = max(self.duration_max, duration)
+            self.histogram.observe(duration)
+
+        if result.success:
+            self.successful += 1
+        else:
+            self.failed += 1
+            self._add_error(result, operation, object_type)
+
+        if self.jsonl is not None:
+            line = {
+                "row_id": result.row_id,
+                "operation": operation,
+                "object_type": object_type,
+                "success": result.success,
+                "resource_id": getattr(result, "resource_id", None),
+                "duration_ms": duration,
+                "error": result.error_message if not result.success else None,
+            }
+            self.jsonl.write(_JSONL_ENCODER.encode(line) + "\n")
+
+    def _add_error(self, result: Any, operation: str, object_type: Any) -> None:
+        if len(self.errors) < self.max_errors:
+            self.errors.append(
+                {
+                    "row_id": result.row_id,
+                    "operation_type": operation,
+                    "error": result.error_message,
+                    "object_type": object_type,
+                }
+            )
+
+        signature = error_signature(result.error_message)
+        key = (signature, str(object_type) if object_type is not None else None, str(operation))
+        group = self.groups.get(key)
+        if group is None:
+            if len(self.groups) >= MAX_ERROR_GROUPS:
+                key = ("(other errors)", None, "*")
+                group = self.groups.get(key)
+            if group is None:
+                group = self.groups[key] = {
+                    "signature": key[0],
+                    "object_type": key[1],
+                    "operation_type": key[2],
+                    "count": 0,
+                    "sample_row_ids": [],
+                    "sample_error": result.error_message,
+                }
+        group["count"] += 1
+        if len(group["sample_row_ids"]) < ERROR_GROUP_SAMPLES:
+            group["sample_row_ids"].append(result.row_id)
+
+    def error_groups(self) -> list[dict[str, Any]]:
+        """Return error groups, largest first."""
+        return sorted(self.groups.values(), key=lambda group: group["count"], reverse=True)
 
 
 class ReportGenerator:
@@ -100,60 +261,68 @@ class ReportGenerator:
         end_time: datetime,
         csv_file: Path,
         dry_run: bool,
-        results: list[Any],  # List[OperationResult]
+        results: Iterable[Any],  # Iterable[OperationResult]
         metrics: dict[str, Any],
         rollback_path: Path | None = None,
+        profile: dict[str, Any] | None = None,
+        latency_histograms: dict[str, dict[str, Any]] | None = None,
+        results_path: Path | None = None,
+        object_types: Mapping[Any, str] | None = None,
+        max_errors: int = MAX_ERROR_DETAILS,
     ) -> ImportReport:
         """
         Generate report object from execution data.
 
+        Results are consumed in a single pass, so a generator can be passed to
+        avoid materialising them.
+
         Args:
             session_id: Session identifier
             start_time: Start timestamp
             end_time: End timestamp
             csv_file: CSV file path
             dry_run: Dry run mode
-            results: List of operation results
+            results: Operation results
             metrics: Execution metrics
             rollback_path: Path to rollback CSV (if any)
+            profile: Profiler output (SessionProfiler.to_dict()) to embed
+            latency_histograms: Histograms from the metrics backend
+                (MetricsCollector.get_latency_histograms()) to embed
+            results_path: If set, write one JSON line per operation result here
+            object_types: Mapping of row ID to object type, used to label errors
+            max_errors: Maximum failed rows kept verbatim on the report
 
         Returns:
             ImportReport object
         """
+        if results_path is not None:
+            results_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(results_path, "w", encoding="utf-8") as jsonl:
+                acc = _ResultAccumulator(object_types, max_errors, jsonl)
+                for result in results:
+                    acc.add(result)
+            logger.info("Results JSONL written", path=str(results_path))
+        else:
+            acc = _ResultAccumulator(object_types, max_errors)
+            for result in results:
+                acc.add(result)
+
         duration = (end_time - start_time).total_seconds()
-        total_ops = len(results)
-        successful = sum(1 for r in results if r.success)
-        failed = sum(1 for r in results if not r.success)
         # Assuming no explicit skipped status in result object yet, but could be added
         skipped = 0
 
-        # Calculate breakdown
-        creates = sum(1 for r in results if r.operation == "create")
-        updates = sum(1 for r in results if r.operation == "update")
-        deletes = sum(1 for r in results if r.operation == "delete")
-        noops = sum(1 for r in results if r.operation == "noop")
-
         # Calculate performance
-        ops_per_sec = total_ops / duration if duration > 0 else 0
-        durations = [r.duration_ms for r in results if r.duration_ms is not None]
-        avg_latency = sum(durations) / len(durations) if durations else 0
-        max_latency = max(durations) if durations else 0
-
-        # Collect errors
-        errors = [
-            {
-                "row_id": r.row_id,
-                "operation_type": r.operation,
-                "error": r.error_message,
-                "object_type": getattr(r, "object_type", None),  # Might not be on result
-            }
-            for r in results
-            if not r.success
-        ]
+        ops_per_sec = acc.total / duration if duration > 0 else 0
+        avg_latency = acc.duration_total / acc.duration_count if acc.duration_count else 0
+        max_latency = acc.duration_max
+
+        histograms = dict(latency_histograms or {})
+        if OPERATION_LATENCY_METRIC not in histograms and acc.histogram.count:
+            histograms[OPERATION_LATENCY_METRIC] = acc.histogram.to_dict()
 
         status = "completed"
-        if failed > 0:
-            status = "partial" if successful > 0 else "failed"
+        if acc.failed > 0:
+            status = "partial" if acc.successful > 0 else "failed"
 
         return ImportReport(
             session_id=session_id,
@@ -163,9 +332,9 @@ class ReportGenerator:
             duration_seconds=duration,
             csv_file=str(csv_file),
             dry_run=dry_run,
-            total_operations=total_ops,
-            successful_operations=successful,
-            failed_operations=failed,
+            total_operations=acc.total,
+            successful_operations=acc.successful,
+            failed_operations=acc.failed,
             skipped_operations=skipped,
             operations_per_second=ops_per_sec,
             avg_operation_duration_ms=avg_latency,
@@ -175,11 +344,15 @@ class ReportGenerator:
             rate_limit_hits=metrics.get("rate_limit_errors", 0),
             rollback_csv_generated=rollback_path is not None,
             rollback_csv_path=str(rollback_path) if rollback_path else None,
-            errors=errors,
-            creates=creates,
-            updates=updates,
-            deletes=deletes,
-            noops=noops,
+            errors=acc.errors,
+            creates=acc.operations.get("create", 0),
+            updates=acc.operations.get("update", 0),
+            deletes=acc.operations.get("delete", 0),
+            noops=acc.operations.get("noop", 0),
+            profile=profile,
+            error_groups=acc.error_groups(),
+            latency_histograms=histograms,
+            results_path=str(results_path) if results_path else None,
         )
 
     def write_json_report(self, report: ImportReport, output_path: Path) -> None:
@@ -193,7 +366,7 @@ class ReportGenerator:
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
         with open(output_path, "w") as f:
-            json.dump(asdict(report), f, indent=2)
+            json.dump(asdict(report), f, indent=2, default=str)
 
         logger.info("JSON report written", path=str(output_path))
 
@@ -207,10 +380,8 @@ class ReportGenerator:
         """
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        html = self._generate_html(report)
-
         with open(output_path, "w", encoding="utf-8") as f:
-            f.write(html)
+            self._write_html(report, f)
 
         logger.info("HTML report written", path=str(output_path))
 
@@ -224,18 +395,34 @@ class ReportGenerator:
         Returns:
             HTML content string
         """
+        buffer = io.StringIO()
+        self._write_html(report, buffer)
+        return buffer.getvalue()
+
+    def _write_html(self, report: ImportReport, out: TextIO) -> None:
+        """
+        Write the HTML report section by section.
+
+        Each section is written as soon as it is rendered, so memory use is
+        bounded by the largest section rather than the whole document.
+
+        Args:
+            report: Import report
+            out: Text stream to write to
+        """
         status_color = {
             "completed": "#28a745",
             "failed": "#dc3545",
             "partial": "#ffc107",
         }
 
-        html = f"""
+        out.write(
+            f"""
 <!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
-    <title>BlueCat Import Report - {report.session_id}</title>
+    <title>BlueCat Import Report - {escape(report.session_id)}</title>
     <style>
         body {{
             font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, sans-serif;
@@ -310,6 +497,11 @@ class ReportGenerator:
         .error-row {{
             background: #fff3cd;
         }}
+        .bar {{
+            height: 14px;
+            background: #4a90d9;
+            border-radius: 2px;
+        }}
         .success-rate {{
             font-size: 48px;
             font-weight: bold;
@@ -321,10 +513,10 @@ class ReportGenerator:
 <body>
     <div class="header">
         <h1>BlueCat Import Report</h1>
-        <p><strong>Session:</strong> {report.session_id}</p>
+        <p><strong>Session:</strong> {escape(report.session_id)}</p>
         <p><strong>Status:</strong> <span class="status">{report.status.upper()}</span></p>
         <p><strong>Duration:</strong> {report.duration_seconds:.2f} seconds</p>
-        <p><strong>CSV File:</strong> {report.csv_file}</p>
+        <p><strong>CSV File:</strong> {escape(report.csv_file)}</p>
         {'<p><strong>Dry Run:</strong> Yes</p>' if report.dry_run else ''}
     </div>
 
@@ -415,10 +607,20 @@ class ReportGenerator:
         </table>
     </div>
 
-    {self._generate_errors_section(report.errors) if report.errors else ''}
+"""
+        )
 
-    {self._generate_rollback_section(report) if report.rollback_csv_generated else ''}
+        if report.latency_histograms:
+            out.write(self._generate_latency_section(report.latency_histograms))
+        if report.profile:
+            out.write(self._generate_profile_section(report.profile))
+        if report.error_groups or report.errors:
+            self._write_errors_section(report, out)
+        if report.rollback_csv_generated:
+            out.write(self._generate_rollback_section(report))
 
+        out.write(
+            f"""
     <div class="section">
         <p style="color: #666; font-size: 12px;">
             Generated: {datetime.now().isoformat()}<br>
@@ -429,42 +631,238 @@ class ReportGenerator:
 </body>
 </html>
 """
-        return html
+        )
 
-    def _generate_errors_section(self, errors: list[dict[str, Any]]) -> str:
+    def _write_errors_section(self, report: ImportReport, out: TextIO) -> None:
         """
-        Generate HTML errors section.
+        Write the HTML errors section.
+
+        Failures are shown grouped by error signature and object type; the
+        per-row table is limited to the errors kept on the report, and the
+        complete list lives in the results JSONL file.
 
         Args:
-            errors: List of error dictionaries
+            report: Import report
+            out: Text stream to write to
+        """
+        out.write(
+            f"""
+    <div class="section">
+        <div class="section-title">Errors ({report.failed_operations})</div>
+"""
+        )
+
+        if report.error_groups:
+            out.write(
+                """
+        <h3>By Error Signature</h3>
+        <table>
+            <tr>
+                <th>Count</th>
+                <th>Object Type</th>
+                <th>Operation</th>
+                <th>Error Signature</th>
+                <th>Example Rows</th>
+            </tr>
+"""
+            )
+            for group in report.error_groups:
+                sample_rows = ", ".join(escape(str(row_id)) for row_id in group["sample_row_ids"])
+                out.write(
+                    f"""
+            <tr class="error-row">
+                <td>{group['count']}</td>
+                <td>{escape(str(group['object_type'] or 'N/A'))}</td>
+                <td>{escape(str(group['operation_type']))}</td>
+                <td><code>{escape(group['signature'])}</code></td>
+                <td>{sample_rows}</td>
+            </tr>
+"""
+                )
+            out.write("        </table>\n")
+
+        if report.errors:
+            shown = len(report.errors)
+            note = (
+                f"<p>Showing the first {shown} of {report.failed_operations} failed rows."
+                + (
+                    f" Full results: <code>{escape(report.results_path)}</code>"
+                    if report.results_path
+                    else ""
+                )
+                + "</p>"
+                if shown < report.failed_operations
+                else ""
+            )
+            out.write(
+                f"""
+        <h3>Failed Rows</h3>
+        {note}
+        <table>
+            <tr>
+                <th>Row ID</th>
+                <th>Object Type</th>
+                <th>Operation</th>
+                <th>Error</th>
+            </tr>
+"""
+            )
+            for error in report.errors:
+                out.write(
+                    f"""
+            <tr class="error-row">
+                <td>{escape(str(error['row_id']))}</td>
+                <td>{escape(str(error.get('object_type') or 'N/A'))}</td>
+                <td>{escape(str(error['operation_type']))}</td>
+                <td>{escape(str(error['error']))}</td>
+            </tr>
+"""
+                )
+            out.write("        </table>\n")
+
+        out.write("    </div>\n")
+
+    def _generate_latency_section(self, histograms: dict[str, dict[str, Any]]) -> str:
+        """
+        Generate HTML latency histogram section.
+
+        Args:
+            histograms: Mapping of timing name to LatencyHistogram.to_dict()
+
+        Returns:
+            HTML string for latency section
+        """
+        parts = []
+        for name, histogram in histograms.items():
+            if not histogram["count"]:
+                continue
+            peak = max(bucket["count"] for bucket in histogram["buckets"])
+            bucket_rows = "\n".join(
+                f"""
+            <tr>
+                <td>&le; {bucket['le']}</td>
+                <td>{bucket['count']}</td>
+                <td style="width: 60%;"><div class="bar" style="width: {bucket['count'] / peak * 100:.1f}%;"></div></td>
+            </tr>
+            """
+                for bucket in histogram["buckets"]
+                if bucket["count"]
+            )
+            parts.append(
+                f"""
+        <h3><code>{escape(name)}</code></h3>
+        <p>Count: {histogram['count']}, avg: {histogram['avg']:.1f} ms,
+        p50: {histogram['p50']:.1f} ms, p90: {histogram['p90']:.1f} ms,
+        p99: {histogram['p99']:.1f} ms, max: {histogram['max']:.1f} ms</p>
+        <table>
+            <tr>
+                <th>Bucket (ms)</th>
+                <th>Count</th>
+                <th></th>
+            </tr>
+            {bucket_rows}
+        </table>
+"""
+            )
+
+        if not parts:
+            return ""
+
+        return f"""
+    <div class="section">
+        <div class="section-title">Latency</div>
+        {"".join(parts)}
+    </div>
+"""
+
+    def _generate_profile_section(self, profile: dict[str, Any]) -> str:
+        """
+        Generate HTML profile section (phase, endpoint and hotspot tables).
+
+        Args:
+            profile: Profiler output
 
         Returns:
-            HTML string for errors section
+            HTML string for profile section
         """
-        rows = "\n".join(
+        phase_rows = "\n".join(
             f"""
-            <tr class="error-row">
-                <td>{error['row_id']}</td>
-                <td>{error.get('object_type', 'N/A')}</td>
-                <td>{error['operation_type']}</td>
-                <td>{error['error']}</td>
+            <tr>
+                <td>{entry['name']}</td>
+                <td>{entry['wall_seconds']:.3f}</td>
+                <td>{entry['cpu_seconds']:.3f}</td>
+                <td>{entry['percent']:.1f}%</td>
+            </tr>
+            """
+            for entry in profile.get("phases", [])
+        )
+        endpoint_rows = "\n".join(
+            f"""
+            <tr>
+                <td><code>{escape(entry['family'])}</code></td>
+                <td>{entry['count']}</td>
+                <td>{entry['errors']}</td>
+                <td>{entry['avg_ms']:.1f} ms</td>
+                <td>{entry['max_ms']:.1f} ms</td>
+                <td>{entry['total_ms']:.0f} ms</td>
+            </tr>
+            """
+            for entry in profile.get("endpoints", [])
+        )
+        hotspot_rows = "\n".join(
+            f"""
+            <tr>
+                <td><code>{escape(entry['function'])}</code></td>
+                <td>{entry['self_percent']:.1f}%</td>
+                <td>{entry['total_percent']:.1f}%</td>
             </tr>
             """
-            for error in errors
+            for entry in profile.get("hotspots", [])
+        )
+
+        hotspots = (
+            f"""
+        <h3>Hot Functions ({profile.get('samples', 0)} samples)</h3>
+        <table>
+            <tr>
+                <th>Function</th>
+                <th>Self</th>
+                <th>Total</th>
+            </tr>
+            {hotspot_rows}
+        </table>
+"""
+            if hotspot_rows
+            else ""
         )
 
         return f"""
     <div class="section">
-        <div class="section-title">Errors ({len(errors)})</div>
+        <div class="section-title">Profile</div>
+        <p>Wall: {profile.get('wall_seconds', 0):.2f} s, CPU: {profile.get('cpu_seconds', 0):.2f} s,
+        API calls: {profile.get('api_calls', 0)}</p>
         <table>
             <tr>
-                <th>Row ID</th>
-                <th>Object Type</th>
-                <th>Operation</th>
-                <th>Error</th>
+                <th>Phase</th>
+                <th>Wall (s)</th>
+                <th>CPU (s)</th>
+                <th>Share</th>
+            </tr>
+            {phase_rows}
+        </table>
+        <h3>API Calls by Endpoint</h3>
+        <table>
+            <tr>
+                <th>Endpoint</th>
+                <th>Calls</th>
+                <th>Errors</th>
+                <th>Avg</th>
+                <th>Max</th>
+                <th>Total</th>
             </tr>
-            {rows}
+            {endpoint_rows}
         </table>
+        {hotspots}
     </div>
 """
 
@@ -482,10 +880,10 @@ class ReportGenerator:
     <div class="section">
         <div class="section-title">Rollback</div>
         <p>Rollback CSV has been generated for this import session.</p>
-        <p><strong>Path:</strong> <code>{report.rollback_csv_path}</code></p>
+        <p><strong>Path:</strong> <code>{escape(str(report.rollback_csv_path))}</code></p>
         <p>To rollback this import, run:</p>
         <pre style="background: #f8f9fa; padding: 10px; border-radius: 4px;">
-python import.py apply {report.rollback_csv_path}
+bluecat-import rollback {escape(str(report.rollback_csv_path))}
         </pre>
     </div>
 """
@@ -1,6 +1,6 @@
 """Persistence layer for checkpoint and changelog tracking."""
 
-from .changelog import ChangeLog, ChangeLogEntry
+from .changelog import ChangeLog, ChangeLogEntry, RowSnapshot
 from .checkpoint import Checkpoint, CheckpointManager
 
-__all__ = ["ChangeLog", "ChangeLogEntry", "Checkpoint", "CheckpointManager"]
+__all__ = ["ChangeLog", "ChangeLogEntry", "Checkpoint", "CheckpointManager", "RowSnapshot"]
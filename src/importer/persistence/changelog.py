@@ -22,8 +22,47 @@ changelog (
     before_state    TEXT,                -- JSON: state before operation
     after_state     TEXT                 -- JSON: state after operation
 )
+
+sessions (
+    session_id       TEXT PRIMARY KEY,   -- Session identifier
+    start_time       TEXT NOT NULL,      -- Timestamp of the first entry
+    end_time         TEXT NOT NULL,      -- Timestamp of the latest entry
+    total_operations INTEGER NOT NULL,   -- Entries recorded for the session
+    successful       INTEGER NOT NULL,   -- Entries with success = 1
+    failed           INTEGER NOT NULL    -- Entries with success = 0
+)
+
+row_snapshots (
+    session_id      TEXT PRIMARY KEY,    -- Session that applied the file successfully
+    source_key      TEXT NOT NULL,       -- Logical file identity (resolved CSV path)
+    created_at      TEXT NOT NULL,       -- ISO format timestamp
+    row_count       INTEGER NOT NULL     -- Number of rows in the snapshot
+)
+
+row_hashes (
+    session_id      TEXT NOT NULL,       -- row_snapshots.session_id
+    row_id          TEXT NOT NULL,       -- CSV row ID
+    row_hash        TEXT NOT NULL,       -- SHA256 of the canonical row JSON
+    row_data        TEXT,                -- Canonical row JSON (rebuilds deletes)
+    PRIMARY KEY (session_id, row_id)
+)
 ```
 
+Session Summaries:
+-----------------
+``sessions`` holds one row per session and is updated in the same transaction
+as each changelog insert, so ``history`` and ``status`` read a handful of rows
+instead of aggregating the whole changelog. Databases created before the table
+existed are backfilled once when opened. ``prune_sessions`` drops old sessions
+(entries and summaries) and ``compact`` reclaims the freed pages.
+
+Row Snapshots:
+-------------
+After a fully successful live session the per-row content hashes of the input
+file are stored as a snapshot keyed by the logical file. ``apply --incremental``
+diffs the next run of the same file against it (see core/incremental.py). Only
+the latest snapshot per file is kept.
+
 Rollback Generation:
 -------------------
 The before_state and after_state fields enable rollback CSV generation:
@@ -61,8 +100,9 @@ entries = changelog.get_session_entries("session123")
 
 import json
 import sqlite3
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from types import TracebackType
 from typing import Any
@@ -89,6 +129,16 @@ class ChangeLogEntry:
     after_state: str | None  # JSON
 
 
+@dataclass
+class RowSnapshot:
+    """Per-row content hashes recorded for a successful session."""
+
+    session_id: str
+    source_key: str
+    created_at: str
+    rows: dict[str, tuple[str, str | None]]  # row_id -> (row_hash, row JSON)
+
+
 class ChangeLog:
     """
     SQLite-based changelog for auditing and rollback.
@@ -100,7 +150,7 @@ class ChangeLog:
     - Query capability
     """
 
-    def __init__(self, db_path: str) -> None:
+    def __init__(self, db_path: str | Path) -> None:
         """
         Initialize ChangeLog.
 
@@ -134,11 +184,110 @@ class ChangeLog:
         """
         )
 
-        # Create indexes
+        # Create indexes. (session_id, success) also serves session_id-only lookups,
+        # so the older single-column index is dropped.
+        conn.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_changelog_session_success
+            ON changelog(session_id, success)
+        """
+        )
+        conn.execute("DROP INDEX IF EXISTS idx_session_id_changelog")
+
         conn.execute(
             """
-            CREATE INDEX IF NOT EXISTS idx_session_id_changelog
-            ON changelog(session_id)
+            CREATE INDEX IF NOT EXISTS idx_changelog_resource
+            ON changelog(object_type, resource_id)
+        """
+        )
+
+        # Per-session summary, maintained by record_operation
+        has_sessions = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sessions'"
+        ).fetchone()
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS sessions (
+                session_id TEXT PRIMARY KEY,
+                start_time TEXT NOT NULL,
+                end_time TEXT NOT NULL,
+                total_operations INTEGER NOT NULL,
+                successful INTEGER NOT NULL,
+                failed INTEGER NOT NULL
+            )
+        """
+        )
+        conn.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_sessions_start_time
+            ON sessions(start_time)
+        """
+        )
+        if not has_sessions:
+            # Backfill summaries for databases written before the table existed
+            cursor = conn.execute(
+                """
+                INSERT INTO sessions (
+                    session_id, start_time, end_time, total_operations, successful, failed
+                )
+                SELECT
+                    session_id,
+                    MIN(timestamp),
+                    MAX(timestamp),
+                    COUNT(*),
+                    SUM(CASE WHEN success THEN 1 ELSE 0 END),
+                    SUM(CASE WHEN NOT success THEN 1 ELSE 0 END)
+                FROM changelog
+                GROUP BY session_id
+            """
+            )
+            if cursor.rowcount > 0:
+                logger.info("Backfilled changelog session summaries", sessions=cursor.rowcount)
+
+        # Row snapshots for incremental re-import
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS row_snapshots (
+                session_id TEXT PRIMARY KEY,
+                source_key TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                row_count INTEGER NOT NULL
+            )
+        """
+        )
+
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS row_hashes (
+                session_id TEXT NOT NULL,
+                row_id TEXT NOT NULL,
+                row_hash TEXT NOT NULL,
+                row_data TEXT,
+                PRIMARY KEY (session_id, row_id)
+            )
+        """
+        )
+
+        conn.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_row_snapshots_source
+            ON row_snapshots(source_key, created_at)
+        """
+        )
+
+        # Latency sums of successful operations per session and type, for the
+        # planner's cost model (see execution/cost_model.py)
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS operation_timings (
+                session_id TEXT NOT NULL,
+                object_type TEXT NOT NULL,
+                operation_type TEXT NOT NULL,
+                count INTEGER NOT NULL,
+                total_ms REAL NOT NULL,
+                total_sq_ms REAL NOT NULL,
+                PRIMARY KEY (session_id, object_type, operation_type)
+            )
         """
         )
 
@@ -156,6 +305,7 @@ class ChangeLog:
         error_message: str | None = None,
         before_state: dict[str, Any] | None = None,
         after_state: dict[str, Any] | None = None,
+        duration_ms: float | None = None,
     ) -> int:
         """
         Record an operation in the changelog.
@@ -168,52 +318,128 @@ class ChangeLog:
             success: Whether operation succeeded
             resource_id: BAM resource ID
             error_message: Error details if failed
-            before_state: Resource state before operation
-            after_state: Resource state after operation
+            before_state: Resource state before operation (stored as a JSON object)
+            after_state: Resource state after operation (stored as a JSON object)
+            duration_ms: Operation latency, added to the session's timings if successful
 
         Returns:
             ID of inserted record
         """
-        entry = ChangeLogEntry(
-            id=None,
-            session_id=session_id,
-            timestamp=datetime.utcnow().isoformat(),
-            row_id=str(row_id),
-            object_type=object_type,
-            operation_type=operation_type,
-            success=success,
-            resource_id=resource_id,
-            error_message=error_message,
-            before_state=json.dumps(before_state) if before_state else None,
-            after_state=json.dumps(after_state) if after_state else None,
-        )
-
-        cursor = self.conn.execute(
-            """
-            INSERT INTO changelog (
-                session_id, timestamp, row_id, object_type, operation_type,
-                success, resource_id, error_message, before_state, after_state
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                entry.session_id,
-                entry.timestamp,
-                entry.row_id,
-                entry.object_type,
-                entry.operation_type,
-                entry.success,
-                entry.resource_id,
-                entry.error_message,
-                entry.before_state,
-                entry.after_state,
-            ),
+        cursor = self._insert(
+            session_id,
+            [
+                {
+                    "row_id": row_id,
+                    "object_type": object_type,
+                    "operation_type": operation_type,
+                    "success": success,
+                    "resource_id": resource_id,
+                    "error_message": error_message,
+                    "before_state": before_state,
+                    "after_state": after_state,
+                    "duration_ms": duration_ms,
+                }
+            ],
         )
 
-        self.conn.commit()
         entry_id = cursor.lastrowid
         assert entry_id is not None, "INSERT should always set lastrowid"
         return entry_id
 
+    def record_operations(self, session_id: str, operations: list[dict[str, Any]]) -> int:
+        """
+        Record several operations of a session in one transaction.
+
+        Args:
+            session_id: Session identifier
+            operations: Keyword arguments of record_operation (without session_id),
+                one dict per operation
+
+        Returns:
+            Number of entries recorded
+        """
+        if operations:
+            self._insert(session_id, operations)
+        return len(operations)
+
+    def _insert(self, session_id: str, operations: list[dict[str, Any]]) -> sqlite3.Cursor:
+        """Insert entries and update the session summary; returns the last insert's cursor."""
+        timestamp = datetime.utcnow().isoformat()
+        values = []
+        successful = 0
+        timings: dict[tuple[str, str], list[float]] = {}
+        for op in operations:
+            before_state = op.get("before_state")
+            after_state = op.get("after_state")
+            success = bool(op["success"])
+            successful += success
+            if success and op.get("duration_ms") is not None:
+                timing = timings.setdefault((op["object_type"], op["operation_type"]), [0, 0, 0])
+                timing[0] += 1
+                timing[1] += op["duration_ms"]
+                timing[2] += op["duration_ms"] ** 2
+            values.append(
+                (
+                    session_id,
+                    timestamp,
+                    str(op["row_id"]),
+                    op["object_type"],
+                    op["operation_type"],
+                    success,
+                    op.get("resource_id"),
+                    op.get("error_message"),
+                    json.dumps(before_state, default=str) if before_state else None,
+                    json.dumps(after_state, default=str) if after_state else None,
+                )
+            )
+
+        # Entries and session summary are written in one transaction
+        with self.conn:
+            insert = """
+                INSERT INTO changelog (
+                    session_id, timestamp, row_id, object_type, operation_type,
+                    success, resource_id, error_message, before_state, after_state
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """
+            if len(values) > 1:
+                self.conn.executemany(insert, values[:-1])
+            cursor = self.conn.execute(insert, values[-1])
+            self.conn.execute(
+                """
+                INSERT INTO sessions (
+                    session_id, start_time, end_time, total_operations, successful, failed
+                ) VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(session_id) DO UPDATE SET
+                    start_time = MIN(start_time, excluded.start_time),
+                    end_time = MAX(end_time, excluded.end_time),
+                    total_operations = total_operations + excluded.total_operations,
+                    successful = successful + excluded.successful,
+                    failed = failed + excluded.failed
+                """,
+                (
+                    session_id,
+                    timestamp,
+                    timestamp,
+                    len(values),
+                    successful,
+                    len(values) - successful,
+                ),
+            )
+            if timings:
+                self.conn.executemany(
+                    """
+                    INSERT INTO operation_timings (
+                        session_id, object_type, operation_type, count, total_ms, total_sq_ms
+                    ) VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(session_id, object_type, operation_type) DO UPDATE SET
+                        count = count + excluded.count,
+                        total_ms = total_ms + excluded.total_ms,
+                        total_sq_ms = total_sq_ms + excluded.total_sq_ms
+                    """,
+                    [(session_id, *key, *timing) for key, timing in timings.items()],
+                )
+        return cursor
+
     def get_session_entries(self, session_id: str) -> list[ChangeLogEntry]:
         """
         Get all entries for a session.
@@ -235,32 +461,305 @@ class ChangeLog:
 
         return [self._row_to_entry(row) for row in cursor.fetchall()]
 
+    def iter_session_entries(
+        self,
+        session_id: str,
+        successful_only: bool = False,
+        reverse: bool = False,
+        batch_size: int = 1000,
+    ) -> Iterator[ChangeLogEntry]:
+        """
+        Stream the entries of a session without loading them all.
+
+        Args:
+            session_id: Session identifier
+            successful_only: Only yield successful entries
+            reverse: Yield newest entries first
+            batch_size: Rows fetched from SQLite per round trip
+
+        Yields:
+            Changelog entries in recording order (or reverse order)
+        """
+        query = "SELECT * FROM changelog WHERE session_id = ?"
+        if successful_only:
+            query += " AND success = 1"
+        query += " ORDER BY id DESC" if reverse else " ORDER BY id ASC"
+
+        cursor = self.conn.execute(query, (session_id,))
+        while rows := cursor.fetchmany(batch_size):
+            for row in rows:
+                yield self._row_to_entry(row)
+
     def get_sessions(self, limit: int = 10) -> list[dict[str, Any]]:
         """
         Get list of recent sessions with summary stats.
 
+        Reads the ``sessions`` summary table, so the cost does not grow with the
+        number of changelog entries.
+
         Args:
             limit: Maximum number of sessions to return
 
         Returns:
-            List of session summaries
-        """
-        query = """
-            SELECT
-                session_id,
-                MIN(timestamp) as start_time,
-                MAX(timestamp) as end_time,
-                COUNT(*) as total_operations,
-                SUM(CASE WHEN success THEN 1 ELSE 0 END) as successful,
-                SUM(CASE WHEN NOT success THEN 1 ELSE 0 END) as failed
-            FROM changelog
-            GROUP BY session_id
-            ORDER BY start_time DESC
+            List of session summaries, most recent first
+        """
+        cursor = self.conn.execute(
+            """
+            SELECT session_id, start_time, end_time, total_operations, successful, failed
+            FROM sessions
+            ORDER BY start_time DESC, rowid DESC
             LIMIT ?
+            """,
+            (limit,),
+        )
+        return [dict(row) for row in cursor.fetchall()]
+
+    def get_session(self, session_id: str) -> dict[str, Any] | None:
         """
+        Get the summary of one session.
 
-        cursor = self.conn.execute(query, (limit,))
-        return [dict(row) for row in cursor.fetchall()]
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            Session summary, or None if the session has no entries
+        """
+        row = self.conn.execute(
+            """
+            SELECT session_id, start_time, end_time, total_operations, successful, failed
+            FROM sessions
+            WHERE session_id = ?
+            """,
+            (session_id,),
+        ).fetchone()
+        return dict(row) if row else None
+
+    def get_operation_timings(
+        self, sessions: int = 20
+    ) -> dict[tuple[str, str], tuple[int, float, float]]:
+        """
+        Latency sums of successful operations in the most recent sessions.
+
+        Args:
+            sessions: Number of most recent sessions to include
+
+        Returns:
+            (object_type, operation_type) -> (count, total ms, total of squared ms)
+        """
+        cursor = self.conn.execute(
+            """
+            SELECT object_type, operation_type,
+                   SUM(count) AS count, SUM(total_ms) AS total_ms, SUM(total_sq_ms) AS total_sq_ms
+            FROM operation_timings
+            WHERE session_id IN (
+                SELECT session_id FROM sessions
+                ORDER BY start_time DESC, rowid DESC
+                LIMIT ?
+            )
+            GROUP BY object_type, operation_type
+            """,
+            (sessions,),
+        )
+        return {
+            (row["object_type"], row["operation_type"]): (
+                row["count"],
+                row["total_ms"],
+                row["total_sq_ms"],
+            )
+            for row in cursor.fetchall()
+        }
+
+    def get_failed_entries(self, session_id: str) -> list[ChangeLogEntry]:
+        """
+        Get the failed entries of a session.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            Failed changelog entries in recording order
+        """
+        cursor = self.conn.execute(
+            """
+            SELECT * FROM changelog
+            WHERE session_id = ? AND success = 0
+            ORDER BY id ASC
+            """,
+            (session_id,),
+        )
+        return [self._row_to_entry(row) for row in cursor.fetchall()]
+
+    def get_resource_history(self, object_type: str, resource_id: int) -> list[ChangeLogEntry]:
+        """
+        Get every entry recorded for a BAM resource, across sessions.
+
+        Args:
+            object_type: Type of resource (ip4_network, etc.)
+            resource_id: BAM resource ID
+
+        Returns:
+            Changelog entries for the resource in recording order
+        """
+        cursor = self.conn.execute(
+            """
+            SELECT * FROM changelog
+            WHERE object_type = ? AND resource_id = ?
+            ORDER BY id ASC
+            """,
+            (object_type, resource_id),
+        )
+        return [self._row_to_entry(row) for row in cursor.fetchall()]
+
+    def prune_sessions(
+        self,
+        older_than_days: int,
+        keep_last: int = 0,
+        dry_run: bool = False,
+    ) -> list[dict[str, Any]]:
+        """
+        Delete sessions whose latest entry is older than the retention window.
+
+        Entries, summaries and timings are removed in one transaction. Row
+        snapshots are left alone: incremental re-import already keeps only the
+        latest per file.
+
+        Args:
+            older_than_days: Retention window in days
+            keep_last: Always keep this many most recent sessions
+            dry_run: Only return the sessions that would be deleted
+
+        Returns:
+            Summaries of the pruned (or prunable, with dry_run) sessions
+        """
+        cutoff = (datetime.utcnow() - timedelta(days=older_than_days)).isoformat()
+        cursor = self.conn.execute(
+            """
+            SELECT session_id, start_time, end_time, total_operations, successful, failed
+            FROM sessions
+            WHERE end_time < ?
+              AND session_id NOT IN (
+                  SELECT session_id FROM sessions
+                  ORDER BY start_time DESC, rowid DESC
+                  LIMIT ?
+              )
+            ORDER BY start_time ASC
+            """,
+            (cutoff, keep_last),
+        )
+        sessions = [dict(row) for row in cursor.fetchall()]
+        if dry_run or not sessions:
+            return sessions
+
+        params = [(s["session_id"],) for s in sessions]
+        with self.conn:
+            self.conn.executemany("DELETE FROM changelog WHERE session_id = ?", params)
+            self.conn.executemany("DELETE FROM sessions WHERE session_id = ?", params)
+            self.conn.executemany("DELETE FROM operation_timings WHERE session_id = ?", params)
+
+        logger.info(
+            "Pruned changelog sessions",
+            sessions=len(sessions),
+            entries=sum(s["total_operations"] for s in sessions),
+            older_than_days=older_than_days,
+        )
+        return sessions
+
+    def compact(self) -> None:
+        """Reclaim space freed by pruning and refresh query planner statistics."""
+        self.conn.execute("VACUUM")
+        self.conn.execute("PRAGMA optimize")
+
+    def record_row_snapshot(
+        self,
+        session_id: str,
+        source_key: str,
+        fingerprints: Mapping[str, tuple[str, str | None]],
+    ) -> None:
+        """
+        Store the per-row content hashes of a successfully applied file.
+
+        Older snapshots of the same file are removed in the same transaction,
+        so only the latest successful run is kept.
+
+        Args:
+            session_id: Session that applied the file
+            source_key: Logical file identity
+            fingerprints: Mapping of row_id -> (row_hash, row JSON)
+        """
+        with self.conn:
+            stale = [
+                row["session_id"]
+                for row in self.conn.execute(
+                    "SELECT session_id FROM row_snapshots WHERE source_key = ?",
+                    (source_key,),
+                )
+            ]
+            stale.append(session_id)
+            self.conn.executemany(
+                "DELETE FROM row_hashes WHERE session_id = ?", [(s,) for s in stale]
+            )
+            self.conn.executemany(
+                "DELETE FROM row_snapshots WHERE session_id = ?", [(s,) for s in stale]
+            )
+
+            self.conn.execute(
+                """
+                INSERT INTO row_snapshots (session_id, source_key, created_at, row_count)
+                VALUES (?, ?, ?, ?)
+                """,
+                (session_id, source_key, datetime.utcnow().isoformat(), len(fingerprints)),
+            )
+            self.conn.executemany(
+                """
+                INSERT INTO row_hashes (session_id, row_id, row_hash, row_data)
+                VALUES (?, ?, ?, ?)
+                """,
+                (
+                    (session_id, row_id, row_hash, row_data)
+                    for row_id, (row_hash, row_data) in fingerprints.items()
+                ),
+            )
+
+        logger.debug(
+            "Recorded row snapshot",
+            session_id=session_id,
+            source_key=source_key,
+            rows=len(fingerprints),
+        )
+
+    def get_latest_row_snapshot(self, source_key: str) -> RowSnapshot | None:
+        """
+        Get the latest row snapshot recorded for a file.
+
+        Args:
+            source_key: Logical file identity
+
+        Returns:
+            RowSnapshot, or None if the file was never applied successfully
+        """
+        snapshot = self.conn.execute(
+            """
+            SELECT session_id, source_key, created_at FROM row_snapshots
+            WHERE source_key = ?
+            ORDER BY created_at DESC
+            LIMIT 1
+            """,
+            (source_key,),
+        ).fetchone()
+
+        if snapshot is None:
+            return None
+
+        cursor = self.conn.execute(
+            "SELECT row_id, row_hash, row_data FROM row_hashes WHERE session_id = ?",
+            (snapshot["session_id"],),
+        )
+        return RowSnapshot(
+            session_id=snapshot["session_id"],
+            source_key=snapshot["source_key"],
+            created_at=snapshot["created_at"],
+            rows={row["row_id"]: (row["row_hash"], row["row_data"]) for row in cursor},
+        )
 
     def _row_to_entry(self, row: sqlite3.Row) -> ChangeLogEntry:
         """
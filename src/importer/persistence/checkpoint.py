@@ -40,7 +40,7 @@ class CheckpointManager:
     - Automatic cleanup of old checkpoints
     """
 
-    def __init__(self, db_path: str) -> None:
+    def __init__(self, db_path: str | Path) -> None:
         """
         Initialize CheckpointManager.
 
@@ -102,13 +102,15 @@ class CheckpointManager:
         """
         )
 
-        # Create indexes
+        # Create indexes. (session_id, timestamp) serves both session lookups and
+        # the latest-checkpoint query used by resume and `status`.
         conn.execute(
             """
-            CREATE INDEX IF NOT EXISTS idx_session_id
-            ON checkpoints(session_id)
+            CREATE INDEX IF NOT EXISTS idx_checkpoints_session_timestamp
+            ON checkpoints(session_id, timestamp)
         """
         )
+        conn.execute("DROP INDEX IF EXISTS idx_session_id")
 
         conn.execute(
             """
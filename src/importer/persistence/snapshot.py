@@ -0,0 +1,541 @@
+"""Local snapshot of BAM configurations for offline resolution and validation.
+
+Purpose:
+-------
+Resolving a large CSV asks BAM the same kind of question thousands of times
+("does block 10.0.0.0/8 exist in Default?", "which network holds 10.1.2.3?").
+A SnapshotStore keeps a compact, indexed copy of one or more configurations
+(views, blocks, networks, zones and optionally addresses and resource records)
+in a single SQLite file so those questions are answered locally. The store is
+filled and refreshed by ``bam/snapshot.py``; reads go through
+``SnapshotReadClient``, which applies the freshness policy.
+
+Database Schema:
+---------------
+```
+configurations (
+    id           INTEGER PRIMARY KEY,  -- BAM configuration ID
+    name         TEXT UNIQUE NOT NULL, -- Configuration name
+    collections  TEXT NOT NULL,        -- Comma-separated collections captured
+    synced_at    TEXT NOT NULL,        -- ISO timestamp of the last full pull
+    refreshed_at TEXT NOT NULL,        -- ISO timestamp of the last pull or refresh
+    watermark    TEXT                  -- Newest BAM transaction time applied (NULL if
+                                       -- the server exposes no transaction log)
+)
+
+entities (
+    id          INTEGER PRIMARY KEY,   -- BAM resource ID
+    config_id   INTEGER NOT NULL,      -- Owning configuration
+    collection  TEXT NOT NULL,         -- REST v2 collection (blocks, networks, ...)
+    parent_id   INTEGER,               -- Parent resource ID
+    view_id     INTEGER,               -- Owning view (zones and records only)
+    key         TEXT,                  -- Identity: normalized CIDR/address or name
+    version     INTEGER,               -- IP version of range/address resources
+    first       BLOB,                  -- First address as a 16-byte big-endian integer
+    last        BLOB,                  -- Last address as a 16-byte big-endian integer
+    data        TEXT NOT NULL          -- Resource JSON (without HAL links)
+)
+```
+
+Range Queries:
+-------------
+IP bounds are stored as fixed-width big-endian integers so SQLite's byte-wise
+BLOB comparison orders them numerically for both IPv4 and IPv6. The index on
+(config_id, collection, version, first DESC, last) answers "smallest block or
+network containing X" by walking backwards from X and stopping at the first
+range whose end covers it.
+
+Usage:
+-----
+```python
+with SnapshotStore(".snapshots/bam.db") as store:
+    config = store.get_configuration("Default")
+    block = store.find_child(config.id, "blocks", "10.0.0.0/8")
+```
+"""
+
+import json
+import sqlite3
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+import structlog
+
+from ..utils.ipnet import try_parse_address, try_parse_network
+
+logger = structlog.get_logger(__name__)
+
+# Identity field per collection (resources not listed are identified by name)
+_KEY_FIELDS = {
+    "blocks": "range",
+    "networks": "range",
+    "addresses": "address",
+    "zones": "absoluteName",
+    "resourceRecords": "absoluteName",
+}
+
+# Byte width of stored range bounds (wide enough for IPv6)
+_BOUND_BYTES = 16
+
+
+@dataclass(frozen=True)
+class SnapshotRecord:
+    """A resource ready to be written to the store."""
+
+    collection: str
+    entity: dict[str, Any]
+    parent_id: int | None
+    view_id: int | None = None
+
+
+@dataclass
+class SnapshotConfiguration:
+    """A configuration captured in the store."""
+
+    id: int
+    name: str
+    collections: tuple[str, ...]
+    synced_at: str
+    refreshed_at: str
+    watermark: str | None
+
+    def age_seconds(self, now: datetime | None = None) -> float:
+        """Seconds since the configuration was last pulled or refreshed."""
+        now = now or datetime.utcnow()
+        return (now - datetime.fromisoformat(self.refreshed_at)).total_seconds()
+
+
+def snapshot_key(collection: str, value: Any) -> str | None:
+    """
+    Normalize an identity value the way the store indexes it.
+
+    CIDRs and addresses are canonicalized (host bits cleared, IPv6 compressed)
+    and DNS names lose their trailing dot, so lookups match regardless of spelling.
+    """
+    if value is None:
+        return None
+    text = str(value)
+    field_name = _KEY_FIELDS.get(collection, "name")
+    if field_name == "range":
+        network = try_parse_network(text)
+        return network.cidr if network else text
+    if field_name == "address":
+        address = try_parse_address(text)
+        return address.text if address else text
+    return text.rstrip(".")
+
+
+def _bounds(
+    collection: str, entity: dict[str, Any]
+) -> tuple[int | None, bytes | None, bytes | None]:
+    """IP version and range bounds of a resource (all None for non-IP resources)."""
+    field_name = _KEY_FIELDS.get(collection)
+    if field_name == "range":
+        network = try_parse_network(entity.get("range"))
+        if network is not None:
+            return network.version, _encode(network.first), _encode(network.last)
+    elif field_name == "address":
+        address = try_parse_address(entity.get("address"))
+        if address is not None:
+            value = _encode(address.value)
+            return address.version, value, value
+    return None, None, None
+
+
+def _encode(value: int) -> bytes:
+    return value.to_bytes(_BOUND_BYTES, "big")
+
+
+class SnapshotStore:
+    """
+    SQLite store holding a local copy of BAM configurations.
+
+    Writes replace or patch one configuration at a time inside a transaction,
+    so readers never observe a half-written configuration.
+    """
+
+    def __init__(self, db_path: str | Path) -> None:
+        """
+        Initialize SnapshotStore.
+
+        Args:
+            db_path: Path to SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn: sqlite3.Connection = self._initialize_db()
+
+    def _initialize_db(self) -> sqlite3.Connection:
+        """Initialize database schema."""
+        conn = sqlite3.connect(str(self.db_path))
+        conn.row_factory = sqlite3.Row
+
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS configurations (
+                id INTEGER PRIMARY KEY,
+                name TEXT UNIQUE NOT NULL,
+                collections TEXT NOT NULL,
+                synced_at TEXT NOT NULL,
+                refreshed_at TEXT NOT NULL,
+                watermark TEXT
+            )
+        """
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS entities (
+                id INTEGER PRIMARY KEY,
+                config_id INTEGER NOT NULL,
+                collection TEXT NOT NULL,
+                parent_id INTEGER,
+                view_id INTEGER,
+                key TEXT,
+                version INTEGER,
+                first BLOB,
+                last BLOB,
+                data TEXT NOT NULL
+            )
+        """
+        )
+        conn.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_entities_key
+            ON entities(config_id, collection, key)
+        """
+        )
+        conn.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_entities_parent
+            ON entities(parent_id, collection, key)
+        """
+        )
+        conn.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_entities_view
+            ON entities(view_id, collection, key)
+        """
+        )
+        conn.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_entities_range
+            ON entities(config_id, collection, version, first DESC, last)
+        """
+        )
+        conn.commit()
+        return conn
+
+    # ------------------------------------------------------------------
+    # Configurations
+    # ------------------------------------------------------------------
+
+    def configurations(self) -> list[SnapshotConfiguration]:
+        """Return every configuration in the store, by name."""
+        rows = self.conn.execute("SELECT * FROM configurations ORDER BY name").fetchall()
+        return [self._configuration(row) for row in rows]
+
+    def get_configuration(self, name: str) -> SnapshotConfiguration | None:
+        """Return a configuration by name, or None if it is not in the store."""
+        row = self.conn.execute("SELECT * FROM configurations WHERE name = ?", (name,)).fetchone()
+        return self._configuration(row) if row else None
+
+    def replace_configuration(
+        self,
+        config: dict[str, Any],
+        records: Iterable[SnapshotRecord],
+        collections: Iterable[str],
+        watermark: str | None = None,
+    ) -> int:
+        """
+        Replace everything stored for a configuration with a fresh pull.
+
+        Args:
+            config: Configuration resource as returned by BAM
+            records: Resources of the configuration (the configuration itself excluded)
+            collections: Collections the pull covered
+            watermark: Newest BAM transaction time at the start of the pull
+
+        Returns:
+            Number of resources stored (including the configuration)
+        """
+        config_id = config["id"]
+        now = datetime.utcnow().isoformat()
+        with self.conn:
+            self.conn.execute("DELETE FROM entities WHERE config_id = ?", (config_id,))
+            self.conn.execute(
+                "DELETE FROM configurations WHERE id = ? OR name = ?", (config_id, config["name"])
+            )
+            self.conn.execute(
+                """
+                INSERT INTO configurations (
+                    id, name, collections, synced_at, refreshed_at, watermark
+                ) VALUES (?, ?, ?, ?, ?, ?)
+            """,
+                (config_id, config["name"], ",".join(collections), now, now, watermark),
+            )
+            count = self._upsert(
+                config_id,
+                [SnapshotRecord("configurations", config, None), *records],
+            )
+        logger.info("Snapshot stored", configuration=config["name"], resources=count)
+        return count
+
+    def apply_changes(
+        self,
+        config_id: int,
+        upserts: Iterable[SnapshotRecord],
+        deletes: Iterable[int],
+        watermark: str | None,
+    ) -> tuple[int, int]:
+        """
+        Patch a configuration with changed and deleted resources.
+
+        Deleting a resource also deletes everything stored below it, as BAM does.
+
+        Args:
+            config_id: Configuration to patch
+            upserts: Added or updated resources
+            deletes: IDs of deleted resources
+            watermark: Newest BAM transaction time applied
+
+        Returns:
+            Tuple of (resources written, resources deleted)
+        """
+        delete_ids = list(deletes)
+        with self.conn:
+            written = self._upsert(config_id, upserts)
+            # rowcount is not reported for statements starting with WITH
+            changes_before = self.conn.total_changes
+            for start in range(0, len(delete_ids), 500):
+                chunk = delete_ids[start : start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                self.conn.execute(
+                    f"""
+                    WITH RECURSIVE doomed(id) AS (
+                        SELECT id FROM entities
+                        WHERE config_id = ? AND id IN ({placeholders})
+                        UNION
+                        SELECT e.id FROM entities e JOIN doomed d ON e.parent_id = d.id
+                    )
+                    DELETE FROM entities WHERE id IN (SELECT id FROM doomed)
+                """,
+                    (config_id, *chunk),
+                )
+            removed = self.conn.total_changes - changes_before
+            self.conn.execute(
+                """
+                UPDATE configurations
+                SET refreshed_at = ?, watermark = COALESCE(?, watermark)
+                WHERE id = ?
+            """,
+                (datetime.utcnow().isoformat(), watermark, config_id),
+            )
+        return written, removed
+
+    def remove_configuration(self, name: str) -> bool:
+        """
+        Drop a configuration and its resources.
+
+        Returns:
+            True if the configuration was in the store
+        """
+        config = self.get_configuration(name)
+        if config is None:
+            return False
+        with self.conn:
+            self.conn.execute("DELETE FROM entities WHERE config_id = ?", (config.id,))
+            self.conn.execute("DELETE FROM configurations WHERE id = ?", (config.id,))
+        return True
+
+    def count(self, config_id: int) -> int:
+        """Number of resources stored for a configuration."""
+        row = self.conn.execute(
+            "SELECT COUNT(*) FROM entities WHERE config_id = ?", (config_id,)
+        ).fetchone()
+        count: int = row[0]
+        return count
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def get(self, entity_id: int) -> dict[str, Any] | None:
+        """Return a resource by ID."""
+        row = self.conn.execute("SELECT data FROM entities WHERE id = ?", (entity_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def locate(self, entity_id: int) -> tuple[int, str, int | None] | None:
+        """Return (config_id, collection, view_id) of a stored resource."""
+        row = self.conn.execute(
+            "SELECT config_id, collection, view_id FROM entities WHERE id = ?", (entity_id,)
+        ).fetchone()
+        return (row[0], row[1], row[2]) if row else None
+
+    def find(self, config_id: int, collection: str, value: Any) -> dict[str, Any] | None:
+        """Return a resource of a collection by identity anywhere in a configuration."""
+        row = self.conn.execute(
+            "SELECT data FROM entities WHERE config_id = ? AND collection = ? AND key = ? LIMIT 1",
+            (config_id, collection, snapshot_key(collection, value)),
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def find_child(self, parent_id: int, collection: str, value: Any) -> dict[str, Any] | None:
+        """Return a direct child of a resource by identity."""
+        row = self.conn.execute(
+            "SELECT data FROM entities WHERE parent_id = ? AND collection = ? AND key = ? LIMIT 1",
+            (parent_id, collection, snapshot_key(collection, value)),
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def find_in_view(self, view_id: int, collection: str, value: Any) -> dict[str, Any] | None:
+        """Return a zone or record by absolute name anywhere below a view."""
+        row = self.conn.execute(
+            "SELECT data FROM entities WHERE view_id = ? AND collection = ? AND key = ? LIMIT 1",
+            (view_id, collection, snapshot_key(collection, value)),
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def children(self, parent_id: int, collection: str) -> list[dict[str, Any]]:
+        """Return the direct children of a resource in one collection, in ID order."""
+        rows = self.conn.execute(
+            "SELECT data FROM entities WHERE parent_id = ? AND collection = ? ORDER BY id",
+            (parent_id, collection),
+        ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def find_containing(self, config_id: int, collection: str, value: str) -> dict[str, Any] | None:
+        """
+        Return the smallest range resource containing a CIDR or address.
+
+        Args:
+            config_id: Configuration to search
+            collection: "blocks" or "networks"
+            value: CIDR (``10.1.0.0/24``) or address (``10.1.0.5``)
+
+        Returns:
+            The most specific containing resource, or None
+        """
+        target = try_parse_network(value) if "/" in value else try_parse_address(value)
+        if target is None:
+            return None
+        if "/" in value:
+            first, last = target.first, target.last  # type: ignore[union-attr]
+        else:
+            first = last = target.value  # type: ignore[union-attr]
+        cursor = self.conn.execute(
+            """
+            SELECT data, last FROM entities
+            WHERE config_id = ? AND collection = ? AND version = ? AND first <= ?
+            ORDER BY first DESC, last
+        """,
+            (config_id, collection, target.version, _encode(first)),
+        )
+        wanted = _encode(last)
+        for data, range_last in cursor:
+            if range_last >= wanted:
+                entity: dict[str, Any] = json.loads(data)
+                return entity
+        return None
+
+    def existing_keys(self, scope_id: int, collection: str, values: Iterable[Any]) -> set[str]:
+        """
+        Return which identity values already exist.
+
+        Zones and records are scoped to a view; everything else to a configuration.
+
+        Args:
+            scope_id: View ID for zones/records, configuration ID otherwise
+            collection: Collection to check
+            values: Identity values as spelled in the input
+
+        Returns:
+            The subset of ``values`` (original spelling) that exist
+        """
+        by_key: dict[str, list[str]] = {}
+        for value in values:
+            key = snapshot_key(collection, value)
+            if key is not None:
+                by_key.setdefault(key, []).append(str(value))
+        scope_column = "view_id" if collection in ("zones", "resourceRecords") else "config_id"
+
+        found: set[str] = set()
+        keys = list(by_key)
+        for start in range(0, len(keys), 500):
+            chunk = keys[start : start + 500]
+            rows = self.conn.execute(
+                f"""
+                SELECT DISTINCT key FROM entities
+                WHERE {scope_column} = ? AND collection = ? AND key IN ({",".join("?" * len(chunk))})
+            """,
+                (scope_id, collection, *chunk),
+            ).fetchall()
+            for row in rows:
+                found.update(by_key[row[0]])
+        return found
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _upsert(self, config_id: int, records: Iterable[SnapshotRecord]) -> int:
+        """Insert or replace resources (caller holds the transaction)."""
+        rows = []
+        for record in records:
+            entity = {k: v for k, v in record.entity.items() if k not in ("_links", "_embedded")}
+            version, first, last = _bounds(record.collection, entity)
+            field_name = _KEY_FIELDS.get(record.collection, "name")
+            rows.append(
+                (
+                    entity["id"],
+                    config_id,
+                    record.collection,
+                    record.parent_id,
+                    record.view_id,
+                    snapshot_key(record.collection, entity.get(field_name)),
+                    version,
+                    first,
+                    last,
+                    json.dumps(entity, separators=(",", ":")),
+                )
+            )
+        self.conn.executemany(
+            """
+            INSERT OR REPLACE INTO entities (
+                id, config_id, collection, parent_id, view_id, key, version, first, last, data
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+            rows,
+        )
+        return len(rows)
+
+    @staticmethod
+    def _configuration(row: sqlite3.Row) -> SnapshotConfiguration:
+        return SnapshotConfiguration(
+            id=row["id"],
+            name=row["name"],
+            collections=tuple(c for c in row["collections"].split(",") if c),
+            synced_at=row["synced_at"],
+            refreshed_at=row["refreshed_at"],
+            watermark=row["watermark"],
+        )
+
+    def close(self) -> None:
+        """Close database connection."""
+        self.conn.close()
+
+    def __enter__(self) -> "SnapshotStore":
+        """Context manager entry."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Context manager exit."""
+        self.close()
@@ -0,0 +1,728 @@
+"""Durable work queue shared by a coordinator and its workers.
+
+Purpose:
+-------
+``apply --coordinator QUEUE_DB`` plans an import and publishes its dependency
+graph here instead of executing it; ``bluecat-import worker QUEUE_DB``
+processes on any number of hosts lease ready operations, execute them and
+report their results (and the IDs of what they created) back. The
+coordinator streams the reported results into the session's result pipeline.
+
+Database Schema:
+---------------
+```
+work_sessions (
+    session_id      TEXT PRIMARY KEY,
+    created_at      TEXT NOT NULL,
+    input_hash      TEXT,                -- Input file hash (reattach on restart)
+    dry_run         INTEGER NOT NULL,    -- Workers simulate execution
+    allow_dangerous INTEGER NOT NULL,    -- Workers may delete critical resources
+    total           INTEGER NOT NULL,    -- Operations, excluding phase barriers
+    consumed        INTEGER NOT NULL     -- Last result seq the coordinator consumed
+)
+
+work_items (
+    session_id      TEXT NOT NULL,
+    node_id         TEXT NOT NULL,       -- Dependency graph node ID
+    seq             INTEGER NOT NULL,    -- Lease order (see publish)
+    row_id          TEXT NOT NULL,       -- JSON row ID (keeps int vs str)
+    object_type     TEXT NOT NULL,
+    operation_type  TEXT NOT NULL,
+    operation       BLOB NOT NULL,       -- Pickled Operation
+    state           TEXT NOT NULL,       -- blocked, ready, leased, done, failed, skipped
+    remaining       INTEGER NOT NULL,    -- Dependencies not done yet
+    lease_owner     TEXT,
+    lease_expires   REAL,                -- Unix time
+    attempts        INTEGER NOT NULL,    -- Times leased
+    PRIMARY KEY (session_id, node_id)
+)
+
+work_edges (session_id, node_id, dependent_id)          -- dependent waits for node
+work_results (seq, session_id, node_id, result)         -- JSON OperationResult
+work_resources (seq, session_id, resource_type, resource_key, bam_id)
+```
+
+Dependencies:
+------------
+An item becomes ready when its last dependency is done, in the transaction
+that reports that dependency's result and created resources, so a worker
+that loads the created resources before leasing sees every parent of what
+it leases. Phase barriers complete as soon as they are released. A failed
+item skips all of its transitive dependents, with the skip reason the
+in-process executor uses.
+
+Leases:
+------
+Leasing takes ready items in ``seq`` order. A lease expires after
+``lease_seconds`` unless the worker renews it; expired items go back to
+ready, and an item whose lease expired ``max_attempts`` times is failed.
+Reports for a lease the worker no longer holds are ignored.
+
+Every write runs in one ``BEGIN IMMEDIATE`` transaction, so any number of
+processes can share the file. The database uses SQLite's default rollback
+journal rather than WAL, which needs shared memory: across hosts the file
+must be on a filesystem with working POSIX locks.
+
+Operations are pickled: the coordinator and its workers must run the same
+version of the importer, and the queue file must be as trusted as the
+configuration.
+"""
+
+import json
+import pickle
+import sqlite3
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+import structlog
+
+from ..constants import MAX_LEASE_ATTEMPTS
+from ..models.operations import Operation, OperationType
+from ..models.results import OperationResult
+
+logger = structlog.get_logger(__name__)
+
+_BARRIER = "system_barrier"
+_OPEN_STATES = ("blocked", "ready", "leased")
+
+
+@dataclass
+class QueueSession:
+    """A session published to the work queue."""
+
+    session_id: str
+    dry_run: bool
+    allow_dangerous_operations: bool
+    total: int
+    consumed: int
+    input_hash: str | None = None
+
+
+@dataclass
+class WorkItem:
+    """A leased operation."""
+
+    node_id: str
+    operation: Operation
+    attempts: int
+
+
+def result_to_json(result: OperationResult) -> str:
+    """Serialize an operation result."""
+    return json.dumps(
+        {
+            "row_id": result.row_id,
+            "operation": result.operation.value,
+            "success": result.success,
+            "resource_id": result.resource_id,
+            "error_message": result.error_message,
+            "duration_ms": result.duration_ms,
+            "before_state": result.before_state,
+            "after_state": result.after_state,
+            "metadata": result.metadata,
+        },
+        default=str,
+    )
+
+
+def result_from_json(data: str) -> OperationResult:
+    """Deserialize an operation result written by result_to_json."""
+    fields = json.loads(data)
+    fields["operation"] = OperationType(fields["operation"])
+    return OperationResult(**fields)
+
+
+class WorkQueue:
+    """SQLite work queue of one or more import sessions."""
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        busy_timeout: float = 30.0,
+        max_attempts: int = MAX_LEASE_ATTEMPTS,
+    ) -> None:
+        """
+        Open (or create) a work queue.
+
+        Args:
+            db_path: Path to SQLite database file
+            busy_timeout: Seconds to wait for another process's transaction
+            max_attempts: Expired leases after which an item is failed
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_attempts = max_attempts
+        # Autocommit: transactions are explicit BEGIN IMMEDIATE blocks
+        self.conn = sqlite3.connect(str(self.db_path), timeout=busy_timeout, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self._initialize_db()
+
+    def _initialize_db(self) -> None:
+        """Initialize database schema."""
+        self.conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS work_sessions (
+                session_id TEXT PRIMARY KEY,
+                created_at TEXT NOT NULL,
+                input_hash TEXT,
+                dry_run INTEGER NOT NULL,
+                allow_dangerous INTEGER NOT NULL,
+                total INTEGER NOT NULL,
+                consumed INTEGER NOT NULL DEFAULT 0
+            );
+            CREATE TABLE IF NOT EXISTS work_items (
+                session_id TEXT NOT NULL,
+                node_id TEXT NOT NULL,
+                seq INTEGER NOT NULL,
+                row_id TEXT NOT NULL,
+                object_type TEXT NOT NULL,
+                operation_type TEXT NOT NULL,
+                operation BLOB NOT NULL,
+                state TEXT NOT NULL,
+                remaining INTEGER NOT NULL,
+                lease_owner TEXT,
+                lease_expires REAL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (session_id, node_id)
+            );
+            CREATE INDEX IF NOT EXISTS idx_work_items_state
+                ON work_items(session_id, state, seq);
+            CREATE TABLE IF NOT EXISTS work_edges (
+                session_id TEXT NOT NULL,
+                node_id TEXT NOT NULL,
+                dependent_id TEXT NOT NULL,
+                PRIMARY KEY (session_id, node_id, dependent_id)
+            );
+            CREATE TABLE IF NOT EXISTS work_results (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                session_id TEXT NOT NULL,
+                node_id TEXT NOT NULL,
+                result TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_work_results_session
+                ON work_results(session_id, seq);
+            CREATE TABLE IF NOT EXISTS work_resources (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                session_id TEXT NOT NULL,
+                resource_type TEXT NOT NULL,
+                resource_key TEXT NOT NULL,
+                bam_id INTEGER NOT NULL,
+                UNIQUE (session_id, resource_type, resource_key)
+            );
+            """
+        )
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run a write transaction, taking the database write lock up front."""
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield self.conn
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.conn.execute("COMMIT")
+
+    # --- Coordinator -------------------------------------------------------
+
+    def publish(
+        self,
+        session_id: str,
+        graph: Any,
+        dry_run: bool = False,
+        allow_dangerous_operations: bool = False,
+        input_hash: str | None = None,
+        priorities: dict[str, Any] | None = None,
+    ) -> bool:
+        """
+        Publish a session's dependency graph.
+
+        Args:
+            session_id: Session identifier
+            graph: Validated DependencyGraph, depths calculated
+            dry_run: Workers simulate execution without API calls
+            allow_dangerous_operations: Workers may delete critical resources
+            input_hash: Input file hash (see find_session)
+            priorities: Sort key per node ID; ready items are leased in
+                ascending order (default: dependency depth, then graph order)
+
+        Returns:
+            False if the session was already published (nothing changed)
+        """
+        if priorities is None:
+            nodes = sorted(graph.nodes.values(), key=lambda node: node.depth)
+        else:
+            nodes = sorted(graph.nodes.values(), key=lambda node: priorities[node.node_id])
+        total = sum(1 for node in nodes if node.operation.object_type != _BARRIER)
+        with self._transaction() as conn:
+            exists = conn.execute(
+                "SELECT 1 FROM work_sessions WHERE session_id = ?", (session_id,)
+            ).fetchone()
+            if exists:
+                return False
+            conn.execute(
+                """
+                INSERT INTO work_sessions
+                    (session_id, created_at, input_hash, dry_run, allow_dangerous, total)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    session_id,
+                    datetime.now().isoformat(),
+                    input_hash,
+                    int(dry_run),
+                    int(allow_dangerous_operations),
+                    total,
+                ),
+            )
+            conn.executemany(
+                """
+                INSERT INTO work_items (session_id, node_id, seq, row_id, object_type,
+                    operation_type, operation, state, remaining)
+                VALUES (?, ?, ?, ?, ?, ?, ?, 'blocked', ?)
+                """,
+                (
+                    (
+                        session_id,
+                        node.node_id,
+                        seq,
+                        json.dumps(node.operation.row_id),
+                        node.operation.object_type,
+                        node.operation.operation_type.value,
+                        pickle.dumps(node.operation, protocol=pickle.HIGHEST_PROTOCOL),
+                        len(node.dependencies),
+                    )
+                    for seq, node in enumerate(nodes)
+                ),
+            )
+            conn.executemany(
+                "INSERT INTO work_edges (session_id, node_id, dependent_id) VALUES (?, ?, ?)",
+                (
+                    (session_id, node.node_id, dependent)
+                    for node in nodes
+                    for dependent in node.dependents
+                ),
+            )
+            self._ready(conn, session_id, [node.node_id for node in nodes if not node.dependencies])
+        logger.info("Session published to work queue", session_id=session_id, operations=total)
+        return True
+
+    def find_session(self, input_hash: str) -> str | None:
+        """
+        Unfinished session published for an input file.
+
+        Args:
+            input_hash: Input file hash
+
+        Returns:
+            Most recent unfinished session ID, or None
+        """
+        row = self.conn.execute(
+            f"""
+            SELECT s.session_id FROM work_sessions s
+            WHERE s.input_hash = ? AND EXISTS (
+                SELECT 1 FROM work_items i
+                WHERE i.session_id = s.session_id AND i.state IN {_OPEN_STATES}
+            )
+            ORDER BY s.created_at DESC LIMIT 1
+            """,
+            (input_hash,),
+        ).fetchone()
+        return row["session_id"] if row else None
+
+    def results(
+        self, session_id: str, after: int = 0, limit: int = 1000
+    ) -> list[tuple[int, OperationResult]]:
+        """
+        Reported results, in report order.
+
+        Args:
+            session_id: Session identifier
+            after: Return results after this sequence number
+            limit: Most results to return
+
+        Returns:
+            (sequence number, result) pairs
+        """
+        rows = self.conn.execute(
+            """
+            SELECT seq, result FROM work_results
+            WHERE session_id = ? AND seq > ? ORDER BY seq LIMIT ?
+            """,
+            (session_id, after, limit),
+        ).fetchall()
+        return [(row["seq"], result_from_json(row["result"])) for row in rows]
+
+    def mark_consumed(self, session_id: str, seq: int) -> None:
+        """Record that the coordinator consumed the results up to seq."""
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE work_sessions SET consumed = ? WHERE session_id = ?", (seq, session_id)
+            )
+
+    # --- Workers -----------------------------------------------------------
+
+    def session(self, session_id: str) -> QueueSession | None:
+        """Published session, or None."""
+        row = self.conn.execute(
+            "SELECT * FROM work_sessions WHERE session_id = ?", (session_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        return QueueSession(
+            session_id=row["session_id"],
+            dry_run=bool(row["dry_run"]),
+            allow_dangerous_operations=bool(row["allow_dangerous"]),
+            total=row["total"],
+            consumed=row["consumed"],
+            input_hash=row["input_hash"],
+        )
+
+    def open_sessions(self) -> list[str]:
+        """Unfinished sessions, oldest first."""
+        rows = self.conn.execute(
+            f"""
+            SELECT s.session_id FROM work_sessions s
+            WHERE EXISTS (
+                SELECT 1 FROM work_items i
+                WHERE i.session_id = s.session_id AND i.state IN {_OPEN_STATES}
+            )
+            ORDER BY s.created_at
+            """
+        ).fetchall()
+        return [row["session_id"] for row in rows]
+
+    def lease(
+        self, session_id: str, worker_id: str, limit: int, lease_seconds: float
+    ) -> list[WorkItem]:
+        """
+        Lease up to limit ready items.
+
+        Expired leases are returned to ready first (or failed, after
+        max_attempts of them).
+
+        Args:
+            session_id: Session identifier
+            worker_id: Leasing worker
+            limit: Most items to lease
+            lease_seconds: Lease duration
+
+        Returns:
+            Leased items, in seq order
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            self._expire(conn, session_id, now)
+            rows = conn.execute(
+                """
+                UPDATE work_items
+                SET state = 'leased', lease_owner = ?, lease_expires = ?, attempts = attempts + 1
+                WHERE rowid IN (
+                    SELECT rowid FROM work_items
+                    WHERE session_id = ? AND state = 'ready' ORDER BY seq LIMIT ?
+                )
+                RETURNING seq, node_id, operation, attempts
+                """,
+                (worker_id, now + lease_seconds, session_id, limit),
+            ).fetchall()
+        return [
+            WorkItem(
+                node_id=row["node_id"],
+                operation=pickle.loads(row["operation"]),
+                attempts=row["attempts"],
+            )
+            for row in sorted(rows, key=lambda row: row["seq"])
+        ]
+
+    def renew(self, session_id: str, worker_id: str, lease_seconds: float) -> int:
+        """
+        Extend every lease a worker holds.
+
+        Returns:
+            Number of leases renewed
+        """
+        with self._transaction() as conn:
+            return conn.execute(
+                """
+                UPDATE work_items SET lease_expires = ?
+                WHERE session_id = ? AND lease_owner = ? AND state = 'leased'
+                """,
+                (time.time() + lease_seconds, session_id, worker_id),
+            ).rowcount
+
+    def complete(
+        self,
+        session_id: str,
+        worker_id: str,
+        results: list[tuple[str, OperationResult]],
+        created_resources: dict[str, dict[str, int]] | None = None,
+    ) -> int:
+        """
+        Report results of leased items and release their dependents.
+
+        Args:
+            session_id: Session identifier
+            worker_id: Reporting worker
+            results: (node_id, result) pairs
+            created_resources: Resources created so far, {type: {key: BAM ID}}
+
+        Returns:
+            Number of results accepted (others were for leases the worker lost)
+        """
+        accepted = 0
+        with self._transaction() as conn:
+            # Before releasing anything: dependents may need these IDs
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO work_resources
+                    (session_id, resource_type, resource_key, bam_id)
+                VALUES (?, ?, ?, ?)
+                """,
+                (
+                    (session_id, resource_type, key, bam_id)
+                    for resource_type, created in (created_resources or {}).items()
+                    for key, bam_id in created.items()
+                ),
+            )
+            for node_id, result in results:
+                if result.success:
+                    state = "done"
+                elif result.metadata.get("skipped"):
+                    state = "skipped"
+                else:
+                    state = "failed"
+                item = conn.execute(
+                    """
+                    UPDATE work_items
+                    SET state = ?, lease_owner = NULL, lease_expires = NULL
+                    WHERE session_id = ? AND node_id = ? AND state = 'leased'
+                        AND lease_owner = ?
+                    RETURNING object_type, row_id
+                    """,
+                    (state, session_id, node_id, worker_id),
+                ).fetchone()
+                if item is None:
+                    logger.warning("Ignoring result of a lost lease", node_id=node_id)
+                    continue
+                accepted += 1
+                self._add_result(conn, session_id, node_id, result)
+                if result.success:
+                    self._release(conn, session_id, node_id)
+                else:
+                    self._skip_dependents(
+                        conn,
+                        session_id,
+                        node_id,
+                        f"{item['object_type']}:{json.loads(item['row_id'])}",
+                        result.error_message,
+                    )
+        return accepted
+
+    def created_resources(
+        self, session_id: str, after: int = 0
+    ) -> tuple[dict[str, dict[str, int]], int]:
+        """
+        Resources reported as created.
+
+        Args:
+            session_id: Session identifier
+            after: Only those reported after this sequence number
+
+        Returns:
+            ({type: {key: BAM ID}}, sequence number to pass as after next time)
+        """
+        rows = self.conn.execute(
+            """
+            SELECT seq, resource_type, resource_key, bam_id FROM work_resources
+            WHERE session_id = ? AND seq > ? ORDER BY seq
+            """,
+            (session_id, after),
+        ).fetchall()
+        created: dict[str, dict[str, int]] = {}
+        for row in rows:
+            created.setdefault(row["resource_type"], {})[row["resource_key"]] = row["bam_id"]
+        return created, rows[-1]["seq"] if rows else after
+
+    # --- Status ------------------------------------------------------------
+
+    def counts(self, session_id: str) -> dict[str, int]:
+        """Number of items in each state (phase barriers included)."""
+        rows = self.conn.execute(
+            "SELECT state, COUNT(*) AS n FROM work_items WHERE session_id = ? GROUP BY state",
+            (session_id,),
+        ).fetchall()
+        return {row["state"]: row["n"] for row in rows}
+
+    def finished(self, session_id: str) -> bool:
+        """Whether every item of a session is done, failed or skipped."""
+        row = self.conn.execute(
+            f"""
+            SELECT 1 FROM work_items
+            WHERE session_id = ? AND state IN {_OPEN_STATES} LIMIT 1
+            """,
+            (session_id,),
+        ).fetchone()
+        return row is None
+
+    # --- Internals ---------------------------------------------------------
+
+    def _expire(self, conn: sqlite3.Connection, session_id: str, now: float) -> None:
+        """Return expired leases to ready; fail items that used up their attempts."""
+        expired = conn.execute(
+            """
+            SELECT node_id, row_id, object_type, operation_type, attempts, lease_owner
+            FROM work_items
+            WHERE session_id = ? AND state = 'leased' AND lease_expires < ?
+            """,
+            (session_id, now),
+        ).fetchall()
+        for row in expired:
+            logger.warning(
+                "Lease expired",
+                node_id=row["node_id"],
+                worker=row["lease_owner"],
+                attempts=row["attempts"],
+            )
+            if row["attempts"] < self.max_attempts:
+                conn.execute(
+                    """
+                    UPDATE work_items SET state = 'ready', lease_owner = NULL, lease_expires = NULL
+                    WHERE session_id = ? AND node_id = ?
+                    """,
+                    (session_id, row["node_id"]),
+                )
+                continue
+            message = f"Abandoned after {row['attempts']} expired leases"
+            conn.execute(
+                """
+                UPDATE work_items SET state = 'failed', lease_owner = NULL, lease_expires = NULL
+                WHERE session_id = ? AND node_id = ?
+                """,
+                (session_id, row["node_id"]),
+            )
+            self._add_result(
+                conn,
+                session_id,
+                row["node_id"],
+                OperationResult(
+                    row_id=json.loads(row["row_id"]),
+                    operation=OperationType(row["operation_type"]),
+                    success=False,
+                    error_message=message,
+                    duration_ms=0,
+                ),
+            )
+            self._skip_dependents(
+                conn,
+                session_id,
+                row["node_id"],
+                f"{row['object_type']}:{json.loads(row['row_id'])}",
+                message,
+            )
+
+    def _add_result(
+        self, conn: sqlite3.Connection, session_id: str, node_id: str, result: OperationResult
+    ) -> None:
+        conn.execute(
+            "INSERT INTO work_results (session_id, node_id, result) VALUES (?, ?, ?)",
+            (session_id, node_id, result_to_json(result)),
+        )
+
+    def _dependents(self, conn: sqlite3.Connection, session_id: str, node_id: str) -> list[str]:
+        rows = conn.execute(
+            "SELECT dependent_id FROM work_edges WHERE session_id = ? AND node_id = ?",
+            (session_id, node_id),
+        ).fetchall()
+        return [row["dependent_id"] for row in rows]
+
+    def _release(self, conn: sqlite3.Connection, session_id: str, node_id: str) -> None:
+        """Count a finished dependency against each dependent; ready those with none left."""
+        released = []
+        for dependent in self._dependents(conn, session_id, node_id):
+            row = conn.execute(
+                """
+                UPDATE work_items SET remaining = remaining - 1
+                WHERE session_id = ? AND node_id = ? AND state = 'blocked'
+                RETURNING remaining
+                """,
+                (session_id, dependent),
+            ).fetchone()
+            if row is not None and row["remaining"] <= 0:
+                released.append(dependent)
+        self._ready(conn, session_id, released)
+
+    def _ready(self, conn: sqlite3.Connection, session_id: str, node_ids: list[str]) -> None:
+        """Make items ready; phase barriers complete (and release) right away."""
+        for node_id in node_ids:
+            row = conn.execute(
+                """
+                UPDATE work_items
+                SET state = CASE WHEN object_type = ? THEN 'done' ELSE 'ready' END
+                WHERE session_id = ? AND node_id = ? AND state = 'blocked'
+                RETURNING state
+                """,
+                (_BARRIER, session_id, node_id),
+            ).fetchone()
+            if row is not None and row["state"] == "done":
+                self._release(conn, session_id, node_id)
+
+    def _skip_dependents(
+        self,
+        conn: sqlite3.Connection,
+        session_id: str,
+        node_id: str,
+        parent: str,
+        error_message: str | None,
+    ) -> None:
+        """Skip every transitive dependent of a failed item."""
+        reason = f"Skipped because parent {parent} failed: {error_message}"
+        stack = self._dependents(conn, session_id, node_id)
+        while stack:
+            dependent = stack.pop()
+            row = conn.execute(
+                """
+                UPDATE work_items SET state = 'skipped'
+                WHERE session_id = ? AND node_id = ? AND state = 'blocked'
+                RETURNING row_id, object_type, operation_type
+                """,
+                (session_id, dependent),
+            ).fetchone()
+            if row is None:
+                continue
+            if row["object_type"] != _BARRIER:
+                self._add_result(
+                    conn,
+                    session_id,
+                    dependent,
+                    OperationResult(
+                        row_id=json.loads(row["row_id"]),
+                        operation=OperationType(row["operation_type"]),
+                        success=False,
+                        error_message=reason,
+                        metadata={"skipped": True},
+                    ),
+                )
+            stack.extend(self._dependents(conn, session_id, dependent))
+
+    def close(self) -> None:
+        """Close database connection."""
+        self.conn.close()
+
+    def __enter__(self) -> "WorkQueue":
+        """Context manager entry."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Context manager exit."""
+        self.close()
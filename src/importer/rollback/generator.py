@@ -11,9 +11,14 @@ This enables safe recovery from unwanted imports.
 Operation Inversion:
 -------------------
 Original Operation  ->  Rollback Operation
-CREATE              ->  DELETE (using resource_id from after_state)
+CREATE              ->  DELETE (bam_id plus the identifying fields from after_state)
 UPDATE              ->  UPDATE (using before_state to restore original values)
-DELETE              ->  CREATE (using before_state to recreate - risky/complex)
+DELETE              ->  CREATE (re-create from the deleted row stored in before_state)
+
+States are recorded by the runner as JSON objects in CSV-row form (the fields
+of the original row, plus ``id``), so inverse rows are valid importer input
+and run through the normal dependency graph and parallel executor: phasing
+deletes children before parents and re-creates parents before children.
 
 Example:
 -------
@@ -28,6 +33,13 @@ Rollback CSV would contain (in reverse order):
 Note: Reverse order is critical because dependent resources must be deleted
 before their parents (can't delete network with addresses in it).
 
+Streaming:
+---------
+Entries are read newest-first from an indexed SQLite cursor and inverse rows
+are spooled to a temporary JSON-lines file next to the output while the
+column set is collected, then copied into the CSV. Memory stays flat however
+large the session is.
+
 Output Format:
 -------------
 Rollback CSV is saved to rollbacks/<session_id>_rollback.csv with:
@@ -37,8 +49,8 @@ Rollback CSV is saved to rollbacks/<session_id>_rollback.csv with:
 
 Limitations:
 -----------
-1. DELETE rollbacks require recreating resources from before_state, which
-   may be incomplete (e.g., missing custom fields, associations)
+1. DELETE rollbacks re-create resources from the deleted CSV row, which may
+   omit properties the row did not set (e.g., custom fields, associations)
 2. Some operations are not safely reversible (e.g., config/view deletion)
 3. Time-sensitive data may have changed between import and rollback
 
@@ -49,13 +61,18 @@ generator = RollbackGenerator(changelog)
 stats = generator.generate_rollback_csv(
     session_id="import-12345",
     output_path=Path("rollbacks/import-12345_rollback.csv"),
-    include_updates=True
+    include_updates=True,
+    include_deletes=True,
 )
 ```
 """
 
+import ast
 import csv
 import json
+import tempfile
+from collections import Counter
+from datetime import datetime
 from pathlib import Path
 from typing import Any
 
@@ -73,10 +90,33 @@ class RollbackGenerator:
     Features:
     - Generates DELETE operations for successful CREATEs
     - Generates UPDATE operations to restore previous state
+    - Generates CREATE operations to re-create deleted resources
+    - Streams entries, so memory does not grow with session size
     - Maintains field order for readability
     - Includes metadata comments
     """
 
+    # Leading columns of the rollback CSV, in order
+    COLUMN_ORDER = [
+        "row_id",
+        "object_type",
+        "action",
+        "bam_id",
+        "config",
+        "view_path",
+        "parent",
+        "name",
+        "address",
+        "cidr",
+        "mac",
+        "verify_name",
+        "verify_address",
+        "_comment",
+    ]
+
+    # Row-state keys that are never copied into inverse rows
+    _STATE_EXCLUDE = {"id", "type", "row_id", "object_type", "action", "bam_id"}
+
     def __init__(self, changelog: ChangeLog) -> None:
         """
         Initialize Rollback Generator.
@@ -91,6 +131,7 @@ class RollbackGenerator:
         session_id: str,
         output_path: Path,
         include_updates: bool = True,
+        include_deletes: bool = True,
     ) -> dict[str, Any]:
         """
         Generate rollback CSV for a session.
@@ -99,6 +140,7 @@ class RollbackGenerator:
             session_id: Session to generate rollback for
             output_path: Path to write rollback CSV
             include_updates: Whether to include UPDATE rollbacks
+            include_deletes: Whether to re-create resources the session deleted
 
         Returns:
             Dictionary with rollback statistics
@@ -109,61 +151,90 @@ class RollbackGenerator:
             output_path=str(output_path),
         )
 
-        entries = self.changelog.get_session_entries(session_id)
-
-        # Filter to successful operations only
-        successful_entries = [e for e in entries if e.success]
-
-        # Generate inverse operations
-        rollback_rows = []
-
-        for entry in reversed(successful_entries):  # Reverse order for rollback
-            if entry.operation_type == "create":
-                # CREATE → DELETE
-                rollback_row = self._create_delete_row(entry)
-                if rollback_row:
-                    rollback_rows.append(rollback_row)
-
-            elif entry.operation_type == "update" and include_updates:
-                # UPDATE → UPDATE (restore previous state)
-                rollback_row = self._create_restore_row(entry)
-                if rollback_row:
-                    rollback_rows.append(rollback_row)
-
-            elif entry.operation_type == "delete":
-                # DELETE → CREATE (recreate resource)
-                # This is complex and risky - log warning
-                logger.warning(
-                    "DELETE operation in changelog - rollback requires recreation",
-                    entry_id=entry.id,
-                    resource_id=entry.resource_id,
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        columns: set[str] = set()
+        counts: Counter[str] = Counter()
+        successful_entries = 0
+
+        with tempfile.TemporaryFile(
+            "w+", encoding="utf-8", dir=output_path.parent, suffix=".jsonl"
+        ) as spool:
+            # Newest first: later operations are undone before earlier ones
+            for entry in self.changelog.iter_session_entries(
+                session_id, successful_only=True, reverse=True
+            ):
+                successful_entries += 1
+                rollback_row = self._inverse_row(entry, include_updates, include_deletes)
+                if rollback_row is None:
+                    continue
+                columns.update(rollback_row)
+                counts[rollback_row["action"]] += 1
+                spool.write(json.dumps(rollback_row, default=str))
+                spool.write("\n")
+
+            rollback_operations = sum(counts.values())
+            if rollback_operations:
+                spool.seek(0)
+                self._write_csv(
+                    output_path,
+                    (json.loads(line) for line in spool),
+                    session_id,
+                    columns,
+                    rollback_operations,
                 )
-                # Could implement if before_state is complete enough
-
-        # Write CSV
-        if rollback_rows:
-            self._write_csv(output_path, rollback_rows, session_id)
 
+        summary = self.changelog.get_session(session_id)
         stats = {
             "session_id": session_id,
-            "total_entries": len(entries),
-            "successful_entries": len(successful_entries),
-            "rollback_operations": len(rollback_rows),
+            "total_entries": summary["total_operations"] if summary else successful_entries,
+            "successful_entries": successful_entries,
+            "rollback_operations": rollback_operations,
+            "deletes": counts["delete"],
+            "restores": counts["update"],
+            "recreates": counts["create"],
             "output_path": str(output_path),
         }
 
         logger.info(
             "Rollback CSV generated",
             session_id=session_id,
-            rollback_operations=len(rollback_rows),
+            rollback_operations=rollback_operations,
         )
 
         return stats
 
+    def _inverse_row(
+        self, entry: ChangeLogEntry, include_updates: bool, include_deletes: bool
+    ) -> dict[str, Any] | None:
+        """
+        Build the inverse CSV row for one changelog entry.
+
+        Args:
+            entry: Successful changelog entry
+            include_updates: Whether UPDATE entries are reversed
+            include_deletes: Whether DELETE entries are reversed
+
+        Returns:
+            Row dictionary, or None if the entry has no inverse
+        """
+        if entry.operation_type == "create":
+            # CREATE → DELETE
+            return self._create_delete_row(entry)
+        if entry.operation_type == "update" and include_updates:
+            # UPDATE → UPDATE (restore previous state)
+            return self._create_restore_row(entry)
+        if entry.operation_type == "delete" and include_deletes:
+            # DELETE → CREATE (re-create from the deleted row)
+            return self._create_recreate_row(entry)
+        return None
+
     def _create_delete_row(self, entry: ChangeLogEntry) -> dict[str, Any] | None:
         """
         Create DELETE row from CREATE entry.
 
+        Identifying fields from after_state (config, cidr, address, ...) are kept
+        so the row validates and the dependency graph can order the deletes.
+
         Args:
             entry: ChangeLog entry for CREATE operation
 
@@ -174,18 +245,18 @@ class RollbackGenerator:
             logger.warning("No resource_id for CREATE entry", entry_id=entry.id)
             return None
 
-        # Parse after_state to get resource details
-        after_state = json.loads(entry.after_state) if entry.after_state else {}
+        after_state = _load_state(entry.after_state)
 
         row = {
             "row_id": f"rollback_{entry.row_id}",
             "object_type": entry.object_type,
             "action": "delete",
             "bam_id": entry.resource_id,
-            "verify_name": after_state.get("name", ""),
-            "verify_address": after_state.get("address", ""),
-            "_comment": f"Rollback CREATE from session {entry.session_id}",
         }
+        row.update(self._state_fields(after_state))
+        row["verify_name"] = after_state.get("name", "")
+        row["verify_address"] = after_state.get("address", "")
+        row["_comment"] = f"Rollback CREATE from session {entry.session_id}"
 
         return row
 
@@ -199,12 +270,10 @@ class RollbackGenerator:
         Returns:
             Dictionary representing CSV row
         """
-        if not entry.resource_id or not entry.before_state:
+        before_state = _load_state(entry.before_state)
+        if not entry.resource_id or not before_state:
             return None
 
-        # Parse before_state to get previous values
-        before_state = json.loads(entry.before_state)
-
         row = {
             "row_id": f"rollback_{entry.row_id}",
             "object_type": entry.object_type,
@@ -214,79 +283,86 @@ class RollbackGenerator:
         }
 
         # Add all fields from before_state
-        for key, value in before_state.items():
-            if key not in ("id", "type"):
-                row[key] = value
+        row.update(self._state_fields(before_state))
 
         return row
 
+    def _create_recreate_row(self, entry: ChangeLogEntry) -> dict[str, Any] | None:
+        """
+        Create CREATE row that re-creates a deleted resource.
+
+        Args:
+            entry: ChangeLog entry for DELETE operation
+
+        Returns:
+            Dictionary representing CSV row, or None if no before_state was recorded
+        """
+        before_state = _load_state(entry.before_state)
+        if not before_state:
+            logger.warning(
+                "DELETE entry has no before_state - cannot re-create",
+                entry_id=entry.id,
+                resource_id=entry.resource_id,
+            )
+            return None
+
+        row = {
+            "row_id": f"rollback_{entry.row_id}",
+            "object_type": entry.object_type,
+            "action": "create",
+            "_comment": f"Re-create DELETE from session {entry.session_id}",
+        }
+        row.update(self._state_fields(before_state))
+        # Safety checks on the deleted resource do not apply to the new one
+        row.pop("verify_name", None)
+        row.pop("verify_address", None)
+
+        return row
+
+    def _state_fields(self, state: dict[str, Any]) -> dict[str, Any]:
+        """Return the state fields that can be copied into a CSV row."""
+        return {
+            key: value
+            for key, value in state.items()
+            if key not in self._STATE_EXCLUDE and value is not None
+        }
+
     def _write_csv(
         self,
         output_path: Path,
-        rows: list[dict[str, Any]],
+        rows: Any,
         session_id: str,
+        all_columns: set[str],
+        row_count: int,
     ) -> None:
         """
         Write rollback CSV file.
 
         Args:
             output_path: Output file path
-            rows: List of row dictionaries
+            rows: Iterable of row dictionaries
             session_id: Session ID for header comment
+            all_columns: Union of the keys of all rows
+            row_count: Number of rows, for the header comment
         """
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        if not rows:
-            logger.warning("No rows to write")
-            return
-
-        # Determine all columns
-        all_columns: set[str] = set()
-        for row in rows:
-            all_columns.update(row.keys())
-
-        # Order columns logically
-        ordered_columns = [
-            "row_id",
-            "object_type",
-            "action",
-            "bam_id",
-            "config",
-            "view_path",
-            "parent",
-            "name",
-            "address",
-            "cidr",
-            "mac",
-            "verify_name",
-            "verify_address",
-            "_comment",
-        ]
-
-        # Add any remaining columns
-        for col in sorted(all_columns):
-            if col not in ordered_columns:
-                ordered_columns.append(col)
-
-        # Filter to only columns that exist
-        columns = [col for col in ordered_columns if col in all_columns]
-
-        # Write CSV
+        # Order columns logically, then any remaining columns alphabetically
+        columns = [col for col in self.COLUMN_ORDER if col in all_columns]
+        columns.extend(sorted(all_columns - set(columns)))
+
         with open(output_path, "w", newline="", encoding="utf-8") as f:
             # Write header comment
-            timestamp = json.dumps({"timestamp": "now"})  # Simplified timestamp
             f.write(f"# Rollback CSV for session: {session_id}\n")
-            f.write(f"# Generated: {timestamp}\n")
-            f.write(f"# Operations: {len(rows)}\n")
+            f.write(f"# Generated: {datetime.now().isoformat(timespec='seconds')}\n")
+            f.write(f"# Operations: {row_count}\n")
             f.write("#\n")
 
-            writer = csv.DictWriter(f, fieldnames=columns, extrasaction="ignore")
-            writer.writeheader()
-
-            for row in rows:
-                writer.writerow(row)
+            writer = csv.writer(f)
+            writer.writerow(columns)
+            writer.writerows([row.get(col) for col in columns] for row in rows)
 
-        logger.info("Rollback CSV written", path=str(output_path), rows=len(rows))
+        logger.info("Rollback CSV written", path=str(output_path), rows=row_count)
 
     def get_rollback_manifest(self, session_id: str) -> dict[str, Any]:
         """
@@ -298,29 +374,52 @@ class RollbackGenerator:
         Returns:
             Manifest dictionary
         """
-        entries = self.changelog.get_session_entries(session_id)
-        successful = [e for e in entries if e.success]
-
-        creates = [e for e in successful if e.operation_type == "create"]
-        updates = [e for e in successful if e.operation_type == "update"]
-        deletes = [e for e in successful if e.operation_type == "delete"]
-
-        manifest = {
-            "session_id": session_id,
-            "total_operations": len(entries),
-            "successful_operations": len(successful),
-            "rollback_required": {
-                "deletes_for_creates": len(creates),
-                "restores_for_updates": len(updates),
-                "recreates_for_deletes": len(deletes),
-            },
-            "resources": [
+        summary = self.changelog.get_session(session_id)
+        counts: Counter[str] = Counter()
+        resources = []
+        for e in self.changelog.iter_session_entries(session_id, successful_only=True):
+            counts[e.operation_type] += 1
+            resources.append(
                 {
                     "resource_id": e.resource_id,
                     "object_type": e.object_type,
                     "operation": e.operation_type,
                 }
-                for e in successful
-            ],
+            )
+
+        manifest = {
+            "session_id": session_id,
+            "total_operations": summary["total_operations"] if summary else 0,
+            "successful_operations": len(resources),
+            "rollback_required": {
+                "deletes_for_creates": counts["create"],
+                "restores_for_updates": counts["update"],
+                "recreates_for_deletes": counts["delete"],
+            },
+            "resources": resources,
         }
         return manifest
+
+
+def _load_state(raw: str | None) -> dict[str, Any]:
+    """
+    Decode a stored before/after state.
+
+    Entries written before states were stored as JSON objects hold a JSON
+    string containing the dict's repr; those are decoded with literal_eval.
+
+    Args:
+        raw: Stored state column value
+
+    Returns:
+        State dict (empty if missing or undecodable)
+    """
+    if not raw:
+        return {}
+    try:
+        state = json.loads(raw)
+        if isinstance(state, str):
+            state = ast.literal_eval(state)
+    except (ValueError, SyntaxError):
+        return {}
+    return state if isinstance(state, dict) else {}
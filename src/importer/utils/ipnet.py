@@ -0,0 +1,388 @@
+"""Canonical IP/CIDR objects with a shared, bounded parse cache.
+
+The same CIDRs and addresses show up many times per import: in row validation,
+pending-parent lookups in the operation factory and path matching in the
+dependency graph. Parsing them with ``ipaddress`` at every site is wasted work,
+so every site goes through this module instead:
+
+- ``parse_network`` / ``parse_address`` memoise the parse (LRU-bounded) and
+  return frozen ``IPNet`` / ``IPAddr`` objects carrying the canonical string
+  and precomputed integer bounds.
+- ``NetworkIndex`` answers "which indexed network contains X" with one dict
+  probe per distinct prefix length instead of a scan over all networks.
+
+Invalid input raises the same ``ValueError`` (same message) that ``ipaddress``
+raises, so callers keep their existing error handling.
+"""
+
+import re
+import sys
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from functools import lru_cache
+from ipaddress import (
+    IPv4Address,
+    IPv4Network,
+    IPv6Address,
+    IPv6Network,
+    ip_address,
+    ip_network,
+)
+from socket import inet_aton
+from typing import Any, Generic, TypeVar
+
+# Entries per cache. Large enough for a 100k-row CSV's distinct networks and a
+# working set of addresses; bounded so long-running processes do not grow.
+CACHE_SIZE = 131_072
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True, slots=True)
+class IPNet:
+    """Parsed network with canonical string and integer bounds.
+
+    Equality and hashing use (version, first, prefixlen), so two spellings of
+    the same network (``10.1.0.1/24`` and ``10.1.0.0/24``) compare equal.
+    """
+
+    version: int
+    first: int
+    prefixlen: int
+    last: int = field(compare=False)
+    cidr: str = field(compare=False)
+    network: IPv4Network | IPv6Network = field(compare=False, repr=False)
+
+    @property
+    def num_addresses(self) -> int:
+        """Number of addresses in the network."""
+        return self.last - self.first + 1
+
+    def contains(self, other: "IPNet") -> bool:
+        """Whether ``other`` is this network or a subnet of it."""
+        return (
+            self.version == other.version
+            and self.prefixlen <= other.prefixlen
+            and self.first <= other.first
+            and other.last <= self.last
+        )
+
+    def contains_address(self, address: "IPAddr") -> bool:
+        """Whether ``address`` falls inside this network."""
+        return self.version == address.version and self.first <= address.value <= self.last
+
+    def __str__(self) -> str:
+        return self.cidr
+
+
+@dataclass(frozen=True, slots=True)
+class IPAddr:
+    """Parsed address with canonical (compressed) string and integer value."""
+
+    version: int
+    value: int
+    text: str = field(compare=False)
+    address: IPv4Address | IPv6Address = field(compare=False, repr=False)
+
+    def __str__(self) -> str:
+        return self.text
+
+
+_NETWORK_TYPES: dict[int | None, Any] = {4: IPv4Network, 6: IPv6Network}
+_ADDRESS_TYPES: dict[int | None, Any] = {4: IPv4Address, 6: IPv6Address}
+
+
+# Four decimal octets, 0-255, no leading zeros: exactly what ipaddress accepts.
+_OCTET = r"(?:25[0-5]|2[0-4][0-9]|1[0-9][0-9]|[1-9]?[0-9])"
+_DOTTED_QUAD = re.compile(rf"{_OCTET}\.{_OCTET}\.{_OCTET}\.{_OCTET}")
+
+
+def _dotted_quad(value: str) -> int | None:
+    """
+    Integer value of a plain dotted-quad IPv4 string, or None.
+
+    Only accepts what ``ipaddress`` accepts (four ASCII decimal octets, no
+    leading zeros); anything else returns None and goes through ``ipaddress``
+    so that error messages are unchanged.
+    """
+    if _DOTTED_QUAD.fullmatch(value) is None:
+        return None
+    return int.from_bytes(inet_aton(value), "big")
+
+
+def _fast_ipv4_network(value: str, strict: bool) -> IPNet | None:
+    """Parse ``a.b.c.d/len`` without ``ipaddress`` (None if not in that form)."""
+    address, sep, prefix = value.partition("/")
+    if not sep or not (prefix.isascii() and prefix.isdigit()) or len(prefix) > 2:
+        return None
+    prefixlen = int(prefix)
+    value_int = _dotted_quad(address)
+    if value_int is None or prefixlen > 32:
+        return None
+    host_mask = (1 << (32 - prefixlen)) - 1
+    if strict and value_int & host_mask:
+        return None
+    first = value_int & ~host_mask
+    net = IPv4Network((first, prefixlen))
+    return IPNet(
+        version=4,
+        first=first,
+        prefixlen=prefixlen,
+        last=first | host_mask,
+        cidr=sys.intern(f"{net.network_address}/{prefixlen}"),
+        network=net,
+    )
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _parse_network(value: str, version: int | None, strict: bool) -> IPNet:
+    if version != 6 and isinstance(value, str) and (fast := _fast_ipv4_network(value, strict)):
+        return fast
+    parser = _NETWORK_TYPES.get(version)
+    net = parser(value, strict=strict) if parser else ip_network(value, strict=strict)
+    return IPNet(
+        version=net.version,
+        first=int(net.network_address),
+        prefixlen=net.prefixlen,
+        last=int(net.broadcast_address),
+        cidr=sys.intern(str(net)),
+        network=net,
+    )
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _parse_address(value: str, version: int | None) -> IPAddr:
+    if version != 6 and isinstance(value, str) and (value_int := _dotted_quad(value)) is not None:
+        return IPAddr(
+            version=4, value=value_int, text=sys.intern(value), address=IPv4Address(value_int)
+        )
+    parser = _ADDRESS_TYPES.get(version)
+    addr = parser(value) if parser else ip_address(value)
+    return IPAddr(version=addr.version, value=int(addr), text=sys.intern(str(addr)), address=addr)
+
+
+def parse_network(value: Any, version: int | None = None, strict: bool = False) -> IPNet:
+    """
+    Parse a CIDR into a cached ``IPNet``.
+
+    Args:
+        value: CIDR string
+        version: 4 or 6 to accept only that family, None for either
+        strict: Reject host bits set (``ipaddress`` strict semantics)
+
+    Returns:
+        IPNet
+
+    Raises:
+        ValueError: If the value is not a valid network of the requested family
+    """
+    if isinstance(value, str):
+        return _parse_network(value, version, strict)
+    # Non-string input (ints, ipaddress objects) is rare; parse without caching
+    return _parse_network.__wrapped__(value, version, strict)
+
+
+def parse_address(value: Any, version: int | None = None) -> IPAddr:
+    """
+    Parse an IP address into a cached ``IPAddr``.
+
+    Args:
+        value: Address string
+        version: 4 or 6 to accept only that family, None for either
+
+    Returns:
+        IPAddr
+
+    Raises:
+        ValueError: If the value is not a valid address of the requested family
+    """
+    if isinstance(value, str):
+        return _parse_address(value, version)
+    return _parse_address.__wrapped__(value, version)
+
+
+def normalize_cidr(value: Any, version: int | None = None) -> str:
+    """
+    Return the canonical form of a CIDR (host bits cleared).
+
+    Args:
+        value: CIDR string
+        version: 4 or 6 to accept only that family, None for either
+
+    Returns:
+        Canonical CIDR string, e.g. ``10.1.0.0/24`` for ``10.1.0.1/24``
+
+    Raises:
+        ValueError: If the value is not a valid network
+    """
+    return parse_network(value, version).cidr
+
+
+def try_parse_network(value: Any, version: int | None = None) -> IPNet | None:
+    """Parse a CIDR, returning None instead of raising for empty or invalid input."""
+    if not value:
+        return None
+    try:
+        return parse_network(value, version)
+    except (ValueError, TypeError):
+        return None
+
+
+def try_parse_address(value: Any, version: int | None = None) -> IPAddr | None:
+    """Parse an address, returning None instead of raising for empty or invalid input."""
+    if not value:
+        return None
+    try:
+        return parse_address(value, version)
+    except (ValueError, TypeError):
+        return None
+
+
+def address_value(value: Any) -> tuple[int, int] | None:
+    """
+    (version, integer value) of an address, or None if empty or invalid.
+
+    Unlike ``try_parse_address`` this neither caches nor builds ``IPAddr``
+    objects, for one-shot passes over more distinct addresses than the
+    cache holds.
+    """
+    if not value:
+        return None
+    if isinstance(value, str) and (value_int := _dotted_quad(value)) is not None:
+        return 4, value_int
+    try:
+        addr = ip_address(value)
+    except (ValueError, TypeError):
+        return None
+    return addr.version, int(addr)
+
+
+def ipv4_address_mask(values: Iterable[str]) -> list[bool]:
+    """
+    Whether each value is a plain dotted-quad IPv4 address.
+
+    A whole-column check for batch validation: nothing is parsed or cached.
+    False only means "not a plain dotted quad"; such values must still go
+    through ``parse_address`` to get an answer and an error message.
+    """
+    return [match is not None for match in map(_DOTTED_QUAD.fullmatch, values)]
+
+
+def parse_path_networks(path: str) -> frozenset[IPNet]:
+    """
+    Return every network that appears as ``address/prefix`` segments in a path.
+
+    ``Default/10.0.0.0/8/10.0.1.0/24`` yields {10.0.0.0/8, 10.0.1.0/24}.
+
+    Args:
+        path: Slash-separated resource path
+
+    Returns:
+        Set of networks found in the path (empty if none)
+    """
+    return _parse_path_networks(path)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _parse_path_networks(path: str) -> frozenset[IPNet]:
+    segments = path.split("/")
+    found = set()
+    for i in range(len(segments) - 1):
+        prefix = segments[i + 1]
+        if prefix.isdigit() and (net := try_parse_network(f"{segments[i]}/{prefix}")):
+            found.add(net)
+    return frozenset(found)
+
+
+def cache_info() -> dict[str, Any]:
+    """Return hit/miss statistics for the parse caches."""
+    return {
+        "networks": _parse_network.cache_info()._asdict(),
+        "addresses": _parse_address.cache_info()._asdict(),
+        "paths": _parse_path_networks.cache_info()._asdict(),
+    }
+
+
+def clear_cache() -> None:
+    """Clear all parse caches."""
+    _parse_network.cache_clear()
+    _parse_address.cache_clear()
+    _parse_path_networks.cache_clear()
+
+
+class NetworkIndex(Generic[T]):
+    """
+    Map of networks to values with longest-prefix containment lookup.
+
+    Lookups mask the target with each prefix length present in the index (most
+    specific first), so cost depends on the number of distinct prefix lengths,
+    not the number of networks.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._entries: dict[tuple[int, int, int], T] = {}
+        self._prefixlens: dict[int, list[int]] = {4: [], 6: []}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, net: IPNet, value: T) -> None:
+        """
+        Index a network. The first value added for a network wins.
+
+        Args:
+            net: Network to index
+            value: Value to return for lookups matching this network
+        """
+        key = (net.version, net.prefixlen, net.first)
+        if key in self._entries:
+            return
+        self._entries[key] = value
+        prefixlens = self._prefixlens[net.version]
+        if net.prefixlen not in prefixlens:
+            prefixlens.append(net.prefixlen)
+            prefixlens.sort(reverse=True)
+
+    def get(self, net: IPNet) -> T | None:
+        """Return the value for exactly this network."""
+        return self._entries.get((net.version, net.prefixlen, net.first))
+
+    def find_containing(self, net: IPNet, strict: bool = False) -> T | None:
+        """
+        Return the value of the most specific indexed network containing ``net``.
+
+        Args:
+            net: Network to find a container for
+            strict: Exclude ``net`` itself (only proper supernets)
+
+        Returns:
+            Value of the containing network, or None
+        """
+        bits = 32 if net.version == 4 else 128
+        for prefixlen in self._prefixlens[net.version]:
+            if prefixlen > net.prefixlen or (strict and prefixlen == net.prefixlen):
+                continue
+            mask = ((1 << prefixlen) - 1) << (bits - prefixlen)
+            value = self._entries.get((net.version, prefixlen, net.first & mask))
+            if value is not None:
+                return value
+        return None
+
+    def find_containing_address(self, address: IPAddr) -> T | None:
+        """
+        Return the value of the most specific indexed network containing ``address``.
+
+        Args:
+            address: Address to find a container for
+
+        Returns:
+            Value of the containing network, or None
+        """
+        bits = 32 if address.version == 4 else 128
+        for prefixlen in self._prefixlens[address.version]:
+            mask = ((1 << prefixlen) - 1) << (bits - prefixlen)
+            value = self._entries.get((address.version, prefixlen, address.value & mask))
+            if value is not None:
+                return value
+        return None
@@ -2,18 +2,30 @@
 Bulk validation engine for detecting issues before import logic runs.
 """
 
+import asyncio
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass, field
+from typing import Any
 
 import structlog
 
+from ..bam.bulk_query import BulkQuery
 from ..bam.client import BAMClient
+from ..bam.lookup import lookup_profile
+from ..bam.snapshot import SnapshotReadClient
 from ..models.csv_row import (
     CSVRow,
     DNSZoneRow,
     HostRecordRow,
+    IP4AddressRow,
     IP4BlockRow,
     IP4NetworkRow,
+    IP6AddressRow,
+    IP6BlockRow,
+    IP6NetworkRow,
+    LocationRow,
 )
+from ..persistence.snapshot import snapshot_key
 
 logger = structlog.get_logger(__name__)
 
@@ -55,16 +67,80 @@ class ValidationReport:
         self.summary["warnings"] += 1
 
 
+@dataclass(frozen=True)
+class _ExistenceCheck:
+    """How to check that the resource a create row names does not exist yet."""
+
+    collection: str  # BAM collection (and snapshot collection)
+    field: str  # Field matched by the ``in(...)`` filter
+    attribute: str  # Row attribute holding the value
+    label: str  # Resource name in messages
+    per_view: bool = False  # Scoped to a view instead of a configuration
+    type_filter: str | None = None  # Extra filter term (record type)
+
+
+_NETWORK_CHECK = _ExistenceCheck("networks", "range", "cidr", "Network")
+_BLOCK_CHECK = _ExistenceCheck("blocks", "range", "cidr", "Block")
+_ADDRESS_CHECK = _ExistenceCheck("addresses", "address", "address", "Address")
+
+_EXISTENCE_CHECKS: dict[type, _ExistenceCheck] = {
+    IP4NetworkRow: _NETWORK_CHECK,
+    IP6NetworkRow: _NETWORK_CHECK,
+    IP4BlockRow: _BLOCK_CHECK,
+    IP6BlockRow: _BLOCK_CHECK,
+    IP4AddressRow: _ADDRESS_CHECK,
+    IP6AddressRow: _ADDRESS_CHECK,
+    DNSZoneRow: _ExistenceCheck("zones", "absoluteName", "zone_name", "Zone", per_view=True),
+    HostRecordRow: _ExistenceCheck(
+        "resourceRecords",
+        "absoluteName",
+        "name",
+        "Host record",
+        per_view=True,
+        type_filter="type:'HostRecord'",
+    ),
+}
+
+# Row models with an existence check, and those of them checked per view
+_CheckedRow = (
+    IP4NetworkRow
+    | IP6NetworkRow
+    | IP4BlockRow
+    | IP6BlockRow
+    | IP4AddressRow
+    | IP6AddressRow
+    | DNSZoneRow
+    | HostRecordRow
+)
+_ViewRow = DNSZoneRow | HostRecordRow
+
+
 class BulkValidator:
     """
     Performs bulk pre-flight checks against BAM to catch common issues
     before the slower import process starts.
+
+    Existence checks run through BulkQuery: values are grouped per
+    configuration (or view) and sent as URL-length-bounded ``in(...)``
+    filters, concurrently and through every page of results.
+
+    Given a SnapshotReadClient, existence checks for configurations held in a
+    fresh snapshot are answered locally.
     """
 
-    def __init__(self, client: BAMClient):
+    def __init__(self, client: BAMClient | SnapshotReadClient, query: BulkQuery | None = None):
         self.client = client
+        self.query = query or BulkQuery(client)
         self.report = ValidationReport()
 
+    def _snapshot_existing(
+        self, scope_id: int, collection: str, values: list[str]
+    ) -> set[str] | None:
+        """Values that exist according to the local snapshot (None: ask BAM)."""
+        if isinstance(self.client, SnapshotReadClient):
+            return self.client.existing_keys(scope_id, collection, values)
+        return None
+
     async def validate(self, rows: list[CSVRow]) -> ValidationReport:
         """
         Run all validation checks on the provided CSV rows.
@@ -74,21 +150,16 @@ class BulkValidator:
 
         logger.info("Starting bulk validation", row_count=len(rows))
 
-        # Group rows by type for efficient checking
-        networks = [r for r in rows if isinstance(r, IP4NetworkRow)]
-        blocks = [r for r in rows if isinstance(r, IP4BlockRow)]
-        zones = [r for r in rows if isinstance(r, DNSZoneRow)]
-        [
-            r for r in rows if isinstance(r, HostRecordRow)
-        ]  # And others if we support generic records
+        # 1. Resources to be created that already exist (networks, blocks,
+        #    addresses, zones, host records)
+        #    Both only read IDs and the matched field, so BAM returns just those
+        creates = [r for r in rows if isinstance(r, _CheckedRow) and r.action == "create"]
+        with lookup_profile():
+            if creates:
+                await self._check_existing(creates)
 
-        # 1. Check for Duplicate CIDRs (Networks/Blocks)
-        if networks or blocks:
-            await self._check_duplicate_cidrs(networks + blocks)
-
-        # 2. Check for Duplicate Names (Zones/Records)
-        if zones:
-            await self._check_duplicate_zone_names(zones)
+            # 2. Location codes referenced or created by the file
+            await self._check_locations(rows)
 
         # 3. Parent Existence Checks - deliberately omitted here.
         # The Resolver performs full parent path resolution during import.
@@ -98,16 +169,17 @@ class BulkValidator:
             "Bulk validation complete",
             errors=self.report.summary["errors"],
             warnings=self.report.summary["warnings"],
+            requests=self.query.requests,
         )
 
         return self.report
 
-    async def _resolve_config_ids(self, rows: list[CSVRow]) -> dict[str, int]:
-        """Resolve configuration names to IDs for all rows using parallel requests."""
+    async def _resolve_config_ids(self, names: Iterable[str]) -> dict[str, int]:
+        """Resolve configuration names to IDs using parallel requests."""
         import asyncio
 
-        config_map = {}
-        unique_configs = list({r.config for r in rows if r.config})
+        config_map: dict[str, int] = {}
+        unique_configs = list({name for name in names if name})
 
         if not unique_configs:
             return config_map
@@ -130,11 +202,11 @@ class BulkValidator:
 
         return config_map
 
-    async def _resolve_view_ids(self, rows: list[DNSZoneRow]) -> dict[str, int]:
-        """Resolve view names to IDs for zone rows."""
+    async def _resolve_view_ids(self, rows: Sequence[_ViewRow]) -> dict[str, int]:
+        """Resolve view names to IDs for zone and host record rows."""
         import asyncio
 
-        view_map = {}
+        view_map: dict[str, int] = {}
 
         # We need both config and view path to resolve a view
         # Create unique keys: (config_name, view_path)
@@ -144,9 +216,7 @@ class BulkValidator:
             return view_map
 
         # First resolve configs since we need config_id to find views
-        # Note: _resolve_config_ids uses just config names
-        config_rows = [type("ConfigRow", (), {"config": c})() for c, _ in unique_views]
-        config_map = await self._resolve_config_ids(config_rows)
+        config_map = await self._resolve_config_ids(c for c, _ in unique_views)
 
         async def fetch_view(config_name: str, view_path: str) -> tuple[str, str, int | None]:
             config_id = config_map.get(config_name)
@@ -174,207 +244,142 @@ class BulkValidator:
 
         return view_map
 
-    async def _check_duplicate_cidrs(self, rows: list[CSVRow]) -> None:
-        """
-        Check if networks/blocks with action='create' already exist.
-
-        PERF: Uses bulk API filter with range:in() instead of per-CIDR queries.
-        """
-        import asyncio
-
-        create_rows = [r for r in rows if r.action == "create"]
-        if not create_rows:
-            return
-
-        # 1. Resolve Config IDs (already optimized with asyncio.gather)
-        config_map = await self._resolve_config_ids(create_rows)
-
-        # 2. Group CIDRs by config for bulk checking
-        networks_by_config: dict[int, list[tuple[CSVRow, str]]] = {}
-        blocks_by_config: dict[int, list[tuple[CSVRow, str]]] = {}
-
-        for row in create_rows:
-            if not isinstance(row, IP4NetworkRow | IP4BlockRow) or not row.cidr:
+    async def _check_existing(self, rows: list[_CheckedRow]) -> None:
+        """Report create rows whose resource already exists, one query group per scope."""
+        view_rows = [r for r in rows if isinstance(r, _ViewRow)]
+        config_names = [r.config for r in rows if not isinstance(r, _ViewRow)]
+        config_map = await self._resolve_config_ids(config_names) if config_names else {}
+        view_map = await self._resolve_view_ids(view_rows) if view_rows else {}
+
+        # (check, scope ID) -> [(row, value)]
+        groups: dict[tuple[_ExistenceCheck, int], list[tuple[Any, str]]] = {}
+        for row in rows:
+            check = _EXISTENCE_CHECKS[type(row)]
+            value = getattr(row, check.attribute, None)
+            if not value:
                 continue
+            if isinstance(row, _ViewRow):
+                # Skip if view not found (will be caught during import execution)
+                scope_id = view_map.get(f"{row.config}/{row.view_path}")
+                if not scope_id:
+                    continue
+            else:
+                scope_id = config_map.get(row.config)
+                if not scope_id:
+                    self.report.add_warning(
+                        str(row.row_id),
+                        "config",
+                        f"Configuration '{row.config}' not found. Skipping duplicate check.",
+                    )
+                    continue
+            groups.setdefault((check, scope_id), []).append((row, value))
+
+        await asyncio.gather(
+            *(
+                self._check_group(check, scope_id, items)
+                for (check, scope_id), items in groups.items()
+            )
+        )
 
-            config_id = config_map.get(row.config)
-            if not config_id:
-                self.report.add_warning(
-                    str(row.row_id),
-                    "config",
-                    f"Configuration '{row.config}' not found. Skipping duplicate check.",
+    async def _check_group(
+        self, check: _ExistenceCheck, scope_id: int, items: list[tuple[Any, str]]
+    ) -> None:
+        """Check one collection within one configuration or view."""
+        values = [value for _, value in items]
+        try:
+            existing = self._snapshot_existing(scope_id, check.collection, values)
+            if existing is None:
+                existing = await self._query_existing(check, scope_id, values)
+        except Exception as e:
+            if check.collection == "zones":
+                # If the bulk filter is not supported, fall back to individual checks
+                logger.debug(
+                    "Bulk zone check failed, falling back to individual checks", error=str(e)
                 )
-                continue
-
-            if isinstance(row, IP4NetworkRow):
-                if config_id not in networks_by_config:
-                    networks_by_config[config_id] = []
-                networks_by_config[config_id].append((row, row.cidr))
-            elif isinstance(row, IP4BlockRow):
-                if config_id not in blocks_by_config:
-                    blocks_by_config[config_id] = []
-                blocks_by_config[config_id].append((row, row.cidr))
-
-        # 3. Bulk check networks per config using API filter
-        async def check_networks_bulk(config_id: int, items: list[tuple[CSVRow, str]]) -> None:
-            if not items:
-                return
-
-            # Build filter: range:in('10.0.0.0/8', '10.1.0.0/16', ...)
-            cidrs = [cidr for _, cidr in items]
-            cidr_list = ", ".join([f"'{c}'" for c in cidrs])
-            filter_str = f"range:in({cidr_list})"
-
-            try:
-                # Query all networks matching any of the CIDRs in one request
-                existing = await self.client.get(
-                    f"/configurations/{config_id}/networks",
-                    params={"filter": filter_str, "fields": "range"},
+                existing = await self._zones_existing(scope_id, values)
+            else:
+                # Log a warning but don't block the import
+                logger.warning(
+                    "Bulk existence check failed, skipping",
+                    collection=check.collection,
+                    error=str(e),
                 )
-
-                # Build set of existing CIDRs for O(1) lookup
-                existing_cidrs = set()
-                if existing and "data" in existing:
-                    for net in existing["data"]:
-                        if "range" in net:
-                            existing_cidrs.add(net["range"])
-
-                # Report errors for duplicates
-                for row, cidr in items:
-                    if cidr in existing_cidrs:
-                        self.report.add_error(
-                            str(row.row_id),
-                            "cidr",
-                            f"Network {cidr} already exists in configuration.",
-                        )
-            except Exception as e:
-                # Fallback: if bulk filter fails, log warning but don't block
-                logger.warning("Bulk network check failed, skipping", error=str(e))
-
-        async def check_blocks_bulk(config_id: int, items: list[tuple[CSVRow, str]]) -> None:
-            if not items:
                 return
 
-            cidrs = [cidr for _, cidr in items]
-            cidr_list = ", ".join([f"'{c}'" for c in cidrs])
-            filter_str = f"range:in({cidr_list})"
+        for row, value in items:
+            if value not in existing:
+                continue
+            if check.per_view:
+                message = f"{check.label} '{value}' already exists in view '{row.view_path}'."
+            else:
+                message = f"{check.label} {value} already exists in configuration."
+            self.report.add_error(str(row.row_id), check.attribute, message)
+
+    async def _query_existing(
+        self, check: _ExistenceCheck, scope_id: int, values: list[str]
+    ) -> set[str]:
+        """Values (as spelled in the CSV) that match an existing resource in BAM."""
+        scope = f"{'view' if check.per_view else 'configuration'}.id:{scope_id}"
+        if check.type_filter:
+            scope = f"{scope} and {check.type_filter}"
+
+        def key(item: dict[str, Any]) -> str | None:
+            value = item.get(check.field)
+            if value is None and check.field == "absoluteName":
+                value = item.get("name")
+            return snapshot_key(check.collection, value)
+
+        found = await self.query.existing(
+            check.collection, check.field, values, scope=scope, key=key
+        )
+        return {v for v in values if snapshot_key(check.collection, v) in found}
 
+    async def _zones_existing(self, view_id: int, names: list[str]) -> set[str]:
+        """Look zones up one by one (fallback when ``in(...)`` filters fail)."""
+        existing: set[str] = set()
+        for name in names:
             try:
-                existing = await self.client.get(
-                    f"/configurations/{config_id}/blocks",
-                    params={"filter": filter_str, "fields": "range"},
-                )
-
-                existing_cidrs = set()
-                if existing and "data" in existing:
-                    for blk in existing["data"]:
-                        if "range" in blk:
-                            existing_cidrs.add(blk["range"])
-
-                for row, cidr in items:
-                    if cidr in existing_cidrs:
-                        self.report.add_error(
-                            str(row.row_id),
-                            "cidr",
-                            f"Block {cidr} already exists in configuration.",
-                        )
-            except Exception as e:
-                logger.warning("Bulk block check failed, skipping", error=str(e))
-
-        # 4. Execute all bulk checks in parallel
-        tasks = []
-        for config_id, items in networks_by_config.items():
-            tasks.append(check_networks_bulk(config_id, items))
-        for config_id, items in blocks_by_config.items():
-            tasks.append(check_blocks_bulk(config_id, items))
-
-        if tasks:
-            await asyncio.gather(*tasks)
-
-    async def _check_duplicate_zone_names(self, rows: list[DNSZoneRow]) -> None:
-        """Check if zones to be created already exist."""
-        import asyncio
-
-        create_rows = [r for r in rows if r.action == "create"]
-        if not create_rows:
-            return
-
-        # 1. Resolve View IDs
-        view_map = await self._resolve_view_ids(create_rows)
+                if await self.client.get_zone_by_fqdn(view_id, name):
+                    existing.add(name)
+            except Exception:
+                pass  # Likely 404 not found, which is good
+        return existing
 
-        # 2. Group Zones by View ID
-        zones_by_view: dict[int, list[tuple[DNSZoneRow, str]]] = {}
-
-        for row in create_rows:
-            if not row.zone_name or not row.config or not row.view_path:
-                continue
-
-            view_key = f"{row.config}/{row.view_path}"
-            view_id = view_map.get(view_key)
+    async def _check_locations(self, rows: list[CSVRow]) -> None:
+        """
+        Check location codes against BAM.
 
-            if not view_id:
-                # Skip if view not found (will be caught during import execution)
+        A referenced ``location_code`` (or a location's ``parent_code``) must
+        exist in BAM or be created by the file; a location to be created must
+        not exist yet.
+        """
+        created = {r.code: r for r in rows if isinstance(r, LocationRow) and r.action == "create"}
+        references: list[tuple[CSVRow, str, str]] = []
+        for row in rows:
+            if row.action == "delete":
                 continue
+            if isinstance(row, LocationRow):
+                if row.action == "create" and row.parent_code:
+                    references.append((row, "parent_code", row.parent_code))
+            elif code := getattr(row, "location_code", None):
+                references.append((row, "location_code", code))
+        if not created and not references:
+            return
 
-            if view_id not in zones_by_view:
-                zones_by_view[view_id] = []
-            zones_by_view[view_id].append((row, row.zone_name))
-
-        # 3. Bulk check zones per view
-        async def check_zones_bulk(view_id: int, items: list[tuple[DNSZoneRow, str]]) -> None:
-            if not items:
-                return
-
-            names = [name for _, name in items]
-
-            # BAM doesn't support generic name:in() filter easily for zones?
-            # Or maybe it does. Let's try name:in().
-            # If not, we fall back to parallel individual checks or get all zones in view (risky if many).
-            # Let's try name:in(...)
-            name_list = ", ".join([f"'{n}'" for n in names])
-            filter_str = f"name:in({name_list})"
-
-            try:
-                existing = await self.client.get(
-                    f"/views/{view_id}/zones", params={"filter": filter_str, "fields": "name"}
-                )
+        codes = list(dict.fromkeys([*created, *(code for _, _, code in references)]))
+        try:
+            existing = await self.query.existing("locations", "code", codes)
+        except Exception as e:
+            logger.warning("Bulk location check failed, skipping", error=str(e))
+            return
 
-                existing_names = set()
-                if existing and "data" in existing:
-                    for zone in existing["data"]:
-                        if "name" in zone:
-                            existing_names.add(zone["name"])
-
-                for row, name in items:
-                    if name in existing_names:
-                        self.report.add_error(
-                            str(row.row_id),
-                            "zone_name",
-                            f"Zone '{name}' already exists in view '{row.view_path}'.",
-                        )
-            except Exception as e:
-                # If bulk filter is not supported/fails, we could fallback to individual checks
-                logger.debug(
-                    "Bulk zone check failed, falling back to individual checks", error=str(e)
+        for code, row in created.items():
+            if code in existing:
+                self.report.add_error(str(row.row_id), "code", f"Location '{code}' already exists.")
+        for row, field_name, code in references:
+            if code not in existing and code not in created:
+                self.report.add_error(
+                    str(row.row_id),
+                    field_name,
+                    f"Location '{code}' does not exist in BAM and is not created by this file.",
                 )
-                # Fallback implementation
-                for row, name in items:
-                    try:
-                        # Use client wrapper if exists, or direct query
-                        # client.get_zone_by_fqdn(view_id, name)
-                        z = await self.client.get_zone_by_fqdn(view_id, name)
-                        if z:
-                            self.report.add_error(
-                                str(row.row_id),
-                                "zone_name",
-                                f"Zone '{name}' already exists in view '{row.view_path}'.",
-                            )
-                    except Exception:
-                        pass  # Likely 404 not found, which is good
-
-        tasks = []
-        for view_id, items in zones_by_view.items():
-            tasks.append(check_zones_bulk(view_id, items))
-
-        if tasks:
-            await asyncio.gather(*tasks)
@@ -26,11 +26,11 @@ async def test_request_recursion_prevention(mock_config):
     mock_response.text = "Unauthorized"
     client._client.request.return_value = mock_response
 
-    # Mock authenticate to succeed and SET CREDENTIALS
-    async def side_effect(force=False):
+    # Mock authentication to succeed and SET CREDENTIALS
+    async def side_effect(instance, force=False, stale=None):
         client.basic_auth_credentials = "mock_creds"
 
-    with patch.object(client, "authenticate", new_callable=AsyncMock) as mock_auth:
+    with patch.object(client, "_authenticate_instance", new_callable=AsyncMock) as mock_auth:
         mock_auth.side_effect = side_effect
 
         with pytest.raises(BAMAuthenticationError) as exc_info:
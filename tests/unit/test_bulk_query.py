@@ -0,0 +1,160 @@
+"""Tests for chunked, paginated bulk existence queries."""
+
+from urllib.parse import quote
+
+import pytest
+
+from src.importer.bam.bulk_query import BulkQuery, in_filters
+from src.importer.bam.mock_server import MockBAMState
+from src.importer.bam.simulator import create_simulated_client
+from src.importer.models.csv_row import (
+    DNSZoneRow,
+    HostRecordRow,
+    IP4AddressRow,
+    IP6NetworkRow,
+    LocationRow,
+)
+from src.importer.validation.validator import BulkValidator
+
+
+@pytest.fixture
+def state():
+    """Simulated BAM with networks, an address, a zone, a host record and a location."""
+    bam = MockBAMState()
+    config = bam.find("configurations", name="Default")[0]
+    view = bam.find("views", name="Internal")[0]
+    block = bam.add_entity(config["id"], "blocks", {"type": "IPv4Block", "range": "10.0.0.0/8"})
+    for i in range(30):
+        bam.add_entity(block["id"], "networks", {"type": "IPv4Network", "range": f"10.0.{i}.0/24"})
+    network = bam.find("networks", range="10.0.1.0/24")[0]
+    bam.add_entity(network["id"], "addresses", {"type": "IPv4Address", "address": "10.0.1.5"})
+    block6 = bam.add_entity(config["id"], "blocks", {"type": "IPv6Block", "range": "2001:db8::/32"})
+    bam.add_entity(block6["id"], "networks", {"type": "IPv6Network", "range": "2001:db8:1::/64"})
+    zone = bam.add_entity(view["id"], "zones", {"type": "Zone", "absoluteName": "example.com"})
+    sub = bam.add_entity(zone["id"], "zones", {"type": "Zone", "absoluteName": "sub.example.com"})
+    bam.add_entity(sub["id"], "resourceRecords", {"type": "HostRecord", "name": "www"})
+    bam.add_entity(None, "locations", {"type": "Location", "name": "New York", "code": "US NYC"})
+    return bam
+
+
+@pytest.fixture
+async def client(state):
+    """Authenticated client backed by the simulated BAM."""
+    bam = create_simulated_client(state)
+    await bam.authenticate()
+    yield bam
+    await bam.close()
+
+
+class TestInFilters:
+    """Test URL-length-aware chunking."""
+
+    def test_chunks_stay_within_encoded_length(self):
+        """Test that every filter fits the budget and all values are sent once."""
+        cidrs = [f"10.{i // 256}.{i % 256}.0/24" for i in range(2000)]
+
+        filters = in_filters("range", cidrs + cidrs[:10], scope="configuration.id:5")
+
+        assert len(filters) > 1
+        assert all(len(quote(f, safe="")) <= 6000 for f in filters)
+        assert all(f.startswith("configuration.id:5 and range:in('") for f in filters)
+        assert sum(f.count("/24'") for f in filters) == 2000
+
+    def test_value_limit_and_quoting(self):
+        """Test the per-filter value cap, escaping and unquoted IDs."""
+        assert in_filters("id", range(5), quote_values=False, max_values=2) == [
+            "id:in(0,1)",
+            "id:in(2,3)",
+            "id:in(4)",
+        ]
+        assert in_filters("name", ["o'brien"]) == ["name:in('o\\'brien')"]
+        assert in_filters("name", []) == []
+
+    def test_oversized_value_rejected(self):
+        """Test that a value that cannot fit in any request raises."""
+        with pytest.raises(ValueError):
+            in_filters("name", ["x" * 200], max_length=100)
+
+
+class TestBulkQuery:
+    """Test concurrent, paginated fetches."""
+
+    async def test_fetch_follows_pages_and_chunks(self, client, state):
+        """Test that matches beyond the first page and across chunks are all returned."""
+        config_id = state.find("configurations", name="Default")[0]["id"]
+        cidrs = [f"10.0.{i}.0/24" for i in range(40)]
+        query = BulkQuery(client, page_size=7, max_values=16)
+
+        found = await query.fetch("networks", "range", cidrs, scope=f"configuration.id:{config_id}")
+
+        assert sorted(n["range"] for n in found) == sorted(cidrs[:30])
+        # 3 chunks (16 + 16 + 8 values) matching 16, 14 and 0 networks, 7 per page
+        assert query.requests == 3 + 2 + 1
+
+
+class TestBulkValidatorCoverage:
+    """Test existence checks beyond IPv4 networks, blocks and zones."""
+
+    async def test_all_resource_types(self, client):
+        """Test IPv6 networks, addresses, nested zones, host records and locations."""
+        rows = [
+            IP6NetworkRow(
+                row_id=1,
+                object_type="ip6_network",
+                action="create",
+                config="Default",
+                name="V6",
+                cidr="2001:db8:1::/64",
+            ),
+            IP4AddressRow(
+                row_id=2,
+                object_type="ip4_address",
+                action="create",
+                config="Default",
+                address="10.0.1.5",
+                location_code="US LON",
+            ),
+            DNSZoneRow(
+                row_id=3,
+                object_type="dns_zone",
+                action="create",
+                config="Default",
+                view_path="Internal",
+                zone_name="sub.example.com",
+            ),
+            HostRecordRow(
+                row_id=4,
+                object_type="host_record",
+                action="create",
+                config="Default",
+                view_path="Internal",
+                name="www.sub.example.com",
+                addresses="10.0.1.6",
+            ),
+            LocationRow(
+                row_id=5,
+                object_type="location",
+                action="create",
+                parent_code="US NYC",
+                code="US NYC HQ",
+                name="HQ",
+            ),
+            IP4AddressRow(
+                row_id=6,
+                object_type="ip4_address",
+                action="create",
+                config="Default",
+                address="10.0.1.7",
+                location_code="US NYC HQ",
+            ),
+        ]
+
+        report = await BulkValidator(client).validate(rows)
+
+        assert {(e.row_id, e.field) for e in report.errors} == {
+            ("1", "cidr"),
+            ("2", "address"),
+            ("2", "location_code"),
+            ("3", "zone_name"),
+            ("4", "name"),
+        }
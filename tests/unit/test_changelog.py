@@ -432,3 +432,210 @@ class TestChangeLog:
         entries = self.changelog.get_session_entries("sess1")
         loaded_state = json.loads(entries[0].before_state)
         assert loaded_state == before_state
+
+    def test_row_snapshot_roundtrip(self):
+        """Test recording and loading the row snapshot of a file."""
+        self.changelog.record_row_snapshot(
+            "sess_1", "/data/feed.csv", {"1": ("hash1", '{"a":1}'), "2": ("hash2", None)}
+        )
+
+        snapshot = self.changelog.get_latest_row_snapshot("/data/feed.csv")
+
+        assert snapshot is not None
+        assert snapshot.session_id == "sess_1"
+        assert snapshot.rows == {"1": ("hash1", '{"a":1}'), "2": ("hash2", None)}
+        assert self.changelog.get_latest_row_snapshot("/data/other.csv") is None
+
+    def test_row_snapshot_keeps_only_latest_per_file(self):
+        """Test a new snapshot replaces older snapshots of the same file."""
+        self.changelog.record_row_snapshot("sess_1", "/data/feed.csv", {"1": ("old", None)})
+        self.changelog.record_row_snapshot("sess_2", "/data/feed.csv", {"1": ("new", None)})
+        self.changelog.record_row_snapshot("sess_3", "/data/other.csv", {"9": ("x", None)})
+
+        snapshot = self.changelog.get_latest_row_snapshot("/data/feed.csv")
+        assert snapshot.session_id == "sess_2"
+        assert snapshot.rows == {"1": ("new", None)}
+
+        count = self.changelog.conn.execute("SELECT COUNT(*) FROM row_hashes").fetchone()[0]
+        assert count == 2
+
+    def test_session_summary_maintained_on_insert(self):
+        """Test the sessions table tracks counts and time range per session."""
+        self.changelog.record_operation("s1", 1, "ip4_network", "create", True, resource_id=10)
+        self.changelog.record_operation("s1", 2, "ip4_network", "create", False)
+
+        summary = self.changelog.get_session("s1")
+
+        assert summary["total_operations"] == 2
+        assert summary["successful"] == 1
+        assert summary["failed"] == 1
+        assert summary["start_time"] <= summary["end_time"]
+        assert self.changelog.get_session("missing") is None
+
+    def test_record_operations_in_one_transaction(self):
+        """Test batched entries and their session summary."""
+        recorded = self.changelog.record_operations(
+            "s1",
+            [
+                {
+                    "row_id": 1,
+                    "object_type": "ip4_network",
+                    "operation_type": "create",
+                    "success": True,
+                    "resource_id": 10,
+                    "after_state": {"id": 10},
+                },
+                {
+                    "row_id": 2,
+                    "object_type": "ip4_network",
+                    "operation_type": "create",
+                    "success": False,
+                    "error_message": "boom",
+                },
+            ],
+        )
+        self.changelog.record_operation("s1", 3, "ip4_network", "create", True, resource_id=11)
+
+        entries = self.changelog.get_session_entries("s1")
+        summary = self.changelog.get_session("s1")
+
+        assert recorded == 2
+        assert [e.row_id for e in entries] == ["1", "2", "3"]
+        assert json.loads(entries[0].after_state) == {"id": 10}
+        assert entries[1].error_message == "boom"
+        assert (summary["total_operations"], summary["successful"], summary["failed"]) == (3, 2, 1)
+        assert self.changelog.record_operations("s1", []) == 0
+
+    def test_backfills_sessions_for_existing_database(self):
+        """Test databases written before the sessions table get summaries on open."""
+        legacy_path = self.temp_dir / "legacy.db"
+        conn = sqlite3.connect(str(legacy_path))
+        conn.execute(
+            """
+            CREATE TABLE changelog (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, session_id TEXT NOT NULL,
+                timestamp TEXT NOT NULL, row_id TEXT NOT NULL, object_type TEXT NOT NULL,
+                operation_type TEXT NOT NULL, success BOOLEAN NOT NULL, resource_id INTEGER,
+                error_message TEXT, before_state TEXT, after_state TEXT
+            )
+            """
+        )
+        conn.executemany(
+            "INSERT INTO changelog (session_id, timestamp, row_id, object_type, operation_type,"
+            " success) VALUES (?, ?, '1', 'ip4_block', 'create', ?)",
+            [("old", "2024-01-01T00:00:00", 1), ("old", "2024-01-01T00:05:00", 0)],
+        )
+        conn.commit()
+        conn.close()
+
+        with ChangeLog(str(legacy_path)) as changelog:
+            sessions = changelog.get_sessions()
+
+        assert sessions == [
+            {
+                "session_id": "old",
+                "start_time": "2024-01-01T00:00:00",
+                "end_time": "2024-01-01T00:05:00",
+                "total_operations": 2,
+                "successful": 1,
+                "failed": 1,
+            }
+        ]
+
+    def test_queries_use_indexes(self):
+        """Test history, session and resource lookups avoid full table scans."""
+
+        def plan(sql, params):
+            rows = self.changelog.conn.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+            return " ".join(row["detail"] for row in rows)
+
+        assert "idx_sessions_start_time" in plan(
+            "SELECT * FROM sessions ORDER BY start_time DESC LIMIT ?", (10,)
+        )
+        assert "idx_changelog_session_success" in plan(
+            "SELECT * FROM changelog WHERE session_id = ? AND success = 0", ("s",)
+        )
+        assert "idx_changelog_resource" in plan(
+            "SELECT * FROM changelog WHERE object_type = ? AND resource_id = ?", ("t", 1)
+        )
+
+    def test_get_failed_entries_and_resource_history(self):
+        """Test the indexed per-session and per-resource queries."""
+        self.changelog.record_operation("s1", 1, "ip4_network", "create", True, resource_id=7)
+        self.changelog.record_operation("s1", 2, "ip4_network", "create", False)
+        self.changelog.record_operation("s2", 1, "ip4_network", "update", True, resource_id=7)
+
+        failed = self.changelog.get_failed_entries("s1")
+        history = self.changelog.get_resource_history("ip4_network", 7)
+
+        assert [e.row_id for e in failed] == ["2"]
+        assert [e.session_id for e in history] == ["s1", "s2"]
+
+    def test_prune_sessions(self):
+        """Test pruning removes old sessions but keeps recent and kept ones."""
+        for session_id in ("a", "b", "c"):
+            self.changelog.record_operation(session_id, 1, "ip4_block", "create", True)
+        self.changelog.conn.execute(
+            "UPDATE sessions SET start_time = '2000-01-01', end_time = '2000-01-01'"
+            " WHERE session_id IN ('a', 'b')"
+        )
+        self.changelog.conn.commit()
+
+        preview = self.changelog.prune_sessions(30, dry_run=True)
+        assert [s["session_id"] for s in preview] == ["a", "b"]
+        assert self.changelog.get_session("a") is not None
+
+        pruned = self.changelog.prune_sessions(30, keep_last=2)
+        self.changelog.compact()
+
+        assert [s["session_id"] for s in pruned] == ["a"]
+        assert self.changelog.get_session_entries("a") == []
+        assert {s["session_id"] for s in self.changelog.get_sessions()} == {"b", "c"}
+
+    def test_operation_timings(self):
+        """Test that latencies of successful operations are summed per session and type."""
+        self.changelog.record_operations(
+            "a",
+            [
+                {
+                    "row_id": 1,
+                    "object_type": "host_record",
+                    "operation_type": "create",
+                    "success": True,
+                    "duration_ms": 100.0,
+                },
+                {
+                    "row_id": 2,
+                    "object_type": "host_record",
+                    "operation_type": "create",
+                    "success": True,
+                    "duration_ms": 300.0,
+                },
+                {
+                    "row_id": 3,
+                    "object_type": "host_record",
+                    "operation_type": "create",
+                    "success": False,
+                    "duration_ms": 5000.0,
+                },
+                {
+                    "row_id": 4,
+                    "object_type": "ip4_network",
+                    "operation_type": "create",
+                    "success": True,
+                },
+            ],
+        )
+        self.changelog.record_operation("b", 1, "host_record", "create", True, duration_ms=200.0)
+
+        timings = self.changelog.get_operation_timings()
+        assert timings == {("host_record", "create"): (3, 600.0, 140000.0)}
+        # Only the most recent session
+        assert self.changelog.get_operation_timings(sessions=1) == {
+            ("host_record", "create"): (1, 200.0, 40000.0)
+        }
+
+        self.changelog.conn.execute("UPDATE sessions SET end_time = '2000-01-01'")
+        self.changelog.conn.commit()
+        self.changelog.prune_sessions(30)
+        assert self.changelog.get_operation_timings() == {}
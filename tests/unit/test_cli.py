@@ -35,7 +35,7 @@ class TestCLI:
         assert isinstance(app, typer.Typer)
         assert callable(app)
 
-    @patch("src.importer.cli.CSVParser")
+    @patch("src.importer.core.parser.CSVParser")
     def test_validate_command_success(self, mock_parser_class):
         """Test successful validation command."""
         mock_parser = MagicMock()
@@ -49,7 +49,7 @@ class TestCLI:
         assert result.exit_code == 0
         assert "Validation successful!" in result.stdout
 
-    @patch("src.importer.cli.CSVParser")
+    @patch("src.importer.core.parser.CSVParser")
     def test_validate_command_with_errors(self, mock_parser_class):
         """Test validation command with errors."""
         mock_parser = MagicMock()
@@ -63,7 +63,7 @@ class TestCLI:
         assert result.exit_code == 0  # Should not fail in non-strict mode
         assert "Found 1 validation errors" in result.stdout
 
-    @patch("src.importer.cli.CSVParser")
+    @patch("src.importer.core.parser.CSVParser")
     def test_validate_command_strict_mode(self, mock_parser_class):
         """Test validation command in strict mode."""
         mock_parser = MagicMock()
@@ -83,7 +83,7 @@ class TestCLI:
 
         assert result.exit_code == 2  # Typer validation error
 
-    @patch("src.importer.cli.CSVParser")
+    @patch("src.importer.core.parser.CSVParser")
     def test_validate_command_exception(self, mock_parser_class):
         """Test validation with parser exception."""
         mock_parser_class.side_effect = Exception("Parser error")
@@ -102,6 +102,39 @@ class TestCLI:
         # Check that the help output contains command usage information
         assert "Usage:" in result.stdout or "apply" in result.stdout.lower()
 
+    def test_apply_simulate_rejects_dry_run(self):
+        """Test that --simulate and --dry-run cannot be combined."""
+        result = self.runner.invoke(app, ["apply", str(self.csv_file), "--simulate", "--dry-run"])
+
+        assert result.exit_code == 1
+        assert "mutually exclusive" in result.stdout
+
+    def test_apply_simulate_state_requires_simulate(self):
+        """Test that --simulate-save is rejected without --simulate."""
+        result = self.runner.invoke(
+            app,
+            ["apply", str(self.csv_file), "--simulate-save", "out.json"],
+        )
+
+        assert result.exit_code == 1
+        assert "require --simulate" in result.stdout
+
+    def test_apply_snapshot_rejects_simulate(self):
+        """Test that --snapshot and --simulate cannot be combined."""
+        result = self.runner.invoke(
+            app, ["apply", str(self.csv_file), "--simulate", "--snapshot", str(self.csv_file)]
+        )
+
+        assert result.exit_code == 1
+        assert "mutually exclusive" in result.stdout
+
+    def test_snapshot_requires_scope(self):
+        """Test that snapshot needs --config-name or --refresh."""
+        result = self.runner.invoke(app, ["snapshot"])
+
+        assert result.exit_code == 1
+        assert "--config-name or --refresh" in result.stdout
+
     def test_export_command_exists(self):
         """Test that export command exists."""
         # Get help for export command
@@ -153,3 +186,57 @@ class TestCLI:
         assert result.exit_code == 0
         # Check that the help output contains command usage information
         assert "Usage:" in result.stdout or "self-test" in result.stdout.lower()
+
+    def test_status_shows_checkpoint_and_changelog_summary(self):
+        """Test status reads the latest checkpoint and the session summary."""
+        from src.importer.persistence import ChangeLog, CheckpointManager
+
+        checkpoint_db = Path(self.temp_dir) / "checkpoint.db"
+        changelog_db = Path(self.temp_dir) / "changelog.db"
+        with CheckpointManager(str(checkpoint_db)) as manager:
+            manager.save_checkpoint("sess1", 0, 4, 4, 8, "in_progress")
+        with ChangeLog(str(changelog_db)) as changelog:
+            changelog.record_operation("sess1", 1, "ip4_block", "create", True)
+            changelog.record_operation("sess1", 2, "ip4_block", "create", False)
+
+        result = self.runner.invoke(
+            app,
+            [
+                "status",
+                "sess1",
+                "--checkpoint-db",
+                str(checkpoint_db),
+                "--changelog-db",
+                str(changelog_db),
+            ],
+        )
+
+        assert result.exit_code == 0
+        assert "IN_PROGRESS" in result.stdout
+        assert "4/8 operations" in result.stdout
+        assert "Recorded Operations" in result.stdout
+
+    def test_prune_command(self):
+        """Test prune previews with --dry-run and deletes with --yes."""
+        from src.importer.persistence import ChangeLog
+
+        changelog_db = Path(self.temp_dir) / "changelog.db"
+        with ChangeLog(str(changelog_db)) as changelog:
+            changelog.record_operation("old", 1, "ip4_block", "create", True)
+            changelog.record_operation("new", 1, "ip4_block", "create", True)
+            changelog.conn.execute(
+                "UPDATE sessions SET start_time = '2000-01-01', end_time = '2000-01-01'"
+                " WHERE session_id = 'old'"
+            )
+            changelog.conn.commit()
+        args = ["prune", "--changelog-db", str(changelog_db), "--keep", "0"]
+
+        preview = self.runner.invoke(app, [*args, "--dry-run"])
+        result = self.runner.invoke(app, [*args, "--yes"])
+
+        assert preview.exit_code == 0
+        assert "old" in preview.stdout
+        assert result.exit_code == 0
+        assert "Pruned 1 session(s)" in result.stdout
+        with ChangeLog(str(changelog_db)) as changelog:
+            assert [s["session_id"] for s in changelog.get_sessions()] == ["new"]
@@ -0,0 +1,152 @@
+"""Tests for columnar validation of single-type CSV sections."""
+
+from pathlib import Path
+
+import pytest
+from pydantic import TypeAdapter, ValidationError
+
+from src.importer.core.columnar import SPECS, validate_section
+from src.importer.core.parser import CSVParser
+from src.importer.models.csv_row import CSVRow
+from src.importer.utils.exceptions import CSVValidationError
+
+_ADAPTER: TypeAdapter = TypeAdapter(CSVRow)
+_PARSER = CSVParser(Path("unused.csv"))
+
+ADDRESS_HEADERS = [
+    "row_id",
+    "object_type",
+    "action",
+    "config",
+    "address",
+    "name",
+    "mac",
+    "state",
+    "description",
+    "udf_owner",
+]
+ADDRESS_ROWS = [
+    ["1", "ip4_address", "create", "Default", "10.0.0.1", "a", "00:11:22:33:44:55", "", "", "x"],
+    ["2", "ip4_address", "update", " Default ", " 10.0.0.2 ", "", "", "static", " d ", ""],
+    ["3", "ip4_address", "create", "Default", "10.0.0.256", "c", "", "", "", ""],
+    ["4", "ip4_address", "create", "Default", "10.0.0.4", "d", "00:11:22", "", "", ""],
+    ["5", "ip4_address", "create", "Default", "10.0.0.5", "e", "", "unknown", "", ""],
+    ["6", "ip4_address", "Create", "Default", "10.0.0.6"],
+]
+HOST_HEADERS = ["row_id", "object_type", "action", "config", "view_path", "name", "addresses"]
+HOST_EXTRA = ["ttl", "ptr"]
+
+
+def _per_row(headers, row_list):
+    """Validate one row the way the per-row path does, or return the error."""
+    padded = row_list[: len(headers)] + [""] * (len(headers) - len(row_list))
+    cleaned = _PARSER._clean_row_dict(dict(zip(headers, padded, strict=True)))
+    try:
+        return _ADAPTER.validate_python(cleaned)
+    except ValidationError as e:
+        return e
+
+
+def _assert_equivalent(headers, rows):
+    models = validate_section(headers, rows)
+    assert models is not None
+    for row_list, model in zip(rows, models, strict=True):
+        expected = _per_row(headers, row_list)
+        if model is None:
+            continue
+        assert not isinstance(expected, ValidationError), row_list
+        assert type(model) is type(expected)
+        assert model == expected
+        assert model.model_dump() == expected.model_dump()
+        assert model.model_fields_set == expected.model_fields_set
+    return models
+
+
+class TestSpecs:
+    """Test that the column checks cover their models."""
+
+    @pytest.mark.parametrize("object_type", sorted(SPECS))
+    def test_every_field_has_a_check(self, object_type):
+        """Test that a new model field cannot be silently skipped."""
+        spec = SPECS[object_type]
+        covered = {spec.field_of(column) for column in spec.checks}
+
+        assert covered == set(spec.model.model_fields)
+
+
+class TestValidateSection:
+    """Test column-by-column validation against the per-row path."""
+
+    def test_address_section(self):
+        """Test that valid rows match the per-row models and others are left to it."""
+        models = _assert_equivalent(ADDRESS_HEADERS, ADDRESS_ROWS)
+
+        assert [m is not None for m in models] == [True, True, False, False, False, False]
+        assert models[1].state == "STATIC"
+        assert models[1].description == "d"
+        assert models[0].get_udf_fields() == {"udf_owner": "x"}
+
+    def test_every_rejected_row_fails_per_row(self):
+        """Test that the rejected rows of the address fixture really are invalid."""
+        for row_list in ADDRESS_ROWS[2:]:
+            assert isinstance(_per_row(ADDRESS_HEADERS, row_list), ValidationError)
+
+    def test_host_record_section(self):
+        """Test addresses lists, apex names, TTLs and PTR flags."""
+        headers = HOST_HEADERS + HOST_EXTRA
+        rows = [
+            ["h1", "host_record", "create", "Default", "Internal", "www", "10.0.0.1|10.0.0.2"]
+            + ["3600", "yes"],
+            ["h2", "host_record", "create", "Default", "Internal", "", " 10.0.0.3 || "]
+            + ["", "Off"],
+            ["h3", "host_record", "create", "Default", "Internal", "x", "|"] + ["", ""],
+            ["h4", "host_record", "create", "Default", "Internal", "x", "10.0.0.4"]
+            + ["+60", "maybe"],
+        ]
+
+        models = _assert_equivalent(headers, rows)
+
+        assert [m is not None for m in models] == [True, True, False, False]
+        assert models[0].ttl == 3600
+        assert models[0].ptr is True
+        assert models[1].name == "@"
+        assert models[1].ptr is False
+
+    def test_unsupported_sections(self):
+        """Test mixed types, other types and uncovered columns are left per-row."""
+        rows = [row[:6] for row in ADDRESS_ROWS[:2]]
+        headers = ADDRESS_HEADERS[:6]
+
+        assert validate_section(headers, [rows[0], [*rows[1][:1], "host_record"]]) is None
+        assert validate_section(headers, [["1", "ip4_block", "create", "D", "x", "y"]]) is None
+        assert validate_section([*headers, "version"], rows) is None
+        # A required column missing from the header
+        assert validate_section(["row_id", "object_type", "action", "config"], rows) is None
+
+
+class TestParserIntegration:
+    """Test that CSVParser reports columnar sections as it does per-row ones."""
+
+    def test_errors_and_duplicates_keep_line_numbers(self, tmp_path):
+        """Test rejected rows and duplicate row_ids in a columnar section."""
+        csv_file = tmp_path / "addresses.csv"
+        csv_file.write_text(
+            "row_id,object_type,action,config,address\n"
+            "1,ip4_address,create,Default,10.0.0.1\n"
+            "2,ip4_address,create,Default,10.0.0.300\n"
+            "1,ip4_address,create,Default,10.0.0.3\n"
+            "row_id,object_type,action,config,cidr,name\n"
+            "4,ip4_block,create,Default,10.0.0.0/8,Private\n",
+            encoding="utf-8",
+        )
+
+        parser = CSVParser(csv_file)
+        rows = parser.parse(strict=False)
+
+        assert [row.row_id for row in rows] == ["1", "4"]
+        assert [error.line_number for error in parser.errors] == [3, 4]
+        assert "address" in str(parser.errors[0])
+        assert "Duplicate row_id '1'" in str(parser.errors[1])
+
+        with pytest.raises(CSVValidationError, match="Line 3"):
+            CSVParser(csv_file).parse(strict=True)
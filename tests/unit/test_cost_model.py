@@ -0,0 +1,129 @@
+"""Tests for the learned operation cost model and plan estimates."""
+
+import pytest
+
+from src.importer.config import PolicyConfig
+from src.importer.dependency.graph import DependencyGraph
+from src.importer.execution.cost_model import CostModel, LatencyStats, RemainingWork
+from src.importer.execution.planner import ExecutionPlanner
+from src.importer.models.operations import Operation, OperationType
+from src.importer.models.results import OperationResult
+from src.importer.persistence.changelog import ChangeLog
+
+
+def _op(row_id, object_type="host_record", operation_type=OperationType.CREATE):
+    return Operation(
+        row_id=row_id,
+        operation_type=operation_type,
+        object_type=object_type,
+        resource_id=None,
+        payload={},
+        csv_row=None,
+    )
+
+
+def _ok(row_id, duration_ms):
+    return OperationResult(
+        row_id=row_id, operation=OperationType.CREATE, success=True, duration_ms=duration_ms
+    )
+
+
+class TestCostModel:
+    """Test latency estimates from guesses, history and observations."""
+
+    def test_stats_from_changelog_sums(self):
+        """Test mean and standard deviation from stored sums."""
+        stats = LatencyStats.from_sums(3, 600.0, 140000.0)
+
+        assert stats.mean == pytest.approx(0.2)
+        assert stats.stddev == pytest.approx(0.1)
+
+    def test_history_and_observations_refine_the_guess(self):
+        """Test that each layer moves the estimate in proportion to its samples."""
+        model = CostModel(history={("host_record", "create"): LatencyStats(5, 0.1, 0.0)})
+
+        # 5 history samples against the 0.5 s guess counting as 5
+        assert model.estimate("host_record", OperationType.CREATE) == pytest.approx(0.3)
+        assert model.estimate("ip4_network", OperationType.CREATE) == 0.5
+        assert model.estimate("system_barrier", OperationType.NOOP) == 0.0
+
+        for _ in range(45):
+            model.observe("host_record", OperationType.CREATE, 0.05)
+        assert model.estimate("host_record", OperationType.CREATE) == pytest.approx(0.075)
+
+    def test_from_changelog(self, tmp_path):
+        """Test learning from timings recorded in the changelog."""
+        with ChangeLog(str(tmp_path / "changelog.db")) as changelog:
+            changelog.record_operations(
+                "s1",
+                [
+                    {
+                        "row_id": i,
+                        "object_type": "host_record",
+                        "operation_type": "create",
+                        "success": True,
+                        "duration_ms": 20.0,
+                    }
+                    for i in range(95)
+                ],
+            )
+            model = CostModel.from_changelog(changelog)
+
+        assert model.estimate("host_record", OperationType.CREATE) == pytest.approx(0.044)
+        assert model.describe()[0]["samples"] == 95
+
+    async def test_remaining_work(self):
+        """Test that the time left shrinks with results and follows observed latencies."""
+        operations = [_op(i) for i in range(10)] + [_op("barrier", "system_barrier")]
+        model = CostModel(prior_weight=1)
+        remaining = RemainingWork(model, operations, concurrency=2)
+        assert remaining.seconds() == pytest.approx(10 * 0.5 / 2)
+
+        await remaining.handle([_ok(0, 100.0), _ok(1, 100.0)])
+
+        # 8 left at (0.5 + 2 * 0.1) / 3 s, two at a time until a round is measured
+        assert model.estimate("host_record", OperationType.CREATE) == pytest.approx(0.7 / 3)
+        assert 0 < remaining.seconds() <= 8 * 0.7 / 3
+
+
+class TestPlanEstimates:
+    """Test the planner's use of the cost model."""
+
+    def _graph(self):
+        """A chain of three host records next to ten networks."""
+        graph = DependencyGraph()
+        for i in range(3):
+            graph.add_operation(_op(f"h{i}"))
+        for i in range(10):
+            graph.add_operation(_op(f"n{i}", "ip4_network"))
+        graph.add_dependency("host_record:h1", "host_record:h0")
+        graph.add_dependency("host_record:h2", "host_record:h1")
+        return graph
+
+    def _planner(self, scheduling="critical_path"):
+        model = CostModel(
+            history={
+                ("host_record", "create"): LatencyStats(10_000, 2.0, 0.0),
+                ("ip4_network", "create"): LatencyStats(10_000, 0.1, 0.0),
+            }
+        )
+        policy = PolicyConfig(max_concurrent_operations=4, scheduling=scheduling)
+        return ExecutionPlanner(policy, cost_model=model)
+
+    def test_costs_and_critical_path_duration(self):
+        """Test per-node costs and a duration bounded by the slow chain."""
+        plan = self._planner().create_plan(self._graph())
+
+        assert plan.costs["host_record:h0"] == pytest.approx(2.0, rel=1e-3)
+        assert plan.costs["ip4_network:n0"] == pytest.approx(0.1, rel=1e-2)
+        assert plan.estimated_total_duration == pytest.approx(6.0, rel=1e-3)
+
+    def test_batch_scheduling_duration(self):
+        """Test that depth-at-a-time estimates add up batch by batch."""
+        plan = self._planner("batch").create_plan(self._graph())
+
+        # Batch 0: max(2.0, (2.0 + 10 * 0.1) / 4); then 2.0 twice
+        assert [b.estimated_duration for b in plan.batches] == pytest.approx(
+            [2.0, 2.0, 2.0], rel=1e-2
+        )
+        assert plan.estimated_total_duration == pytest.approx(6.0, rel=1e-2)
@@ -440,3 +440,60 @@ class TestDependencyGraph:
 
         with pytest.raises(ValueError, match="Invalid dependency reference"):
             graph.validate()
+
+    def test_weakly_connected_components(self, graph):
+        """Test components ignore barriers but follow edges, deferred rows and resources."""
+
+        def op(row_id, object_type="ip4_network", config=None, **payload):
+            return Operation(
+                object_type=object_type,
+                operation_type=OperationType.CREATE,
+                row_id=row_id,
+                payload=payload,
+                resource_id=None,
+                csv_row=MagicMock(config=config or f"Config{row_id}"),
+            )
+
+        operations = [
+            op(1, "ip4_block"),
+            op(2),  # depends on 1 by edge
+            op(3, "ip4_block"),
+            op(4, _deferred_block_cidr="10.0.0.0/8", _deferred_block_row=3),
+            op(5, resource_path="Default/10.9.0.0/16"),
+            op(6, resource_path="Default/10.9.0.0/16"),
+            op(7),
+        ]
+        for operation in operations:
+            graph.add_operation(operation)
+        graph.add_dependency("ip4_network:2", "ip4_block:1")
+        graph._apply_phasing()
+
+        components = graph.weakly_connected_components()
+
+        assert sorted(map(sorted, components)) == [
+            ["ip4_block:1", "ip4_network:2"],
+            ["ip4_block:3", "ip4_network:4"],
+            ["ip4_network:5", "ip4_network:6"],
+            ["ip4_network:7"],
+        ]
+        assert len(components[-1]) == 1
+
+    def test_components_follow_phase_scopes(self, graph):
+        """Test that phase-ordered rows of one configuration stay together."""
+        delete = self.create_op(
+            "ip4_network", "1", OperationType.DELETE, config="A", cidr="10.0.0.0/16"
+        )
+        create = self.create_op("ip4_network", "2", config="A", cidr="10.0.0.0/15")
+        other = self.create_op("ip4_network", "3", config="B", cidr="10.0.0.0/15")
+        udf = self.create_op("udf_definition", "4", config=None)
+        for operation in (delete, create, other, udf):
+            graph.add_operation(operation)
+        graph._apply_phasing()
+
+        components = graph.weakly_connected_components()
+
+        assert sorted(map(sorted, components)) == [
+            ["ip4_network:1", "ip4_network:2"],
+            ["ip4_network:3"],
+        ]
+        assert graph.global_node_ids() == ["udf_definition:4"]
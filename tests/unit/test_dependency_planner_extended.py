@@ -620,6 +620,27 @@ class TestHostRecordWithAddressDependencies:
         # Should still have dependency for valid address
         assert node_network in host_node.dependencies
 
+    def test_host_record_keeps_address_index_for_links(self, planner, create_host_op):
+        """Test that a host record's addresses do not replace the address index UDLs use."""
+        graph = DependencyGraph()
+
+        op_address = create_host_op(1, "ip4_address")
+        op_address.csv_row.address = "10.1.1.10"
+        op_host = create_host_op(
+            2, "host_record",
+            name="web.example.com",
+            addresses="10.1.1.10",
+            zone_name="example.com"
+        )
+        op_link = create_host_op(3, "user_defined_link")
+        op_link.csv_row.source_type = "ip4_address"
+        op_link.csv_row.source_path = "10.1.1.10"
+        op_link.csv_row.destination_type = None
+
+        planner.build_graph(graph, [op_address, op_host, op_link])
+
+        assert "ip4_address:1" in graph.nodes["user_defined_link:3"].dependencies
+
 
 class TestEdgeCases:
     """Test edge cases and error conditions."""
@@ -6,13 +6,18 @@ from unittest.mock import AsyncMock, patch
 import pytest
 
 from src.importer.bam.client import BAMClient
+from src.importer.bam.response_cache import in_fresh_reads
 from src.importer.config import PolicyConfig, ThrottleConfig
 from src.importer.execution.executor import OperationExecutor
 from src.importer.execution.planner import ExecutionBatch, ExecutionPlan
 from src.importer.models.csv_row import IP4AddressRow, IP4BlockRow, IP4NetworkRow
 from src.importer.models.operations import Operation, OperationStatus, OperationType
 from src.importer.models.results import OperationResult
-from src.importer.utils.exceptions import BAMAPIError, BAMRateLimitError
+from src.importer.utils.exceptions import (
+    BAMAPIError,
+    BAMRateLimitError,
+    ResourceAlreadyExistsError,
+)
 
 
 class TestOperationExecutor:
@@ -239,6 +244,76 @@ class TestOperationExecutor:
             parent_id=None,
         )
 
+    @pytest.mark.asyncio
+    async def test_execute_operation_create_conflict_reads_fresh(self):
+        """Test that the lookup after a 409 bypasses cached listings."""
+        operation = Operation(
+            row_id=1,
+            operation_type=OperationType.CREATE,
+            object_type="ip4_block",
+            csv_row=IP4BlockRow(
+                row_id=1,
+                object_type="ip4_block",
+                action="create",
+                config="Default",
+                cidr="10.0.0.0/8",
+                name="Test Block",
+            ),
+            resource_id=None,
+            payload={"config_id": 123, "properties": {}},
+        )
+        fresh = []
+
+        async def lookup(config_id, cidr):
+            fresh.append(in_fresh_reads())
+            return {"id": 456}
+
+        self.mock_client.create_ip4_block.side_effect = ResourceAlreadyExistsError("exists")
+        self.mock_client.get_block_by_cidr_in_config.side_effect = lookup
+
+        result = await self.executor._execute_operation(operation)
+
+        assert result.success is True
+        assert result.resource_id == 456
+        assert fresh == [True]
+
+    @pytest.mark.asyncio
+    async def test_execute_operation_changed_create_updates_existing(self):
+        """Test that a changed create row updates the resource it finds on 409."""
+        operation = Operation(
+            row_id=1,
+            operation_type=OperationType.CREATE,
+            object_type="ip4_block",
+            csv_row=IP4BlockRow(
+                row_id=1,
+                object_type="ip4_block",
+                action="create",
+                config="Default",
+                cidr="10.0.0.0/8",
+                name="Renamed Block",
+            ),
+            resource_id=None,
+            payload={
+                "config_id": 123,
+                "name": "Renamed Block",
+                "properties": {},
+                "_update_existing": True,
+            },
+        )
+        self.mock_client.create_ip4_block.side_effect = ResourceAlreadyExistsError("exists")
+        self.mock_client.get_block_by_cidr_in_config.return_value = {"id": 456}
+
+        result = await self.executor._execute_operation(operation)
+
+        assert result.success is True
+        assert result.resource_id == 456
+        assert result.metadata["updated"] is True
+        self.mock_client.update_entity_by_id.assert_awaited_once()
+        args = self.mock_client.update_entity_by_id.await_args.args
+        assert args[:2] == (456, "IPv4Block")
+        assert args[2]["name"] == "Renamed Block"
+        assert "_update_existing" not in args[2]
+
     @pytest.mark.asyncio
     async def test_execute_operation_create_network(self):
         """Test executing a CREATE network operation."""
@@ -0,0 +1,237 @@
+"""Tests for grouped create_many/delete_many execution."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.importer.bam.client import BAMClient
+from src.importer.config import PolicyConfig
+from src.importer.constants import HANDLER_GROUP_SIZE
+from src.importer.execution import handlers
+from src.importer.execution.executor import OperationExecutor
+from src.importer.execution.handlers import HostRecordHandler
+from src.importer.execution.planner import ExecutionBatch
+from src.importer.models.csv_row import HostRecordRow
+from src.importer.models.operations import Operation, OperationStatus, OperationType
+from src.importer.utils.exceptions import BAMAPIError, BAMRateLimitError
+
+
+def _host(row_id, payload, operation_type=OperationType.CREATE, resource_id=None):
+    return Operation(
+        row_id=row_id,
+        operation_type=operation_type,
+        object_type="host_record",
+        resource_id=resource_id,
+        payload={"name": f"h{row_id}", "addresses": "10.0.0.1", **payload},
+        csv_row=HostRecordRow(
+            row_id=row_id,
+            object_type="host_record",
+            action="create",
+            config="Default",
+            view_path="Internal",
+            name=f"h{row_id}",
+            addresses="10.0.0.1",
+        ),
+    )
+
+
+class RecordingHandler(HostRecordHandler):
+    """Host record handler that records every create_many/delete_many call."""
+
+    def __init__(self):
+        self.create_calls: list[list] = []
+        self.delete_calls: list[list] = []
+
+    async def create_many(self, client, operations, throttle=None):
+        self.create_calls.append([op.row_id for op in operations])
+        return await super().create_many(client, operations, throttle)
+
+    async def delete_many(
+        self, client, operations, allow_dangerous_operations=False, throttle=None
+    ):
+        self.delete_calls.append([op.row_id for op in operations])
+        return await super().delete_many(client, operations, allow_dangerous_operations, throttle)
+
+
+@pytest.fixture
+def handler(monkeypatch):
+    """Recording host record handler registered for the test."""
+    recording = RecordingHandler()
+    monkeypatch.setitem(handlers.HANDLER_REGISTRY, "host_record", recording)
+    return recording
+
+
+@pytest.fixture
+def client():
+    """Mock BAM client creating host records with increasing IDs."""
+    mock = AsyncMock(spec=BAMClient)
+    counter = iter(range(1000, 100000))
+    mock.create_host_record.side_effect = lambda **kwargs: {"id": next(counter)}
+    return mock
+
+
+class TestGrouping:
+    """Test how a batch is split into groups."""
+
+    def test_groups_by_parent_and_size(self, handler, client):
+        """Test groups per zone, capped at HANDLER_GROUP_SIZE, other types alone."""
+        executor = OperationExecutor(client, PolicyConfig())
+        operations = [_host(i, {"zone_id": 1}) for i in range(HANDLER_GROUP_SIZE + 2)]
+        operations += [_host(100, {"zone_id": 2}), _host(101, {"_deferred_zone_name": "a.com"})]
+        operations.append(_host(102, {"zone_id": 1}, operation_type=OperationType.UPDATE))
+
+        units = executor._group_operations(operations)
+
+        assert [len(unit) for unit in units] == [HANDLER_GROUP_SIZE, 2, 1, 1, 1]
+        assert units[1][0].row_id == HANDLER_GROUP_SIZE
+
+    def test_handlers_without_batch_key_run_alone(self, monkeypatch, client):
+        """Test that a plain registered handler is never grouped."""
+        monkeypatch.setitem(handlers.HANDLER_REGISTRY, "host_record", AsyncMock())
+        executor = OperationExecutor(client, PolicyConfig())
+
+        units = executor._group_operations([_host(1, {"zone_id": 1}), _host(2, {"zone_id": 1})])
+
+        assert units == [[units[0][0]], [units[1][0]]]
+
+
+class TestGroupExecution:
+    """Test create_many/delete_many outcomes per operation."""
+
+    async def test_create_group(self, handler, client):
+        """Test one handler call per group and results in batch order."""
+        executor = OperationExecutor(client, PolicyConfig())
+        operations = [_host(i, {"zone_id": 7}) for i in range(20)]
+
+        results = await executor._execute_batch(ExecutionBatch(batch_id=1, operations=operations))
+
+        assert handler.create_calls == [list(range(16)), list(range(16, 20))]
+        assert [r.row_id for r in results] == list(range(20))
+        assert all(r.success and r.resource_id for r in results)
+        assert all(op.status == OperationStatus.SUCCEEDED for op in operations)
+        assert executor.throttle.get_metrics()["total_requests"] == 20
+
+    async def test_deferred_parent_resolved_for_whole_group(self, handler, client):
+        """Test that a created zone is resolved once and applied to every member."""
+        executor = OperationExecutor(client, PolicyConfig())
+        executor.created_zones["a.com"] = 55
+        operations = [_host(i, {"_deferred_zone_name": "a.com"}) for i in range(3)]
+
+        results = await executor._execute_batch(ExecutionBatch(batch_id=1, operations=operations))
+
+        assert all(r.success for r in results)
+        assert {call.kwargs["zone_id"] for call in client.create_host_record.call_args_list} == {55}
+        assert all("_deferred_zone_name" not in op.payload for op in operations)
+
+    async def test_unresolved_parent_fails_group(self, handler, client):
+        """Test that an uncreated parent fails every member without calling BAM."""
+        executor = OperationExecutor(client, PolicyConfig())
+        operations = [_host(i, {"_deferred_zone_name": "missing.com"}) for i in range(2)]
+
+        results = await executor._execute_batch(ExecutionBatch(batch_id=1, operations=operations))
+
+        assert not any(r.success for r in results)
+        assert handler.create_calls == []
+
+    async def test_groups_stay_within_throttle_limit(self, handler, client):
+        """Test that grouped requests never exceed the throttle's concurrency."""
+        in_flight = peak = 0
+        counter = iter(range(1000, 2000))
+
+        async def create(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            return {"id": next(counter)}
+
+        client.create_host_record.side_effect = create
+        executor = OperationExecutor(
+            client, PolicyConfig(max_concurrent_operations=3, max_concurrency=3)
+        )
+        operations = [_host(i, {"zone_id": 7 + i % 2}) for i in range(40)]
+
+        results = await executor._execute_batch(ExecutionBatch(batch_id=1, operations=operations))
+
+        assert all(r.success for r in results)
+        assert len(handler.create_calls) == 4
+        assert peak == 3
+
+    async def test_failures_stay_per_operation(self, handler, client):
+        """Test that one failed create does not fail the rest of its group."""
+        counter = iter(range(1000, 2000))
+
+        def create(**kwargs):
+            if kwargs["name"] == "h1":
+                raise BAMAPIError("boom")
+            return {"id": next(counter)}
+
+        client.create_host_record.side_effect = create
+        executor = OperationExecutor(client, PolicyConfig())
+        operations = [_host(i, {"zone_id": 7}) for i in range(3)]
+
+        results = await executor._execute_batch(ExecutionBatch(batch_id=1, operations=operations))
+
+        assert [r.success for r in results] == [True, False, True]
+        assert "boom" in results[1].error_message
+        assert executor.failed_operations == {"host_record:1"}
+
+    async def test_rate_limited_members_retried_alone(self, handler, client, monkeypatch):
+        """Test that rate-limited members are retried individually after waiting."""
+        sleep = AsyncMock()
+        monkeypatch.setattr("asyncio.sleep", sleep)
+        limited = {"h0"}
+
+        async def create(client, operation):
+            if operation.payload["name"] in limited:
+                limited.clear()
+                raise BAMRateLimitError(retry_after=3)
+            return {"id": 5 if operation.row_id == 0 else 6}
+
+        handler.create = create
+        executor = OperationExecutor(client, PolicyConfig())
+        operations = [_host(i, {"zone_id": 7}) for i in range(2)]
+
+        results = await executor._execute_batch(ExecutionBatch(batch_id=1, operations=operations))
+
+        assert [r.resource_id for r in results] == [5, 6]
+        assert handler.create_calls == [[0, 1]]
+        sleep.assert_any_await(3)
+
+    async def test_native_create_many(self, monkeypatch, client):
+        """Test that a handler overriding create_many gets the whole group in one call."""
+
+        class BulkHandler(HostRecordHandler):
+            calls = 0
+
+            async def create_many(self, client, operations, throttle=None):
+                BulkHandler.calls += 1
+                return [{"id": 500 + op.row_id} for op in operations]
+
+        monkeypatch.setitem(handlers.HANDLER_REGISTRY, "host_record", BulkHandler())
+        executor = OperationExecutor(client, PolicyConfig())
+        operations = [_host(i, {"zone_id": 7}) for i in range(5)]
+
+        results = await executor._execute_batch(ExecutionBatch(batch_id=1, operations=operations))
+
+        assert BulkHandler.calls == 1
+        assert [r.resource_id for r in results] == [500, 501, 502, 503, 504]
+        client.create_host_record.assert_not_called()
+
+    async def test_delete_group(self, handler, client):
+        """Test grouped deletes pass the dangerous-operation flag through."""
+        executor = OperationExecutor(client, PolicyConfig(), allow_dangerous_operations=True)
+        operations = [
+            _host(i, {}, operation_type=OperationType.DELETE, resource_id=100 + i) for i in range(3)
+        ]
+
+        results = await executor._execute_batch(ExecutionBatch(batch_id=1, operations=operations))
+
+        assert handler.delete_calls == [[0, 1, 2]]
+        assert all(r.success for r in results)
+        assert {
+            c.kwargs["allow_dangerous_operations"]
+            for c in client.delete_entity_by_id.call_args_list
+        } == {True}
@@ -0,0 +1,88 @@
+"""Import-time regression tests for CLI startup."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# Modules that only some commands need; none may load when the CLI module is imported
+HEAVY_MODULES = [
+    "httpx",
+    "pydantic",
+    "structlog",
+    "yaml",
+    "src.importer.bam.client",
+    "src.importer.models.csv_row",
+    "src.importer.execution.runner",
+    "src.importer.core.parser",
+]
+
+# Microseconds the CLI may spend importing beyond typer/rich (was ~600ms before lazy imports)
+CLI_IMPORT_BUDGET_US = 200_000
+
+
+def _run(code: str, *args: str, flags: tuple[str, ...] = ()) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code, *args],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=60,
+        check=True,
+    )
+
+
+def _parse_importtime(stderr: str) -> dict[str, int]:
+    """Map module name to cumulative import time (us) from -X importtime output."""
+    cumulative = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative_us, name = line[len("import time:") :].split("|")
+        if cumulative_us.strip().isdigit():
+            cumulative.setdefault(name.strip(), int(cumulative_us))
+    return cumulative
+
+
+class TestCLIImportTime:
+    """Keep `bluecat-import` startup fast."""
+
+    def test_cli_import_skips_heavy_modules(self):
+        """Test that importing the CLI does not load the client, models or runner."""
+        result = _run(
+            "import sys, src.importer.cli; "
+            f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+        )
+        assert result.stdout.strip() == ""
+
+    def test_cli_import_time_budget(self):
+        """Test that the CLI's own import cost (excluding typer) stays within budget."""
+        # Best of three to absorb scheduler noise
+        overheads = []
+        for _ in range(3):
+            times = _parse_importtime(
+                _run("import src.importer.cli", flags=("-X", "importtime")).stderr
+            )
+            overheads.append(times["src.importer.cli"] - times.get("typer", 0))
+        assert min(overheads) < CLI_IMPORT_BUDGET_US
+
+    @pytest.mark.parametrize(
+        "args",
+        [["version"], ["status", "sess_x", "--checkpoint-db", "missing.db"], ["history"]],
+    )
+    def test_lightweight_commands_skip_client(self, args, tmp_path):
+        """Test that informational commands never import httpx or the row models."""
+        code = (
+            "import os, sys; "
+            "from typer.testing import CliRunner; from src.importer.cli import app; "
+            "os.chdir(sys.argv[1]); "
+            f"result = CliRunner().invoke(app, {args!r}); "
+            "assert result.exit_code == 0, result.output; "
+            "print(','.join(m for m in ['httpx', 'pydantic', 'src.importer.models.csv_row'] "
+            "if m in sys.modules))"
+        )
+        result = _run(code, str(tmp_path))
+        assert result.stdout.strip() == ""
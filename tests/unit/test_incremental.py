@@ -0,0 +1,261 @@
+"""Unit tests for row-level incremental re-import selection."""
+
+import json
+
+from src.importer.core.incremental import (
+    RowDependencyIndex,
+    compute_row_hash,
+    fingerprint_rows,
+    flag_changed_creates,
+    select_incremental_rows,
+)
+from src.importer.models.csv_row import (
+    AliasRecordRow,
+    DNSZoneRow,
+    HostRecordRow,
+    IP4AddressRow,
+    IP4BlockRow,
+    IP4NetworkRow,
+)
+from src.importer.models.operations import Operation, OperationType
+
+
+def _block(row_id, cidr="10.0.0.0/8", action="create", config="Default"):
+    return IP4BlockRow(
+        row_id=row_id,
+        object_type="ip4_block",
+        action=action,
+        config=config,
+        cidr=cidr,
+        name="Block",
+    )
+
+
+def _network(row_id, cidr="10.1.0.0/24", name="Net", action="create", config="Default"):
+    return IP4NetworkRow(
+        row_id=row_id,
+        object_type="ip4_network",
+        action=action,
+        config=config,
+        cidr=cidr,
+        name=name,
+    )
+
+
+def _address(row_id, address="10.1.0.5", name="host"):
+    return IP4AddressRow(
+        row_id=row_id,
+        object_type="ip4_address",
+        action="create",
+        config="Default",
+        address=address,
+        name=name,
+    )
+
+
+class TestRowHash:
+    """Test per-row content hashing."""
+
+    def test_hash_is_stable(self):
+        """Test identical rows hash identically."""
+        assert compute_row_hash(_network(1)) == compute_row_hash(_network(1))
+
+    def test_hash_ignores_whitespace(self):
+        """Test whitespace normalised by the model does not change the hash."""
+        assert compute_row_hash(_network(1, name="Net")) == compute_row_hash(
+            _network(1, name="  Net ")
+        )
+
+    def test_hash_changes_with_content(self):
+        """Test a field change changes the hash."""
+        assert compute_row_hash(_network(1, name="A")) != compute_row_hash(_network(1, name="B"))
+
+    def test_fingerprint_keyed_by_row_id(self):
+        """Test fingerprints are keyed by string row_id and carry row JSON."""
+        fingerprints = fingerprint_rows([_block(1), _network(2)])
+
+        assert set(fingerprints) == {"1", "2"}
+        row_hash, row_data = fingerprints["2"]
+        assert row_hash == compute_row_hash(_network(2))
+        assert json.loads(row_data)["cidr"] == "10.1.0.0/24"
+
+
+class TestRowDependencyIndex:
+    """Test in-CSV parent lookup."""
+
+    def test_network_and_address_parents(self):
+        """Test containment walks to the most specific pending container."""
+        rows = [
+            _block(1, "10.0.0.0/8"),
+            _block(2, "10.1.0.0/16"),
+            _network(3, "10.1.0.0/24"),
+            _address(4, "10.1.0.5"),
+        ]
+        index = RowDependencyIndex(rows)
+
+        assert index.parents_of(rows[1]) == {"1"}
+        assert index.parents_of(rows[2]) == {"2"}
+        assert index.parents_of(rows[3]) == {"3"}
+
+    def test_parents_stay_in_their_configuration(self):
+        """Test that the same CIDR or zone in another configuration is not a parent."""
+        rows = [
+            _block(1, "10.0.0.0/8", config="Lab"),
+            _block(2, "10.0.0.0/8"),
+            _network(3, "10.1.0.0/24", config="Lab"),
+            _network(4, "10.1.0.0/24"),
+            _address(5, "10.1.0.5"),
+        ]
+        zones = [
+            DNSZoneRow(
+                row_id=row_id,
+                object_type="dns_zone",
+                action="create",
+                config=config,
+                view_path="Internal",
+                zone_name=zone_name,
+            )
+            for row_id, config, zone_name in (
+                (6, "Lab", "example.com"),
+                (7, "Default", "example.com"),
+                (8, "Default", "sub.example.com"),
+            )
+        ]
+        index = RowDependencyIndex(rows + zones)
+
+        assert index.parents_of(rows[3]) == {"2"}
+        assert index.parents_of(rows[4]) == {"4"}
+        assert index.parents_of(zones[2]) == {"7"}
+
+    def test_dns_parents(self):
+        """Test records depend on their zone and linked host record."""
+        zone = DNSZoneRow(
+            row_id=1,
+            object_type="dns_zone",
+            action="create",
+            config="Default",
+            view_path="Internal",
+            zone_name="example.com",
+        )
+        host = HostRecordRow(
+            row_id=2,
+            object_type="host_record",
+            action="create",
+            config="Default",
+            view_path="Internal",
+            name="www.example.com",
+            addresses="10.9.0.1",
+        )
+        alias = AliasRecordRow(
+            row_id=3,
+            object_type="alias_record",
+            action="create",
+            config="Default",
+            view_path="Internal",
+            zone_name="example.com",
+            name="web",
+            linked_record_name="www.example.com",
+        )
+        index = RowDependencyIndex([zone, host, alias])
+
+        assert index.parents_of(host) == {"1"}
+        assert index.parents_of(alias) == {"1", "2"}
+
+
+class TestSelectIncrementalRows:
+    """Test selection of added, changed and removed rows."""
+
+    def _previous(self, rows):
+        return fingerprint_rows(rows)
+
+    def test_unchanged_file_selects_nothing(self):
+        """Test an identical file produces an empty selection."""
+        rows = [_block(1), _network(2)]
+        fingerprints = fingerprint_rows(rows)
+
+        selection = select_incremental_rows(rows, fingerprints, "sess_a", self._previous(rows))
+
+        assert not selection.has_changes
+        assert selection.unchanged == 2
+
+    def test_added_and_changed_rows_pull_in_parents(self):
+        """Test changed rows bring their in-CSV dependency closure along."""
+        old_rows = [_block(1), _network(2), _address(3, name="old"), _network(4, "10.2.0.0/24")]
+        new_rows = [_block(1), _network(2), _address(3, name="new"), _network(4, "10.2.0.0/24")]
+        new_rows.append(_address(5, "10.2.0.9"))
+
+        selection = select_incremental_rows(
+            new_rows, fingerprint_rows(new_rows), "sess_a", self._previous(old_rows)
+        )
+
+        assert selection.added == ["5"]
+        assert selection.changed == ["3"]
+        assert sorted(selection.dependencies) == ["1", "2", "4"]
+        assert [str(r.row_id) for r in selection.rows] == ["1", "2", "3", "4", "5"]
+        assert selection.unchanged == 0
+
+    def test_unrelated_rows_are_not_selected(self):
+        """Test rows outside the closure stay unchanged."""
+        old_rows = [_network(1, "10.1.0.0/24"), _network(2, "10.2.0.0/24"), _address(3)]
+        new_rows = [_network(1, "10.1.0.0/24"), _network(2, "10.2.0.0/24"), _address(3, name="x")]
+
+        selection = select_incremental_rows(
+            new_rows, fingerprint_rows(new_rows), "sess_a", self._previous(old_rows)
+        )
+
+        assert [str(r.row_id) for r in selection.rows] == ["1", "3"]
+        assert selection.unchanged == 1
+
+    def test_removed_create_row_becomes_delete(self):
+        """Test a removed create row is rebuilt as a delete row."""
+        old_rows = [_network(1), _address(2)]
+        new_rows = [_network(1)]
+
+        selection = select_incremental_rows(
+            new_rows, fingerprint_rows(new_rows), "sess_a", self._previous(old_rows)
+        )
+
+        assert selection.removed == ["2"]
+        assert len(selection.rows) == 1
+        delete_row = selection.rows[0]
+        assert isinstance(delete_row, IP4AddressRow)
+        assert delete_row.action == "delete"
+        assert delete_row.address == "10.1.0.5"
+
+    def test_removed_update_row_is_not_reversed(self):
+        """Test removed update rows do not produce deletes."""
+        old_rows = [_network(1), _network(2, "10.2.0.0/24", action="update")]
+        new_rows = [_network(1)]
+
+        selection = select_incremental_rows(
+            new_rows, fingerprint_rows(new_rows), "sess_a", self._previous(old_rows)
+        )
+
+        assert selection.removed == ["2"]
+        assert selection.rows == []
+
+    def test_changed_create_rows_update_existing(self):
+        """Test only the creates of changed rows are flagged to update on 409."""
+        old_rows = [_network(1), _address(2, name="old")]
+        new_rows = [_network(1), _address(2, name="new"), _address(3, "10.1.0.6")]
+        selection = select_incremental_rows(
+            new_rows, fingerprint_rows(new_rows), "sess_a", self._previous(old_rows)
+        )
+        operations = [
+            Operation(
+                row_id=row.row_id,
+                operation_type=OperationType.CREATE,
+                object_type=row.object_type,
+                resource_id=None,
+                payload={},
+                csv_row=row,
+            )
+            for row in selection.rows
+        ]
+
+        assert flag_changed_creates(operations, selection) == 1
+        assert [op.payload.get("_update_existing", False) for op in operations] == [
+            False,
+            True,
+            False,
+        ]
@@ -0,0 +1,162 @@
+"""Tests for the shared IP/CIDR parse cache and network index."""
+
+import pytest
+
+from src.importer.utils.ipnet import (
+    NetworkIndex,
+    address_value,
+    cache_info,
+    clear_cache,
+    ipv4_address_mask,
+    normalize_cidr,
+    parse_address,
+    parse_network,
+    parse_path_networks,
+    try_parse_address,
+    try_parse_network,
+)
+
+
+class TestParseNetwork:
+    """Test memoised network parsing."""
+
+    def test_normalizes_host_bits(self):
+        """Test that host bits are cleared and bounds are precomputed."""
+        net = parse_network("10.1.0.1/24")
+
+        assert net.cidr == "10.1.0.0/24"
+        assert net.version == 4
+        assert net.prefixlen == 24
+        assert net.num_addresses == 256
+        assert net.last - net.first == 255
+
+    def test_equal_spellings_compare_equal(self):
+        """Test that different spellings of one network are equal and hash alike."""
+        assert parse_network("10.1.0.1/24") == parse_network("10.1.0.0/24")
+        assert len({parse_network("10.1.0.1/24"), parse_network("10.1.0.0/24")}) == 1
+
+    def test_returns_cached_object(self):
+        """Test that repeated parses return the same object."""
+        clear_cache()
+
+        first = parse_network("192.168.0.0/16")
+        second = parse_network("192.168.0.0/16")
+
+        assert first is second
+        assert cache_info()["networks"]["hits"] == 1
+
+    def test_version_restriction(self):
+        """Test that a version-specific parse rejects the other family."""
+        assert normalize_cidr("2001:db8::1/64", 6) == "2001:db8::/64"
+        with pytest.raises(ValueError):
+            parse_network("2001:db8::/64", 4)
+        with pytest.raises(ValueError):
+            parse_network("10.0.0.0/8", 6)
+
+    def test_strict_rejects_host_bits(self):
+        """Test strict parsing keeps ipaddress semantics."""
+        with pytest.raises(ValueError, match="host bits set"):
+            parse_network("10.1.0.1/24", strict=True)
+
+    def test_containment(self):
+        """Test network and address containment helpers."""
+        block = parse_network("10.0.0.0/8")
+
+        assert block.contains(parse_network("10.1.0.0/24"))
+        assert block.contains(block)
+        assert not block.contains(parse_network("11.0.0.0/24"))
+        assert not block.contains(parse_network("2001:db8::/64"))
+        assert block.contains_address(parse_address("10.255.255.255"))
+        assert not block.contains_address(parse_address("11.0.0.0"))
+
+    def test_try_parse(self):
+        """Test that try_ helpers return None for empty or invalid input."""
+        assert try_parse_network(None) is None
+        assert try_parse_network("nope") is None
+        assert try_parse_address("") is None
+        assert try_parse_address("10.0.0.256") is None
+        assert try_parse_address("10.0.0.1").value == 0x0A000001
+
+
+class TestParseAddress:
+    """Test memoised address parsing."""
+
+    def test_ipv6_compressed(self):
+        """Test that IPv6 addresses are returned in compressed form."""
+        assert parse_address("2001:0db8:0000:0000:0000:0000:0000:0001").text == "2001:db8::1"
+
+    def test_address_value(self):
+        """Test uncached integer values accept only what ipaddress accepts."""
+        assert address_value("10.0.0.1") == (4, 0x0A000001)
+        assert address_value("2001:db8::1") == (6, 0x20010DB8 << 96 | 1)
+        assert address_value("010.0.0.1") is None
+        assert address_value("10.0.0.256") is None
+        assert address_value("") is None
+
+    def test_ipv4_address_mask(self):
+        """Test the whole-column check accepts only plain dotted quads."""
+        values = ["10.0.0.1", "255.255.255.255", "010.0.0.1", "10.0.0", "::1", ""]
+
+        assert ipv4_address_mask(values) == [True, True, False, False, False, False]
+
+    def test_error_message_matches_ipaddress(self):
+        """Test that invalid input raises the ipaddress error message."""
+        with pytest.raises(ValueError, match="Expected 4 octets"):
+            parse_address("10.0.0", 4)
+
+
+class TestParsePathNetworks:
+    """Test extraction of networks from resource paths."""
+
+    def test_extracts_all_networks(self):
+        """Test that every address/prefix segment pair is found."""
+        networks = parse_path_networks("Default/10.0.0.0/8/10.0.1.0/24")
+
+        assert networks == {parse_network("10.0.0.0/8"), parse_network("10.0.1.0/24")}
+
+    def test_ignores_non_network_segments(self):
+        """Test that names and lone addresses are not treated as networks."""
+        assert parse_path_networks("Default/IPv4/server1") == frozenset()
+
+
+class TestNetworkIndex:
+    """Test longest-prefix containment lookups."""
+
+    def _index(self):
+        index = NetworkIndex()
+        for cidr in ("10.0.0.0/8", "10.1.0.0/16", "10.1.2.0/24", "2001:db8::/32"):
+            index.add(parse_network(cidr), cidr)
+        return index
+
+    def test_find_containing_most_specific(self):
+        """Test that the smallest containing network wins."""
+        index = self._index()
+
+        assert index.find_containing(parse_network("10.1.2.128/25")) == "10.1.2.0/24"
+        assert index.find_containing(parse_network("10.1.3.0/24")) == "10.1.0.0/16"
+        assert index.find_containing(parse_network("10.9.0.0/24")) == "10.0.0.0/8"
+        assert index.find_containing(parse_network("172.16.0.0/24")) is None
+
+    def test_find_containing_strict(self):
+        """Test that strict lookups skip the network itself."""
+        index = self._index()
+
+        assert index.find_containing(parse_network("10.1.2.0/24")) == "10.1.2.0/24"
+        assert index.find_containing(parse_network("10.1.2.0/24"), strict=True) == "10.1.0.0/16"
+
+    def test_find_containing_address(self):
+        """Test address lookups across both families."""
+        index = self._index()
+
+        assert index.find_containing_address(parse_address("10.1.2.7")) == "10.1.2.0/24"
+        assert index.find_containing_address(parse_address("2001:db8::5")) == "2001:db8::/32"
+        assert index.find_containing_address(parse_address("192.0.2.1")) is None
+
+    def test_first_value_wins(self):
+        """Test that re-adding a network keeps the original value."""
+        index = NetworkIndex()
+        index.add(parse_network("10.0.0.0/8"), "first")
+        index.add(parse_network("10.0.0.1/8"), "second")
+
+        assert len(index) == 1
+        assert index.get(parse_network("10.0.0.0/8")) == "first"
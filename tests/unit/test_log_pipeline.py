@@ -0,0 +1,96 @@
+"""Tests for background log writing, early level filtering and log sampling."""
+
+import json
+import logging
+
+import pytest
+import structlog
+from structlog.testing import capture_logs
+
+from src.importer.observability.logger import (
+    LevelFilteringBoundLogger,
+    LogSampler,
+    configure_logging,
+    shutdown_logging,
+)
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    """A JSON log file; logging is reset to the synchronous default afterwards."""
+    yield tmp_path / "import.log"
+    configure_logging()
+
+
+def _events(path):
+    return [json.loads(line) for line in path.read_text().splitlines() if line.startswith("{")]
+
+
+class TestLogPipeline:
+    """Test the configured pipeline end to end."""
+
+    def test_background_writer_with_sampling(self, log_file):
+        """Test that repeats are sampled, warnings kept and everything drained."""
+        configure_logging(log_file=log_file, json_logs=True, background=True, sample_burst=3)
+        logger = structlog.get_logger("importer.execution.executor")
+        for i in range(10):
+            logger.info("Resolved deferred block ID", row_id=i)
+        for i in range(5):
+            logger.warning("Operation retried", row_id=i)
+        logging.getLogger("httpx").info("HTTP Request: GET /configurations")
+        shutdown_logging()
+
+        events = _events(log_file)
+        names = [e["event"] for e in events]
+        assert names.count("Resolved deferred block ID") == 3
+        assert names.count("Operation retried") == 5
+        assert "HTTP Request: GET /configurations" in names
+        summary = next(e for e in events if e["event"] == LogSampler.SUMMARY_EVENT)
+        assert summary["dropped"] == {"Resolved deferred block ID": 7}
+
+    def test_no_sampling_below_info(self, log_file):
+        """Test that DEBUG runs keep every event."""
+        configure_logging(level="DEBUG", log_file=log_file, json_logs=True, sample_burst=1)
+        logger = structlog.get_logger("test")
+        for _ in range(4):
+            logger.debug("Cache hit")
+
+        assert [e["event"] for e in _events(log_file)] == ["Cache hit"] * 4
+
+
+class TestProcessors:
+    """Test the processors on their own."""
+
+    def test_filtered_events_skip_processors(self):
+        """Test that events below the level never reach the processor chain."""
+        seen = []
+
+        def record(_, __, event_dict):
+            seen.append(event_dict)
+            return event_dict["event"]
+
+        stdlib_logger = logging.getLogger("test_level_filtering")
+        stdlib_logger.setLevel(logging.WARNING)
+        logger = LevelFilteringBoundLogger(stdlib_logger, [record], {})
+        try:
+            logger.info("dropped")
+            logger.exception("kept")
+        finally:
+            stdlib_logger.setLevel(logging.NOTSET)
+
+        assert [e["event"] for e in seen] == ["kept"]
+
+    def test_window_summary(self):
+        """Test that the first event of a new window reports the previous one."""
+        sampler = LogSampler(burst=1, interval=60)
+        sampler(None, "info", {"event": "a"})
+        for _ in range(3):
+            with pytest.raises(structlog.DropEvent):
+                sampler(None, "info", {"event": "a"})
+
+        sampler._window_start -= 60
+        with capture_logs() as logs:
+            assert sampler(None, "info", {"event": "a"}) == {"event": "a"}
+
+        assert logs[0]["event"] == LogSampler.SUMMARY_EVENT
+        assert logs[0]["dropped"] == {"a": 3}
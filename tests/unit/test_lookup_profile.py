@@ -0,0 +1,82 @@
+"""Tests for sparse-field lookups and fast JSON decoding."""
+
+import json
+
+import pytest
+
+from src.importer.bam import lookup
+from src.importer.bam.client import BAMClient
+from src.importer.bam.lookup import in_lookup, lookup_fields, lookup_profile
+from src.importer.bam.mock_server import MockBAMServer
+from src.importer.config import BAMConfig
+
+
+@pytest.fixture
+async def client():
+    """BAMClient against a mock server holding one block."""
+    with MockBAMServer() as server:
+        config = server.state.find("configurations", name="Default")[0]
+        server.state.add_entity(
+            config["id"],
+            "blocks",
+            {"type": "IPv4Block", "range": "10.0.0.0/8", "name": "B", "comment": "x" * 500},
+        )
+        bam = BAMClient(
+            BAMConfig(
+                base_url=server.base_url, username="admin", password="admin", verify_ssl=False
+            )
+        )
+        yield bam
+        await bam.close()
+
+
+class TestLookupFields:
+    """Test the fields requested per collection."""
+
+    def test_collection_key_fields(self):
+        """Test that lookups ask for the collection's identifying field."""
+        assert lookup_fields("configurations/1/blocks") == "id,type,name,range"
+        assert lookup_fields("/views/3/zones/7") == "id,type,name,absoluteName"
+        assert lookup_fields("locations?filter=code:'US'") == "id,type,name,code"
+        assert lookup_fields("configurations") == "id,type,name"
+
+    def test_profile_is_scoped(self):
+        """Test that the profile ends with its block."""
+        with lookup_profile():
+            assert in_lookup()
+        assert not in_lookup()
+
+
+class TestLookupRequests:
+    """Test BAMClient inside and outside the lookup profile."""
+
+    async def test_lookup_returns_projected_entities(self, client):
+        """Test that lookups carry only the projected fields."""
+        config = await client.get_configuration_by_name("Default")
+        with lookup_profile():
+            block = await client.get_block_by_cidr_in_config(config["id"], "10.0.0.0/8")
+
+        assert set(block) <= {"id", "type", "name", "range"}
+        assert block["range"] == "10.0.0.0/8"
+
+    async def test_full_entities_outside_profile(self, client):
+        """Test that other reads still get every field."""
+        config = await client.get_configuration_by_name("Default")
+        block = await client.get_block_by_cidr_in_config(config["id"], "10.0.0.0/8")
+
+        assert block["comment"] == "x" * 500
+
+    async def test_explicit_fields_win(self, client):
+        """Test that a caller's own projection is left alone."""
+        with lookup_profile():
+            response = await client.get("configurations", params={"fields": "id"})
+
+        assert set(response["data"][0]) == {"id"}
+
+    async def test_stdlib_fallback(self, client, monkeypatch):
+        """Test decoding without orjson installed."""
+        monkeypatch.setattr(lookup, "_loads", json.loads)
+        with lookup_profile():
+            config = await client.get_configuration_by_name("Default")
+
+        assert config["name"] == "Default"
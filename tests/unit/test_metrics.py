@@ -1,6 +1,11 @@
 import unittest
 
-from src.importer.observability.metrics import LoggerBackend, MetricsCollector, get_global_collector
+from src.importer.observability.metrics import (
+    LatencyHistogram,
+    LoggerBackend,
+    MetricsCollector,
+    get_global_collector,
+)
 
 
 class TestLoggerBackend(unittest.TestCase):
@@ -37,6 +42,40 @@ class TestLoggerBackend(unittest.TestCase):
         self.assertEqual(timings["test_timer"]["avg"], 150.0)
         self.assertEqual(timings["test_timer"]["max"], 200)
 
+    def test_histogram_merges_tags(self):
+        backend = LoggerBackend()
+        backend.timing("api", 3, tags={"method": "GET"})
+        backend.timing("api", 30, tags={"method": "POST"})
+        backend.timing("api_other", 3000)
+
+        histogram = backend.get_histogram("api")
+
+        self.assertEqual(histogram.count, 2)
+        self.assertEqual(histogram.max, 30)
+        self.assertIsNone(backend.get_histogram("missing"))
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    def test_buckets_and_percentiles(self):
+        histogram = LatencyHistogram(bounds=(10, 100))
+        for value in [5] * 90 + [50] * 9 + [500]:
+            histogram.observe(value)
+
+        data = histogram.to_dict()
+
+        self.assertEqual([b["count"] for b in data["buckets"]], [90, 9, 1])
+        self.assertEqual(data["buckets"][-1]["le"], "+Inf")
+        self.assertLessEqual(data["p50"], 10)
+        self.assertTrue(10 <= data["p99"] <= 100)
+        self.assertEqual(data["max"], 500)
+
+    def test_empty(self):
+        data = LatencyHistogram().to_dict()
+
+        self.assertEqual(data["count"], 0)
+        self.assertEqual(data["p99"], 0.0)
+        self.assertEqual(data["min"], 0.0)
+
 
 class TestMetricsCollector(unittest.TestCase):
     def test_singleton(self):
@@ -60,6 +99,16 @@ class TestMetricsCollector(unittest.TestCase):
             any("import_operation_total" in k and "operation=create" in k for k in keys)
         )
 
+    def test_latency_histograms(self):
+        collector = MetricsCollector(backend="logger")
+        collector.record_latency("create", 12.0)
+        collector.record_latency("update", 40.0)
+
+        histograms = collector.get_latency_histograms()
+
+        self.assertEqual(list(histograms), ["import_operation_duration_ms"])
+        self.assertEqual(histograms["import_operation_duration_ms"]["count"], 2)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,242 @@
+"""Tests for the local mock BAM server used by the benchmark suite."""
+
+import pytest
+
+from benchmarks.pipeline import compare_reports, generate_csv
+from src.importer.bam.client import BAMClient
+from src.importer.bam.mock_server import MockBAMFaults, MockBAMServer, MockBAMState
+from src.importer.config import BAMConfig
+from src.importer.core.parser import CSVParser
+from src.importer.utils.exceptions import BAMAPIError, BAMAuthenticationError
+
+
+@pytest.fixture
+def server():
+    """Run a mock server for the duration of a test."""
+    with MockBAMServer() as srv:
+        yield srv
+
+
+@pytest.fixture
+async def client(server):
+    """BAMClient pointed at the mock server."""
+    bam = BAMClient(
+        BAMConfig(base_url=server.base_url, username="admin", password="admin", verify_ssl=False)
+    )
+    yield bam
+    await bam.close()
+
+
+class TestMockBAMState:
+    """Test the transport-independent request handling."""
+
+    def _auth_headers(self, state):
+        response = state.handle("POST", "sessions", {}, {"username": "admin", "password": "admin"})
+        assert response.status == 201
+        return {"Authorization": f"Basic {response.body['basicAuthenticationCredentials']}"}
+
+    def test_rejects_unauthenticated_requests(self):
+        """Test that API calls without credentials return 401."""
+        state = MockBAMState()
+        assert state.handle("GET", "configurations", {}).status == 401
+        assert state.get_stats()["unauthorized"] == 1
+
+    def test_rejects_bad_credentials(self):
+        """Test that POST /sessions with a wrong password returns 401."""
+        state = MockBAMState()
+        response = state.handle("POST", "sessions", {}, {"username": "admin", "password": "x"})
+        assert response.status == 401
+
+    def test_create_duplicate_returns_409(self):
+        """Test that creating the same block twice conflicts."""
+        state = MockBAMState()
+        headers = self._auth_headers(state)
+        config = state.find("configurations", name="Default")[0]
+        body = {"type": "IPv4Block", "range": "10.0.0.0/8", "name": "B"}
+
+        first = state.handle("POST", f"configurations/{config['id']}/blocks", {}, body, headers)
+        second = state.handle("POST", f"configurations/{config['id']}/blocks", {}, body, headers)
+
+        assert first.status == 201
+        assert second.status == 409
+
+    def test_filters_and_stats(self):
+        """Test filter matching and per-endpoint counters."""
+        state = MockBAMState()
+        headers = self._auth_headers(state)
+
+        response = state.handle(
+            "GET", "configurations", {"filter": "name:'Default'"}, None, headers
+        )
+
+        assert response.body["count"] == 1
+        assert response.body["data"][0]["name"] == "Default"
+        stats = state.get_stats()
+        assert stats["by_endpoint"]["GET configurations"] == 1
+        assert stats["by_endpoint"]["POST sessions"] == 1
+
+    def test_delete_removes_children(self):
+        """Test that deleting a block removes its networks."""
+        state = MockBAMState()
+        config = state.find("configurations", name="Default")[0]
+        block = state.add_entity(
+            config["id"], "blocks", {"type": "IPv4Block", "range": "10.0.0.0/8"}
+        )
+        state.add_entity(block["id"], "networks", {"type": "IPv4Network", "range": "10.1.0.0/24"})
+
+        state.delete_entity(block["id"])
+
+        assert state.find("networks") == []
+
+    def test_overlapping_network_conflicts(self):
+        """Test that networks may not overlap within a configuration."""
+        state = MockBAMState()
+        config = state.find("configurations", name="Default")[0]
+        block = state.add_entity(
+            config["id"], "blocks", {"type": "IPv4Block", "range": "10.0.0.0/8"}
+        )
+        network = state.add_entity(
+            block["id"], "networks", {"type": "IPv4Network", "range": "10.1.0.0/24"}
+        )
+
+        for cidr in ("10.1.0.128/25", "10.1.0.0/23", "10.0.0.0/15"):
+            with pytest.raises(ValueError, match="overlaps"):
+                state.add_entity(block["id"], "networks", {"type": "IPv4Network", "range": cidr})
+        state.add_entity(block["id"], "networks", {"type": "IPv4Network", "range": "10.1.1.0/24"})
+
+        state.delete_entity(network["id"])
+        state.add_entity(block["id"], "networks", {"type": "IPv4Network", "range": "10.1.0.0/25"})
+
+    def test_rejects_address_outside_network(self):
+        """Test that POSTing an address outside its parent network returns 409."""
+        state = MockBAMState()
+        headers = self._auth_headers(state)
+        config = state.find("configurations", name="Default")[0]
+        block = state.add_entity(
+            config["id"], "blocks", {"type": "IPv4Block", "range": "10.0.0.0/8"}
+        )
+        network = state.add_entity(
+            block["id"], "networks", {"type": "IPv4Network", "range": "10.1.0.0/24"}
+        )
+
+        response = state.handle(
+            "POST",
+            f"networks/{network['id']}/addresses",
+            {},
+            {"type": "IPv4Address", "address": "10.2.0.1"},
+            headers,
+        )
+
+        assert response.status == 409
+        assert "not within parent range" in response.body["message"]
+
+    def test_export_round_trip(self):
+        """Test that an export reloads with the same IDs, hierarchy and indexes."""
+        state = MockBAMState()
+        config = state.find("configurations", name="Default")[0]
+        block = state.add_entity(
+            config["id"], "blocks", {"type": "IPv4Block", "range": "10.0.0.0/8"}
+        )
+        state.add_entity(block["id"], "networks", {"type": "IPv4Network", "range": "10.1.0.0/24"})
+
+        copy = MockBAMState.from_entities(state.export_entities())
+
+        assert copy.entities.keys() == state.entities.keys()
+        assert copy.find("networks")[0]["configuration"]["id"] == config["id"]
+        assert copy._next_id == state._next_id
+        with pytest.raises(ValueError, match="overlaps"):
+            copy.add_entity(
+                block["id"], "networks", {"type": "IPv4Network", "range": "10.1.0.0/25"}
+            )
+
+
+class TestMockBAMServer:
+    """Test BAMClient against the mock server over HTTP."""
+
+    async def test_create_and_lookup(self, client):
+        """Test creating a block and network and finding them by address."""
+        config = await client.get_configuration_by_name("Default")
+        block = await client.create_ip4_block(config["id"], "10.0.0.0/8", "Block")
+        await client.create_ip4_network(block["id"], "10.0.3.0/24", "Net")
+
+        network = await client.find_network_containing_address(config["id"], "10.0.3.7")
+        container = await client.find_block_containing_network(config["id"], "10.0.9.0/24")
+
+        assert network["range"] == "10.0.3.0/24"
+        assert container["id"] == block["id"]
+
+    async def test_duplicate_create_raises(self, client):
+        """Test that a 409 from the server surfaces as a BAMAPIError."""
+        config = await client.get_configuration_by_name("Default")
+        await client.create_ip4_block(config["id"], "10.0.0.0/8", "Block")
+
+        with pytest.raises(BAMAPIError):
+            await client.create_ip4_block(config["id"], "10.0.0.0/8", "Block")
+
+    async def test_pagination(self, client):
+        """Test that get_all_pages follows next links across pages."""
+        config = await client.get_configuration_by_name("Default")
+        block = await client.create_ip4_block(config["id"], "10.0.0.0/8", "Block")
+        for i in range(5):
+            await client.create_ip4_network(block["id"], f"10.0.{i}.0/24", f"N{i}")
+
+        networks = await client.get_all_pages(f"blocks/{block['id']}/networks", page_size=2)
+
+        assert len(networks) == 5
+
+    async def test_bad_credentials(self, server):
+        """Test that wrong credentials fail authentication."""
+        bam = BAMClient(
+            BAMConfig(base_url=server.base_url, username="admin", password="nope", verify_ssl=False)
+        )
+        try:
+            with pytest.raises(BAMAuthenticationError):
+                await bam.authenticate()
+        finally:
+            await bam.close()
+
+    async def test_retries_on_rate_limit(self, server, client):
+        """Test that injected 429s are retried by the client."""
+        await client.authenticate()
+        server.state.set_faults(MockBAMFaults(rate_limit_rate=0.5, retry_after=0, seed=1))
+
+        configs = await client.get_configurations()
+
+        assert configs
+        assert server.state.get_stats()["rate_limited"] > 0
+
+    async def test_reauthenticates_after_session_expiry(self, server, client):
+        """Test that the client re-authenticates on 401."""
+        await client.authenticate()
+        server.state.expire_sessions()
+
+        config = await client.get_configuration_by_name("Default")
+
+        assert config["name"] == "Default"
+        assert server.state.get_stats()["unauthorized"] == 1
+
+
+class TestBenchmarkHelpers:
+    """Test the benchmark harness helpers."""
+
+    def test_generate_csv_parses(self, tmp_path):
+        """Test that the synthetic CSV has the requested rows and parses."""
+        csv_path = tmp_path / "bench.csv"
+
+        written = generate_csv(csv_path, 40)
+        rows = CSVParser(csv_path).parse()
+
+        assert written == 40
+        assert len(rows) == 40
+        assert {row.object_type for row in rows} >= {"ip4_block", "ip4_network", "host_record"}
+
+    def test_compare_reports(self):
+        """Test that comparison lines include wall-time deltas."""
+        phase = {"phase": "parse", "wall_seconds": 1.0, "api_calls_per_row": 0.0}
+        baseline = {"results": [{"rows": 10, "phases": [phase]}]}
+        current = {"results": [{"rows": 10, "phases": [{**phase, "wall_seconds": 1.5}]}]}
+
+        lines = compare_reports(current, baseline)
+
+        assert len(lines) == 1
+        assert "+50.0%" in lines[0]
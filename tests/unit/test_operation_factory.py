@@ -196,6 +196,43 @@ class TestDeferredResolver:
         # 172.16.0.1 is not within any pending network
         assert resolver.find_containing_pending_network("172.16.0.1") is None
 
+    def test_find_containing_pending_block_prefers_most_specific(self):
+        """Test that nested pending blocks resolve to the smallest container."""
+        pending = PendingResources(
+            blocks={"10.0.0.0/8": 1, "10.1.0.0/16": 2},
+            networks={},
+            zones={},
+        )
+        resolver = DeferredResolver(pending)
+
+        assert resolver.find_containing_pending_block("10.1.2.0/24") == ("10.1.0.0/16", 2)
+        assert resolver.find_containing_pending_block("10.2.0.0/24") == ("10.0.0.0/8", 1)
+
+        # Blocks added after the first lookup are picked up
+        pending.blocks["10.1.2.0/23"] = 3
+        assert resolver.find_containing_pending_block("10.1.2.0/24") == ("10.1.2.0/23", 3)
+
+    def test_pending_index_built_once_with_unindexable_cidrs(self):
+        """Test that invalid and equal CIDRs do not force a rebuild on every lookup."""
+        pending = PendingResources(
+            blocks={"10.0.0.0/8": 1, "10.0.0.0/08": 2, "bogus": 3}, networks={}, zones={}
+        )
+        resolver = DeferredResolver(pending)
+
+        resolver.find_containing_pending_block("10.1.0.0/24")
+        index = resolver._block_index
+        resolver.find_containing_pending_block("10.2.0.0/24")
+
+        assert resolver._block_index is index
+
+    def test_find_containing_pending_invalid_input(self):
+        """Test that invalid CIDRs and addresses return None instead of raising."""
+        pending = PendingResources(blocks={"10.0.0.0/8": 1}, networks={"10.1.0.0/24": 5}, zones={})
+        resolver = DeferredResolver(pending)
+
+        assert resolver.find_containing_pending_block("not-a-cidr") is None
+        assert resolver.find_containing_pending_network("10.1.0.999") is None
+
 
 class TestOperationFactory:
     """Test OperationFactory class."""
@@ -0,0 +1,143 @@
+"""Tests for offline in-file overlap analysis."""
+
+from src.importer.models.csv_row import (
+    IP4AddressRow,
+    IP4BlockRow,
+    IP4NetworkRow,
+    IP6NetworkRow,
+    IPv4DHCPRangeRow,
+)
+from src.importer.validation.overlap import analyze_overlaps
+
+
+def _block(row_id, cidr, config="Default"):
+    return IP4BlockRow(
+        row_id=row_id, object_type="ip4_block", action="create", config=config, name="B", cidr=cidr
+    )
+
+
+def _network(row_id, cidr, config="Default", action="create"):
+    return IP4NetworkRow(
+        row_id=row_id, object_type="ip4_network", action=action, config=config, name="N", cidr=cidr
+    )
+
+
+def _address(row_id, address):
+    return IP4AddressRow(
+        row_id=row_id, object_type="ip4_address", action="create", config="Default", address=address
+    )
+
+
+def _range(row_id, value):
+    return IPv4DHCPRangeRow(
+        row_id=row_id, object_type="ipv4_dhcp_range", action="create", config="Default", range=value
+    )
+
+
+def _messages(entries):
+    return {(e.row_id, e.message) for e in entries}
+
+
+class TestCIDROverlaps:
+    """Test block and network nesting."""
+
+    def test_valid_hierarchy(self):
+        """Test that networks in nested blocks, including a network spanning its block, pass."""
+        rows = [
+            _block(1, "10.0.0.0/8"),
+            _block(2, "10.1.0.0/16"),
+            _network(3, "10.1.2.0/24"),
+            _block(4, "10.2.0.0/24"),
+            _network(5, "10.2.0.0/24"),
+            _network(6, "10.3.0.0/24"),
+        ]
+
+        report = analyze_overlaps(rows)
+
+        assert report.is_valid
+        assert report.summary["checked"] == 6
+
+    def test_overlaps_and_duplicates(self):
+        """Test that nested networks, blocks in networks and duplicates are reported."""
+        rows = [
+            _network(1, "10.1.0.0/16"),
+            _network(2, "10.1.5.0/24"),
+            _block(3, "10.1.6.0/24"),
+            _network(4, "10.2.0.0/24"),
+            _network(5, "10.2.0.1/24"),
+            _block(6, "172.16.0.0/12"),
+            _block(7, "172.16.0.0/12"),
+        ]
+
+        report = analyze_overlaps(rows)
+
+        assert _messages(report.errors) == {
+            ("2", "Network 10.1.5.0/24 overlaps network 10.1.0.0/16 (row 1)"),
+            ("3", "Block 10.1.6.0/24 is inside network 10.1.0.0/16 (row 1)"),
+            ("5", "Network 10.2.0.0/24 duplicates row 4"),
+            ("7", "Block 172.16.0.0/12 duplicates row 6"),
+        }
+
+    def test_scoped_by_config_and_action(self):
+        """Test that other configurations, other families and deletes do not conflict."""
+        rows = [
+            _network(1, "10.1.0.0/16"),
+            _network(2, "10.1.0.0/24", config="Lab"),
+            _network(3, "10.1.0.0/24", action="delete"),
+            IP6NetworkRow(
+                row_id=4,
+                object_type="ip6_network",
+                action="create",
+                config="Default",
+                name="N6",
+                cidr="2001:db8::/64",
+            ),
+        ]
+
+        assert analyze_overlaps(rows).is_valid
+
+
+class TestAddressesAndRanges:
+    """Test addresses and DHCP ranges against the file's networks."""
+
+    def test_duplicate_and_orphan_addresses(self):
+        """Test duplicate addresses are errors and addresses outside networks warnings."""
+        rows = [
+            _network(1, "10.1.0.0/24"),
+            _address(2, "10.1.0.5"),
+            _address(3, "10.1.0.5"),
+            _address(4, "10.9.0.1"),
+        ]
+
+        report = analyze_overlaps(rows)
+
+        assert _messages(report.errors) == {("3", "Address 10.1.0.5 duplicates row 2")}
+        assert [w.row_id for w in report.warnings] == ["4"]
+
+    def test_addresses_without_networks_are_not_orphans(self):
+        """Test that a file of addresses alone is assumed to target existing networks."""
+        report = analyze_overlaps([_address(1, "10.1.0.5"), _address(2, "10.1.0.6")])
+
+        assert report.is_valid
+        assert not report.warnings
+
+    def test_dhcp_ranges(self):
+        """Test ranges crossing network boundaries or each other."""
+        rows = [
+            _network(1, "10.1.0.0/24"),
+            _network(2, "10.1.1.0/24"),
+            _range(3, "10.1.0.100-10.1.0.150"),
+            _range(4, "10.1.0.140-10.1.0.160"),
+            _range(5, "10.1.0.200-10.1.1.10"),
+            _range(6, "10.0.255.250-10.1.0.5"),
+            _range(7, "10.5.0.1-10.5.0.9"),
+        ]
+
+        report = analyze_overlaps(rows)
+
+        assert _messages(report.errors) == {
+            ("4", "DHCP range 10.1.0.140-10.1.0.160 overlaps row 3"),
+            ("5", "DHCP range 10.1.0.200-10.1.1.10 extends past network 10.1.0.0/24 (row 1)"),
+            ("6", "DHCP range 10.0.255.250-10.1.0.5 crosses into network 10.1.0.0/24 (row 1)"),
+        }
+        assert [w.row_id for w in report.warnings] == ["7"]
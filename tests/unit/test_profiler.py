@@ -0,0 +1,94 @@
+"""Unit tests for SessionProfiler."""
+
+import time
+
+from src.importer.observability.profiler import SessionProfiler, StackSampler, endpoint_family
+
+
+class TestEndpointFamily:
+    """Test endpoint family normalization."""
+
+    def test_ids_collapsed(self):
+        """Test that numeric segments become {id}."""
+        assert endpoint_family("get", "blocks/12/networks") == "GET blocks/{id}/networks"
+
+    def test_query_string_dropped(self):
+        """Test that query strings do not create separate families."""
+        assert endpoint_family("GET", "/configurations?filter=name:'x'") == "GET configurations"
+
+
+class TestSessionProfiler:
+    """Test SessionProfiler."""
+
+    def test_phases_accumulate_in_order(self):
+        """Test that re-entering a phase adds to its totals."""
+        profiler = SessionProfiler()
+        profiler.start()
+        with profiler.phase("parse"):
+            pass
+        with profiler.phase("execute"):
+            time.sleep(0.01)
+        with profiler.phase("parse"):
+            pass
+        profiler.stop()
+
+        data = profiler.to_dict()
+
+        assert [p["name"] for p in data["phases"]] == ["parse", "execute"]
+        assert data["phases"][0]["calls"] == 2
+        assert data["phases"][1]["wall_seconds"] >= 0.01
+        assert data["wall_seconds"] >= data["phases"][1]["wall_seconds"]
+
+    def test_record_request(self):
+        """Test per-endpoint counts, errors and latency."""
+        profiler = SessionProfiler()
+        profiler.record_request("GET", "blocks/1/networks", 200, 10.0)
+        profiler.record_request("GET", "blocks/2/networks", 200, 30.0)
+        profiler.record_request("POST", "blocks/2/networks", 409, 5.0)
+
+        data = profiler.to_dict()
+
+        assert data["api_calls"] == 3
+        top = data["endpoints"][0]
+        assert top["family"] == "GET blocks/{id}/networks"
+        assert top["count"] == 2
+        assert top["avg_ms"] == 20.0
+        assert top["max_ms"] == 30.0
+        assert data["endpoints"][1]["errors"] == 1
+
+    def test_start_is_idempotent(self):
+        """Test that a second start() keeps the original clock."""
+        profiler = SessionProfiler()
+        profiler.start()
+        first = profiler._wall_start
+        profiler.start()
+        assert profiler._wall_start == first
+        profiler.stop()
+
+    def test_no_hotspots_without_sampling(self):
+        """Test that sampling is off by default."""
+        profiler = SessionProfiler()
+        profiler.start()
+        profiler.stop()
+        assert profiler.to_dict()["hotspots"] == []
+
+
+class TestStackSampler:
+    """Test StackSampler."""
+
+    def test_samples_busy_function(self):
+        """Test that a CPU-bound function shows up as a hotspot."""
+
+        def busy_loop():
+            end = time.perf_counter() + 0.2
+            while time.perf_counter() < end:
+                pass
+
+        sampler = StackSampler(interval=0.002)
+        sampler.start()
+        busy_loop()
+        sampler.stop()
+
+        hotspots = sampler.hotspots()
+        assert sampler.samples > 0
+        assert any("busy_loop" in h["function"] for h in hotspots)
@@ -0,0 +1,159 @@
+"""Tests for read routing across BAM instances and background session renewal."""
+
+import asyncio
+
+import pytest
+
+from src.importer.bam.client import BAMClient
+from src.importer.bam.mock_server import MockBAMCluster, MockBAMFaults
+from src.importer.bam.routing import InstancePool
+from src.importer.config import BAMConfig
+
+
+@pytest.fixture
+def cluster():
+    """Run a primary and two read instances for the duration of a test."""
+    with MockBAMCluster(readers=2) as running:
+        yield running
+
+
+def _client(cluster, **overrides):
+    settings = {
+        "base_url": cluster.base_url,
+        "read_urls": cluster.read_urls,
+        "username": "admin",
+        "password": "admin",
+        "verify_ssl": False,
+        "read_after_write_seconds": 0.0,
+        "health_check_interval": 0,
+        "response_cache_size": 0,  # count every request
+    }
+    settings.update(overrides)
+    return BAMClient(BAMConfig(**settings))
+
+
+def _requests(server, key):
+    return server.state.get_stats()["by_endpoint"].get(key, 0)
+
+
+class TestInstancePool:
+    """Test routing decisions."""
+
+    def test_writes_and_fresh_reads_use_the_primary(self):
+        """Test that reads stay on the primary right after a write."""
+        pool = InstancePool("p", ["r1", "r2"], read_after_write_seconds=60)
+
+        assert pool.route("GET")[0].api_url in ("r1", "r2")
+        assert [i.api_url for i in pool.route("POST")] == ["p"]
+        assert [i.api_url for i in pool.route("GET")] == ["p"]
+
+    def test_least_busy_reader_first(self):
+        """Test that reads prefer idle read instances and end with the primary."""
+        pool = InstancePool("p", ["r1", "r2"])
+        pool.readers[0].in_flight = 3
+
+        assert [i.api_url for i in pool.route("GET")] == ["r2", "r1", "p"]
+
+    def test_failing_reader_leaves_rotation(self):
+        """Test that repeated failures take a reader out until its probe is due."""
+        pool = InstancePool("p", ["r1"], health_check_interval=60)
+        reader = pool.readers[0]
+
+        pool.mark_failure(reader, "refused")
+        assert reader.healthy
+        pool.mark_failure(reader, "refused")
+
+        assert [i.api_url for i in pool.route("GET")] == ["p"]
+        assert pool.due_for_probe() == []
+        reader.retry_at = 1.0
+        assert pool.due_for_probe() == [reader]
+        pool.mark_success(reader)
+        assert reader.healthy
+
+
+class TestClusterRouting:
+    """Test BAMClient against a mock primary with read instances."""
+
+    async def test_reads_spread_over_read_instances(self, cluster):
+        """Test that writes reach the primary and lookups the read instances."""
+        client = _client(cluster)
+        try:
+            config = await client.get_configuration_by_name("Default")
+            await client.create_ip4_block(config["id"], "10.0.0.0/8", "Block")
+            for _ in range(6):
+                await client.get_configuration_by_name("Default")
+        finally:
+            await client.close()
+
+        assert _requests(cluster.primary, "POST configurations/{id}/blocks") == 1
+        assert _requests(cluster.primary, "GET configurations") == 0
+        assert all(_requests(reader, "GET configurations") > 0 for reader in cluster.readers)
+
+    async def test_failover_and_recovery(self, cluster):
+        """Test that a failing reader is skipped and rejoins once its probe passes."""
+        broken = cluster.readers[0]
+        broken.state.set_faults(MockBAMFaults(error_rate=1.0))
+        client = _client(cluster, health_check_interval=3600)
+        try:
+            for _ in range(6):
+                assert (await client.get_configuration_by_name("Default"))["name"] == "Default"
+            reader = client.instances.readers[0]
+            assert not reader.healthy
+
+            broken.state.set_faults(MockBAMFaults())
+            reader.retry_at = 1.0  # probe due
+            await client.get_configuration_by_name("Default")
+            await asyncio.gather(*client._background)
+            assert reader.healthy
+        finally:
+            await client.close()
+
+    async def test_unreachable_reader(self, cluster):
+        """Test that reads fail over when a read instance is down."""
+        cluster.readers[0].stop()
+        cluster.readers[1].stop()
+        client = _client(cluster, health_check_interval=3600)
+        try:
+            config = await client.get_configuration_by_name("Default")
+        finally:
+            await client.close()
+
+        assert config["name"] == "Default"
+        assert _requests(cluster.primary, "GET configurations") == 1
+
+
+class TestSessionRenewal:
+    """Test proactive and reactive session renewal."""
+
+    async def test_renews_before_expiry(self, cluster):
+        """Test that an old session is replaced in the background without a 401."""
+        client = _client(cluster, read_urls=[], session_timeout=100)
+        try:
+            await client.authenticate()
+            old = client.basic_auth_credentials
+            client.instances.primary.authenticated_at -= 90
+
+            await client.get_configuration_by_name("Default")
+            await asyncio.gather(*client._background)
+        finally:
+            await client.close()
+
+        assert client.basic_auth_credentials != old
+        assert _requests(cluster.primary, "POST sessions") == 2
+        assert cluster.primary.state.get_stats()["unauthorized"] == 0
+
+    async def test_concurrent_expiry_authenticates_once(self, cluster):
+        """Test that requests failing on the same expired session share one re-auth."""
+        client = _client(cluster, read_urls=[])
+        try:
+            await client.authenticate()
+            cluster.primary.state.expire_sessions()
+
+            configs = await asyncio.gather(
+                *(client.get_configuration_by_name("Default") for _ in range(8))
+            )
+        finally:
+            await client.close()
+
+        assert all(config["name"] == "Default" for config in configs)
+        assert _requests(cluster.primary, "POST sessions") == 2
@@ -8,7 +8,8 @@ import pytest
 
 from src.importer.models.operations import OperationType
 from src.importer.models.results import OperationResult
-from src.importer.observability.reporter import ImportReport, ReportGenerator
+from src.importer.observability.metrics import MetricsCollector
+from src.importer.observability.reporter import ImportReport, ReportGenerator, error_signature
 
 
 class TestReporter:
@@ -150,6 +151,169 @@ class TestReporter:
         assert "FAILED" in content
         assert "rollback.csv" in content
 
+    def test_html_report_includes_profile(self, reporter, sample_results, tmp_path):
+        """Test that profile data is embedded in JSON and rendered in HTML."""
+        profile = {
+            "wall_seconds": 2.0,
+            "cpu_seconds": 1.0,
+            "phases": [
+                {
+                    "name": "resolve",
+                    "wall_seconds": 1.5,
+                    "cpu_seconds": 0.5,
+                    "calls": 1,
+                    "percent": 75.0,
+                }
+            ],
+            "api_calls": 3,
+            "endpoints": [
+                {
+                    "family": "GET blocks/{id}/networks",
+                    "count": 3,
+                    "errors": 0,
+                    "total_ms": 30.0,
+                    "max_ms": 15.0,
+                    "avg_ms": 10.0,
+                }
+            ],
+            "hotspots": [
+                {
+                    "function": "resolver.py:10(resolve)",
+                    "self_samples": 5,
+                    "total_samples": 8,
+                    "self_percent": 50.0,
+                    "total_percent": 80.0,
+                }
+            ],
+            "samples": 10,
+        }
+        report = reporter.generate_report(
+            session_id="prof",
+            start_time=datetime(2023, 1, 1, 12, 0, 0),
+            end_time=datetime(2023, 1, 1, 12, 0, 2),
+            csv_file=Path("test.csv"),
+            dry_run=False,
+            results=sample_results,
+            metrics={},
+            profile=profile,
+        )
+
+        reporter.write_html_report(report, tmp_path / "report.html")
+        content = (tmp_path / "report.html").read_text()
+
+        assert report.profile == profile
+        assert "Profile" in content
+        assert "GET blocks/{id}/networks" in content
+        assert "resolver.py:10(resolve)" in content
+
+    def test_error_signature(self):
+        """Test that variable parts of error messages are normalised."""
+        assert error_signature("Network 10.0.0.0/24 not found (id 12)") == error_signature(
+            "Network 10.1.0.0/24 not found (id 99)"
+        )
+        assert error_signature("Zone 'a.com' missing") == "Zone '<str>' missing"
+        assert error_signature(None) == "Unknown error"
+
+    def test_errors_grouped_and_bounded(self, reporter):
+        """Test that failures are aggregated by signature and only a sample is kept."""
+
+        def results():
+            for i in range(50):
+                yield OperationResult(
+                    row_id=str(i),
+                    operation=OperationType.CREATE,
+                    success=False,
+                    error_message=f"Network 10.0.{i}.0/24 not found",
+                    duration_ms=float(i),
+                )
+            yield OperationResult(
+                row_id="x",
+                operation=OperationType.DELETE,
+                success=False,
+                error_message="Permission denied",
+            )
+
+        report = reporter.generate_report(
+            session_id="grouped",
+            start_time=datetime(2023, 1, 1, 12, 0, 0),
+            end_time=datetime(2023, 1, 1, 12, 0, 5),
+            csv_file=Path("test.csv"),
+            dry_run=False,
+            results=results(),
+            metrics={},
+            object_types={str(i): "ip4_network" for i in range(50)},
+            max_errors=10,
+        )
+
+        assert report.failed_operations == 51
+        assert len(report.errors) == 10
+        assert report.errors[0]["object_type"] == "ip4_network"
+        assert [g["count"] for g in report.error_groups] == [50, 1]
+        top = report.error_groups[0]
+        assert top["signature"] == "Network <ip> not found"
+        assert top["object_type"] == "ip4_network"
+        assert top["sample_row_ids"] == ["0", "1", "2", "3", "4"]
+        assert report.max_operation_duration_ms == 49.0
+        assert report.latency_histograms["import_operation_duration_ms"]["count"] == 50
+
+    def test_results_jsonl(self, reporter, sample_results, tmp_path):
+        """Test that per-operation results are streamed to JSON Lines."""
+        import json
+
+        results_path = tmp_path / "reports" / "results.jsonl"
+
+        report = reporter.generate_report(
+            session_id="jsonl",
+            start_time=datetime(2023, 1, 1, 12, 0, 0),
+            end_time=datetime(2023, 1, 1, 12, 0, 5),
+            csv_file=Path("test.csv"),
+            dry_run=False,
+            results=sample_results,
+            metrics={},
+            results_path=results_path,
+        )
+
+        lines = [json.loads(line) for line in results_path.read_text().splitlines()]
+        assert report.results_path == str(results_path)
+        assert [line["row_id"] for line in lines] == ["1", "2"]
+        assert lines[0]["operation"] == "create"
+        assert lines[0]["resource_id"] == 101
+        assert lines[1]["error"] == "Update failed"
+
+    def test_html_report_latency_and_escaping(self, reporter, tmp_path):
+        """Test the latency histogram section and that error text is escaped."""
+        results = [
+            OperationResult(
+                row_id="1",
+                operation=OperationType.CREATE,
+                success=False,
+                error_message="<script>alert(1)</script>",
+                duration_ms=20.0,
+            )
+        ]
+        histograms = MetricsCollector(backend="logger")
+        histograms.backend.timing("bam_api_latency_ms", 7.0, tags={"method": "GET"})
+
+        report = reporter.generate_report(
+            session_id="html",
+            start_time=datetime(2023, 1, 1, 12, 0, 0),
+            end_time=datetime(2023, 1, 1, 12, 0, 5),
+            csv_file=Path("test.csv"),
+            dry_run=False,
+            results=results,
+            metrics={},
+            latency_histograms=histograms.get_latency_histograms(),
+        )
+        reporter.write_html_report(report, tmp_path / "report.html")
+        content = (tmp_path / "report.html").read_text()
+
+        assert "Latency" in content
+        assert "bam_api_latency_ms" in content
+        assert "import_operation_duration_ms" in content
+        assert "<script>" not in content
+        assert "&lt;script&gt;" in content
+        assert "By Error Signature" in content
+
     def test_get_session_summary_no_changelog(self):
         """Test getting summary without changelog."""
         reporter = ReportGenerator()
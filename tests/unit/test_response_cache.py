@@ -0,0 +1,129 @@
+"""Tests for the conditional-request GET response cache."""
+
+import pytest
+
+from src.importer.bam.client import BAMClient
+from src.importer.bam.mock_server import MockBAMServer, MockBAMState
+from src.importer.bam.response_cache import ResponseCache, fresh_reads
+from src.importer.config import BAMConfig
+
+
+def _requests(server, key):
+    return server.state.get_stats()["by_endpoint"].get(key, 0)
+
+
+@pytest.fixture(params=[False, True], ids=["ttl", "etag"])
+def server(request):
+    """Mock BAM with and without ETags."""
+    with MockBAMServer(MockBAMState(etags=request.param)) as srv:
+        yield srv
+
+
+@pytest.fixture
+async def client(server):
+    """BAMClient against the mock server."""
+    bam = BAMClient(
+        BAMConfig(base_url=server.base_url, username="admin", password="admin", verify_ssl=False)
+    )
+    yield bam
+    await bam.close()
+
+
+class TestResponseCache:
+    """Test the store itself."""
+
+    def test_least_recently_used_entry_is_dropped(self):
+        """Test that the cache keeps at most max_entries responses."""
+        cache = ResponseCache(ttl=60, max_entries=2)
+        first, second, third = (cache.key(f"blocks/{i}", None) for i in range(3))
+        cache.store(first, b"{}", {})
+        cache.store(second, b"{}", {})
+        cache.get(first)
+        cache.store(third, b"{}", {})
+
+        assert cache.get(second) is None
+        assert cache.get(first) is not None
+
+    def test_writes_invalidate_their_collection(self):
+        """Test that a write drops every path through the written collection."""
+        cache = ResponseCache(ttl=60)
+        networks = cache.key("blocks/7/networks", {"limit": 100})
+        views = cache.key("configurations/1/views", None)
+        cache.store(networks, b"{}", {})
+        cache.store(views, b"{}", {})
+
+        cache.invalidate("POST", "blocks/8/networks")
+        assert cache.get(networks) is None
+        assert cache.get(views) is not None
+
+        cache.invalidate("DELETE", "zones/3")
+        assert len(cache) == 0
+
+    def test_writes_invalidate_collections_they_change(self):
+        """Test that a host record write also drops the address listings it allocates in."""
+        cache = ResponseCache(ttl=60)
+        addresses = cache.key("networks/5/addresses", None)
+        views = cache.key("configurations/1/views", None)
+        cache.store(addresses, b"{}", {})
+        cache.store(views, b"{}", {})
+
+        cache.invalidate("POST", "zones/9/resourceRecords")
+        assert cache.get(addresses) is None
+        assert cache.get(views) is not None
+
+    def test_no_ttl_keeps_only_validated_responses(self):
+        """Test that without a TTL only responses with validators are stored."""
+        cache = ResponseCache(ttl=0)
+
+        assert cache.store(cache.key("views", None), b"{}", {}) is None
+        entry = cache.store(cache.key("views", None), b"{}", {"ETag": '"a"'})
+        assert entry is not None and not cache.fresh(entry)
+        assert entry.conditional_headers() == {"If-None-Match": '"a"'}
+
+
+class TestCachedClient:
+    """Test BAMClient against the mock server, with TTL and with ETags."""
+
+    async def test_repeated_listing(self, client, server):
+        """Test that an unchanged listing is not transferred twice."""
+        first = await client.get_views_in_configuration(1)
+        second = await client.get_views_in_configuration(1)
+
+        assert second == first
+        stats = client.response_cache.stats
+        if server.state.etags:
+            assert _requests(server, "GET configurations/{id}/views") == 2
+            assert server.state.get_stats()["not_modified"] == 1
+            assert stats["revalidated"] == 1
+        else:
+            assert _requests(server, "GET configurations/{id}/views") == 1
+            assert stats["hits"] == 1
+
+    async def test_callers_get_their_own_copy(self, client):
+        """Test that mutating a returned listing does not change the cached one."""
+        views = await client.get_views_in_configuration(1)
+        views[0]["name"] = "changed"
+
+        assert (await client.get_views_in_configuration(1))[0]["name"] != "changed"
+
+    async def test_own_write_is_visible(self, client):
+        """Test that creating a block refreshes the block listing."""
+        config = await client.get_configuration_by_name("Default")
+        assert await client.get_all_pages(f"configurations/{config['id']}/blocks") == []
+
+        await client.create_ip4_block(config["id"], "10.0.0.0/8", "Block")
+
+        blocks = await client.get_all_pages(f"configurations/{config['id']}/blocks")
+        assert [b["range"] for b in blocks] == ["10.0.0.0/8"]
+
+    async def test_outside_change(self, client, server):
+        """Test that ETags catch outside changes and fresh_reads() always does."""
+        await client.get_views_in_configuration(1)
+        server.state.add_entity(1, "views", {"type": "View", "name": "Lab"})
+
+        views = await client.get_views_in_configuration(1)
+        assert ("Lab" in {v["name"] for v in views}) == server.state.etags
+
+        with fresh_reads():
+            views = await client.get_views_in_configuration(1)
+        assert "Lab" in {v["name"] for v in views}
@@ -0,0 +1,196 @@
+"""Tests for streaming results from the executor to consumers."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.importer.bam.client import BAMClient
+from src.importer.config import PolicyConfig
+from src.importer.execution.executor import OperationExecutor
+from src.importer.execution.pipeline import (
+    CacheInvalidator,
+    ChangelogRecorder,
+    ResultPipeline,
+    ResultTally,
+)
+from src.importer.execution.planner import ExecutionBatch, ExecutionPlan
+from src.importer.models.operations import Operation, OperationType
+from src.importer.models.results import OperationResult
+from src.importer.persistence.changelog import ChangeLog
+
+
+def _result(row_id, success=True, **kwargs):
+    return OperationResult(row_id=row_id, operation=OperationType.CREATE, success=success, **kwargs)
+
+
+class Recorder:
+    """Consumer that keeps every chunk it is handed."""
+
+    def __init__(self):
+        self.chunks: list[list] = []
+
+    async def handle(self, results):
+        self.chunks.append([r.row_id for r in results])
+
+    @property
+    def row_ids(self):
+        return [row_id for chunk in self.chunks for row_id in chunk]
+
+
+class TestResultPipeline:
+    """Test queueing, chunking, backpressure and errors."""
+
+    async def test_delivers_in_order_and_in_chunks(self):
+        """Test that queued results reach every consumer in chunks of bounded size."""
+        first, second = Recorder(), Recorder()
+        async with ResultPipeline([first, second], chunk_size=3) as pipeline:
+            for i in range(7):
+                await pipeline.publish(_result(i))
+            await pipeline.drain()
+            assert first.row_ids == list(range(7))
+
+        assert second.row_ids == list(range(7))
+        assert max(map(len, first.chunks)) <= 3
+
+    async def test_publish_waits_for_slow_consumer(self):
+        """Test that a full queue holds the publisher back."""
+        release = asyncio.Event()
+
+        class Blocked:
+            async def handle(self, results):
+                await release.wait()
+
+        pipeline = ResultPipeline([Blocked()], maxsize=2, chunk_size=1)
+        pipeline.start()
+        for i in range(3):  # one in the consumer, two queued
+            await pipeline.publish(_result(i))
+
+        blocked = asyncio.create_task(pipeline.publish(_result(3)))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+
+        release.set()
+        await blocked
+        await pipeline.close()
+        assert pipeline.published == 4
+
+    async def test_consumer_error_raised_on_drain(self):
+        """Test that a failing consumer neither stops the others nor goes unnoticed."""
+        failing = MagicMock()
+        failing.handle = AsyncMock(side_effect=RuntimeError("disk full"))
+        recorder = Recorder()
+        pipeline = ResultPipeline([failing, recorder])
+
+        await pipeline.publish(_result(1))
+        await pipeline.publish(_result(2))
+        with pytest.raises(RuntimeError, match="disk full"):
+            await pipeline.close()
+        assert recorder.row_ids == [1, 2]
+
+
+class TestExecutorStreaming:
+    """Test OperationExecutor publishing to a sink."""
+
+    async def test_results_consumed_before_checkpoint(self):
+        """Test each batch is consumed before its checkpoint, with results not kept."""
+        client = AsyncMock(spec=BAMClient)
+        operations = [
+            Operation(
+                row_id=i,
+                operation_type=OperationType.NOOP,
+                object_type="ip4_network",
+                resource_id=100 + i,
+                payload={"name": f"n{i}"},
+                csv_row=None,
+            )
+            for i in range(6)
+        ]
+        plan = ExecutionPlan(
+            batches=[
+                ExecutionBatch(batch_id=0, operations=operations[:4]),
+                ExecutionBatch(batch_id=1, operations=operations[4:]),
+            ],
+            total_operations=6,
+        )
+        recorder, tally = Recorder(), ResultTally()
+        consumed_at_checkpoint = []
+        checkpoints = MagicMock()
+        checkpoints.save_checkpoint.side_effect = lambda **kwargs: consumed_at_checkpoint.append(
+            (tally.total, kwargs["operation_index"])
+        )
+        executor = OperationExecutor(
+            client, PolicyConfig(), checkpoint_manager=checkpoints, session_id="s"
+        )
+
+        async with ResultPipeline([recorder, tally]) as pipeline:
+            results = await executor.execute_plan(plan, sink=pipeline, keep_results=False)
+
+        assert results == []
+        assert sorted(recorder.row_ids) == list(range(6))
+        assert consumed_at_checkpoint == [(4, 4), (6, 6)]
+        assert tally.successful == executor.succeeded_count
+
+
+class TestConsumers:
+    """Test the runner's result consumers."""
+
+    async def test_tally(self):
+        """Test counts and the capped failure sample."""
+        tally = ResultTally(max_failures=1)
+
+        await tally.handle(
+            [
+                _result(1),
+                _result(2, success=False, error_message="a"),
+                _result(3, success=False, error_message="b"),
+                _result(4, success=False, metadata={"skipped": True}),
+            ]
+        )
+
+        assert (tally.successful, tally.failed, tally.skipped) == (1, 2, 1)
+        assert [r.row_id for r in tally.failures] == [2]
+
+    @pytest.mark.parametrize(
+        "path, parent",
+        [
+            ("Default/10.0.0.0/8", "Default"),
+            ("Internal/example.com/sub", "Internal/example.com"),
+            ("Default", None),
+        ],
+    )
+    def test_parent_path(self, path, parent):
+        """Test CIDR and hierarchical parent paths."""
+        assert CacheInvalidator.parent_path(path) == parent
+
+    async def test_changelog_recorder(self, tmp_path):
+        """Test that successes and failures are recorded and skips are not."""
+        changelog = ChangeLog(str(tmp_path / "changelog.db"))
+        op = Operation(
+            row_id=1,
+            operation_type=OperationType.CREATE,
+            object_type="ip4_network",
+            payload={},
+            resource_id=None,
+            csv_row=None,
+        )
+        recorder = ChangelogRecorder(
+            changelog, "s1", {1: op}, lambda op, result: (None, {"id": result.resource_id})
+        )
+
+        await recorder.handle(
+            [
+                _result(1, resource_id=7),
+                _result(2, success=False, error_message="boom"),
+                _result(3, success=False, metadata={"skipped": True}),
+            ]
+        )
+
+        entries = changelog.get_session_entries("s1")
+        changelog.close()
+        assert recorder.recorded == 2
+        assert [(e.row_id, e.object_type, e.success) for e in entries] == [
+            ("1", "ip4_network", True),
+            ("2", "unknown", False),
+        ]
+        assert entries[0].resource_id == 7
@@ -16,7 +16,7 @@ class TestRollbackCLI:
         self.csv_file = Path("rollback.csv")
 
     @patch("src.importer.execution.runner.ImportRunner")
-    @patch("src.importer.cli.ImporterConfig")
+    @patch("src.importer.config.ImporterConfig")
     def test_rollback_command_execution(self, mock_config, mock_runner_class):
         """Test rollback command executes ImportRunner correctly."""
         # Setup mocks
@@ -42,7 +42,7 @@ class TestRollbackCLI:
             assert call_kwargs["generate_rollback"] is False  # Should be False for rollback
 
     @patch("src.importer.execution.runner.ImportRunner")
-    @patch("src.importer.cli.ImporterConfig")
+    @patch("src.importer.config.ImporterConfig")
     def test_rollback_command_dry_run(self, mock_config, mock_runner_class):
         """Test rollback command in dry-run mode."""
         mock_runner_instance = mock_runner_class.return_value
@@ -3,10 +3,10 @@
 import csv
 import json
 from pathlib import Path
-from unittest.mock import MagicMock, patch
 
 import pytest
 
+from src.importer.core.parser import CSVParser
 from src.importer.persistence.changelog import ChangeLog, ChangeLogEntry
 from src.importer.rollback.generator import RollbackGenerator
 
@@ -27,8 +27,32 @@ class TestRollbackGenerator:
         self.changelog.close()
 
     def mock_changelog_entries(self, entries):
-        """Mock changelog entries retrieval."""
-        self.changelog.get_session_entries = MagicMock(return_value=entries)
+        """Store changelog entries directly, keeping their ids and raw states."""
+        with self.changelog.conn:
+            self.changelog.conn.executemany(
+                """
+                INSERT INTO changelog (
+                    id, session_id, timestamp, row_id, object_type, operation_type,
+                    success, resource_id, error_message, before_state, after_state
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (
+                        e.id,
+                        e.session_id,
+                        e.timestamp,
+                        e.row_id,
+                        e.object_type,
+                        e.operation_type,
+                        e.success,
+                        e.resource_id,
+                        e.error_message,
+                        e.before_state,
+                        e.after_state,
+                    )
+                    for e in entries
+                ],
+            )
 
     def test_init(self):
         """Test initialization."""
@@ -126,11 +150,10 @@ class TestRollbackGenerator:
         assert row["name"] == "old_name"
 
     def test_generate_rollback_csv_delete_operation(self):
-        """Test generating rollback for DELETE operation (skipped)."""
+        """Test generating rollback for DELETE operation (re-create)."""
         session_id = "test_session"
         output_path = Path(self.temp_dir) / "rollback_delete.csv"
 
-        # DELETE operations require recreation which is risky/complex, so typically skipped or logged
         entry = ChangeLogEntry(
             id=1,
             timestamp="2023-01-01T12:00:00",
@@ -139,7 +162,9 @@ class TestRollbackGenerator:
             object_type="ip4_address",
             resource_id=103,
             row_id="1",
-            before_state=json.dumps({"address": "10.1.0.3"}),
+            before_state=json.dumps(
+                {"config": "Default", "address": "10.1.0.3", "name": "web", "id": 103}
+            ),
             after_state=None,
             success=True,
             error_message=None,
@@ -151,8 +176,21 @@ class TestRollbackGenerator:
             output_path=output_path,
         )
 
-        # Expect 0 operations as DELETE rollback is not auto-generated
-        assert stats["rollback_operations"] == 0
+        assert stats["rollback_operations"] == 1
+        assert stats["recreates"] == 1
+
+        with open(output_path, encoding="utf-8") as f:
+            data_lines = [line for line in f if not line.startswith("#")]
+            rows = list(csv.DictReader(data_lines))
+
+        assert rows[0]["action"] == "create"
+        assert rows[0]["address"] == "10.1.0.3"
+        assert rows[0]["name"] == "web"
+        assert "bam_id" not in rows[0]
+
+        # Re-create rows are valid importer input
+        parsed = CSVParser(output_path).parse()
+        assert parsed[0].action == "create"
 
     def test_generate_rollback_csv_failed_operation(self):
         """Test that failed operations are ignored."""
@@ -255,8 +293,8 @@ class TestRollbackGenerator:
         assert row["name"] == "original_name"
         assert row["mac"] == "aa:bb:cc:dd:ee:ff"
 
-    def test_delete_operation_warning(self):
-        """Test that delete operation logs warning."""
+    def test_delete_without_before_state_is_skipped(self):
+        """Test that DELETE entries without a recorded state cannot be re-created."""
         session_id = "test_session"
         output_path = Path(self.temp_dir) / "delete_warning.csv"
 
@@ -268,21 +306,71 @@ class TestRollbackGenerator:
             object_type="ip4_address",
             resource_id=103,
             row_id="1",
-            before_state=json.dumps({"address": "10.1.0.3"}),
+            before_state=None,
             after_state=None,
             success=True,
             error_message=None,
         )
         self.mock_changelog_entries([entry])
 
-        with patch("structlog.stdlib.BoundLogger.warning"):
-            # We assume structlog is used, but if not we can patch logger in the module
-            # For simplicity, we just run it and assume no error
-            self.rollback_generator.generate_rollback_csv(
-                session_id=session_id,
-                output_path=output_path,
-            )
-            # Cannot easily verify log call without proper capture fixture, but execution should pass
+        stats = self.rollback_generator.generate_rollback_csv(
+            session_id=session_id,
+            output_path=output_path,
+            include_deletes=True,
+        )
+
+        assert stats["rollback_operations"] == 0
+        assert not output_path.exists()
+
+    def test_legacy_repr_states_are_decoded(self):
+        """Test entries stored as JSON-encoded dict reprs by older versions still work."""
+        entry = ChangeLogEntry(
+            id=1,
+            timestamp="2023-01-01T12:00:00",
+            session_id="s",
+            operation_type="create",
+            object_type="ip4_address",
+            resource_id=101,
+            row_id="1",
+            before_state=None,
+            after_state=json.dumps(str({"address": "10.1.0.1", "name": "server1"})),
+            success=True,
+            error_message=None,
+        )
+
+        row = self.rollback_generator._create_delete_row(entry)
+
+        assert row["verify_name"] == "server1"
+
+    def test_create_rollback_round_trips_through_parser(self):
+        """Test delete rows for recorded creates carry enough fields to validate."""
+        self.changelog.record_operation(
+            "s",
+            1,
+            "ip4_block",
+            "create",
+            True,
+            resource_id=10,
+            after_state={"config": "Default", "cidr": "10.0.0.0/8", "name": "b", "id": 10},
+        )
+        self.changelog.record_operation(
+            "s",
+            2,
+            "ip4_network",
+            "create",
+            True,
+            resource_id=11,
+            after_state={"config": "Default", "cidr": "10.1.0.0/24", "name": "n", "id": 11},
+        )
+        output_path = Path(self.temp_dir) / "roundtrip.csv"
+
+        self.rollback_generator.generate_rollback_csv("s", output_path)
+        rows = CSVParser(output_path).parse()
+
+        assert [(r.object_type, r.action, r.bam_id) for r in rows] == [
+            ("ip4_network", "delete", 11),
+            ("ip4_block", "delete", 10),
+        ]
 
     def test_reverse_order_for_rollback(self):
         """Test that operations are reversed for rollback."""
@@ -10,6 +10,17 @@ from src.importer.execution.runner import ImportRunner
 from src.importer.models.operations import OperationType
 
 
+def _streaming(*results):
+    """execute_plan stand-in that publishes its results to the sink, like the executor."""
+
+    async def execute_plan(plan, **kwargs):
+        for result in results:
+            await kwargs["sink"].publish(result)
+        return list(results)
+
+    return AsyncMock(side_effect=execute_plan)
+
+
 class TestImportRunner:
     """Test ImportRunner class."""
 
@@ -74,8 +85,7 @@ class TestImportRunner:
         result = MagicMock()
         result.success = True
         result.metadata = {}
-        mock_executor_instance.execute_plan.return_value = [result]
-        mock_executor_instance.execute_plan = AsyncMock(return_value=[result])
+        mock_executor_instance.execute_plan = _streaming(result)
 
         mock_plan = MagicMock()
         mock_plan.total_operations = 1
@@ -164,7 +174,7 @@ class TestImportRunner:
         result.row_id = 99
         result.success = True
         result.operation = OperationType.DELETE
-        mock_executor.return_value.execute_plan = AsyncMock(return_value=[result])
+        mock_executor.return_value.execute_plan = _streaming(result)
 
         # Run
         await self.runner.run_session(Path("dummy.csv"))
@@ -225,7 +235,7 @@ class TestImportRunner:
         result.success = False
         result.error_message = "Failed"
         result.metadata = {}
-        mock_executor_instance.execute_plan = AsyncMock(return_value=[result])
+        mock_executor_instance.execute_plan = _streaming(result)
 
         mock_plan = MagicMock()
         mock_plan.total_operations = 1
@@ -275,3 +285,237 @@ class TestImportRunner:
         assert result["successful_operations"] == 0
         assert result["failed_operations"] == 0
         assert "empty" in result["message"].lower()
+
+    @patch("src.importer.execution.runner.Progress")
+    @patch("src.importer.execution.runner.BAMClient")
+    @patch("src.importer.execution.runner.OperationExecutor")
+    @patch("src.importer.execution.runner.CSVParser")
+    @patch("src.importer.execution.runner.ChangeLog")
+    @patch("src.importer.execution.runner.CheckpointManager")
+    @patch("src.importer.execution.runner.ImportRunner._calculate_file_hash")
+    @pytest.mark.asyncio
+    async def test_run_session_incremental_no_changes(
+        self,
+        mock_hash,
+        mock_ckpt_mgr,
+        mock_changelog,
+        mock_parser,
+        mock_executor,
+        mock_client,
+        mock_progress,
+    ):
+        """Test --incremental skips execution when no row changed since the last run."""
+        from src.importer.core.incremental import fingerprint_rows
+        from src.importer.models.csv_row import IP4NetworkRow
+        from src.importer.persistence.changelog import RowSnapshot
+
+        mock_hash.return_value = "dummyhash"
+        rows = [
+            IP4NetworkRow(
+                row_id=1,
+                object_type="ip4_network",
+                action="create",
+                config="Default",
+                cidr="10.1.0.0/24",
+                name="Net",
+            )
+        ]
+        mock_parser.return_value.parse.return_value = rows
+        mock_changelog.return_value.get_latest_row_snapshot.return_value = RowSnapshot(
+            session_id="sess_prev",
+            source_key="/data/feed.csv",
+            created_at="2024-01-01T00:00:00",
+            rows=fingerprint_rows(rows),
+        )
+
+        mock_client_instance = mock_client.return_value
+        mock_client_instance.authenticate = AsyncMock()
+        mock_client_instance.close = AsyncMock()
+
+        failed = await self.runner.run_session(
+            csv_file=Path("feed.csv"), resume=False, incremental=True
+        )
+
+        assert failed == 0
+        mock_executor.assert_not_called()
+        mock_changelog.return_value.get_latest_row_snapshot.assert_called_once_with(
+            str(Path("feed.csv").resolve())
+        )
+
+    @patch("src.importer.execution.runner.ImportRunner._write_profile_report")
+    @patch("src.importer.execution.runner.Progress")
+    @patch("src.importer.execution.runner.BAMClient")
+    @patch("src.importer.execution.runner.Resolver")
+    @patch("src.importer.execution.runner.DependencyGraph")
+    @patch("src.importer.execution.runner.DependencyPlanner")
+    @patch("src.importer.execution.runner.ExecutionPlanner")
+    @patch("src.importer.execution.runner.OperationExecutor")
+    @patch("src.importer.execution.runner.CSVParser")
+    @patch("src.importer.execution.runner.ChangeLog")
+    @patch("src.importer.execution.runner.CheckpointManager")
+    @patch("src.importer.execution.runner.RollbackGenerator")
+    @patch("src.importer.execution.runner.ImportRunner._calculate_file_hash")
+    @pytest.mark.asyncio
+    async def test_run_session_profile(
+        self,
+        mock_hash,
+        mock_rollback_gen,
+        mock_ckpt_mgr,
+        mock_changelog,
+        mock_parser,
+        mock_executor,
+        mock_exec_planner,
+        mock_dep_planner,
+        mock_graph,
+        mock_resolver,
+        mock_client,
+        mock_progress,
+        mock_write_profile,
+    ):
+        """Test that a profiler records each pipeline phase and is attached to the client."""
+        from src.importer.observability.profiler import SessionProfiler
+
+        mock_hash.return_value = "dummyhash"
+        mock_parser.return_value.parse.return_value = [
+            MagicMock(row_id=1, object_type="network", action="create")
+        ]
+        mock_client_instance = mock_client.return_value
+        mock_client_instance.authenticate = AsyncMock()
+        mock_client_instance.close = AsyncMock()
+        result = MagicMock(success=True, metadata={})
+        mock_executor.return_value.execute_plan = _streaming(result)
+        mock_exec_planner.return_value.create_plan.return_value = MagicMock(total_operations=1)
+
+        profiler = SessionProfiler()
+        failed = await self.runner.run_session(
+            csv_file=Path("test.csv"), resume=False, profiler=profiler
+        )
+
+        assert failed == 0
+        assert mock_client_instance.profiler is profiler
+        phases = [p["name"] for p in profiler.to_dict()["phases"]]
+        assert phases == [
+            "connect",
+            "parse",
+            "resolve",
+            "graph_build",
+            "phasing",
+            "plan",
+            "execute",
+            "persistence",
+            "rollback",
+        ]
+        mock_write_profile.assert_called_once()
+
+    def test_changelog_states_record_csv_row(self):
+        """Test creates record the row as after_state and deletes as before_state."""
+        from src.importer.models.csv_row import IP4NetworkRow
+        from src.importer.models.operations import Operation
+        from src.importer.models.results import OperationResult
+
+        row = IP4NetworkRow(
+            row_id=3,
+            object_type="ip4_network",
+            action="delete",
+            config="Default",
+            cidr="10.1.0.0/24",
+            name="Net",
+        )
+        op = Operation(
+            row_id=3,
+            operation_type=OperationType.DELETE,
+            object_type="ip4_network",
+            resource_id=42,
+            payload={},
+            csv_row=row,
+        )
+        deleted = OperationResult(
+            row_id=3, operation=OperationType.DELETE, success=True, resource_id=42
+        )
+        created = OperationResult(
+            row_id=3, operation=OperationType.CREATE, success=True, resource_id=42
+        )
+
+        before, after = ImportRunner._changelog_states(op, deleted)
+        assert after is None
+        assert before["cidr"] == "10.1.0.0/24"
+        assert before["name"] == "Net"
+        assert before["id"] == 42
+        assert "action" not in before and "row_id" not in before
+
+        before, after = ImportRunner._changelog_states(op, created)
+        assert before is None
+        assert after["config"] == "Default"
+
+    def test_plan_shards(self):
+        """Test sharding falls back to one process for simulation or a single component."""
+        from src.importer.dependency.graph import DependencyGraph
+        from src.importer.models.operations import Operation
+
+        graph = DependencyGraph()
+        for row_id in range(4):
+            graph.add_operation(
+                Operation(
+                    row_id=row_id,
+                    operation_type=OperationType.CREATE,
+                    object_type="ip4_block",
+                    resource_id=None,
+                    payload={},
+                    csv_row=MagicMock(config=f"Config{row_id}"),
+                )
+            )
+        graph._apply_phasing()
+
+        assert self.runner._plan_shards(graph, 2, simulated=True) == ([], [])
+        global_ops, shards = self.runner._plan_shards(graph, 2, simulated=False)
+        assert global_ops == []
+        assert sorted(len(shard) for shard in shards) == [1, 1, 1, 1]
+
+        graph.add_dependency("ip4_block:1", "ip4_block:0")
+        graph.add_dependency("ip4_block:2", "ip4_block:1")
+        graph.add_dependency("ip4_block:3", "ip4_block:2")
+        assert self.runner._plan_shards(graph, 2, simulated=False) == ([], [])
+
+    def test_plan_shards_global_operations(self):
+        """Test that global creates run first and a global delete prevents sharding."""
+        from src.importer.dependency.graph import DependencyGraph
+        from src.importer.models.operations import Operation
+
+        def build(tag_operation):
+            graph = DependencyGraph()
+            operations = [
+                Operation(
+                    row_id=row_id,
+                    operation_type=OperationType.CREATE,
+                    object_type="ip4_network",
+                    resource_id=None,
+                    payload={},
+                    csv_row=MagicMock(config=config),
+                )
+                for row_id, config in ((1, "A"), (2, "B"))
+            ]
+            operations.append(
+                Operation(
+                    row_id=3,
+                    operation_type=tag_operation,
+                    object_type="tag",
+                    resource_id=None,
+                    payload={},
+                    csv_row=MagicMock(config=None),
+                )
+            )
+            for operation in operations:
+                graph.add_operation(operation)
+            graph._apply_phasing()
+            return graph
+
+        global_ops, shards = self.runner._plan_shards(
+            build(OperationType.CREATE), 2, simulated=False
+        )
+        assert [op.row_id for op in global_ops] == [3]
+        assert sorted(op.row_id for shard in shards for op in shard) == [1, 2]
+
+        assert self.runner._plan_shards(build(OperationType.DELETE), 2, simulated=False) == (
+            [],
+            [],
+        )
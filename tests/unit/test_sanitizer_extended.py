@@ -15,7 +15,7 @@ from unittest.mock import Mock
 import pytest
 from rich.console import Console
 
-from src.importer.core.sanitizer import CSVSanitizer, _truncate
+from src.importer.core.sanitizer import MAX_CHANGE_SAMPLES, CSVSanitizer, _truncate
 
 
 class TestStreamingMode:
@@ -371,7 +371,10 @@ class TestEdgeCases:
         result = sanitizer.sanitize()
 
         # Should not add trailing newline if not present
-        assert not result.cleaned_content.endswith("\n") or result.cleaned_content == csv_without_newline + "\n"
+        assert (
+            not result.cleaned_content.endswith("\n")
+            or result.cleaned_content == csv_without_newline + "\n"
+        )
 
     def test_very_long_cell_value(self, tmp_path):
         """Test handling of very long cell values."""
@@ -407,3 +410,95 @@ class TestSanitizeResult:
         assert "rows_processed" in result.stats
         assert "cells_cleaned" in result.stats
         assert "headers_cleaned" in result.stats
+
+
+class TestSanitizeTo:
+    """Test chunked cleaning straight to an output file."""
+
+    DIRTY = (
+        "row_id,object_type,name\r\n"
+        "# comment , kept \r\n"
+        " 1 ,ip4_block, A \r\n"
+        '2,ip4_block," multi\nline "\r\n'
+        '3,ip4_block,"#x "\r\n'
+        "4,ip4_block,B\r\n"
+    )
+    CLEAN = (
+        "row_id,object_type,name\r\n"
+        "# comment , kept \r\n"
+        "1,ip4_block,A\r\n"
+        '2,ip4_block,"multi\nline"\r\n'
+        "3,ip4_block,#x\r\n"
+        "4,ip4_block,B\r\n"
+    )
+
+    def _write(self, tmp_path, content):
+        csv_file = tmp_path / "input.csv"
+        csv_file.write_bytes(content.encode("utf-8"))
+        return csv_file
+
+    def test_clean_file_writes_nothing(self, tmp_path):
+        """Test that a clean file produces no output file."""
+        csv_file = self._write(tmp_path, self.CLEAN)
+        output = tmp_path / "out.csv"
+
+        result = CSVSanitizer(csv_file).sanitize_to(output)
+
+        assert not result.has_changes
+        assert result.output_path is None
+        assert not output.exists()
+        assert result.stats["rows_processed"] == 5
+
+    def test_dirty_file_cleaned_verbatim_elsewhere(self, tmp_path):
+        """Test that comments, quoting and CRLF line endings survive cleaning."""
+        csv_file = self._write(tmp_path, self.DIRTY)
+        output = tmp_path / "out.csv"
+
+        result = CSVSanitizer(csv_file).sanitize_to(output)
+
+        assert result.output_path == output
+        assert output.read_bytes() == self.CLEAN.encode("utf-8")
+        assert result.stats["cells_cleaned"] == 4
+        assert "Line 3 [row_id]: ' 1 ' -> '1'" in result.changes
+        assert not list(tmp_path.glob(".*.partial"))
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 40])
+    def test_chunk_size_does_not_change_output(self, tmp_path, chunk_size):
+        """Test that records split across chunks are cleaned as a whole."""
+        csv_file = self._write(tmp_path, self.DIRTY)
+        output = tmp_path / "out.csv"
+
+        result = CSVSanitizer(csv_file).sanitize_to(output, chunk_size=chunk_size)
+
+        assert output.read_bytes() == self.CLEAN.encode("utf-8")
+        assert result.stats["rows_processed"] == 5
+        assert result.stats["cells_cleaned"] == 4
+
+    def test_workers_match_sequential(self, tmp_path):
+        """Test that parallel chunk cleaning produces the same file and samples."""
+        csv_file = self._write(tmp_path, self.DIRTY * 20)
+        sequential = CSVSanitizer(csv_file).sanitize_to(tmp_path / "a.csv", chunk_size=64)
+        parallel = CSVSanitizer(csv_file).sanitize_to(tmp_path / "b.csv", workers=2, chunk_size=64)
+
+        assert (tmp_path / "a.csv").read_bytes() == (tmp_path / "b.csv").read_bytes()
+        assert parallel.changes == sequential.changes
+        assert parallel.stats == sequential.stats
+
+    def test_change_samples_are_bounded(self, tmp_path):
+        """Test that samples stop at MAX_CHANGE_SAMPLES and the rest are counted."""
+        rows = "".join(f"{i}, ip4_block \n" for i in range(MAX_CHANGE_SAMPLES + 50))
+        csv_file = self._write(tmp_path, "row_id,object_type\n" + rows)
+
+        result = CSVSanitizer(csv_file).sanitize_to(tmp_path / "out.csv", chunk_size=4096)
+
+        assert len(result.changes) == MAX_CHANGE_SAMPLES
+        assert result.changes_dropped == 50
+        assert result.stats["cells_cleaned"] == MAX_CHANGE_SAMPLES + 50
+
+    def test_in_place(self, tmp_path):
+        """Test that the input file can be its own output."""
+        csv_file = self._write(tmp_path, self.DIRTY)
+
+        CSVSanitizer(csv_file).sanitize_to(csv_file, chunk_size=16)
+
+        assert csv_file.read_bytes() == self.CLEAN.encode("utf-8")
@@ -0,0 +1,136 @@
+"""Tests for critical-path-first scheduling of ready operations."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+from src.importer.config import PolicyConfig
+from src.importer.dependency.graph import DependencyGraph
+from src.importer.execution.executor import OperationExecutor
+from src.importer.execution.planner import ExecutionPlanner
+from src.importer.execution.scheduler import PriorityScheduler, critical_path_priorities
+from src.importer.models.operations import Operation, OperationType
+from src.importer.models.results import OperationResult
+
+
+def _op(row_id):
+    return Operation(
+        row_id=row_id,
+        operation_type=OperationType.NOOP,
+        object_type="ip4_network",
+        resource_id=None,
+        payload={},
+        csv_row=None,
+    )
+
+
+def _graph():
+    """Chain a -> b -> c, leaves x, y and z, and x -> w."""
+    graph = DependencyGraph()
+    for row_id in ("x", "y", "z", "a", "b", "c", "w"):
+        graph.add_operation(_op(row_id))
+    graph.add_dependency("ip4_network:b", "ip4_network:a")
+    graph.add_dependency("ip4_network:c", "ip4_network:b")
+    graph.add_dependency("ip4_network:w", "ip4_network:x")
+    graph._calculate_depths()
+    return graph
+
+
+def _executor(graph, scheduling):
+    policy = PolicyConfig(
+        max_concurrent_operations=1, min_concurrency=1, max_concurrency=1, scheduling=scheduling
+    )
+    executor = OperationExecutor(
+        bam_client=AsyncMock(),
+        policy=policy,
+        dependency_graph=graph,
+        checkpoint_manager=MagicMock(),
+        session_id="s1",
+    )
+    order = []
+
+    async def run(operation):
+        order.append(operation.row_id)
+        return OperationResult(
+            row_id=operation.row_id, operation=operation.operation_type, success=True
+        )
+
+    executor._execute_operation = run
+    return executor, order
+
+
+class TestPriorities:
+    """Test priority keys and ready tracking."""
+
+    def test_longest_chain_first(self):
+        """Test that nodes heading longer chains rank first."""
+        priorities = critical_path_priorities(_graph())
+
+        ranked = sorted(priorities, key=priorities.get)
+        assert ranked[:2] == ["ip4_network:a", "ip4_network:x"]
+        assert priorities["ip4_network:a"][0] == -3
+        assert priorities["ip4_network:y"][:2] == (-1, 0)
+
+    def test_releases_dependents_on_completion(self):
+        """Test that operations become ready only when their dependencies complete."""
+        scheduler = PriorityScheduler(_graph(), done=["ip4_network:x"])
+
+        assert [op.row_id for op in scheduler.pop(2)] == ["a", "y"]
+        assert scheduler.ready_count == 2
+        scheduler.complete("ip4_network:a")
+        assert [op.row_id for op in scheduler.pop(10)] == ["b", "z", "w"]
+        assert scheduler.pending_count == 5
+
+
+class TestPriorityExecution:
+    """Test the executor admitting ready operations by priority."""
+
+    async def test_critical_path_runs_first(self):
+        """Test that with one slot the heads of chains run before the independent leaves."""
+        graph = _graph()
+        plan = ExecutionPlanner(PolicyConfig()).create_plan(graph)
+        executor, order = _executor(graph, "critical_path")
+
+        results = await executor.execute_plan(plan)
+
+        assert order == ["a", "x", "b", "y", "z", "w", "c"]
+        assert len(results) == 7 and all(r.success for r in results)
+        # Checkpoints still mean "this batch and all before it are done"
+        saved = [
+            c.kwargs["batch_id"] for c in executor.checkpoint_manager.save_checkpoint.mock_calls
+        ]
+        assert saved == [0, 1, 2]
+
+    async def test_batch_and_ready_scheduling(self):
+        """Test the depth-at-a-time and plan-order alternatives."""
+        graph = _graph()
+        plan = ExecutionPlanner(PolicyConfig()).create_plan(graph)
+        plan_order = [op.row_id for batch in plan.batches for op in batch.operations]
+
+        for scheduling in ("batch", "ready"):
+            executor, order = _executor(graph, scheduling)
+            await executor.execute_plan(plan)
+            assert order == plan_order
+
+    async def test_resume_skips_completed_batches(self):
+        """Test that batches before start_batch_id count as done."""
+        graph = _graph()
+        plan = ExecutionPlanner(PolicyConfig()).create_plan(graph)
+        executor, order = _executor(graph, "critical_path")
+
+        await executor.execute_plan(plan, start_batch_id=1)
+
+        assert order == ["b", "w", "c"]
+
+    async def test_failure_skips_dependents(self):
+        """Test that dependents of a failed operation are released as skipped."""
+        graph = _graph()
+        plan = ExecutionPlanner(PolicyConfig()).create_plan(graph)
+        graph.nodes["ip4_network:a"].operation.payload["error"] = "bad row"
+        executor = OperationExecutor(
+            bam_client=AsyncMock(), policy=PolicyConfig(), dependency_graph=graph
+        )
+
+        results = {r.row_id: r for r in await executor.execute_plan(plan)}
+
+        assert results["a"].error_message == "bad row"
+        assert results["c"].metadata == {"skipped": True}
+        assert results["y"].success
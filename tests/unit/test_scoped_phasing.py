@@ -0,0 +1,127 @@
+"""Tests for phase barriers scoped per configuration."""
+
+import random
+from unittest.mock import MagicMock
+
+from src.importer.dependency.graph import DELETE_PHASE_ORDER, PHASE_ORDER, DependencyGraph
+from src.importer.models.operations import Operation, OperationType
+
+_CREATE_PHASE = {t: i for i, types in enumerate(PHASE_ORDER) for t in types}
+_DELETE_PHASE = {t: i for i, types in enumerate(DELETE_PHASE_ORDER) for t in types}
+_GLOBAL_TYPES = sorted(PHASE_ORDER[0] | PHASE_ORDER[1])
+_SCOPED_TYPES = ["ip4_block", "ip4_network", "dns_zone", "host_record", "alias_record", "device"]
+
+
+def _op(row_id, object_type, config=None, operation_type=OperationType.CREATE):
+    return Operation(
+        row_id=row_id,
+        operation_type=operation_type,
+        object_type=object_type,
+        resource_id=None,
+        payload={},
+        csv_row=MagicMock(config=config) if config else None,
+    )
+
+
+def _phased(operations):
+    graph = DependencyGraph()
+    for op in operations:
+        graph.add_operation(op)
+    graph._apply_phasing()
+    graph._calculate_depths()
+    return graph
+
+
+def _ancestors(graph, node_id):
+    """Every node that must finish before node_id."""
+    seen: set[str] = set()
+    stack = list(graph.nodes[node_id].dependencies)
+    while stack:
+        current = stack.pop()
+        if current not in seen:
+            seen.add(current)
+            stack.extend(graph.nodes[current].dependencies)
+    return seen
+
+
+def _globally_ordered(a, b):
+    """Whether unscoped phasing runs operation a before operation b."""
+    a_delete = a.operation_type == OperationType.DELETE
+    b_delete = b.operation_type == OperationType.DELETE
+    if a_delete and not b_delete:
+        return True
+    if a_delete and b_delete:
+        return _DELETE_PHASE[a.object_type] < _DELETE_PHASE[b.object_type]
+    if not a_delete and not b_delete:
+        return _CREATE_PHASE[a.object_type] < _CREATE_PHASE[b.object_type]
+    return False
+
+
+class TestScopedPhasing:
+    """Test that configurations progress independently without losing any ordering."""
+
+    def test_configurations_do_not_wait_for_each_other(self):
+        """Test that a record in one configuration does not wait for a block in another."""
+        graph = _phased(
+            [
+                _op("blockA", "ip4_block", "A"),
+                _op("hostA", "host_record", "A"),
+                _op("hostB", "host_record", "B"),
+            ]
+        )
+
+        assert "ip4_block:blockA" in _ancestors(graph, "host_record:hostA")
+        assert "ip4_block:blockA" not in _ancestors(graph, "host_record:hostB")
+        assert graph.nodes["host_record:hostB"].depth == 0
+        assert "system_barrier:barrier_create_phase_2@A" in graph.nodes
+
+    def test_global_operations_order_every_configuration(self):
+        """Test that global definitions stay ahead of every configuration."""
+        graph = _phased(
+            [
+                _op("tag", "tag"),
+                _op("blockA", "ip4_block", "A"),
+                _op("blockB", "ip4_block", "B", OperationType.DELETE),
+            ]
+        )
+
+        assert "tag:tag" in _ancestors(graph, "ip4_block:blockA")
+        # A global create still waits for every configuration's deletes
+        assert "ip4_block:blockB" in _ancestors(graph, "tag:tag")
+
+    def test_single_configuration_keeps_barrier_names(self):
+        """Test that a one-configuration import keeps the unscoped barriers."""
+        graph = _phased([_op("block", "ip4_block", "Default"), _op("host", "host_record")])
+
+        assert "system_barrier:barrier_create_phase_2" in graph.nodes
+        assert "ip4_block:block" in _ancestors(graph, "host_record:host")
+
+    def test_no_ordering_guarantee_is_lost(self):
+        """Test every pair ordered by global phasing within a scope is still ordered."""
+        rng = random.Random(7)
+        operations = []
+        for i in range(150):
+            config = rng.choice(["A", "B", "C", None])
+            types = _SCOPED_TYPES if config else _GLOBAL_TYPES
+            action = rng.choice([OperationType.CREATE, OperationType.UPDATE, OperationType.DELETE])
+            operations.append(_op(f"r{i}", rng.choice(types), config, action))
+        graph = _phased(operations)
+
+        independent = 0
+        for b in operations:
+            b_id = f"{b.object_type}:{b.row_id}"
+            before = _ancestors(graph, b_id)
+            for a in operations:
+                if a is b or not _globally_ordered(a, b):
+                    continue
+                a_id = f"{a.object_type}:{a.row_id}"
+                a_config, b_config = (
+                    getattr(a.csv_row, "config", None),
+                    b.csv_row and b.csv_row.config,
+                )
+                if a_config is None or not b_config or a_config == b_config:
+                    assert a_id in before, f"{a_id} must run before {b_id}"
+                elif a_id not in before:
+                    # Other configurations are only ordered through global operations
+                    independent += 1
+        assert independent > 0
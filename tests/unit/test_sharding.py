@@ -0,0 +1,144 @@
+"""Tests for sharded multi-process execution."""
+
+import json
+
+import pytest
+
+from src.importer.config import BAMConfig, ImporterConfig, PolicyConfig
+from src.importer.execution.pipeline import ResultPipeline, ResultTally
+from src.importer.execution.sharding import (
+    GLOBAL_SHARD,
+    ShardedExecutor,
+    ShardOutcome,
+    completed_shards,
+    plan_shards,
+    shard_policy,
+)
+from src.importer.models.csv_row import IP4NetworkRow
+from src.importer.models.operations import Operation, OperationType
+from src.importer.models.results import OperationResult
+from src.importer.persistence.checkpoint import CheckpointManager
+
+
+def _network(row_id):
+    cidr = f"10.{row_id}.0.0/16"
+    return Operation(
+        row_id=row_id,
+        operation_type=OperationType.CREATE,
+        object_type="ip4_network",
+        resource_id=None,
+        payload={"name": f"n{row_id}", "resource_path": f"Default/{cidr}"},
+        csv_row=IP4NetworkRow(
+            row_id=row_id,
+            object_type="ip4_network",
+            action="create",
+            config="Default",
+            name=f"n{row_id}",
+            cidr=cidr,
+        ),
+    )
+
+
+def _config():
+    return ImporterConfig(
+        bam=BAMConfig(base_url="https://bam.example.com", username="u", password="p")
+    )
+
+
+class TestPlanning:
+    """Test shard packing and concurrency shares."""
+
+    def test_plan_shards_balances_whole_components(self):
+        """Test largest-first packing that never splits a component."""
+        components = [[_network(i) for i in range(n * 10, n * 10 + n)] for n in (5, 4, 3, 2, 1)]
+
+        shards = plan_shards(components, 2)
+
+        assert sorted(map(len, shards)) == [7, 8]
+        for component in components:
+            assert sum(all(op in shard for op in component) for shard in shards) == 1
+        assert plan_shards(components[:1], 4) == [components[0]]
+
+    def test_shard_policy(self):
+        """Test that workers split the concurrency limits."""
+        policy = shard_policy(
+            PolicyConfig(max_concurrent_operations=10, max_concurrency=50, min_concurrency=2), 4
+        )
+
+        assert (policy.max_concurrent_operations, policy.max_concurrency) == (2, 12)
+        assert policy.min_concurrency == 2
+        assert (
+            shard_policy(PolicyConfig(max_concurrent_operations=2), 8).max_concurrent_operations
+            == 1
+        )
+
+
+class TestShardedExecutor:
+    """Test running shards in worker processes and merging them back."""
+
+    async def test_dry_run_in_worker_processes(self):
+        """Test that every operation runs in a worker and is published to the sink."""
+        shards = plan_shards([[_network(i)] for i in range(6)], 3)
+        tally = ResultTally()
+        executor = ShardedExecutor(_config(), processes=2, session_id="s1", dry_run=True)
+
+        async with ResultPipeline([tally]) as pipeline:
+            results = await executor.execute(shards, sink=pipeline)
+
+        assert sorted(r.row_id for r in results) == list(range(6))
+        assert all(r.success and r.metadata.get("dry_run") for r in results)
+        assert tally.successful == executor.succeeded_count == 6
+
+    async def test_merge_records_shard_and_created_resources(self, tmp_path):
+        """Test that a finished live shard is checkpointed and can be skipped on resume."""
+        checkpoints = CheckpointManager(str(tmp_path / "checkpoint.db"))
+        executor = ShardedExecutor(
+            _config(), processes=2, session_id="s1", checkpoint_manager=checkpoints
+        )
+        outcome = ShardOutcome(
+            shard_index=1,
+            results=[OperationResult(row_id=3, operation=OperationType.CREATE, success=True)],
+            created_resources={"network": {"10.3.0.0/16": 33}},
+        )
+
+        await executor._merge(outcome, shard_count=2, total_operations=4, sink=None)
+
+        checkpoint = checkpoints.get_latest_checkpoint("s1")
+        assert json.loads(checkpoint.metadata) == {"shard": 1, "shards": 2}
+        assert checkpoint.total_operations == 4
+        assert checkpoints.load_created_resources("s1")["network"] == {"10.3.0.0/16": 33}
+        assert completed_shards(checkpoints, "s1", 2) == {1}
+        # Split differently now: nothing can be skipped
+        assert completed_shards(checkpoints, "s1", 3) == set()
+        checkpoints.close()
+
+    async def test_global_operations_run_first_in_parent(self):
+        """Test that global operations finish before any shard and are resumable."""
+        shards = plan_shards([[_network(i)] for i in range(2)], 2)
+        tag = Operation(
+            row_id=9,
+            operation_type=OperationType.CREATE,
+            object_type="tag_group",
+            resource_id=None,
+            payload={"name": "Sites"},
+            csv_row=None,
+        )
+        executor = ShardedExecutor(_config(), processes=2, session_id="s1", dry_run=True)
+
+        results = await executor.execute(shards, global_operations=[tag])
+
+        assert [r.row_id for r in results][0] == 9
+        assert sorted(r.row_id for r in results[1:]) == [0, 1]
+        assert await executor.execute([], global_operations=[tag], skip={GLOBAL_SHARD}) == []
+
+    async def test_skips_completed_shards(self):
+        """Test that nothing runs when every shard is already complete."""
+        shards = plan_shards([[_network(i)] for i in range(2)], 2)
+        executor = ShardedExecutor(_config(), processes=2, session_id="s1", dry_run=True)
+
+        assert await executor.execute(shards, skip={0, 1}) == []
+
+    def test_requires_bam_config(self):
+        """Test that a config without BAM settings is rejected before any shard runs."""
+        with pytest.raises(ValueError, match="BAM configuration"):
+            ShardedExecutor(ImporterConfig(), processes=2, session_id="s1")
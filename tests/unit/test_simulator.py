@@ -0,0 +1,94 @@
+"""Tests for the in-process simulated BAM."""
+
+from pathlib import Path
+
+import pytest
+from rich.console import Console
+
+from src.importer.bam.mock_server import MockBAMState
+from src.importer.bam.simulator import create_simulated_client, load_state, save_state
+from src.importer.config import ImporterConfig
+from src.importer.execution.runner import ImportRunner
+from src.importer.persistence.changelog import ChangeLog
+from src.importer.utils.exceptions import BAMAPIError
+
+
+@pytest.fixture
+async def client():
+    """BAMClient backed by a fresh simulated BAM."""
+    bam = create_simulated_client(MockBAMState())
+    yield bam
+    await bam.close()
+
+
+class TestSimulatedClient:
+    """Test BAMClient requests served in-process."""
+
+    async def test_create_and_lookup(self, client):
+        """Test creating and finding resources without a server."""
+        config = await client.get_configuration_by_name("Default")
+        block = await client.create_ip4_block(config["id"], "10.0.0.0/8", "Block")
+        await client.create_ip4_network(block["id"], "10.0.3.0/24", "Net")
+
+        network = await client.find_network_containing_address(config["id"], "10.0.3.7")
+
+        assert network["range"] == "10.0.3.0/24"
+
+    async def test_overlap_raises(self, client):
+        """Test that an overlapping network surfaces as a BAMAPIError."""
+        config = await client.get_configuration_by_name("Default")
+        block = await client.create_ip4_block(config["id"], "10.0.0.0/8", "Block")
+        await client.create_ip4_network(block["id"], "10.0.0.0/24", "Net")
+
+        with pytest.raises(BAMAPIError, match="overlaps"):
+            await client.create_ip4_network(block["id"], "10.0.0.0/25", "Inner")
+
+
+class TestStateFiles:
+    """Test saving and seeding simulated state."""
+
+    def test_save_and_load(self, tmp_path):
+        """Test that a saved state loads with the same resources."""
+        state = MockBAMState()
+        config = state.find("configurations", name="Default")[0]
+        state.add_entity(config["id"], "blocks", {"type": "IPv4Block", "range": "10.0.0.0/8"})
+
+        count = save_state(state, tmp_path / "state.json")
+        loaded = load_state(tmp_path / "state.json")
+
+        assert count == len(state.entities)
+        assert loaded.find("blocks")[0]["range"] == "10.0.0.0/8"
+
+    def test_load_rejects_other_files(self, tmp_path):
+        """Test that an unrelated JSON file is rejected."""
+        path = tmp_path / "state.json"
+        path.write_text("[]")
+
+        with pytest.raises(ValueError, match="not a simulated BAM state"):
+            load_state(path)
+
+
+class TestSimulatedRun:
+    """Test ImportRunner against a simulated BAM."""
+
+    async def test_reports_conflicts_without_persisting(self, tmp_path, monkeypatch):
+        """Test that conflicts fail as they would live and nothing is recorded."""
+        monkeypatch.chdir(tmp_path)
+        csv_file = Path("import.csv")
+        csv_file.write_text(
+            "row_id,object_type,action,config,cidr,name\n"
+            "1,ip4_block,create,Default,10.0.0.0/8,Block\n"
+            "2,ip4_network,create,Default,10.1.0.0/24,Net\n"
+            "3,ip4_network,create,Default,10.1.0.0/25,Overlap\n"
+        )
+        state = MockBAMState()
+
+        failed = await ImportRunner(ImporterConfig.from_env(), Console(quiet=True)).run_session(
+            csv_file, simulation=state
+        )
+
+        assert failed == 1
+        # The two networks run in the same batch, so either may win
+        assert len(state.find("networks")) == 1
+        assert ChangeLog(Path(".changelogs/changelog.db")).get_sessions() == []
+        assert not Path("rollbacks").exists()
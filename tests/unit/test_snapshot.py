@@ -0,0 +1,220 @@
+"""Tests for the local BAM snapshot store and read client."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.importer.bam.mock_server import MockBAMState
+from src.importer.bam.simulator import create_simulated_client
+from src.importer.bam.snapshot import SnapshotReadClient, refresh_snapshot, take_snapshot
+from src.importer.models.csv_row import IP4NetworkRow
+from src.importer.persistence.snapshot import SnapshotRecord, SnapshotStore
+from src.importer.utils.exceptions import ResourceNotFoundError
+from src.importer.validation.validator import BulkValidator
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Empty snapshot store."""
+    with SnapshotStore(tmp_path / "snapshot.db") as snapshot_store:
+        yield snapshot_store
+
+
+@pytest.fixture
+def state():
+    """Simulated BAM with a block tree, a network and nested zones."""
+    bam = MockBAMState()
+    config = bam.find("configurations", name="Default")[0]
+    view = bam.find("views", name="Internal")[0]
+    block = bam.add_entity(config["id"], "blocks", {"type": "IPv4Block", "range": "10.0.0.0/8"})
+    inner = bam.add_entity(block["id"], "blocks", {"type": "IPv4Block", "range": "10.1.0.0/16"})
+    bam.add_entity(inner["id"], "networks", {"type": "IPv4Network", "range": "10.1.2.0/24"})
+    zone = bam.add_entity(view["id"], "zones", {"type": "Zone", "absoluteName": "example.com"})
+    bam.add_entity(zone["id"], "zones", {"type": "Zone", "absoluteName": "sub.example.com"})
+    return bam
+
+
+@pytest.fixture
+async def client(state):
+    """Authenticated client backed by the simulated BAM."""
+    bam = create_simulated_client(state)
+    await bam.authenticate()
+    yield bam
+    await bam.close()
+
+
+def _ids(state, collection, **match):
+    return [e["id"] for e in state.find(collection, **match)]
+
+
+class TestSnapshotStore:
+    """Test storage and range lookups."""
+
+    def _fill(self, store):
+        config = {"id": 1, "name": "Default"}
+        records = [
+            SnapshotRecord("blocks", {"id": 2, "range": "10.0.0.0/8"}, 1),
+            SnapshotRecord("blocks", {"id": 3, "range": "10.0.0.0/16"}, 2),
+            SnapshotRecord("networks", {"id": 4, "range": "10.0.1.0/24"}, 3),
+            SnapshotRecord("blocks", {"id": 5, "range": "2001:db8::/32"}, 1),
+            SnapshotRecord("networks", {"id": 6, "range": "2001:db8:1::/64"}, 5),
+        ]
+        store.replace_configuration(config, records, ["blocks", "networks"])
+
+    def test_find_containing_smallest(self, store):
+        """Test that the most specific containing range wins, for both families."""
+        self._fill(store)
+
+        assert store.find_containing(1, "blocks", "10.0.5.0/24")["id"] == 3
+        assert store.find_containing(1, "blocks", "10.0.0.0/16")["id"] == 3
+        assert store.find_containing(1, "blocks", "10.9.0.0/16")["id"] == 2
+        assert store.find_containing(1, "blocks", "11.0.0.0/24") is None
+        assert store.find_containing(1, "networks", "10.0.1.77")["id"] == 4
+        assert store.find_containing(1, "networks", "2001:db8:1::5")["id"] == 6
+
+    def test_keys_are_normalized(self, store):
+        """Test that lookups match regardless of CIDR spelling."""
+        self._fill(store)
+
+        assert store.find(1, "networks", "10.0.1.9/24")["id"] == 4
+        assert store.existing_keys(1, "networks", ["10.0.1.0/24", "10.0.2.0/24"]) == {"10.0.1.0/24"}
+
+    def test_delete_cascades(self, store):
+        """Test that deleting a resource removes everything below it."""
+        self._fill(store)
+
+        written, removed = store.apply_changes(1, [], [3], watermark="t1")
+
+        assert (written, removed) == (0, 2)
+        assert store.get(4) is None
+        assert store.get(2) is not None
+        assert store.get_configuration("Default").watermark == "t1"
+
+
+class TestTakeSnapshot:
+    """Test pulling configurations from BAM."""
+
+    async def test_pull_and_lookup(self, client, state, store):
+        """Test that a pulled configuration answers lookups without BAM."""
+        await take_snapshot(client, store, ["Default"])
+        config_id = _ids(state, "configurations", name="Default")[0]
+        view_id = _ids(state, "views", name="Internal")[0]
+        reader = SnapshotReadClient(client, store, max_age=3600)
+        state.reset_stats()
+
+        block = await reader.get_block_by_cidr_in_config(config_id, "10.0.0.0/8")
+        parent = await reader.find_block_containing_network(config_id, "10.1.9.0/24")
+        network = await reader.find_network_containing_address(config_id, "10.1.2.3")
+        zone = await reader.get_zone_by_fqdn(view_id, "sub.example.com.")
+
+        assert block["range"] == "10.0.0.0/8"
+        assert parent["range"] == "10.1.0.0/16"
+        assert network["range"] == "10.1.2.0/24"
+        assert zone["absoluteName"] == "sub.example.com"
+        assert state.get_stats()["total_requests"] == 0
+        assert reader.hits == 4
+
+    async def test_miss_is_authoritative(self, client, state, store):
+        """Test that a fresh snapshot miss raises without asking BAM."""
+        await take_snapshot(client, store, ["Default"])
+        config_id = _ids(state, "configurations", name="Default")[0]
+        reader = SnapshotReadClient(client, store, max_age=3600)
+        state.reset_stats()
+
+        # Nested blocks are not top-level blocks of the configuration
+        with pytest.raises(ResourceNotFoundError):
+            await reader.get_block_by_cidr_in_config(config_id, "10.1.0.0/16")
+
+        assert state.get_stats()["total_requests"] == 0
+
+    async def test_stale_snapshot_uses_bam(self, client, state, store):
+        """Test that configurations older than max_age are looked up in BAM."""
+        await take_snapshot(client, store, ["Default"])
+        store.conn.execute(
+            "UPDATE configurations SET refreshed_at = ?",
+            ((datetime.utcnow() - timedelta(hours=2)).isoformat(),),
+        )
+        config_id = _ids(state, "configurations", name="Default")[0]
+        reader = SnapshotReadClient(client, store, max_age=3600)
+        state.reset_stats()
+
+        block = await reader.get_block_by_cidr_in_config(config_id, "10.0.0.0/8")
+
+        assert block["range"] == "10.0.0.0/8"
+        assert state.get_stats()["total_requests"] == 1
+        assert reader.fallbacks == 1
+
+    async def test_uncaptured_collection_uses_bam(self, client, state, store):
+        """Test that address lookups go to BAM unless addresses were pulled."""
+        await take_snapshot(client, store, ["Default"])
+        config_id = _ids(state, "configurations", name="Default")[0]
+        reader = SnapshotReadClient(client, store, max_age=3600)
+
+        assert await reader.get_ip4_address(config_id, "10.1.2.5") is None
+        assert reader.fallbacks == 1
+
+
+class TestRefreshSnapshot:
+    """Test incremental and full refresh."""
+
+    async def test_incremental_refresh(self, client, state, store):
+        """Test that changes made through the API are applied from the transaction log."""
+        await take_snapshot(client, store, ["Default"])
+        config_id = _ids(state, "configurations", name="Default")[0]
+        inner_id = _ids(state, "blocks", range="10.1.0.0/16")[0]
+        network_id = _ids(state, "networks", range="10.1.2.0/24")[0]
+        await client.create_ip4_network(inner_id, "10.1.3.0/24", "New")
+        await client._delete(f"networks/{network_id}")
+
+        modes = await refresh_snapshot(client, store)
+
+        assert modes == {"Default": "incremental"}
+        added = store.find(config_id, "networks", "10.1.3.0/24")
+        assert added is not None
+        assert store.find_child(inner_id, "networks", "10.1.3.0/24")["id"] == added["id"]
+        assert store.get(network_id) is None
+
+    async def test_full_refresh_without_transaction_log(self, client, state, store):
+        """Test that a configuration without a watermark is pulled again."""
+        await take_snapshot(client, store, ["Default"])
+        store.conn.execute("UPDATE configurations SET watermark = NULL")
+        config_id = _ids(state, "configurations", name="Default")[0]
+        state.add_entity(config_id, "blocks", {"type": "IPv4Block", "range": "172.16.0.0/12"})
+
+        modes = await refresh_snapshot(client, store)
+
+        assert modes == {"Default": "full"}
+        assert store.find(config_id, "blocks", "172.16.0.0/12") is not None
+
+
+class TestBulkValidatorSnapshot:
+    """Test snapshot-backed existence checks."""
+
+    async def test_duplicate_network_from_snapshot(self, client, state, store):
+        """Test that duplicate CIDRs are reported from the snapshot."""
+        await take_snapshot(client, store, ["Default"])
+        reader = SnapshotReadClient(client, store, max_age=3600)
+        rows = [
+            IP4NetworkRow(
+                row_id=1,
+                object_type="ip4_network",
+                action="create",
+                config="Default",
+                name="Net",
+                cidr="10.1.2.0/24",
+            ),
+            IP4NetworkRow(
+                row_id=2,
+                object_type="ip4_network",
+                action="create",
+                config="Default",
+                name="Net",
+                cidr="10.1.4.0/24",
+            ),
+        ]
+        state.reset_stats()
+
+        report = await BulkValidator(reader).validate(rows)
+
+        assert [e.row_id for e in report.errors] == ["1"]
+        assert state.get_stats()["total_requests"] == 0
@@ -0,0 +1,211 @@
+"""Tests for the durable work queue and its coordinator and workers."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.importer.config import BAMConfig, ImporterConfig, PolicyConfig
+from src.importer.dependency.graph import DependencyGraph
+from src.importer.execution.distributed import QueueCoordinator, QueueWorker
+from src.importer.execution.pipeline import ResultPipeline, ResultTally
+from src.importer.models.csv_row import IP4NetworkRow
+from src.importer.models.operations import Operation, OperationType
+from src.importer.models.results import OperationResult
+from src.importer.persistence.work_queue import WorkQueue
+
+
+def _network(row_id):
+    cidr = f"10.{row_id}.0.0/16"
+    return Operation(
+        row_id=row_id,
+        operation_type=OperationType.CREATE,
+        object_type="ip4_network",
+        resource_id=None,
+        payload={"name": f"n{row_id}", "resource_path": f"Default/{cidr}"},
+        csv_row=IP4NetworkRow(
+            row_id=row_id,
+            object_type="ip4_network",
+            action="create",
+            config="Default",
+            name=f"n{row_id}",
+            cidr=cidr,
+        ),
+    )
+
+
+def _chain_graph():
+    """1 -> barrier -> 2 -> 3, plus an independent 4."""
+    graph = DependencyGraph()
+    barrier = Operation(
+        row_id="barrier",
+        operation_type=OperationType.NOOP,
+        object_type="system_barrier",
+        resource_id=None,
+        payload={},
+        csv_row=None,
+    )
+    for op in (_network(1), barrier, _network(2), _network(3), _network(4)):
+        graph.add_operation(op)
+    graph.add_dependency("system_barrier:barrier", "ip4_network:1")
+    graph.add_dependency("ip4_network:2", "system_barrier:barrier")
+    graph.add_dependency("ip4_network:3", "ip4_network:2")
+    graph._calculate_depths()
+    return graph
+
+
+def _ok(row_id):
+    return OperationResult(row_id=row_id, operation=OperationType.CREATE, success=True)
+
+
+def _failed(row_id, message="boom"):
+    return OperationResult(
+        row_id=row_id, operation=OperationType.CREATE, success=False, error_message=message
+    )
+
+
+def _leased(queue, worker="w1", limit=10, lease_seconds=60):
+    return [item.node_id for item in queue.lease("s1", worker, limit, lease_seconds)]
+
+
+class TestWorkQueue:
+    """Test publishing, leasing and dependency release."""
+
+    def test_releases_dependents_as_results_arrive(self, tmp_path):
+        """Test that items become ready only when their dependencies are done."""
+        with WorkQueue(tmp_path / "queue.db") as queue:
+            assert queue.publish("s1", _chain_graph())
+            assert _leased(queue) == ["ip4_network:1", "ip4_network:4"]
+            assert _leased(queue) == []
+
+            queue.complete("s1", "w1", [("ip4_network:1", _ok(1))])
+            # The barrier completed on its own and released 2
+            assert _leased(queue) == ["ip4_network:2"]
+            queue.complete("s1", "w1", [("ip4_network:2", _ok(2)), ("ip4_network:4", _ok(4))])
+            assert _leased(queue) == ["ip4_network:3"]
+            assert not queue.finished("s1")
+            queue.complete("s1", "w1", [("ip4_network:3", _ok(3))])
+
+            assert queue.finished("s1")
+            assert queue.counts("s1") == {"done": 5}
+            assert [r.row_id for _, r in queue.results("s1")] == [1, 2, 4, 3]
+            assert queue.session("s1").total == 4
+
+    def test_failure_skips_transitive_dependents(self, tmp_path):
+        """Test that a failed item skips everything that depends on it."""
+        with WorkQueue(tmp_path / "queue.db") as queue:
+            queue.publish("s1", _chain_graph())
+            _leased(queue)
+            queue.complete("s1", "w1", [("ip4_network:1", _failed(1))])
+
+            results = {r.row_id: r for _, r in queue.results("s1")}
+            assert set(results) == {1, 2, 3}
+            for row_id in (2, 3):
+                assert results[row_id].metadata == {"skipped": True}
+                assert results[row_id].error_message == (
+                    "Skipped because parent ip4_network:1 failed: boom"
+                )
+            assert not queue.finished("s1")  # 4 is still leased
+            queue.complete("s1", "w1", [("ip4_network:4", _ok(4))])
+            assert queue.finished("s1")
+
+    def test_expired_lease_is_taken_over(self, tmp_path):
+        """Test that another worker gets an expired lease and the old report is ignored."""
+        with WorkQueue(tmp_path / "queue.db") as queue:
+            queue.publish("s1", _chain_graph())
+            assert _leased(queue, "w1", lease_seconds=-1) == ["ip4_network:1", "ip4_network:4"]
+
+            items = queue.lease("s1", "w2", 10, 60)
+            assert [(i.node_id, i.attempts) for i in items] == [
+                ("ip4_network:1", 2),
+                ("ip4_network:4", 2),
+            ]
+            assert queue.complete("s1", "w1", [("ip4_network:1", _failed(1))]) == 0
+            assert queue.complete("s1", "w2", [("ip4_network:1", _ok(1))]) == 1
+            assert _leased(queue, "w2") == ["ip4_network:2"]
+
+    def test_item_fails_after_max_attempts(self, tmp_path):
+        """Test that an item whose leases keep expiring is failed, not retried forever."""
+        with WorkQueue(tmp_path / "queue.db", max_attempts=1) as queue:
+            queue.publish("s1", _chain_graph())
+            _leased(queue, lease_seconds=-1)
+
+            assert _leased(queue, "w2") == []
+            results = {r.row_id: r for _, r in queue.results("s1")}
+            assert results[1].error_message == "Abandoned after 1 expired leases"
+            assert results[3].metadata == {"skipped": True}
+            assert queue.finished("s1")
+
+    def test_created_resources_since_cursor(self, tmp_path):
+        """Test that workers read created resources incrementally."""
+        with WorkQueue(tmp_path / "queue.db") as queue:
+            queue.publish("s1", _chain_graph())
+            _leased(queue)
+            queue.complete(
+                "s1", "w1", [("ip4_network:1", _ok(1))], {"network": {"10.1.0.0/16": 101}}
+            )
+            created, seq = queue.created_resources("s1")
+            assert created == {"network": {"10.1.0.0/16": 101}}
+
+            queue.complete("s1", "w1", [("ip4_network:4", _ok(4))], {"block": {"10.0.0.0/8": 7}})
+            assert queue.created_resources("s1", after=seq)[0] == {"block": {"10.0.0.0/8": 7}}
+
+    def test_publish_once_and_find_unfinished_session(self, tmp_path):
+        """Test that a session is published once and found by its input file."""
+        with WorkQueue(tmp_path / "queue.db") as queue:
+            assert queue.publish("s1", _chain_graph(), input_hash="abc", dry_run=True)
+            assert not queue.publish("s1", _chain_graph(), input_hash="abc")
+
+            assert queue.session("s1").dry_run
+            assert queue.find_session("abc") == "s1"
+            assert queue.open_sessions() == ["s1"]
+            assert queue.find_session("other") is None
+
+
+class TestCoordinatorAndWorkers:
+    """Test a coordinator and several workers sharing one queue file."""
+
+    def _worker(self, path, name):
+        config = ImporterConfig(
+            bam=BAMConfig(base_url="https://bam.example.com", username="u", password="p"),
+            policy=PolicyConfig(max_concurrent_operations=2),
+        )
+        return QueueWorker(
+            config, WorkQueue(path), worker_id=name, bam_client=AsyncMock(), poll_interval=0.01
+        )
+
+    def test_worker_requires_client_or_bam_config(self, tmp_path):
+        """Test that a worker with nothing to connect with is rejected up front."""
+        with pytest.raises(ValueError, match="BAM configuration"):
+            QueueWorker(ImporterConfig(), WorkQueue(tmp_path / "queue.db"))
+
+    async def test_workers_execute_the_whole_graph(self, tmp_path):
+        """Test that every operation runs once and reaches the coordinator's pipeline."""
+        path = tmp_path / "queue.db"
+        graph = DependencyGraph()
+        for i in range(20):
+            graph.add_operation(_network(i))
+        for i in range(1, 20, 2):
+            graph.add_dependency(f"ip4_network:{i}", f"ip4_network:{i - 1}")
+        graph._calculate_depths()
+
+        tally = ResultTally()
+        workers = [self._worker(path, f"w{i}") for i in range(3)]
+        with WorkQueue(path) as queue:
+            coordinator = QueueCoordinator(queue, "s1", poll_interval=0.01)
+            async with ResultPipeline([tally]) as pipeline:
+                results, *processed = await asyncio.gather(
+                    coordinator.execute(graph, sink=pipeline, dry_run=True),
+                    *(worker.run() for worker in workers),
+                )
+
+            assert sorted(r.row_id for r in results) == list(range(20))
+            assert tally.successful == 20
+            assert sum(processed) == 20
+            assert queue.session("s1").consumed == len(results)
+
+            # A restarted coordinator continues after what it consumed
+            again = await QueueCoordinator(queue, "s1").execute(graph)
+            assert again == []
+        for worker in workers:
+            worker.queue.close()